@@ -0,0 +1,99 @@
+"""use partial indexes for live rows
+
+Revision ID: a9d3e5f7b2c4
+Revises: f8b2d6a4c1e7
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "a9d3e5f7b2c4"
+down_revision: Union[str, Sequence[str], None] = "f8b2d6a4c1e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+NOT_DELETED = sa.text("deleted_at IS NULL")
+
+# (previous name, new name, table name, previous columns, new columns). The new
+# columns end with each reader's ORDER BY, including the `id` tie-breaker.
+BTREE_INDEXES = (
+    (
+        "ix_conditions_patient_code",
+        "ix_conditions_patient_recorded_at",
+        "conditions",
+        ["patient_id", "code_id"],
+        ["patient_id", "recorded_at", "id"],
+    ),
+    (
+        "ix_encounters_patient_period_start_at",
+        "ix_encounters_patient_period_start_at",
+        "encounters",
+        ["patient_id", "period_start_at"],
+        ["patient_id", "period_start_at", "id"],
+    ),
+    (
+        "ix_observations_patient_effective_at",
+        "ix_observations_patient_effective_at",
+        "observations",
+        ["patient_id", "effective_at"],
+        ["patient_id", "effective_at", "id"],
+    ),
+)
+
+PATIENT_TRIGRAM_INDEXES = (
+    ("ix_patients_id_trgm", "id"),
+    ("ix_patients_name_text_trgm", "name_text"),
+    ("ix_patients_name_family_trgm", "name_family"),
+)
+
+
+def _create_trigram_index(index_name: str, column_name: str, **kwargs) -> None:
+    op.create_index(
+        index_name,
+        "patients",
+        [column_name],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={column_name: "gin_trgm_ops"},
+        **kwargs,
+    )
+
+
+def upgrade() -> None:
+    for old_name, new_name, table_name, _old_columns, new_columns in (
+        BTREE_INDEXES
+    ):
+        op.drop_index(old_name, table_name=table_name)
+        op.create_index(
+            new_name,
+            table_name,
+            new_columns,
+            unique=False,
+            postgresql_where=NOT_DELETED,
+        )
+
+    for index_name, column_name in PATIENT_TRIGRAM_INDEXES:
+        op.drop_index(index_name, table_name="patients")
+        _create_trigram_index(
+            index_name,
+            column_name,
+            postgresql_where=NOT_DELETED,
+        )
+
+
+def downgrade() -> None:
+    for index_name, column_name in reversed(PATIENT_TRIGRAM_INDEXES):
+        op.drop_index(index_name, table_name="patients")
+        _create_trigram_index(index_name, column_name)
+
+    for old_name, new_name, table_name, old_columns, _new_columns in reversed(
+        BTREE_INDEXES
+    ):
+        op.drop_index(new_name, table_name=table_name)
+        op.create_index(old_name, table_name, old_columns, unique=False)
@@ -0,0 +1,160 @@
+"""partition audit events by month
+
+Revision ID: b7d1f4a9c2e3
+Revises: c5e2a8f1d3b6
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from datetime import datetime, timezone
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d1f4a9c2e3"
+down_revision: Union[str, Sequence[str], None] = "c5e2a8f1d3b6"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Partitions created beyond the current month. Later months are created by
+# the audit_partitions maintenance command.
+MONTHS_AHEAD = 3
+
+AUDIT_EVENT_COLUMNS = (
+    "id",
+    "recorded_at",
+    "agent",
+    "action",
+    "entity_resource_type",
+    "entity_id",
+    "created_at",
+)
+
+AUDIT_ACTION_CHECK_SQL = "action IN ('read', 'search', 'export')"
+
+AUDIT_ENTITY_RESOURCE_TYPE_CHECK_SQL = (
+    "entity_resource_type IN ('Condition', 'Encounter', 'Observation', 'Patient')"
+)
+
+
+def _create_audit_events_table(
+    table_name: str,
+    primary_key: tuple[str, ...],
+    **kwargs,
+) -> None:
+    op.create_table(
+        table_name,
+        sa.Column("id", sa.String(), nullable=False),
+        sa.Column(
+            "recorded_at",
+            sa.DateTime(timezone=True),
+            nullable=False,
+        ),
+        sa.Column("agent", sa.String(), nullable=False),
+        sa.Column("action", sa.String(), nullable=False),
+        sa.Column("entity_resource_type", sa.String(), nullable=False),
+        sa.Column("entity_id", sa.String(), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=False,
+        ),
+        sa.CheckConstraint(
+            AUDIT_ACTION_CHECK_SQL,
+            name="ck_audit_events_action_allowed",
+        ),
+        sa.CheckConstraint(
+            AUDIT_ENTITY_RESOURCE_TYPE_CHECK_SQL,
+            name="ck_audit_events_entity_resource_type_allowed",
+        ),
+        sa.CheckConstraint(
+            "btrim(agent) <> ''",
+            name="ck_audit_events_agent_not_empty",
+        ),
+        sa.PrimaryKeyConstraint(*primary_key, name=f"{table_name}_pkey"),
+        **kwargs,
+    )
+
+
+def _month_start(instant: datetime, months: int = 0) -> datetime:
+    month_index = instant.year * 12 + instant.month - 1 + months
+
+    return datetime(month_index // 12, month_index % 12 + 1, 1, tzinfo=timezone.utc)
+
+
+def _copy_rows(source: str, target: str) -> None:
+    columns = ", ".join(AUDIT_EVENT_COLUMNS)
+
+    op.execute(f"INSERT INTO {target} ({columns}) SELECT {columns} FROM {source}")
+
+
+def upgrade() -> None:
+    op.drop_index("ix_audit_events_recorded_at", table_name="audit_events")
+    op.rename_table("audit_events", "audit_events_unpartitioned")
+    op.execute(
+        "ALTER INDEX audit_events_pkey RENAME TO audit_events_unpartitioned_pkey"
+    )
+
+    _create_audit_events_table(
+        "audit_events",
+        ("id", "recorded_at"),
+        postgresql_partition_by="RANGE (recorded_at)",
+    )
+    op.create_index(
+        "ix_audit_events_recorded_at_id",
+        "audit_events",
+        [sa.text("recorded_at DESC"), "id"],
+        unique=False,
+    )
+
+    # Offline (--sql) runs cannot look at existing rows; older rows then
+    # land in the default partition.
+    now = datetime.now(timezone.utc)
+    oldest = None
+
+    if not context.is_offline_mode():
+        oldest = op.get_bind().scalar(
+            sa.text("SELECT min(recorded_at) FROM audit_events_unpartitioned")
+        )
+
+    month = _month_start(min(oldest, now) if oldest is not None else now)
+    last_month = _month_start(now, MONTHS_AHEAD)
+
+    while month <= last_month:
+        next_month = _month_start(month, 1)
+        op.execute(
+            f"CREATE TABLE audit_events_y{month.year:04d}m{month.month:02d} "
+            "PARTITION OF audit_events "
+            f"FOR VALUES FROM ('{month.isoformat()}') "
+            f"TO ('{next_month.isoformat()}')"
+        )
+        month = next_month
+
+    op.execute("CREATE TABLE audit_events_default PARTITION OF audit_events DEFAULT")
+
+    _copy_rows("audit_events_unpartitioned", "audit_events")
+    op.drop_table("audit_events_unpartitioned")
+
+
+def downgrade() -> None:
+    # Partitions detached by the maintenance command are not part of the
+    # partitioned table any more and are left in place, unmerged.
+    op.rename_table("audit_events", "audit_events_partitioned")
+    op.execute(
+        "ALTER INDEX audit_events_pkey RENAME TO audit_events_partitioned_pkey"
+    )
+
+    _create_audit_events_table("audit_events", ("id",))
+    op.create_index(
+        "ix_audit_events_recorded_at",
+        "audit_events",
+        ["recorded_at"],
+        unique=False,
+    )
+
+    _copy_rows("audit_events_partitioned", "audit_events")
+    op.drop_table("audit_events_partitioned")
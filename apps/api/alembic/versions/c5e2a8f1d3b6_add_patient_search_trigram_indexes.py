@@ -0,0 +1,49 @@
+"""add patient search trigram indexes
+
+Revision ID: c5e2a8f1d3b6
+Revises: a6f3c9d2e1b8
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c5e2a8f1d3b6"
+down_revision: Union[str, Sequence[str], None] = "a6f3c9d2e1b8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+TRIGRAM_INDEXES = (
+    ("ix_patients_id_trgm", "patients", "id"),
+    ("ix_patients_name_text_trgm", "patients", "name_text"),
+    ("ix_patients_name_family_trgm", "patients", "name_family"),
+    ("ix_patient_identifiers_system_trgm", "patient_identifiers", "system"),
+    ("ix_patient_identifiers_value_trgm", "patient_identifiers", "value"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for index_name, table_name, column_name in TRIGRAM_INDEXES:
+        op.create_index(
+            index_name,
+            table_name,
+            [column_name],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column_name: "gin_trgm_ops"},
+        )
+
+
+def downgrade() -> None:
+    # The pg_trgm extension is left installed: other objects may depend on it.
+    for index_name, table_name, _column_name in reversed(TRIGRAM_INDEXES):
+        op.drop_index(
+            index_name,
+            table_name=table_name,
+        )
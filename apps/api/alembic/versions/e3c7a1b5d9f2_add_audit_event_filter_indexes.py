@@ -0,0 +1,45 @@
+"""add audit event filter indexes
+
+Revision ID: e3c7a1b5d9f2
+Revises: b7d1f4a9c2e3
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e3c7a1b5d9f2"
+down_revision: Union[str, Sequence[str], None] = "b7d1f4a9c2e3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Each index ends with the page order (recorded_at DESC, id), so a filtered
+# page is one index range scan per partition.
+FILTER_INDEXES = (
+    ("ix_audit_events_agent_recorded_at_id", ("agent",)),
+    ("ix_audit_events_action_recorded_at_id", ("action",)),
+    (
+        "ix_audit_events_entity_recorded_at_id",
+        ("entity_resource_type", "entity_id"),
+    ),
+)
+
+
+def upgrade() -> None:
+    for index_name, leading_columns in FILTER_INDEXES:
+        op.create_index(
+            index_name,
+            "audit_events",
+            [*leading_columns, sa.text("recorded_at DESC"), "id"],
+            unique=False,
+        )
+
+
+def downgrade() -> None:
+    for index_name, _leading_columns in reversed(FILTER_INDEXES):
+        op.drop_index(index_name, table_name="audit_events")
@@ -0,0 +1,48 @@
+"""add observation covering index
+
+Revision ID: f8b2d6a4c1e7
+Revises: e3c7a1b5d9f2
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "f8b2d6a4c1e7"
+down_revision: Union[str, Sequence[str], None] = "e3c7a1b5d9f2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The new index starts with the same two columns, so it replaces
+    # ix_observations_patient_code for every read of undeleted rows.
+    op.create_index(
+        "ix_observations_patient_code_effective_at",
+        "observations",
+        ["patient_id", "code_id", "effective_at", "id"],
+        unique=False,
+        postgresql_include=["status", "value_quantity", "value_unit"],
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.drop_index(
+        "ix_observations_patient_code",
+        table_name="observations",
+    )
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_observations_patient_code",
+        "observations",
+        ["patient_id", "code_id"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_observations_patient_code_effective_at",
+        table_name="observations",
+    )
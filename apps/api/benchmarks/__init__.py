@@ -0,0 +1 @@
+"""Performance benchmarks for the FHIR Mini-Gateway API backend."""
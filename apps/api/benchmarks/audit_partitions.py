@@ -0,0 +1,134 @@
+"""Measure `list_recent` on a large, monthly partitioned audit_events table.
+
+Run from `apps/api` against an empty, disposable PostgreSQL database:
+
+    FHIR_GATEWAY_BENCHMARK_DATABASE_URL=postgresql+psycopg://... \
+        PYTHONPATH=src python -m benchmarks.audit_partitions --rows 100000000
+
+The rows are generated server side with `generate_series`, spread evenly
+over the last `--months` months, one monthly partition each. The benchmark
+then times `SqlAlchemyAuditEventReader.list_recent` with its default recent
+window, which PostgreSQL prunes to the newest partitions, and with a window
+covering the whole table, which has to merge every partition's index.
+SQLite has no table partitioning, so this benchmark requires PostgreSQL.
+"""
+
+import argparse
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Engine, text
+
+from benchmarks.support import (
+    BENCHMARK_DATABASE_URL_VARIABLE,
+    benchmark_engine,
+    measure,
+    print_results,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    SqlAlchemyAuditEventReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.audit_partitions import (
+    monthly_partitions,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    create_session_factory,
+)
+
+_INSERT_AUDIT_EVENTS = text(
+    """
+    INSERT INTO audit_events (
+        id, recorded_at, agent, action, entity_resource_type, entity_id
+    )
+    SELECT
+        'audit-' || n,
+        :oldest + (n * :step_seconds) * interval '1 second',
+        'user-' || (n % 500),
+        (ARRAY['read', 'search', 'export'])[n % 3 + 1],
+        'Patient',
+        'pat-' || (n % 100000)
+    FROM generate_series(CAST(:first AS bigint), CAST(:last AS bigint)) AS n
+    """
+)
+
+
+def _seed_audit_events(
+    engine: Engine,
+    *,
+    rows: int,
+    months: int,
+    now: datetime,
+    batch_size: int,
+) -> None:
+    oldest = now - timedelta(days=30 * months)
+    step_seconds = (now - oldest).total_seconds() / rows
+
+    with engine.begin() as connection:
+        for partition in monthly_partitions(oldest, now):
+            connection.execute(text(partition.create_sql()))
+
+    for first in range(0, rows, batch_size):
+        with engine.begin() as connection:
+            connection.execute(
+                _INSERT_AUDIT_EVENTS,
+                {
+                    "oldest": oldest,
+                    "step_seconds": step_seconds,
+                    "first": first,
+                    "last": min(first + batch_size, rows) - 1,
+                },
+            )
+
+    with engine.begin() as connection:
+        connection.execute(text("ANALYZE audit_events"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000_000)
+    parser.add_argument("--months", type=int, default=24)
+    parser.add_argument("--batch-size", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--iterations", type=int, default=500)
+    arguments = parser.parse_args()
+
+    if not os.environ.get(BENCHMARK_DATABASE_URL_VARIABLE):
+        sys.exit(f"Set {BENCHMARK_DATABASE_URL_VARIABLE} to a PostgreSQL database.")
+
+    now = datetime.now(timezone.utc)
+    readers = {
+        "list_recent: recent window": {},
+        "list_recent: whole table": {"recent_window": timedelta(days=36500)},
+    }
+
+    with benchmark_engine() as engine:
+        _seed_audit_events(
+            engine,
+            rows=arguments.rows,
+            months=arguments.months,
+            now=now,
+            batch_size=arguments.batch_size,
+        )
+        session_factory = create_session_factory(engine)
+
+        def list_recent(reader_options):
+            def call(_iteration: int) -> None:
+                with session_factory() as session:
+                    SqlAlchemyAuditEventReader(
+                        session,
+                        **reader_options,
+                    ).list_recent(arguments.limit)
+
+            return call
+
+        results = [
+            measure(name, engine, list_recent(options), arguments.iterations)
+            for name, options in readers.items()
+        ]
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
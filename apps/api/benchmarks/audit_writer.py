@@ -0,0 +1,127 @@
+"""Compare per-request AuditEvent inserts with the batching audit writer.
+
+Run from `apps/api`:
+
+    PYTHONPATH=src python -m benchmarks.audit_writer --events 20000
+
+The per-request mode writes every event in its own session and transaction,
+which is what recording audit events inline in each request costs. The
+batched mode hands the same events to a `BatchingAuditEventWriter` and
+closes it, so the elapsed time includes draining the queue. Both modes
+report events written per second and the median time the caller spent
+recording one event. Point `FHIR_GATEWAY_BENCHMARK_DATABASE_URL` at a
+PostgreSQL database to exercise the COPY path.
+"""
+
+import argparse
+import statistics
+import time
+from collections.abc import Callable
+from datetime import timedelta
+
+from sqlalchemy import Engine, delete
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.support import BASE_INSTANT, benchmark_engine
+from fhir_gateway.domain.entities.audit_event import AuditAction, AuditEvent
+from fhir_gateway.domain.value_objects.instant import Instant
+from fhir_gateway.domain.value_objects.reference import Reference
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.audit import BatchingAuditEventWriter
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    SqlAlchemyAuditEventBatchWriter,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models import (
+    AuditEventRecord,
+)
+
+
+def _audit_events(count: int) -> list[AuditEvent]:
+    return [
+        AuditEvent(
+            id=ResourceId(f"audit-{index:08d}"),
+            recorded=Instant(BASE_INSTANT + timedelta(milliseconds=index)),
+            agent=f"user-{index % 50:03d}",
+            action=AuditAction.READ,
+            entity=Reference(
+                resource_type="Patient",
+                id=ResourceId(f"pat-{index % 1000:05d}"),
+            ),
+        )
+        for index in range(count)
+    ]
+
+
+def _run(
+    engine: Engine,
+    events: list[AuditEvent],
+    record: Callable[[AuditEvent], None],
+    finish: Callable[[], None],
+) -> tuple[float, float]:
+    with engine.begin() as connection:
+        connection.execute(delete(AuditEventRecord))
+
+    record_ms = []
+    started_at = time.perf_counter()
+
+    for event in events:
+        recorded_at = time.perf_counter()
+        record(event)
+        record_ms.append((time.perf_counter() - recorded_at) * 1000)
+
+    finish()
+
+    return time.perf_counter() - started_at, statistics.median(record_ms)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=20_000)
+    parser.add_argument("--queue-size", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--flush-interval", type=float, default=0.5)
+    arguments = parser.parse_args()
+
+    events = _audit_events(arguments.events)
+    timings = {}
+
+    with benchmark_engine() as engine:
+        sink = SqlAlchemyAuditEventBatchWriter(
+            sessionmaker(bind=engine, expire_on_commit=False)
+        )
+
+        timings["per-request"] = _run(
+            engine,
+            events,
+            lambda event: sink.write_batch([event]),
+            lambda: None,
+        )
+
+        writer = BatchingAuditEventWriter(
+            sink,
+            max_queue_size=arguments.queue_size,
+            batch_size=arguments.batch_size,
+            flush_interval_seconds=arguments.flush_interval,
+        )
+        timings["batched"] = _run(engine, events, writer.record, writer.close)
+
+    print(
+        f"{'mode':<12} {'events':>8} {'seconds':>9} {'events/s':>11} "
+        f"{'record p50 ms':>14}"
+    )
+
+    for name, (seconds, record_median_ms) in timings.items():
+        print(
+            f"{name:<12} {arguments.events:>8} {seconds:>9.3f} "
+            f"{arguments.events / seconds:>11,.0f} {record_median_ms:>14.4f}"
+        )
+
+    print()
+    print(
+        "batched speedup: "
+        f"{timings['per-request'][0] / timings['batched'][0]:.2f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
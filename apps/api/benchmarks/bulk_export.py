@@ -0,0 +1,90 @@
+"""Compare bulk export throughput with inline and process-pool encoding.
+
+Run from `apps/api`:
+
+    PYTHONPATH=src python -m benchmarks.bulk_export --patients 2000 --workers 1 2 4
+
+The same synthetic charts are exported once with batches encoded inline on
+the calling thread, then once per process pool size. Every run scans all
+four resource tables with `BulkExportRunner` and writes NDJSON files to a
+temporary directory. Throughput is the job's own `resources_per_second`.
+"""
+
+import argparse
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+
+from benchmarks.support import benchmark_engine, seed_patient_charts
+from fhir_gateway.application.models.bulk_export import (
+    BULK_EXPORT_RESOURCE_TYPES,
+    BulkExportJob,
+    BulkExportStatus,
+)
+from fhir_gateway.infrastructure.bulk_export import BulkExportRunner
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    create_session_factory,
+)
+
+
+def _run_export(
+    runner: BulkExportRunner,
+    job_id: str,
+    *,
+    gzip: bool,
+) -> BulkExportJob:
+    now = datetime.now(timezone.utc)
+
+    return runner.run(
+        BulkExportJob(
+            id=job_id,
+            status=BulkExportStatus.IN_PROGRESS,
+            resource_types=BULK_EXPORT_RESOURCE_TYPES,
+            requested_at=now,
+            gzip=gzip,
+            started_at=now,
+        )
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--patients", type=int, default=2_000)
+    parser.add_argument("--observations", type=int, default=50)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--gzip", action="store_true")
+    arguments = parser.parse_args()
+
+    print(f"{'mode':<10} {'resources':>10} {'seconds':>9} {'resources/s':>12}")
+
+    with benchmark_engine() as engine, tempfile.TemporaryDirectory() as directory:
+        seed_patient_charts(
+            engine,
+            patients=arguments.patients,
+            observations_per_patient=arguments.observations,
+        )
+        session_factory = create_session_factory(engine)
+
+        for max_workers in (None, *arguments.workers):
+            runner = BulkExportRunner(
+                session_factory,
+                output_directory=Path(directory),
+                batch_size=arguments.batch_size,
+                max_workers=max_workers,
+            )
+            mode = "inline" if max_workers is None else f"{max_workers} procs"
+
+            try:
+                job = _run_export(runner, mode.replace(" ", "-"), gzip=arguments.gzip)
+            finally:
+                runner.shutdown()
+
+            print(
+                f"{mode:<10} {job.resource_count:>10} "
+                f"{job.elapsed_seconds:>9.2f} {job.resources_per_second:>12.0f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,334 @@
+"""Measure FHIR bulk ingestion throughput in resources per second.
+
+Run from `apps/api`:
+
+    PYTHONPATH=src python -m benchmarks.bulk_load --patients 2000
+    PYTHONPATH=src python -m benchmarks.bulk_load --ndjson Patient.ndjson \\
+        Observation.ndjson
+
+Without `--ndjson` the synthetic population of `benchmarks.synthetic` is
+written as one NDJSON file per resource type, which is what a FHIR bulk
+export produces, and those files are ingested. Files are ingested in the
+order given, so patients must come first. The timing covers parsing,
+decoding through the domain entities and writing.
+
+The ORM baseline loads a smaller synthetic population of
+`--baseline-patients` patients by adding resources one at a time to a
+single session and looking up each code on the way, which is what loading
+demo data through the ORM costs. It is skipped with `--ndjson`. Point
+`FHIR_GATEWAY_BENCHMARK_DATABASE_URL` at a PostgreSQL database to exercise
+the COPY path.
+"""
+
+import argparse
+import json
+import tempfile
+import time
+from collections.abc import Iterator
+from datetime import datetime
+from pathlib import Path
+
+from sqlalchemy import Engine, delete, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from benchmarks.support import benchmark_engine
+from benchmarks.synthetic import (
+    CONDITION_CODE_IDS,
+    CONDITION_CODES,
+    OBSERVATION_CODE_IDS,
+    OBSERVATION_PROFILES,
+    SyntheticPopulation,
+)
+from fhir_gateway.domain.entities.condition import Condition
+from fhir_gateway.domain.entities.encounter import Encounter
+from fhir_gateway.domain.entities.observation import Observation
+from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.infrastructure.ingestion import BulkIngestion, iter_fhir_file
+from fhir_gateway.infrastructure.persistence.sqlalchemy import models
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    SqlAlchemyResourceBulkWriter,
+)
+from fhir_gateway.infrastructure.serialization import resource_from_fhir
+
+RESOURCE_TYPES = ("Patient", "Condition", "Encounter", "Observation")
+
+CONDITION_CODINGS = {
+    CONDITION_CODE_IDS[code]: {
+        "system": "http://snomed.info/sct",
+        "code": code,
+        "display": display,
+    }
+    for code, display, _prevalence in CONDITION_CODES
+}
+OBSERVATION_CODINGS = {
+    OBSERVATION_CODE_IDS[profile.code]: {
+        "system": "http://loinc.org",
+        "code": profile.code,
+        "display": profile.display,
+    }
+    for profile in OBSERVATION_PROFILES
+}
+
+# Children before parents, so a rerun can clear the schema.
+TABLES = (
+    models.ObservationRecord,
+    models.EncounterRecord,
+    models.ConditionRecord,
+    models.PatientIdentifierRecord,
+    models.PatientRecord,
+    models.ObservationCodeRecord,
+    models.ConditionCodeRecord,
+)
+
+
+def write_population_ndjson(
+    population: SyntheticPopulation,
+    directory: Path,
+) -> list[Path]:
+    """Write `population` as `<resourceType>.ndjson` files, patients first."""
+    paths = [directory / f"{resource_type}.ndjson" for resource_type in RESOURCE_TYPES]
+    files = [path.open("w", encoding="utf-8") for path in paths]
+
+    try:
+        for batch in population.batches(1_000):
+            rows = batch.rows
+            identifiers: dict[str, list[dict]] = {}
+
+            for row in rows[models.PatientIdentifierRecord]:
+                identifiers.setdefault(row["patient_id"], []).append(
+                    {"system": row["system"], "value": row["value"]}
+                )
+
+            for file, resources in zip(
+                files,
+                (
+                    (
+                        _patient(row, identifiers[row["id"]])
+                        for row in rows[models.PatientRecord]
+                    ),
+                    map(_condition, rows[models.ConditionRecord]),
+                    map(_encounter, rows[models.EncounterRecord]),
+                    map(_observation, rows[models.ObservationRecord]),
+                ),
+                strict=True,
+            ):
+                for resource in resources:
+                    file.write(json.dumps(resource, separators=(",", ":")))
+                    file.write("\n")
+    finally:
+        for file in files:
+            file.close()
+
+    return paths
+
+
+def _patient(row: dict, identifiers: list[dict]) -> dict:
+    return {
+        "resourceType": "Patient",
+        "id": row["id"],
+        "identifier": identifiers,
+        "name": [
+            {
+                "text": row["name_text"],
+                "family": row["name_family"],
+                "given": row["name_given"],
+            }
+        ],
+    }
+
+
+def _condition(row: dict) -> dict:
+    return {
+        "resourceType": "Condition",
+        "id": row["id"],
+        "code": {"coding": [CONDITION_CODINGS[row["code_id"]]]},
+        "subject": {"reference": f"Patient/{row['patient_id']}"},
+        "recordedDate": _instant(row["recorded_at"]),
+    }
+
+
+def _encounter(row: dict) -> dict:
+    return {
+        "resourceType": "Encounter",
+        "id": row["id"],
+        "subject": {"reference": f"Patient/{row['patient_id']}"},
+        "period": {
+            "start": _instant(row["period_start_at"]),
+            "end": _instant(row["period_end_at"]),
+        },
+    }
+
+
+def _observation(row: dict) -> dict:
+    return {
+        "resourceType": "Observation",
+        "id": row["id"],
+        "status": row["status"],
+        "code": {"coding": [OBSERVATION_CODINGS[row["code_id"]]]},
+        "subject": {"reference": f"Patient/{row['patient_id']}"},
+        "effectiveDateTime": _instant(row["effective_at"]),
+        "valueQuantity": {"value": row["value_quantity"], "unit": row["value_unit"]},
+    }
+
+
+def _instant(value: datetime) -> str:
+    return value.isoformat()
+
+
+def _resources(paths: list[Path]) -> Iterator[dict]:
+    for path in paths:
+        yield from iter_fhir_file(path)
+
+
+def _clear(engine: Engine) -> None:
+    with engine.begin() as connection:
+        for record_type in TABLES:
+            connection.execute(delete(record_type))
+
+
+def _orm_row_by_row(engine: Engine, paths: list[Path]) -> tuple[int, float]:
+    resources = [resource_from_fhir(resource) for resource in _resources(paths)]
+    started_at = time.perf_counter()
+
+    with Session(engine) as session, session.begin():
+        for resource in resources:
+            session.add(_orm_record(session, resource))
+            session.flush()
+
+    return len(resources), time.perf_counter() - started_at
+
+
+def _orm_record(session: Session, resource):
+    if isinstance(resource, Patient):
+        name = resource.name
+
+        return models.PatientRecord(
+            id=resource.id.value,
+            name_text=name.text if name else None,
+            name_family=name.family if name else None,
+            name_given=list(name.given) if name else None,
+            identifiers=[
+                models.PatientIdentifierRecord(
+                    system=identifier.system,
+                    value=identifier.value,
+                )
+                for identifier in resource.identifiers
+            ],
+        )
+
+    if isinstance(resource, Condition):
+        return models.ConditionRecord(
+            id=resource.id.value,
+            patient_id=resource.subject.id.value,
+            code_id=_orm_code_id(session, models.ConditionCodeRecord, resource.code),
+            recorded_at=(
+                resource.recorded_date.value if resource.recorded_date else None
+            ),
+        )
+
+    if isinstance(resource, Encounter):
+        return models.EncounterRecord(
+            id=resource.id.value,
+            patient_id=resource.subject.id.value,
+            period_start_at=resource.period.start.value,
+            period_end_at=(
+                resource.period.end.value if resource.period.end else None
+            ),
+        )
+
+    assert isinstance(resource, Observation)
+
+    return models.ObservationRecord(
+        id=resource.id.value,
+        patient_id=resource.subject.id.value,
+        status=resource.status.value,
+        code_id=_orm_code_id(session, models.ObservationCodeRecord, resource.code),
+        effective_at=resource.effective.value,
+        value_quantity=resource.value.value,
+        value_unit=resource.value.unit,
+    )
+
+
+def _orm_code_id(session: Session, record_type, code: Code) -> int:
+    record = session.scalar(
+        select(record_type).where(
+            record_type.system == code.system,
+            record_type.code == code.code,
+        )
+    )
+
+    if record is None:
+        record = record_type(system=code.system, code=code.code, display=code.display)
+        session.add(record)
+        session.flush()
+
+    return record.id
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--patients", type=int, default=2_000)
+    parser.add_argument("--batch-size", type=int, default=20_000)
+    parser.add_argument("--baseline-patients", type=int, default=100)
+    parser.add_argument(
+        "--ndjson",
+        type=Path,
+        nargs="+",
+        help="FHIR NDJSON or JSON Bundle files to ingest instead of synthetic data",
+    )
+    arguments = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory, benchmark_engine() as engine:
+        if arguments.ndjson:
+            paths = arguments.ndjson
+        else:
+            written_at = time.perf_counter()
+            paths = write_population_ndjson(
+                SyntheticPopulation(patients=arguments.patients),
+                Path(directory),
+            )
+            print(
+                f"wrote {arguments.patients} synthetic patients as NDJSON "
+                f"in {time.perf_counter() - written_at:.1f}s"
+            )
+
+        report = BulkIngestion(
+            SqlAlchemyResourceBulkWriter(
+                sessionmaker(bind=engine, expire_on_commit=False)
+            ),
+            batch_size=arguments.batch_size,
+        ).ingest(_resources(paths))
+
+        print()
+        print(f"{'resource type':<14} {'resources':>10}")
+
+        for resource_type, count in sorted(report.resources_by_type.items()):
+            print(f"{resource_type:<14} {count:>10}")
+
+        print()
+        print(
+            f"bulk ingestion: {report.resources} resources in {report.batches} "
+            f"batches, {report.seconds:.2f}s, "
+            f"{report.resources_per_second:,.0f} resources/s"
+        )
+
+        if arguments.baseline_patients and not arguments.ndjson:
+            _clear(engine)
+            baseline_directory = Path(directory) / "baseline"
+            baseline_directory.mkdir()
+            resources, seconds = _orm_row_by_row(
+                engine,
+                write_population_ndjson(
+                    SyntheticPopulation(patients=arguments.baseline_patients),
+                    baseline_directory,
+                ),
+            )
+            print(
+                f"ORM row by row: {resources} resources, {seconds:.2f}s, "
+                f"{resources / seconds:,.0f} resources/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
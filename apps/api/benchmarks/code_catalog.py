@@ -0,0 +1,105 @@
+"""Compare joined and code-catalog observation and condition reads.
+
+Run from `apps/api`:
+
+    PYTHONPATH=src python -m benchmarks.code_catalog --patients 200
+
+The joined paths are the plain `SqlAlchemyObservationReader` and
+`SqlAlchemyConditionReader`, which JOIN the code tables on every query. The
+catalog paths give the same readers a shared `CodeCatalog`, so after the
+first few calls they select resource rows only and map every row onto an
+interned `Code`. Calls cycle through the seeded patients with one session
+per call, like the request-scoped HTTP session.
+"""
+
+import argparse
+
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.support import (
+    benchmark_engine,
+    measure,
+    print_results,
+    seed_patient_charts,
+)
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    SqlAlchemyConditionReader,
+    SqlAlchemyObservationReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.code_catalog import (
+    CodeCatalog,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    create_session_factory,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models import (
+    ConditionCodeRecord,
+    ObservationCodeRecord,
+)
+
+
+def _catalog(record_type) -> CodeCatalog:
+    return CodeCatalog(record_type, max_entries=10000, refresh_interval_seconds=60)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--patients", type=int, default=200)
+    parser.add_argument("--observations", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=2000)
+    arguments = parser.parse_args()
+
+    observation_catalog = _catalog(ObservationCodeRecord)
+    condition_catalog = _catalog(ConditionCodeRecord)
+
+    readers = {
+        "observations: joined": lambda session: SqlAlchemyObservationReader(
+            session
+        ),
+        "observations: code catalog": lambda session: SqlAlchemyObservationReader(
+            session,
+            observation_catalog,
+        ),
+        "conditions: joined": lambda session: SqlAlchemyConditionReader(session),
+        "conditions: code catalog": lambda session: SqlAlchemyConditionReader(
+            session,
+            condition_catalog,
+        ),
+    }
+
+    with benchmark_engine() as engine:
+        patient_ids = seed_patient_charts(
+            engine,
+            patients=arguments.patients,
+            observations_per_patient=arguments.observations,
+        )
+        session_factory: sessionmaker = create_session_factory(engine)
+
+        def list_by_patient(build_reader):
+            def call(iteration: int) -> None:
+                patient_id = ResourceId(patient_ids[iteration % len(patient_ids)])
+
+                with session_factory() as session:
+                    build_reader(session).list_by_patient(patient_id)
+
+            return call
+
+        results = [
+            measure(name, engine, list_by_patient(build_reader), arguments.iterations)
+            for name, build_reader in readers.items()
+        ]
+
+    print_results(results)
+    print()
+
+    for catalog in (observation_catalog, condition_catalog):
+        stats = catalog.stats()
+        print(
+            f"{stats.backend}: {stats.entries} codes, {stats.hits} hits, "
+            f"{stats.misses} misses"
+        )
+
+
+if __name__ == "__main__":
+    main()
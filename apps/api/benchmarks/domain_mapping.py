@@ -0,0 +1,100 @@
+"""Compare validated and trusted ORM-to-domain mapping throughput.
+
+Run from `apps/api`:
+
+    PYTHONPATH=src python -m benchmarks.domain_mapping --observations 100000
+
+The benchmark builds transient `ObservationRecord`s in memory, so no
+database is involved, and maps all of them with
+`observation_record_to_domain` twice: once with full domain validation,
+which runs every value object's `__post_init__`, and once through the
+trusted `_from_trusted` constructors used by default. Each mode keeps its
+fastest of `--repeats` runs and reports observations mapped per second.
+"""
+
+import argparse
+import time
+from datetime import timedelta
+
+from benchmarks.support import BASE_INSTANT
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers import trusted
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.observation import (
+    observation_record_to_domain,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models import (
+    ObservationCodeRecord,
+    ObservationRecord,
+)
+
+
+def _observation_records(
+    count: int,
+) -> list[tuple[ObservationRecord, ObservationCodeRecord]]:
+    code_record = ObservationCodeRecord(
+        id=1,
+        system="http://loinc.org",
+        code="4548-4",
+        display="Hemoglobin A1c/Hemoglobin.total in Blood",
+    )
+
+    return [
+        (
+            ObservationRecord(
+                id=f"obs-{index:07d}",
+                patient_id=f"pat-{index % 1000:05d}",
+                status="final",
+                code_id=1,
+                effective_at=BASE_INSTANT + timedelta(minutes=index),
+                value_quantity=5.0 + index % 40 / 10,
+                value_unit="%",
+            ),
+            code_record,
+        )
+        for index in range(count)
+    ]
+
+
+def _best_seconds(records, repeats: int) -> float:
+    best = float("inf")
+
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+
+        for observation_record, code_record in records:
+            observation_record_to_domain(observation_record, code_record)
+
+        best = min(best, time.perf_counter() - started_at)
+
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--observations", type=int, default=100_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    arguments = parser.parse_args()
+
+    records = _observation_records(arguments.observations)
+    timings = {}
+
+    try:
+        for name, full_validation in (("validated", True), ("trusted", False)):
+            trusted.set_full_validation(full_validation)
+            timings[name] = _best_seconds(records, arguments.repeats)
+    finally:
+        trusted.set_full_validation(False)
+
+    print(f"{'mode':<10} {'observations':>12} {'seconds':>9} {'obs/s':>11}")
+
+    for name, seconds in timings.items():
+        print(
+            f"{name:<10} {arguments.observations:>12} {seconds:>9.3f} "
+            f"{arguments.observations / seconds:>11,.0f}"
+        )
+
+    print()
+    print(f"trusted speedup: {timings['validated'] / timings['trusted']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
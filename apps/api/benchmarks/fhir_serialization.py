@@ -0,0 +1,317 @@
+"""Compare FHIR JSON response encoders on a large patient summary.
+
+Run from `apps/api`:
+
+    PYTHONPATH=src python -m benchmarks.fhir_serialization --observations 5000
+
+The summary holds one patient, a few conditions and encounters and
+`--observations` observations, all built in memory; no database is
+involved. It is encoded three ways:
+
+- `pydantic`: Pydantic response models built from the domain objects,
+  then `model_dump(exclude_none=True)` and `json.dumps`, the usual FastAPI
+  response path.
+- `dicts`: `resource_to_fhir` dictionaries and `json.dumps`.
+- `fhir_bytes`: `encode_fhir`, the encoder behind `FhirJsonResponse`.
+
+Each encoder keeps its fastest of `--repeats` runs. The three outputs are
+checked to decode to the same document before anything is timed.
+"""
+
+import argparse
+import json
+import time
+from datetime import timedelta
+
+from pydantic import BaseModel
+
+from benchmarks.support import BASE_INSTANT
+from fhir_gateway.application.models.patient_summary import PatientSummary
+from fhir_gateway.domain.entities.condition import Condition
+from fhir_gateway.domain.entities.encounter import Encounter
+from fhir_gateway.domain.entities.observation import Observation, ObservationStatus
+from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.human_name import HumanName
+from fhir_gateway.domain.value_objects.identifier import Identifier
+from fhir_gateway.domain.value_objects.instant import Instant
+from fhir_gateway.domain.value_objects.period import Period
+from fhir_gateway.domain.value_objects.quantity import Quantity
+from fhir_gateway.domain.value_objects.reference import Reference
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.serialization import encode_fhir, resource_to_fhir
+
+
+class CodingModel(BaseModel):
+    system: str
+    code: str
+    display: str | None = None
+
+
+class CodeableConceptModel(BaseModel):
+    coding: list[CodingModel]
+
+
+class ReferenceModel(BaseModel):
+    reference: str
+
+
+class IdentifierModel(BaseModel):
+    system: str
+    value: str
+
+
+class HumanNameModel(BaseModel):
+    text: str | None = None
+    family: str | None = None
+    given: list[str] | None = None
+
+
+class PatientModel(BaseModel):
+    resourceType: str = "Patient"
+    id: str
+    identifier: list[IdentifierModel] | None = None
+    name: list[HumanNameModel] | None = None
+
+
+class ConditionModel(BaseModel):
+    resourceType: str = "Condition"
+    id: str
+    code: CodeableConceptModel
+    subject: ReferenceModel
+    recordedDate: str | None = None
+
+
+class PeriodModel(BaseModel):
+    start: str | None = None
+    end: str | None = None
+
+
+class EncounterModel(BaseModel):
+    resourceType: str = "Encounter"
+    id: str
+    subject: ReferenceModel
+    period: PeriodModel
+
+
+class QuantityModel(BaseModel):
+    value: float | int | None = None
+    unit: str | None = None
+
+
+class ObservationModel(BaseModel):
+    resourceType: str = "Observation"
+    id: str
+    status: str
+    code: CodeableConceptModel
+    subject: ReferenceModel
+    effectiveDateTime: str
+    valueQuantity: QuantityModel
+
+
+class BundleEntryModel(BaseModel):
+    resource: PatientModel | ConditionModel | EncounterModel | ObservationModel
+
+
+class BundleModel(BaseModel):
+    resourceType: str = "Bundle"
+    type: str = "collection"
+    entry: list[BundleEntryModel]
+
+
+def _summary(observation_count: int) -> PatientSummary:
+    subject = Reference(resource_type="Patient", id=ResourceId("pat-00001"))
+    glucose = Code(
+        system="http://loinc.org",
+        code="2339-0",
+        display="Glucose [Mass/volume] in Blood",
+    )
+
+    return PatientSummary(
+        patient=Patient(
+            id=ResourceId("pat-00001"),
+            identifiers=(Identifier(system="urn:mrn", value="MRN-00001"),),
+            name=HumanName(given=("Ana", "María"), family="García"),
+        ),
+        conditions=tuple(
+            Condition(
+                id=ResourceId(f"con-{index:05d}"),
+                code=Code(system="http://snomed.info/sct", code="44054006"),
+                subject=subject,
+                recorded_date=Instant(BASE_INSTANT + timedelta(days=index)),
+            )
+            for index in range(10)
+        ),
+        encounters=tuple(
+            Encounter(
+                id=ResourceId(f"enc-{index:05d}"),
+                subject=subject,
+                period=Period(
+                    start=Instant(BASE_INSTANT + timedelta(days=index)),
+                    end=Instant(BASE_INSTANT + timedelta(days=index, hours=2)),
+                ),
+            )
+            for index in range(50)
+        ),
+        observations=tuple(
+            Observation(
+                id=ResourceId(f"obs-{index:07d}"),
+                status=ObservationStatus.FINAL,
+                code=glucose,
+                subject=subject,
+                effective=Instant(BASE_INSTANT + timedelta(minutes=index)),
+                value=Quantity(value=80 + index % 60 / 2, unit="mg/dL"),
+            )
+            for index in range(observation_count)
+        ),
+    )
+
+
+def _code_model(code: Code) -> CodeableConceptModel:
+    return CodeableConceptModel(
+        coding=[CodingModel(system=code.system, code=code.code, display=code.display)]
+    )
+
+
+def _reference_model(reference: Reference) -> ReferenceModel:
+    return ReferenceModel(reference=f"{reference.resource_type}/{reference.id.value}")
+
+
+def _bundle_model(summary: PatientSummary) -> BundleModel:
+    patient = summary.patient
+    entries = [
+        PatientModel(
+            id=patient.id.value,
+            identifier=[
+                IdentifierModel(system=identifier.system, value=identifier.value)
+                for identifier in patient.identifiers
+            ]
+            or None,
+            name=(
+                [
+                    HumanNameModel(
+                        text=patient.name.text,
+                        family=patient.name.family,
+                        given=list(patient.name.given) or None,
+                    )
+                ]
+                if patient.name is not None
+                else None
+            ),
+        )
+    ]
+    entries.extend(
+        ConditionModel(
+            id=condition.id.value,
+            code=_code_model(condition.code),
+            subject=_reference_model(condition.subject),
+            recordedDate=(
+                condition.recorded_date.value.isoformat()
+                if condition.recorded_date is not None
+                else None
+            ),
+        )
+        for condition in summary.conditions
+    )
+    entries.extend(
+        EncounterModel(
+            id=encounter.id.value,
+            subject=_reference_model(encounter.subject),
+            period=PeriodModel(
+                start=encounter.period.start.value.isoformat(),
+                end=encounter.period.end.value.isoformat(),
+            ),
+        )
+        for encounter in summary.encounters
+    )
+    entries.extend(
+        ObservationModel(
+            id=observation.id.value,
+            status=observation.status.value,
+            code=_code_model(observation.code),
+            subject=_reference_model(observation.subject),
+            effectiveDateTime=observation.effective.value.isoformat(),
+            valueQuantity=QuantityModel(
+                value=observation.value.value,
+                unit=observation.value.unit,
+            ),
+        )
+        for observation in summary.observations
+    )
+
+    return BundleModel(entry=[BundleEntryModel(resource=entry) for entry in entries])
+
+
+def _encode_pydantic(summary: PatientSummary) -> bytes:
+    return json.dumps(
+        _bundle_model(summary).model_dump(exclude_none=True),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _encode_dicts(summary: PatientSummary) -> bytes:
+    resources = (
+        summary.patient,
+        *summary.conditions,
+        *summary.encounters,
+        *summary.observations,
+    )
+
+    return json.dumps(
+        {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "entry": [{"resource": resource_to_fhir(item)} for item in resources],
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def _best_seconds(encode, summary: PatientSummary, repeats: int) -> float:
+    best = float("inf")
+
+    for _ in range(repeats):
+        started_at = time.perf_counter()
+        encode(summary)
+        best = min(best, time.perf_counter() - started_at)
+
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--observations", type=int, default=5000)
+    parser.add_argument("--repeats", type=int, default=5)
+    arguments = parser.parse_args()
+
+    summary = _summary(arguments.observations)
+    encoders = {
+        "pydantic": _encode_pydantic,
+        "dicts": _encode_dicts,
+        "fhir_bytes": encode_fhir,
+    }
+    documents = {name: json.loads(encode(summary)) for name, encode in encoders.items()}
+
+    if len({json.dumps(document) for document in documents.values()}) != 1:
+        raise SystemExit("Encoders disagree on the encoded summary.")
+
+    size = len(encode_fhir(summary))
+    timings = {
+        name: _best_seconds(encode, summary, arguments.repeats)
+        for name, encode in encoders.items()
+    }
+
+    print(f"summary: {arguments.observations} observations, {size:,} bytes")
+    print(f"{'encoder':<11} {'ms':>9} {'MB/s':>9} {'vs pydantic':>12}")
+
+    for name, seconds in timings.items():
+        print(
+            f"{name:<11} {seconds * 1000:>9.2f} {size / seconds / 1e6:>9.1f} "
+            f"{timings['pydantic'] / seconds:>11.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Compare bearer token verification with and without the claims cache.
+
+Run from `apps/api`:
+
+    PYTHONPATH=src python -m benchmarks.jwt_verify --tokens 50 --calls 100000
+
+`--tokens` distinct HS256 tokens stand in for the sessions of concurrent
+viewers; every call verifies the next one in turn, so after the first pass
+the cached verifier serves every call from its LRU cache. The uncached
+verifier (`cache_max_entries=0`) runs the full `jwt.decode` each time,
+like the verifier did before the cache. No database is involved.
+"""
+
+import argparse
+import time
+
+import jwt
+
+from fhir_gateway.infrastructure.security import JwtTokenVerifier
+
+SECRET = "benchmark-secret-for-hs256-minimum-32-bytes"
+ISSUER = "fhir-gateway-local"
+AUDIENCE = "fhir-gateway-api"
+
+
+def _tokens(count: int) -> list[str]:
+    now = int(time.time())
+
+    return [
+        jwt.encode(
+            {
+                "iss": ISSUER,
+                "aud": AUDIENCE,
+                "sub": f"clinician-{index:04d}",
+                "exp": now + 3600,
+                "iat": now,
+                "roles": ["clinician"],
+                "name": "Benchmark Clinician",
+            },
+            SECRET,
+            algorithm="HS256",
+        )
+        for index in range(count)
+    ]
+
+
+def _verifies_per_second(
+    verifier: JwtTokenVerifier,
+    tokens: list[str],
+    calls: int,
+) -> float:
+    started_at = time.perf_counter()
+
+    for call in range(calls):
+        verifier.verify(tokens[call % len(tokens)])
+
+    return calls / (time.perf_counter() - started_at)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokens", type=int, default=50)
+    parser.add_argument("--calls", type=int, default=100000)
+    parser.add_argument("--cache-max-entries", type=int, default=1024)
+    arguments = parser.parse_args()
+
+    tokens = _tokens(arguments.tokens)
+    verifiers = {
+        "verify: uncached (full decode)": 0,
+        f"verify: cached ({arguments.cache_max_entries} entries)": (
+            arguments.cache_max_entries
+        ),
+    }
+
+    print(f"{'benchmark':<40} {'calls':>9} {'verify/s':>12} {'us/call':>9}")
+
+    for name, cache_max_entries in verifiers.items():
+        verifier = JwtTokenVerifier(
+            secret=SECRET,
+            issuer=ISSUER,
+            audience=AUDIENCE,
+            algorithm="HS256",
+            cache_max_entries=cache_max_entries,
+        )
+        rate = _verifies_per_second(verifier, tokens, arguments.calls)
+
+        print(
+            f"{name:<40} {arguments.calls:>9} {rate:>12,.0f} {1e6 / rate:>9.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""Compare requests/sec of the sync and async database stacks at a fixed p95.
+
+Run from `apps/api`:
+
+    PYTHONPATH=src python -m benchmarks.load_test --p95-ms 50
+
+Each stack is built with `create_app()` and `FHIR_GATEWAY_DATABASE_STACK`,
+which picks the sync or async patient router, and is driven through the
+real `GET /patients/{patient_id}/summary` route with authentication stubbed
+out. Sync routes run on the FastAPI threadpool and async routes on the event
+loop. Requests are sent in-process through `httpx.ASGITransport`
+by a closed loop of concurrent clients, one concurrency level at a time.
+For each stack the report names the best throughput whose p95 latency stays
+within the target.
+
+Use `FHIR_GATEWAY_BENCHMARK_DATABASE_URL` with a `postgresql+psycopg` URL
+for meaningful numbers: SQLite serialises connections and hides most of the
+difference between the two stacks.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Literal
+
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import Engine
+
+from benchmarks.support import benchmark_engine, seed_patient_charts
+from fhir_gateway.application.security.current_principal import CurrentPrincipal
+from fhir_gateway.infrastructure.config.settings import get_settings
+from fhir_gateway.interfaces.http.app import create_app
+from fhir_gateway.interfaces.http.dependencies.security import (
+    get_current_principal,
+)
+
+DatabaseStack = Literal["sync", "async"]
+
+SUMMARY_PATH = "/patients/{patient_id}/summary"
+
+
+@dataclass(frozen=True, slots=True)
+class LoadLevelResult:
+    stack: DatabaseStack
+    concurrency: int
+    requests: int
+    requests_per_second: float
+    p50_ms: float
+    p95_ms: float
+
+
+def _database_url(engine: Engine, stack: DatabaseStack) -> str:
+    url = engine.url
+
+    if stack == "async" and url.get_backend_name() == "sqlite":
+        url = url.set(drivername="sqlite+aiosqlite")
+
+    return url.render_as_string(hide_password=False)
+
+
+@contextmanager
+def _stack_app(engine: Engine, stack: DatabaseStack) -> Iterator[FastAPI]:
+    overrides = {
+        "FHIR_GATEWAY_DATABASE_URL": _database_url(engine, stack),
+        "FHIR_GATEWAY_DATABASE_STACK": stack,
+        "FHIR_GATEWAY_LOG_LEVEL": "WARNING",
+    }
+    previous = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+    get_settings.cache_clear()
+
+    try:
+        app = create_app()
+        app.dependency_overrides[get_current_principal] = lambda: CurrentPrincipal(
+            subject="benchmark",
+            roles=("clinician",),
+        )
+        yield app
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+        get_settings.cache_clear()
+
+
+async def _run_level(
+    app: FastAPI,
+    stack: DatabaseStack,
+    patient_ids: list[str],
+    *,
+    concurrency: int,
+    duration_seconds: float,
+) -> LoadLevelResult:
+    latencies_ms: list[float] = []
+    deadline = time.perf_counter() + duration_seconds
+
+    transport = httpx.ASGITransport(app=app)
+
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://benchmark",
+    ) as client:
+
+        async def client_loop(client_index: int) -> None:
+            request_index = client_index
+
+            while time.perf_counter() < deadline:
+                patient_id = patient_ids[request_index % len(patient_ids)]
+                request_index += concurrency
+
+                started_at = time.perf_counter()
+                response = await client.get(
+                    SUMMARY_PATH.format(patient_id=patient_id),
+                )
+                latencies_ms.append((time.perf_counter() - started_at) * 1000)
+                response.raise_for_status()
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(client_loop(index) for index in range(concurrency)))
+        elapsed_seconds = time.perf_counter() - started_at
+
+    latencies_ms.sort()
+
+    return LoadLevelResult(
+        stack=stack,
+        concurrency=concurrency,
+        requests=len(latencies_ms),
+        requests_per_second=len(latencies_ms) / elapsed_seconds,
+        p50_ms=statistics.median(latencies_ms),
+        p95_ms=latencies_ms[int(len(latencies_ms) * 0.95) - 1],
+    )
+
+
+async def _run_stack(
+    app: FastAPI,
+    stack: DatabaseStack,
+    patient_ids: list[str],
+    *,
+    concurrency_levels: list[int],
+    duration_seconds: float,
+) -> list[LoadLevelResult]:
+    results = []
+
+    try:
+        for concurrency in concurrency_levels:
+            results.append(
+                await _run_level(
+                    app,
+                    stack,
+                    patient_ids,
+                    concurrency=concurrency,
+                    duration_seconds=duration_seconds,
+                )
+            )
+    finally:
+        if app.state.async_engine is not None:
+            await app.state.async_engine.dispose()
+
+    return results
+
+
+def _print_results(results: list[LoadLevelResult], p95_target_ms: float) -> None:
+    print(
+        f"{'stack':<6} {'clients':>7} {'requests':>9} "
+        f"{'req/s':>9} {'p50 ms':>8} {'p95 ms':>8}"
+    )
+
+    for result in results:
+        print(
+            f"{result.stack:<6} {result.concurrency:>7} {result.requests:>9} "
+            f"{result.requests_per_second:>9.1f} {result.p50_ms:>8.2f} "
+            f"{result.p95_ms:>8.2f}"
+        )
+
+    print()
+    print(f"Best throughput with p95 <= {p95_target_ms:g} ms:")
+
+    for stack in ("sync", "async"):
+        within_target = [
+            result
+            for result in results
+            if result.stack == stack and result.p95_ms <= p95_target_ms
+        ]
+
+        if not within_target:
+            print(f"  {stack:<6} no concurrency level met the target")
+            continue
+
+        best = max(within_target, key=lambda result: result.requests_per_second)
+        print(
+            f"  {stack:<6} {best.requests_per_second:.1f} req/s "
+            f"at {best.concurrency} clients (p95 {best.p95_ms:.2f} ms)"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--patients", type=int, default=200)
+    parser.add_argument("--observations", type=int, default=50)
+    parser.add_argument("--p95-ms", type=float, default=50.0)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        nargs="+",
+        default=[1, 4, 16, 64, 128],
+    )
+    arguments = parser.parse_args()
+
+    results: list[LoadLevelResult] = []
+
+    with benchmark_engine() as engine:
+        patient_ids = seed_patient_charts(
+            engine,
+            patients=arguments.patients,
+            observations_per_patient=arguments.observations,
+        )
+
+        for stack in ("sync", "async"):
+            with _stack_app(engine, stack) as app:
+                results.extend(
+                    asyncio.run(
+                        _run_stack(
+                            app,
+                            stack,
+                            patient_ids,
+                            concurrency_levels=arguments.concurrency,
+                            duration_seconds=arguments.duration,
+                        )
+                    )
+                )
+
+    _print_results(results, arguments.p95_ms)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+"""Compare full observation reads with the columnar, downsampled series.
+
+Run from `apps/api`:
+
+    PYTHONPATH=src python -m benchmarks.observation_series --observations 5000
+
+Every seeded patient has `--observations` HbA1c results. The baseline is
+`ListObservationsByCodeUseCase`, which maps every row to an `Observation`.
+The series paths run `GetObservationSeriesUseCase`, which selects only
+`effective_at`, `value_quantity` and `value_unit`, without and with
+downsampling to `--max-points` points. The JSON size of one response is
+printed after the timings.
+"""
+
+import argparse
+
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.support import (
+    benchmark_engine,
+    measure,
+    print_results,
+    seed_patient_charts,
+)
+from fhir_gateway.application.models.observation_series import SeriesDownsampling
+from fhir_gateway.application.use_cases.get_observation_series import (
+    GetObservationSeriesUseCase,
+)
+from fhir_gateway.application.use_cases.list_observations_by_code import (
+    ListObservationsByCodeUseCase,
+)
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    SqlAlchemyObservationReader,
+    SqlAlchemyPatientReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    create_session_factory,
+)
+from fhir_gateway.interfaces.http.presenters.observation_series import (
+    observation_series_to_response,
+)
+
+HBA1C = Code(system="http://loinc.org", code="4548-4")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--patients", type=int, default=20)
+    parser.add_argument("--observations", type=int, default=5000)
+    parser.add_argument("--max-points", type=int, default=600)
+    parser.add_argument("--iterations", type=int, default=200)
+    arguments = parser.parse_args()
+
+    with benchmark_engine() as engine:
+        patient_ids = seed_patient_charts(
+            engine,
+            patients=arguments.patients,
+            identifiers_per_patient=0,
+            conditions_per_patient=0,
+            encounters_per_patient=0,
+            observations_per_patient=arguments.observations,
+        )
+        session_factory: sessionmaker = create_session_factory(engine)
+
+        def read(execute):
+            def call(iteration: int) -> None:
+                patient_id = ResourceId(patient_ids[iteration % len(patient_ids)])
+
+                with session_factory() as session:
+                    execute(
+                        SqlAlchemyPatientReader(session),
+                        SqlAlchemyObservationReader(session),
+                        patient_id,
+                    )
+
+            return call
+
+        paths = {
+            "observations by code": lambda patients, observations, patient_id: (
+                ListObservationsByCodeUseCase(patients, observations).execute(
+                    patient_id,
+                    HBA1C,
+                )
+            ),
+            "series: all points": lambda patients, observations, patient_id: (
+                GetObservationSeriesUseCase(patients, observations).execute(
+                    patient_id,
+                    HBA1C,
+                )
+            ),
+            **{
+                f"series: {method.value} {arguments.max_points}": (
+                    lambda patients, observations, patient_id, method=method: (
+                        GetObservationSeriesUseCase(patients, observations).execute(
+                            patient_id,
+                            HBA1C,
+                            max_points=arguments.max_points,
+                            method=method,
+                        )
+                    )
+                )
+                for method in SeriesDownsampling
+            },
+        }
+
+        results = [
+            measure(name, engine, read(execute), arguments.iterations)
+            for name, execute in paths.items()
+        ]
+
+        with session_factory() as session:
+            use_case = GetObservationSeriesUseCase(
+                SqlAlchemyPatientReader(session),
+                SqlAlchemyObservationReader(session),
+            )
+            patient_id = ResourceId(patient_ids[0])
+            sizes = {
+                "all points": observation_series_to_response(
+                    patient_id,
+                    HBA1C,
+                    use_case.execute(patient_id, HBA1C),
+                    None,
+                ),
+                f"lttb {arguments.max_points}": observation_series_to_response(
+                    patient_id,
+                    HBA1C,
+                    use_case.execute(
+                        patient_id,
+                        HBA1C,
+                        max_points=arguments.max_points,
+                    ),
+                    SeriesDownsampling.LTTB,
+                ),
+            }
+
+    print_results(results)
+    print()
+
+    for name, response in sizes.items():
+        print(f"{name}: {len(response.model_dump_json())} bytes of JSON")
+
+
+if __name__ == "__main__":
+    main()
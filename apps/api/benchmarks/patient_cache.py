@@ -0,0 +1,116 @@
+"""Compare uncached and read-through cached patient summary loads.
+
+Run from `apps/api`:
+
+    PYTHONPATH=src python -m benchmarks.patient_cache --patients 200
+
+Every path is `GetPatientSummaryUseCase` wired with the single-statement
+`SqlAlchemyPatientSummaryReader`. The cached paths add the
+`SqlAlchemyPatientVersionReader` stamp and either the in-process LRU cache
+or the shared cache over its in-memory stand-in store. Calls cycle through
+the seeded patients, so after the first pass every call is a cache hit and
+pays for the version stamp query only.
+"""
+
+import argparse
+
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.support import (
+    benchmark_engine,
+    measure,
+    print_results,
+    seed_patient_charts,
+)
+from fhir_gateway.application.use_cases.get_patient_summary import (
+    GetPatientSummaryUseCase,
+)
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.cache import (
+    InMemoryKeyValueStore,
+    InMemoryLruCache,
+    SharedCache,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    SqlAlchemyConditionReader,
+    SqlAlchemyEncounterReader,
+    SqlAlchemyObservationReader,
+    SqlAlchemyPatientReader,
+    SqlAlchemyPatientSummaryReader,
+    SqlAlchemyPatientVersionReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    create_session_factory,
+)
+
+
+def _build_use_case(session, cache) -> GetPatientSummaryUseCase:
+    return GetPatientSummaryUseCase(
+        patient_reader=SqlAlchemyPatientReader(session),
+        condition_reader=SqlAlchemyConditionReader(session),
+        encounter_reader=SqlAlchemyEncounterReader(session),
+        observation_reader=SqlAlchemyObservationReader(session),
+        patient_summary_reader=SqlAlchemyPatientSummaryReader(session),
+        cache=cache,
+        version_reader=(
+            SqlAlchemyPatientVersionReader(session) if cache is not None else None
+        ),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--patients", type=int, default=200)
+    parser.add_argument("--observations", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=2000)
+    arguments = parser.parse_args()
+
+    caches = {
+        "summary: uncached": None,
+        "summary: in-process LRU cache": InMemoryLruCache(
+            max_entries=arguments.patients,
+            ttl_seconds=300,
+        ),
+        "summary: shared cache (local store)": SharedCache(
+            InMemoryKeyValueStore(),
+            ttl_seconds=300,
+        ),
+    }
+
+    with benchmark_engine() as engine:
+        patient_ids = seed_patient_charts(
+            engine,
+            patients=arguments.patients,
+            observations_per_patient=arguments.observations,
+        )
+        session_factory: sessionmaker = create_session_factory(engine)
+
+        def load_summary(cache):
+            def call(iteration: int) -> None:
+                patient_id = ResourceId(patient_ids[iteration % len(patient_ids)])
+
+                # One session per call mirrors the request-scoped HTTP session.
+                with session_factory() as session:
+                    _build_use_case(session, cache).execute(patient_id)
+
+            return call
+
+        results = [
+            measure(name, engine, load_summary(cache), arguments.iterations)
+            for name, cache in caches.items()
+        ]
+
+    print_results(results)
+    print()
+
+    for name, cache in caches.items():
+        if cache is not None:
+            stats = cache.stats()
+            print(
+                f"{name}: {stats.hits} hits, {stats.misses} misses, "
+                f"hit ratio {stats.hit_ratio:.2%}"
+            )
+
+
+if __name__ == "__main__":
+    main()
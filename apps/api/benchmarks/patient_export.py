@@ -0,0 +1,136 @@
+"""Compare peak memory of materialized and streaming patient bundle exports.
+
+Run from `apps/api`:
+
+    PYTHONPATH=src python -m benchmarks.patient_export --observations 1000 10000 50000
+
+For each chart size one patient is seeded and exported twice. The
+materialized path runs `ExportPatientBundleUseCase` and encodes the whole
+`PatientBundle` as one JSON document. The streaming path runs
+`StreamPatientBundleUseCase` and drains the NDJSON encoder used by
+`GET /patients/{patient_id}/bundle`. Peak memory is measured with
+`tracemalloc`, so it only counts Python allocations.
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+
+from benchmarks.support import benchmark_engine, seed_patient_charts
+from fhir_gateway.application.use_cases.export_patient_bundle import (
+    ExportPatientBundleUseCase,
+    StreamPatientBundleUseCase,
+)
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    SqlAlchemyConditionReader,
+    SqlAlchemyEncounterReader,
+    SqlAlchemyObservationReader,
+    SqlAlchemyPatientReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    create_session_factory,
+)
+from fhir_gateway.infrastructure.serialization.fhir_json import (
+    resource_to_fhir,
+)
+from fhir_gateway.interfaces.http.presenters.patient_bundle import (
+    iter_patient_bundle_ndjson,
+)
+
+
+def _readers(session) -> dict:
+    return {
+        "patient_reader": SqlAlchemyPatientReader(session),
+        "condition_reader": SqlAlchemyConditionReader(session),
+        "encounter_reader": SqlAlchemyEncounterReader(session),
+        "observation_reader": SqlAlchemyObservationReader(session),
+    }
+
+
+def _export_materialized(session, patient_id: ResourceId) -> int:
+    bundle = ExportPatientBundleUseCase(**_readers(session)).execute(patient_id)
+    resources = (
+        bundle.patient,
+        *bundle.conditions,
+        *bundle.encounters,
+        *bundle.observations,
+    )
+    body = json.dumps(
+        {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "entry": [
+                {"resource": resource_to_fhir(resource)} for resource in resources
+            ],
+        },
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    return len(body)
+
+
+def _export_streaming(session, patient_id: ResourceId) -> int:
+    stream = StreamPatientBundleUseCase(**_readers(session)).execute(patient_id)
+
+    return sum(len(chunk) for chunk in iter_patient_bundle_ndjson(stream))
+
+
+def _measure_peak(call: Callable[[], int]) -> tuple[float, float, int]:
+    tracemalloc.start()
+    started_at = time.perf_counter()
+
+    try:
+        body_bytes = call()
+        elapsed_ms = (time.perf_counter() - started_at) * 1000
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return peak_bytes / (1024 * 1024), elapsed_ms, body_bytes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--observations",
+        type=int,
+        nargs="+",
+        default=[1_000, 10_000, 50_000],
+    )
+    arguments = parser.parse_args()
+
+    print(
+        f"{'observations':>12} {'mode':<12} {'peak MiB':>9} "
+        f"{'time ms':>9} {'body KiB':>9}"
+    )
+
+    for observations in arguments.observations:
+        with benchmark_engine() as engine:
+            (patient_id,) = seed_patient_charts(
+                engine,
+                patients=1,
+                observations_per_patient=observations,
+            )
+            session_factory = create_session_factory(engine)
+
+            for mode, export in (
+                ("materialized", _export_materialized),
+                ("streaming", _export_streaming),
+            ):
+                with session_factory() as session:
+                    peak_mib, elapsed_ms, body_bytes = _measure_peak(
+                        lambda: export(session, ResourceId(patient_id))
+                    )
+
+                print(
+                    f"{observations:>12} {mode:<12} {peak_mib:>9.2f} "
+                    f"{elapsed_ms:>9.1f} {body_bytes / 1024:>9.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
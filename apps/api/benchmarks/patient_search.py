@@ -0,0 +1,147 @@
+"""Compare the legacy and index-backed patient text search statements.
+
+Run from `apps/api`:
+
+    PYTHONPATH=src python -m benchmarks.patient_search --patients 1000000
+
+The legacy statement is the original `ILIKE '%text%'` filter OR-ed across
+`patients` and an outer join to `patient_identifiers`, made unique with
+`DISTINCT`. The current statement is the one `SqlAlchemyPatientReader`
+issues: an exact identifier lookup for `system|value` tokens and otherwise
+one ranked `ILIKE` branch per searched column, bounded to one page.
+
+The `pg_trgm` GIN indexes only exist on PostgreSQL, so point
+`FHIR_GATEWAY_BENCHMARK_DATABASE_URL` at a disposable PostgreSQL database to
+see the index-backed plans. On SQLite both statements scan and the report
+only shows the relative cost of the two query shapes.
+"""
+
+import argparse
+
+from sqlalchemy import Engine, or_, select, text
+from sqlalchemy.orm import selectinload
+
+from benchmarks.support import (
+    MRN_SYSTEM,
+    TimingResult,
+    benchmark_engine,
+    measure,
+    print_results,
+    seed_patient_directory,
+)
+from fhir_gateway.application.use_cases.search_patients import (
+    SearchPatientsUseCase,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    SqlAlchemyPatientReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    create_session_factory,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models import (
+    PatientIdentifierRecord,
+    PatientRecord,
+)
+
+
+def _legacy_search(session, search_text: str) -> list[PatientRecord]:
+    pattern = f"%{search_text}%"
+
+    stmt = (
+        select(PatientRecord)
+        .outerjoin(PatientRecord.identifiers)
+        .options(selectinload(PatientRecord.identifiers))
+        .where(PatientRecord.deleted_at.is_(None))
+        .where(
+            or_(
+                PatientRecord.id.ilike(pattern),
+                PatientRecord.name_text.ilike(pattern),
+                PatientRecord.name_family.ilike(pattern),
+                PatientIdentifierRecord.system.ilike(pattern),
+                PatientIdentifierRecord.value.ilike(pattern),
+            )
+        )
+        .distinct()
+        .order_by(PatientRecord.id)
+    )
+
+    return list(session.scalars(stmt).unique().all())
+
+
+def _search_terms(patients: int) -> dict[str, list[str]]:
+    sample_indexes = [
+        (patients * step) // 100 for step in range(0, 100, 7) if patients
+    ]
+
+    return {
+        "identifier token": [
+            f"{MRN_SYSTEM}|MRN-{index:07d}" for index in sample_indexes
+        ],
+        "identifier value": [f"MRN-{index:07d}" for index in sample_indexes],
+        "family name": [f"Okafor{index % 1000:03d}" for index in sample_indexes],
+    }
+
+
+def _analyze(engine: Engine) -> None:
+    if engine.dialect.name == "postgresql":
+        with engine.begin() as connection:
+            connection.execute(text("ANALYZE patients"))
+            connection.execute(text("ANALYZE patient_identifiers"))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--patients", type=int, default=1_000_000)
+    parser.add_argument("--batch-size", type=int, default=10_000)
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument(
+        "--limit",
+        type=int,
+        default=SearchPatientsUseCase.DEFAULT_LIMIT,
+    )
+    arguments = parser.parse_args()
+
+    results: list[TimingResult] = []
+
+    with benchmark_engine() as engine:
+        seed_patient_directory(
+            engine,
+            patients=arguments.patients,
+            batch_size=arguments.batch_size,
+        )
+        _analyze(engine)
+
+        session_factory = create_session_factory(engine)
+
+        for name, terms in _search_terms(arguments.patients).items():
+            with session_factory() as session:
+                reader = SqlAlchemyPatientReader(session)
+
+                results.append(
+                    measure(
+                        f"legacy {name}",
+                        engine,
+                        lambda iteration: _legacy_search(
+                            session,
+                            terms[iteration % len(terms)],
+                        ),
+                        arguments.iterations,
+                    )
+                )
+                results.append(
+                    measure(
+                        f"indexed {name}",
+                        engine,
+                        lambda iteration: reader.search_by_text(
+                            terms[iteration % len(terms)],
+                            limit=arguments.limit,
+                        ),
+                        arguments.iterations,
+                    )
+                )
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+"""Compare the per-resource and single-statement patient summary paths.
+
+Run from `apps/api`:
+
+    PYTHONPATH=src python -m benchmarks.patient_summary --patients 200
+
+The per-resource path is `GetPatientSummaryUseCase` wired with the patient,
+condition, encounter and observation readers. The single-statement path is
+the same use-case wired with `SqlAlchemyPatientSummaryReader`.
+"""
+
+import argparse
+
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.support import (
+    benchmark_engine,
+    measure,
+    print_results,
+    seed_patient_charts,
+)
+from fhir_gateway.application.use_cases.get_patient_summary import (
+    GetPatientSummaryUseCase,
+)
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    SqlAlchemyConditionReader,
+    SqlAlchemyEncounterReader,
+    SqlAlchemyObservationReader,
+    SqlAlchemyPatientReader,
+    SqlAlchemyPatientSummaryReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    create_session_factory,
+)
+
+
+def _build_use_case(session, *, single_statement: bool) -> GetPatientSummaryUseCase:
+    return GetPatientSummaryUseCase(
+        patient_reader=SqlAlchemyPatientReader(session),
+        condition_reader=SqlAlchemyConditionReader(session),
+        encounter_reader=SqlAlchemyEncounterReader(session),
+        observation_reader=SqlAlchemyObservationReader(session),
+        patient_summary_reader=(
+            SqlAlchemyPatientSummaryReader(session) if single_statement else None
+        ),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--patients", type=int, default=200)
+    parser.add_argument("--observations", type=int, default=50)
+    parser.add_argument("--iterations", type=int, default=500)
+    arguments = parser.parse_args()
+
+    with benchmark_engine() as engine:
+        patient_ids = seed_patient_charts(
+            engine,
+            patients=arguments.patients,
+            observations_per_patient=arguments.observations,
+        )
+        session_factory: sessionmaker = create_session_factory(engine)
+
+        def load_summary(single_statement: bool):
+            def call(iteration: int) -> None:
+                patient_id = ResourceId(patient_ids[iteration % len(patient_ids)])
+
+                # One session per call mirrors the request-scoped HTTP session.
+                with session_factory() as session:
+                    _build_use_case(
+                        session,
+                        single_statement=single_statement,
+                    ).execute(patient_id)
+
+            return call
+
+        results = [
+            measure(
+                "summary: per-resource readers",
+                engine,
+                load_summary(single_statement=False),
+                arguments.iterations,
+            ),
+            measure(
+                "summary: single statement",
+                engine,
+                load_summary(single_statement=True),
+                arguments.iterations,
+            ),
+        ]
+
+    print_results(results)
+
+
+if __name__ == "__main__":
+    main()
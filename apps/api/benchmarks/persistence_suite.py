@@ -0,0 +1,366 @@
+"""Time every SQLAlchemy reader and use case at several population sizes.
+
+Run from `apps/api`:
+
+    PYTHONPATH=src python -m benchmarks.persistence_suite \\
+        --patients 10000 100000 1000000 --output persistence-suite.json
+
+For each `--patients` value a fresh database is loaded with a
+`SyntheticPopulation`, analyzed, and every case below is timed against
+patients drawn with a fixed seed, so two runs of the same commit read the
+same charts. `FHIR_GATEWAY_BENCHMARK_DATABASE_URL` switches from a
+temporary SQLite file to PostgreSQL.
+
+The timings, the load throughput and the environment are written to the
+`--output` JSON file; compare two files to spot regressions. The larger
+populations take a while to load on SQLite (roughly 50 rows per patient).
+"""
+
+import argparse
+import json
+import platform
+import random
+from collections.abc import Callable
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+import sqlalchemy
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from benchmarks.support import TimingResult, benchmark_engine, measure, print_results
+from benchmarks.synthetic import (
+    HBA1C,
+    MRN_SYSTEM,
+    POPULATION_END,
+    LoadReport,
+    SyntheticPopulation,
+    load_population,
+)
+from fhir_gateway.application.models.audit_events import AuditEventFilters
+from fhir_gateway.application.use_cases.export_patient_bundle import (
+    ExportPatientBundleUseCase,
+    StreamPatientBundleUseCase,
+)
+from fhir_gateway.application.use_cases.get_observation_series import (
+    GetObservationSeriesUseCase,
+)
+from fhir_gateway.application.use_cases.get_patient_summary import (
+    GetPatientSummaryUseCase,
+)
+from fhir_gateway.application.use_cases.list_audit_events import (
+    ListAuditEventsUseCase,
+)
+from fhir_gateway.application.use_cases.list_observations_by_code import (
+    ListObservationsByCodeUseCase,
+)
+from fhir_gateway.application.use_cases.search_patients import (
+    SearchPatientsUseCase,
+)
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy import models
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    SqlAlchemyAuditEventReader,
+    SqlAlchemyConditionReader,
+    SqlAlchemyEncounterReader,
+    SqlAlchemyObservationReader,
+    SqlAlchemyPatientReader,
+    SqlAlchemyPatientSummaryReader,
+    SqlAlchemyPatientVersionReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.code_catalog import (
+    CodeCatalog,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    create_session_factory,
+)
+
+HBA1C_CODE = Code(system="http://loinc.org", code=HBA1C.code)
+
+SERIES_MAX_POINTS = 600
+
+# A case receives a session, the patient drawn for this call and that
+# patient's index in the population.
+Case = Callable[[Session, ResourceId, int], object]
+
+
+def _consume(iterator) -> None:
+    for _item in iterator:
+        pass
+
+
+def _consume_bundle(stream) -> None:
+    _consume(stream.conditions)
+    _consume(stream.encounters)
+    _consume(stream.observations)
+
+
+def _audit_reader(session: Session) -> SqlAlchemyAuditEventReader:
+    # The population's audit trail ends at POPULATION_END, so "now" is
+    # pinned there for the recent window to behave as in production.
+    return SqlAlchemyAuditEventReader(session, clock=lambda: POPULATION_END)
+
+
+def _cases() -> dict[str, Case]:
+    condition_catalog = CodeCatalog(
+        models.ConditionCodeRecord,
+        max_entries=1000,
+        refresh_interval_seconds=3600,
+    )
+    observation_catalog = CodeCatalog(
+        models.ObservationCodeRecord,
+        max_entries=1000,
+        refresh_interval_seconds=3600,
+    )
+
+    def catalog_observations(session: Session) -> SqlAlchemyObservationReader:
+        return SqlAlchemyObservationReader(session, observation_catalog)
+
+    def summary_use_case(session: Session) -> GetPatientSummaryUseCase:
+        return GetPatientSummaryUseCase(
+            patient_reader=SqlAlchemyPatientReader(session),
+            condition_reader=SqlAlchemyConditionReader(session),
+            encounter_reader=SqlAlchemyEncounterReader(session),
+            observation_reader=SqlAlchemyObservationReader(session),
+            patient_summary_reader=SqlAlchemyPatientSummaryReader(session),
+        )
+
+    def bundle_readers(session: Session) -> dict:
+        return {
+            "patient_reader": SqlAlchemyPatientReader(session),
+            "condition_reader": SqlAlchemyConditionReader(
+                session,
+                condition_catalog,
+            ),
+            "encounter_reader": SqlAlchemyEncounterReader(session),
+            "observation_reader": catalog_observations(session),
+        }
+
+    return {
+        # Readers
+        "patient.get_by_id": lambda session, patient_id, _index: (
+            SqlAlchemyPatientReader(session).get_by_id(patient_id)
+        ),
+        "patient.search_by_text (identifier)": lambda session, _id, index: (
+            SqlAlchemyPatientReader(session).search_by_text(
+                f"{MRN_SYSTEM}|MRN-{index:07d}",
+                limit=20,
+            )
+        ),
+        "patient.search_by_text (name)": lambda session, _id, index: (
+            SqlAlchemyPatientReader(session).search_by_text(
+                ("Garcia", "Okafor", "Tanaka", "Priya")[index % 4],
+                limit=20,
+            )
+        ),
+        "condition.list_by_patient": lambda session, patient_id, _index: (
+            SqlAlchemyConditionReader(session).list_by_patient(patient_id)
+        ),
+        "condition.list_by_patient (catalog)": lambda session, patient_id, _i: (
+            SqlAlchemyConditionReader(session, condition_catalog).list_by_patient(
+                patient_id
+            )
+        ),
+        "condition.stream_by_patient": lambda session, patient_id, _index: (
+            _consume(SqlAlchemyConditionReader(session).stream_by_patient(patient_id))
+        ),
+        "encounter.list_by_patient": lambda session, patient_id, _index: (
+            SqlAlchemyEncounterReader(session).list_by_patient(patient_id)
+        ),
+        "encounter.stream_by_patient": lambda session, patient_id, _index: (
+            _consume(SqlAlchemyEncounterReader(session).stream_by_patient(patient_id))
+        ),
+        "observation.list_by_patient": lambda session, patient_id, _index: (
+            SqlAlchemyObservationReader(session).list_by_patient(patient_id)
+        ),
+        "observation.list_by_patient (catalog)": lambda session, patient_id, _i: (
+            catalog_observations(session).list_by_patient(patient_id)
+        ),
+        "observation.list_by_patient_and_code": lambda session, patient_id, _i: (
+            catalog_observations(session).list_by_patient_and_code(
+                patient_id,
+                HBA1C_CODE,
+            )
+        ),
+        "observation.list_series_by_patient_and_code": lambda session, pid, _i: (
+            catalog_observations(session).list_series_by_patient_and_code(
+                pid,
+                HBA1C_CODE,
+            )
+        ),
+        "observation.stream_by_patient": lambda session, patient_id, _index: (
+            _consume(
+                SqlAlchemyObservationReader(session).stream_by_patient(patient_id)
+            )
+        ),
+        "patient_summary.get_summary": lambda session, patient_id, _index: (
+            SqlAlchemyPatientSummaryReader(session).get_summary(patient_id)
+        ),
+        "patient_version.get_version": lambda session, patient_id, _index: (
+            SqlAlchemyPatientVersionReader(session).get_version(patient_id)
+        ),
+        "audit_event.list_recent": lambda session, _patient_id, _index: (
+            _audit_reader(session).list_recent(50)
+        ),
+        "audit_event.list_page (agent)": lambda session, _patient_id, index: (
+            _audit_reader(session).list_page(
+                limit=50,
+                filters=AuditEventFilters(agent=f"clinician-{index % 200:03d}"),
+            )
+        ),
+        # Use cases
+        "GetPatientSummaryUseCase": lambda session, patient_id, _index: (
+            summary_use_case(session).execute(patient_id)
+        ),
+        "ExportPatientBundleUseCase": lambda session, patient_id, _index: (
+            ExportPatientBundleUseCase(**bundle_readers(session)).execute(
+                patient_id
+            )
+        ),
+        "StreamPatientBundleUseCase": lambda session, patient_id, _index: (
+            _consume_bundle(
+                StreamPatientBundleUseCase(**bundle_readers(session)).execute(
+                    patient_id
+                )
+            )
+        ),
+        "ListObservationsByCodeUseCase": lambda session, patient_id, _index: (
+            ListObservationsByCodeUseCase(
+                SqlAlchemyPatientReader(session),
+                catalog_observations(session),
+            ).execute(patient_id, HBA1C_CODE)
+        ),
+        "GetObservationSeriesUseCase": lambda session, patient_id, _index: (
+            GetObservationSeriesUseCase(
+                SqlAlchemyPatientReader(session),
+                catalog_observations(session),
+            ).execute(patient_id, HBA1C_CODE, max_points=SERIES_MAX_POINTS)
+        ),
+        "SearchPatientsUseCase": lambda session, _patient_id, index: (
+            SearchPatientsUseCase(SqlAlchemyPatientReader(session)).execute(
+                f"{MRN_SYSTEM}|MRN-{index:07d}"
+            )
+        ),
+        "ListAuditEventsUseCase": lambda session, _patient_id, _index: (
+            ListAuditEventsUseCase(_audit_reader(session)).execute()
+        ),
+    }
+
+
+def _analyze(engine: Engine) -> None:
+    # Fresh statistics, as a production database would have after autovacuum.
+    with engine.begin() as connection:
+        connection.exec_driver_sql("ANALYZE")
+
+
+def _run_scale(
+    population: SyntheticPopulation,
+    *,
+    iterations: int,
+    batch_size: int,
+    case_filter: str | None,
+) -> tuple[str, LoadReport, list[TimingResult]]:
+    with benchmark_engine() as engine:
+        load_report = load_population(engine, population, batch_size=batch_size)
+        _analyze(engine)
+        session_factory: sessionmaker = create_session_factory(engine)
+
+        sampler = random.Random(population.seed)
+        patient_indexes = [
+            sampler.randrange(population.patients) for _ in range(iterations)
+        ]
+
+        def timed(case: Case) -> Callable[[int], object]:
+            def call(iteration: int) -> None:
+                index = patient_indexes[iteration]
+                patient_id = ResourceId(population.patient_id(index))
+
+                with session_factory() as session:
+                    case(session, patient_id, index)
+
+            return call
+
+        results = [
+            measure(name, engine, timed(case), iterations)
+            for name, case in _cases().items()
+            if case_filter is None or case_filter in name
+        ]
+
+        return engine.dialect.name, load_report, results
+
+
+def _write_json(path: Path, arguments, dialect: str, scales: list[dict]) -> None:
+    document = {
+        "suite": "persistence",
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "dialect": dialect,
+        "seed": arguments.seed,
+        "iterations": arguments.iterations,
+        "python": platform.python_version(),
+        "sqlalchemy": sqlalchemy.__version__,
+        "machine": platform.machine(),
+        "scales": scales,
+    }
+    path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--patients",
+        type=int,
+        nargs="+",
+        default=[10_000, 100_000, 1_000_000],
+    )
+    parser.add_argument("--seed", type=int, default=20_240_101)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=5_000)
+    parser.add_argument(
+        "--filter",
+        help="only run cases whose name contains this text",
+    )
+    parser.add_argument(
+        "--output",
+        type=Path,
+        default=Path("persistence-suite.json"),
+    )
+    arguments = parser.parse_args()
+
+    dialect = ""
+    scales = []
+
+    for patients in arguments.patients:
+        population = SyntheticPopulation(patients=patients, seed=arguments.seed)
+        dialect, load_report, results = _run_scale(
+            population,
+            iterations=arguments.iterations,
+            batch_size=arguments.batch_size,
+            case_filter=arguments.filter,
+        )
+
+        print(
+            f"\n{patients} patients: {load_report.rows} rows loaded in "
+            f"{load_report.seconds:.1f}s ({load_report.rows_per_second:,.0f} rows/s)"
+        )
+        print_results(results)
+
+        scales.append(
+            {
+                "patients": patients,
+                "load": {
+                    **asdict(load_report),
+                    "rows_per_second": load_report.rows_per_second,
+                },
+                "results": [asdict(result) for result in results],
+            }
+        )
+        # Rewritten after every scale, so a long run keeps its finished scales.
+        _write_json(arguments.output, arguments, dialect, scales)
+
+    print(f"\nResults written to {arguments.output}")
+
+
+if __name__ == "__main__":
+    main()
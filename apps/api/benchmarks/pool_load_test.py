@@ -0,0 +1,236 @@
+"""Compare connection pool settings under concurrent patient summary reads.
+
+Run from `apps/api`:
+
+    PYTHONPATH=src python -m benchmarks.pool_load_test --clients 64 \\
+        --pools 5:10 20:10 40:0 --use-lifo
+
+Each `size:overflow` pair builds the app with `create_app()`, with
+`FHIR_GATEWAY_DB_POOL_SIZE` and `FHIR_GATEWAY_DB_MAX_OVERFLOW` set, and adds
+one sync patient summary route. A closed loop of `--clients` concurrent
+clients calls it in-process for `--duration` seconds. The report shows
+throughput and latency next to the pool metrics exposed on
+`/health/database-pool`: checkouts, the share of checkouts that waited
+longer than 5 ms, an upper bound of the p95 checkout wait and timeouts.
+
+Sync routes run on the FastAPI threadpool (40 threads), so at most 40
+requests hold a connection at once. Use
+`FHIR_GATEWAY_BENCHMARK_DATABASE_URL` with a `postgresql+psycopg` URL for
+meaningful numbers: SQLite serialises writers and holds no server state.
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Annotated
+
+import httpx
+from fastapi import Depends, FastAPI
+from sqlalchemy import Engine
+
+from benchmarks.support import benchmark_engine, seed_patient_charts
+from fhir_gateway.application.use_cases.get_patient_summary import (
+    GetPatientSummaryUseCase,
+)
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.config.settings import get_settings
+from fhir_gateway.infrastructure.persistence.sqlalchemy.pool_metrics import (
+    PoolStats,
+)
+from fhir_gateway.interfaces.http.app import create_app
+from fhir_gateway.interfaces.http.dependencies.use_cases import (
+    get_patient_summary_use_case,
+)
+
+SUMMARY_PATH = "/benchmark/patients/{patient_id}/summary"
+
+
+@dataclass(frozen=True, slots=True)
+class PoolRunResult:
+    pool: str
+    requests: int
+    requests_per_second: float
+    p50_ms: float
+    p95_ms: float
+    stats: PoolStats
+
+
+@contextmanager
+def _pool_app(engine: Engine, environment: dict[str, str]) -> Iterator[FastAPI]:
+    overrides = {
+        "FHIR_GATEWAY_DATABASE_URL": engine.url.render_as_string(hide_password=False),
+        "FHIR_GATEWAY_LOG_LEVEL": "WARNING",
+        **environment,
+    }
+    previous = {name: os.environ.get(name) for name in overrides}
+    os.environ.update(overrides)
+    get_settings.cache_clear()
+
+    try:
+        app = create_app()
+
+        @app.get(SUMMARY_PATH)
+        def get_summary(
+            patient_id: str,
+            use_case: Annotated[
+                GetPatientSummaryUseCase,
+                Depends(get_patient_summary_use_case),
+            ],
+        ) -> dict[str, int]:
+            summary = use_case.execute(ResourceId(patient_id))
+            return {"observations": len(summary.observations)}
+
+        try:
+            yield app
+        finally:
+            app.state.session_factory.kw["bind"].dispose()
+    finally:
+        for name, value in previous.items():
+            if value is None:
+                os.environ.pop(name, None)
+            else:
+                os.environ[name] = value
+
+        get_settings.cache_clear()
+
+
+async def _run(
+    app: FastAPI,
+    pool: str,
+    patient_ids: list[str],
+    *,
+    clients: int,
+    duration_seconds: float,
+) -> PoolRunResult:
+    latencies_ms: list[float] = []
+    deadline = time.perf_counter() + duration_seconds
+
+    async with httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://benchmark",
+    ) as client:
+
+        async def client_loop(client_index: int) -> None:
+            request_index = client_index
+
+            while time.perf_counter() < deadline:
+                patient_id = patient_ids[request_index % len(patient_ids)]
+                request_index += clients
+
+                started_at = time.perf_counter()
+                response = await client.get(
+                    SUMMARY_PATH.format(patient_id=patient_id),
+                )
+                latencies_ms.append((time.perf_counter() - started_at) * 1000)
+                response.raise_for_status()
+
+        started_at = time.perf_counter()
+        await asyncio.gather(*(client_loop(index) for index in range(clients)))
+        elapsed_seconds = time.perf_counter() - started_at
+
+    latencies_ms.sort()
+
+    return PoolRunResult(
+        pool=pool,
+        requests=len(latencies_ms),
+        requests_per_second=len(latencies_ms) / elapsed_seconds,
+        p50_ms=statistics.median(latencies_ms),
+        p95_ms=latencies_ms[int(len(latencies_ms) * 0.95) - 1],
+        stats=app.state.database_pool_metrics.stats(),
+    )
+
+
+def _waited_share(stats: PoolStats, threshold_ms: float) -> float:
+    within = dict(stats.wait_buckets)[threshold_ms]
+
+    return 1 - within / stats.checkouts if stats.checkouts else 0.0
+
+
+def _p95_wait_bound_ms(stats: PoolStats) -> float | None:
+    target = stats.checkouts * 0.95
+
+    for bound, count in stats.wait_buckets:
+        if count >= target:
+            return bound
+
+    return None
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--patients", type=int, default=200)
+    parser.add_argument("--observations", type=int, default=50)
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--duration", type=float, default=5.0)
+    parser.add_argument(
+        "--pools",
+        nargs="+",
+        default=["5:10", "20:10", "40:0"],
+        help="pool configurations as size:overflow",
+    )
+    parser.add_argument("--pool-timeout", type=float, default=30.0)
+    parser.add_argument("--pre-ping", action="store_true")
+    parser.add_argument("--use-lifo", action="store_true")
+    arguments = parser.parse_args()
+
+    results: list[PoolRunResult] = []
+
+    with benchmark_engine() as engine:
+        patient_ids = list(
+            seed_patient_charts(
+                engine,
+                patients=arguments.patients,
+                observations_per_patient=arguments.observations,
+            )
+        )
+
+        for pool in arguments.pools:
+            size, overflow = pool.split(":")
+            environment = {
+                "FHIR_GATEWAY_DB_POOL_SIZE": size,
+                "FHIR_GATEWAY_DB_MAX_OVERFLOW": overflow,
+                "FHIR_GATEWAY_DB_POOL_TIMEOUT_SECONDS": str(arguments.pool_timeout),
+                "FHIR_GATEWAY_DB_POOL_PRE_PING": str(arguments.pre_ping),
+                "FHIR_GATEWAY_DB_POOL_USE_LIFO": str(arguments.use_lifo),
+            }
+
+            with _pool_app(engine, environment) as app:
+                results.append(
+                    asyncio.run(
+                        _run(
+                            app,
+                            pool,
+                            patient_ids,
+                            clients=arguments.clients,
+                            duration_seconds=arguments.duration,
+                        )
+                    )
+                )
+
+    print(
+        f"{'pool':<8} {'requests':>9} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8} "
+        f"{'checkouts':>10} {'waited>5ms':>11} {'p95 wait':>9} {'timeouts':>9}"
+    )
+
+    for result in results:
+        stats = result.stats
+        p95_wait = _p95_wait_bound_ms(stats)
+        p95_wait_text = f"<={p95_wait:g}" if p95_wait is not None else ">1000"
+
+        print(
+            f"{result.pool:<8} {result.requests:>9} "
+            f"{result.requests_per_second:>9.1f} {result.p50_ms:>8.2f} "
+            f"{result.p95_ms:>8.2f} {stats.checkouts:>10} "
+            f"{_waited_share(stats, 5.0):>11.1%} "
+            f"{p95_wait_text:>9} "
+            f"{stats.timeouts:>9}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,313 @@
+"""Shared helpers for the persistence benchmarks.
+
+Benchmarks run against SQLite by default so they work without any local
+infrastructure. Set `FHIR_GATEWAY_BENCHMARK_DATABASE_URL` to run them against
+PostgreSQL instead; the target database must be empty and disposable.
+"""
+
+import os
+import statistics
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from sqlalchemy import Engine, create_engine, event, insert
+
+from fhir_gateway.infrastructure.persistence.sqlalchemy import models
+from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
+
+BENCHMARK_DATABASE_URL_VARIABLE = "FHIR_GATEWAY_BENCHMARK_DATABASE_URL"
+
+BASE_INSTANT = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+FAMILY_NAMES = (
+    "Anderson",
+    "Brown",
+    "Garcia",
+    "Johnson",
+    "Martinez",
+    "Nguyen",
+    "Okafor",
+    "Rossi",
+    "Smith",
+    "Tanaka",
+)
+
+GIVEN_NAMES = ("Alex", "Maria", "Noah", "Olivia", "Sam", "Yuki")
+
+MRN_SYSTEM = "https://hospital.example.org/mrn"
+
+
+@dataclass(frozen=True, slots=True)
+class TimingResult:
+    name: str
+    iterations: int
+    round_trips_per_call: float
+    median_ms: float
+    p95_ms: float
+    p99_ms: float
+
+
+@contextmanager
+def benchmark_engine() -> Iterator[Engine]:
+    database_url = os.environ.get(BENCHMARK_DATABASE_URL_VARIABLE)
+
+    if database_url:
+        engine = create_engine(database_url)
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        try:
+            yield engine
+        finally:
+            Base.metadata.drop_all(engine)
+            engine.dispose()
+        return
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_path = Path(directory) / "benchmark.sqlite3"
+        engine = create_engine(f"sqlite+pysqlite:///{database_path}")
+        event.listen(engine, "connect", _register_sqlite_btrim)
+        Base.metadata.create_all(engine)
+        try:
+            yield engine
+        finally:
+            engine.dispose()
+
+
+def _register_sqlite_btrim(dbapi_connection, _connection_record) -> None:
+    # The audit_events CHECK constraint uses PostgreSQL's btrim().
+    dbapi_connection.create_function(
+        "btrim",
+        1,
+        lambda value: value.strip() if value is not None else None,
+    )
+
+
+def seed_patient_charts(
+    engine: Engine,
+    *,
+    patients: int,
+    identifiers_per_patient: int = 2,
+    conditions_per_patient: int = 5,
+    encounters_per_patient: int = 10,
+    observations_per_patient: int = 50,
+) -> tuple[str, ...]:
+    """Insert `patients` synthetic charts and return their patient ids."""
+    patient_ids = tuple(f"pat-{index:07d}" for index in range(patients))
+
+    with engine.begin() as connection:
+        connection.execute(
+            insert(models.ConditionCodeRecord),
+            [
+                {
+                    "id": 1,
+                    "system": "http://snomed.info/sct",
+                    "code": "44054006",
+                    "display": "Diabetes mellitus type 2",
+                }
+            ],
+        )
+        connection.execute(
+            insert(models.ObservationCodeRecord),
+            [
+                {
+                    "id": 1,
+                    "system": "http://loinc.org",
+                    "code": "4548-4",
+                    "display": "Hemoglobin A1c/Hemoglobin.total in Blood",
+                }
+            ],
+        )
+
+        for patient_id in patient_ids:
+            _insert_many(
+                connection,
+                models.PatientRecord,
+                [
+                    {
+                        "id": patient_id,
+                        "name_family": "Synthetic",
+                        "name_given": ["Patient"],
+                    }
+                ],
+            )
+            _insert_many(
+                connection,
+                models.PatientIdentifierRecord,
+                [
+                    {
+                        "patient_id": patient_id,
+                        "system": f"https://hospital.example.org/id-{index}",
+                        "value": f"{patient_id}-{index}",
+                    }
+                    for index in range(identifiers_per_patient)
+                ],
+            )
+            _insert_many(
+                connection,
+                models.ConditionRecord,
+                [
+                    {
+                        "id": f"{patient_id}-con-{index}",
+                        "patient_id": patient_id,
+                        "code_id": 1,
+                        "recorded_at": BASE_INSTANT + timedelta(days=index),
+                    }
+                    for index in range(conditions_per_patient)
+                ],
+            )
+            _insert_many(
+                connection,
+                models.EncounterRecord,
+                [
+                    {
+                        "id": f"{patient_id}-enc-{index}",
+                        "patient_id": patient_id,
+                        "period_start_at": BASE_INSTANT + timedelta(days=index),
+                        "period_end_at": BASE_INSTANT
+                        + timedelta(days=index, hours=2),
+                    }
+                    for index in range(encounters_per_patient)
+                ],
+            )
+            _insert_many(
+                connection,
+                models.ObservationRecord,
+                [
+                    {
+                        "id": f"{patient_id}-obs-{index}",
+                        "patient_id": patient_id,
+                        "status": "final",
+                        "code_id": 1,
+                        "effective_at": BASE_INSTANT + timedelta(days=index),
+                        "value_quantity": 5.0 + (index % 30) / 10,
+                        "value_unit": "%",
+                    }
+                    for index in range(observations_per_patient)
+                ],
+            )
+
+    return patient_ids
+
+
+def seed_patient_directory(
+    engine: Engine,
+    *,
+    patients: int,
+    batch_size: int = 10_000,
+) -> tuple[str, ...]:
+    """Insert `patients` searchable patients with one MRN each, in batches.
+
+    Family names cycle through `FAMILY_NAMES` with a numeric suffix so that
+    searches see realistic selectivity instead of one shared name.
+    """
+    patient_ids = tuple(f"pat-{index:07d}" for index in range(patients))
+
+    for start in range(0, patients, batch_size):
+        batch = range(start, min(start + batch_size, patients))
+
+        with engine.begin() as connection:
+            _insert_many(
+                connection,
+                models.PatientRecord,
+                [
+                    {
+                        "id": patient_ids[index],
+                        "name_text": _directory_name_text(index),
+                        "name_family": _directory_family_name(index),
+                        "name_given": [GIVEN_NAMES[index % len(GIVEN_NAMES)]],
+                    }
+                    for index in batch
+                ],
+            )
+            _insert_many(
+                connection,
+                models.PatientIdentifierRecord,
+                [
+                    {
+                        "patient_id": patient_ids[index],
+                        "system": MRN_SYSTEM,
+                        "value": f"MRN-{index:07d}",
+                    }
+                    for index in batch
+                ],
+            )
+
+    return patient_ids
+
+
+def _directory_family_name(index: int) -> str:
+    family_name = FAMILY_NAMES[index % len(FAMILY_NAMES)]
+    return f"{family_name}{index // len(FAMILY_NAMES) % 1000:03d}"
+
+
+def _directory_name_text(index: int) -> str:
+    given_name = GIVEN_NAMES[index % len(GIVEN_NAMES)]
+    return f"{given_name} {_directory_family_name(index)}"
+
+
+def _insert_many(connection, record_type, rows: list[dict]) -> None:
+    if rows:
+        connection.execute(insert(record_type), rows)
+
+
+@contextmanager
+def count_round_trips(engine: Engine) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def record_statement(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+
+def measure(
+    name: str,
+    engine: Engine,
+    call: Callable[[int], object],
+    iterations: int,
+) -> TimingResult:
+    """Time `call(iteration)` and count the SQL statements it issues."""
+    durations_ms: list[float] = []
+
+    with count_round_trips(engine) as statements:
+        for iteration in range(iterations):
+            started_at = time.perf_counter()
+            call(iteration)
+            durations_ms.append((time.perf_counter() - started_at) * 1000)
+
+    quantiles = statistics.quantiles(durations_ms, n=100, method="inclusive")
+
+    return TimingResult(
+        name=name,
+        iterations=iterations,
+        round_trips_per_call=len(statements) / iterations,
+        median_ms=statistics.median(durations_ms),
+        p95_ms=quantiles[94],
+        p99_ms=quantiles[98],
+    )
+
+
+def print_results(results: list[TimingResult]) -> None:
+    width = max(40, *(len(result.name) for result in results))
+    header = (
+        f"{'benchmark':<{width}} {'calls':>7} {'round trips':>12} "
+        f"{'median ms':>10} {'p95 ms':>9} {'p99 ms':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+
+    for result in results:
+        print(
+            f"{result.name:<{width}} {result.iterations:>7} "
+            f"{result.round_trips_per_call:>12.1f} {result.median_ms:>10.3f} "
+            f"{result.p95_ms:>9.3f} {result.p99_ms:>9.3f}"
+        )
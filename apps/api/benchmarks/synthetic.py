@@ -0,0 +1,391 @@
+"""Deterministic synthetic patient population for persistence benchmarks.
+
+Every patient is generated from its own `random.Random` seeded with the
+population seed and the patient index. The same seed therefore yields the
+same rows whatever the batch size, and any patient can be regenerated on
+its own. Distributions aim at a primary-care panel rather than uniform
+noise:
+
+* every patient has an MRN; some also have an insurance member id or a
+  second MRN from a partner hospital
+* encounter counts are log-normal, so most charts are small and a few are
+  very large
+* conditions follow per-code prevalence
+* each encounter records a vital-signs panel, and labs follow the patient's
+  conditions; values drift around a per-patient baseline
+* a small share of clinical rows is logically deleted, and a few
+  observations are amended or entered in error
+* audit events read, search and export patients over the last 90 days
+"""
+
+import math
+import random
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Engine, insert
+
+from fhir_gateway.infrastructure.persistence.sqlalchemy import models
+
+POPULATION_START = datetime(2015, 1, 1, tzinfo=timezone.utc)
+POPULATION_END = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+MRN_SYSTEM = "https://hospital.example.org/mrn"
+PARTNER_MRN_SYSTEM = "https://partner.example.org/mrn"
+INSURANCE_SYSTEM = "https://insurer.example.org/member"
+
+FAMILY_NAMES = (
+    "Anderson",
+    "Brown",
+    "Dubois",
+    "Garcia",
+    "Ivanova",
+    "Johnson",
+    "Kowalski",
+    "Martinez",
+    "Nguyen",
+    "Okafor",
+    "Patel",
+    "Rossi",
+    "Silva",
+    "Smith",
+    "Tanaka",
+    "Wang",
+)
+
+GIVEN_NAMES = (
+    "Aisha",
+    "Alex",
+    "Chen",
+    "David",
+    "Elena",
+    "Fatima",
+    "Ines",
+    "James",
+    "Lucas",
+    "Maria",
+    "Noah",
+    "Olivia",
+    "Priya",
+    "Sam",
+    "Yuki",
+)
+
+# (SNOMED CT code, display, prevalence)
+CONDITION_CODES = (
+    ("38341003", "Hypertensive disorder", 0.30),
+    ("55822004", "Hyperlipidemia", 0.25),
+    ("414916001", "Obesity", 0.20),
+    ("35489007", "Depressive disorder", 0.12),
+    ("44054006", "Diabetes mellitus type 2", 0.10),
+    ("195967001", "Asthma", 0.08),
+    ("709044004", "Chronic kidney disease", 0.05),
+    ("13645005", "Chronic obstructive lung disease", 0.04),
+)
+
+DIABETES = "44054006"
+KIDNEY_DISEASE = "709044004"
+
+
+@dataclass(frozen=True, slots=True)
+class ObservationProfile:
+    code: str
+    display: str
+    unit: str
+    mean: float
+    patient_spread: float
+    visit_spread: float
+
+
+# LOINC vital signs, recorded at most encounters.
+VITAL_SIGNS = (
+    ObservationProfile("8867-4", "Heart rate", "/min", 74, 8, 6),
+    ObservationProfile("8480-6", "Systolic blood pressure", "mm[Hg]", 124, 12, 8),
+    ObservationProfile("8462-4", "Diastolic blood pressure", "mm[Hg]", 79, 7, 5),
+    ObservationProfile("29463-7", "Body weight", "kg", 78, 15, 1.5),
+    ObservationProfile("39156-5", "Body mass index", "kg/m2", 27, 4, 0.5),
+)
+
+# LOINC labs; HbA1c and creatinine are mostly ordered for matching conditions.
+GLUCOSE = ObservationProfile("2339-0", "Glucose", "mg/dL", 100, 12, 15)
+HBA1C = ObservationProfile("4548-4", "Hemoglobin A1c", "%", 5.6, 0.5, 0.3)
+CREATININE = ObservationProfile("2160-0", "Creatinine", "mg/dL", 0.95, 0.15, 0.08)
+
+OBSERVATION_PROFILES = (*VITAL_SIGNS, GLUCOSE, HBA1C, CREATININE)
+
+CONDITION_CODE_IDS = {
+    code: code_id for code_id, (code, _display, _p) in enumerate(CONDITION_CODES, 1)
+}
+OBSERVATION_CODE_IDS = {
+    profile.code: code_id
+    for code_id, profile in enumerate(OBSERVATION_PROFILES, 1)
+}
+
+AUDIT_AGENTS = 200
+AUDIT_WINDOW = timedelta(days=90)
+
+
+@dataclass(slots=True)
+class PopulationBatch:
+    """Rows for a contiguous range of patients, keyed by ORM record type."""
+
+    rows: dict[type, list[dict]] = field(
+        default_factory=lambda: {
+            models.PatientRecord: [],
+            models.PatientIdentifierRecord: [],
+            models.ConditionRecord: [],
+            models.EncounterRecord: [],
+            models.ObservationRecord: [],
+            models.AuditEventRecord: [],
+        }
+    )
+
+    def row_count(self) -> int:
+        return sum(len(rows) for rows in self.rows.values())
+
+
+@dataclass(frozen=True, slots=True)
+class LoadReport:
+    patients: int
+    rows: int
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class SyntheticPopulation:
+    patients: int
+    seed: int = 20_240_101
+    mean_encounters: float = 8.0
+    deleted_share: float = 0.01
+    audit_events_per_patient: float = 2.0
+
+    def patient_id(self, index: int) -> str:
+        return f"pat-{index:07d}"
+
+    def batches(self, batch_size: int) -> Iterator[PopulationBatch]:
+        for start in range(0, self.patients, batch_size):
+            batch = PopulationBatch()
+
+            for index in range(start, min(start + batch_size, self.patients)):
+                self._add_patient(batch, index)
+
+            yield batch
+
+    def _add_patient(self, batch: PopulationBatch, index: int) -> None:
+        # String seeds are hashed deterministically, unlike hash() of a str.
+        rng = random.Random(f"{self.seed}:{index}")
+        patient_id = self.patient_id(index)
+        rows = batch.rows
+
+        family_name = rng.choice(FAMILY_NAMES)
+        given_names = [rng.choice(GIVEN_NAMES)]
+
+        if rng.random() < 0.3:
+            given_names.append(rng.choice(GIVEN_NAMES))
+
+        rows[models.PatientRecord].append(
+            {
+                "id": patient_id,
+                "name_text": f"{' '.join(given_names)} {family_name}",
+                "name_family": family_name,
+                "name_given": given_names,
+                "deleted_at": self._deleted_at(rng),
+            }
+        )
+        rows[models.PatientIdentifierRecord].extend(
+            self._identifiers(rng, index, patient_id)
+        )
+
+        conditions = [
+            code for code, _display, prevalence in CONDITION_CODES
+            if rng.random() < prevalence
+        ]
+        rows[models.ConditionRecord].extend(
+            {
+                "id": f"{patient_id}-con-{number}",
+                "patient_id": patient_id,
+                "code_id": CONDITION_CODE_IDS[code],
+                "recorded_at": self._instant(rng),
+                "deleted_at": self._deleted_at(rng),
+            }
+            for number, code in enumerate(conditions)
+        )
+
+        encounter_count = self._encounter_count(rng)
+        visits = sorted(self._instant(rng) for _ in range(encounter_count))
+        rows[models.EncounterRecord].extend(
+            {
+                "id": f"{patient_id}-enc-{number}",
+                "patient_id": patient_id,
+                "period_start_at": start,
+                "period_end_at": start + timedelta(minutes=rng.randint(15, 90)),
+                "deleted_at": self._deleted_at(rng),
+            }
+            for number, start in enumerate(visits)
+        )
+        rows[models.ObservationRecord].extend(
+            self._observations(rng, patient_id, visits, set(conditions))
+        )
+        rows[models.AuditEventRecord].extend(
+            self._audit_events(rng, patient_id)
+        )
+
+    def _identifiers(self, rng, index: int, patient_id: str) -> list[dict]:
+        identifiers = [(MRN_SYSTEM, f"MRN-{index:07d}")]
+
+        if rng.random() < 0.6:
+            identifiers.append((INSURANCE_SYSTEM, f"M{rng.randrange(10**9):09d}"))
+
+        if rng.random() < 0.3:
+            identifiers.append((PARTNER_MRN_SYSTEM, f"P-{index:07d}"))
+
+        return [
+            {"patient_id": patient_id, "system": system, "value": value}
+            for system, value in identifiers
+        ]
+
+    def _encounter_count(self, rng) -> int:
+        # Log-normal with the requested mean: median charts stay small while
+        # the tail reaches a few hundred encounters.
+        sigma = 0.9
+        mu = math.log(self.mean_encounters) - sigma**2 / 2
+
+        return min(int(rng.lognormvariate(mu, sigma)), 400)
+
+    def _observations(
+        self,
+        rng,
+        patient_id: str,
+        visits: list[datetime],
+        conditions: set[str],
+    ) -> Iterator[dict]:
+        labs = (
+            (GLUCOSE, 0.3),
+            (HBA1C, 0.9 if DIABETES in conditions else 0.05),
+            (CREATININE, 0.8 if KIDNEY_DISEASE in conditions else 0.1),
+        )
+        baselines = {
+            profile.code: rng.gauss(profile.mean, profile.patient_spread)
+            for profile in OBSERVATION_PROFILES
+        }
+
+        if DIABETES in conditions:
+            baselines[HBA1C.code] += 2.0
+            baselines[GLUCOSE.code] += 40
+
+        number = 0
+
+        for visit in visits:
+            measured = list(VITAL_SIGNS) if rng.random() < 0.85 else []
+            measured.extend(
+                profile for profile, probability in labs
+                if rng.random() < probability
+            )
+
+            for profile in measured:
+                status = rng.choices(
+                    ("final", "amended", "entered-in-error"),
+                    weights=(97, 2, 1),
+                )[0]
+                value = rng.gauss(baselines[profile.code], profile.visit_spread)
+
+                yield {
+                    "id": f"{patient_id}-obs-{number}",
+                    "patient_id": patient_id,
+                    "status": status,
+                    "code_id": OBSERVATION_CODE_IDS[profile.code],
+                    "effective_at": visit,
+                    "value_quantity": round(max(value, 0.0), 2),
+                    "value_unit": profile.unit,
+                    "deleted_at": self._deleted_at(rng),
+                }
+                number += 1
+
+    def _audit_events(self, rng, patient_id: str) -> Iterator[dict]:
+        count = int(rng.expovariate(1 / self.audit_events_per_patient))
+
+        for number in range(count):
+            recorded_at = POPULATION_END - AUDIT_WINDOW * rng.random()
+
+            yield {
+                "id": f"{patient_id}-aud-{number}",
+                "recorded_at": recorded_at,
+                "agent": f"clinician-{rng.randrange(AUDIT_AGENTS):03d}",
+                "action": rng.choices(
+                    ("read", "search", "export"),
+                    weights=(85, 10, 5),
+                )[0],
+                "entity_resource_type": "Patient",
+                "entity_id": patient_id,
+            }
+
+    def _instant(self, rng) -> datetime:
+        return POPULATION_START + (POPULATION_END - POPULATION_START) * rng.random()
+
+    def _deleted_at(self, rng) -> datetime | None:
+        if rng.random() < self.deleted_share:
+            return POPULATION_END
+
+        return None
+
+
+def load_population(
+    engine: Engine,
+    population: SyntheticPopulation,
+    *,
+    batch_size: int = 5_000,
+) -> LoadReport:
+    """Insert `population` into an empty schema and time the load.
+
+    Code tables are written first with fixed ids, so resource rows carry
+    their `code_id` directly. Each batch of patients is one transaction of
+    multi-row `INSERT`s, which SQLAlchemy sends as `executemany` batches.
+    """
+    started_at = time.perf_counter()
+    rows = 0
+
+    with engine.begin() as connection:
+        connection.execute(
+            insert(models.ConditionCodeRecord),
+            [
+                {
+                    "id": CONDITION_CODE_IDS[code],
+                    "system": "http://snomed.info/sct",
+                    "code": code,
+                    "display": display,
+                }
+                for code, display, _prevalence in CONDITION_CODES
+            ],
+        )
+        connection.execute(
+            insert(models.ObservationCodeRecord),
+            [
+                {
+                    "id": OBSERVATION_CODE_IDS[profile.code],
+                    "system": "http://loinc.org",
+                    "code": profile.code,
+                    "display": profile.display,
+                }
+                for profile in OBSERVATION_PROFILES
+            ],
+        )
+
+    for batch in population.batches(batch_size):
+        with engine.begin() as connection:
+            for record_type, record_rows in batch.rows.items():
+                if record_rows:
+                    connection.execute(insert(record_type), record_rows)
+
+        rows += batch.row_count()
+
+    return LoadReport(
+        patients=population.patients,
+        rows=rows,
+        seconds=time.perf_counter() - started_at,
+    )
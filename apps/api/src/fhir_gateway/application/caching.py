@@ -0,0 +1,20 @@
+from fhir_gateway.application.ports.cache import Cache
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+
+
+def patient_cache_key(namespace: str, patient_id: ResourceId, version: str) -> str:
+    """Build the cache key of one result for one version of a patient chart.
+
+    The version stamp is part of the key, so a chart change makes every
+    older entry unreachable instead of requiring an explicit invalidation;
+    stale entries simply age out of the cache.
+    """
+    return f"{namespace}:{patient_id.value}:{version}"
+
+
+def validate_cache_collaborators(
+    cache: Cache | None,
+    version_reader: object | None,
+) -> None:
+    if (cache is None) != (version_reader is None):
+        raise ValueError("cache and version_reader must be provided together.")
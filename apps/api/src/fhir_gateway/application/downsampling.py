@@ -0,0 +1,156 @@
+from collections.abc import Iterator, Sequence
+from datetime import datetime, timezone
+from itertools import groupby
+
+from fhir_gateway.application.models.observation_series import (
+    ObservationSeries,
+    SeriesDownsampling,
+)
+
+MIN_DOWNSAMPLED_POINTS = 3
+
+
+def downsample_series(
+    series: ObservationSeries,
+    max_points: int,
+    method: SeriesDownsampling,
+) -> ObservationSeries:
+    """Reduce `series` to at most `max_points` points for display.
+
+    `LTTB` (largest triangle three buckets) keeps original points that
+    preserve the visual shape of the line. `MIN_MAX` keeps the lowest and
+    highest original point of each equal-width time bucket, so no spike is
+    hidden. `AVERAGE` replaces each time bucket by the mean of its
+    timestamps and values. A series that already fits is returned as is.
+    """
+    if max_points < MIN_DOWNSAMPLED_POINTS:
+        raise ValueError(
+            f"max_points must be at least {MIN_DOWNSAMPLED_POINTS}."
+        )
+
+    if len(series) <= max_points:
+        return series
+
+    xs = [timestamp.timestamp() for timestamp in series.timestamps]
+    ys = series.values
+
+    if method is SeriesDownsampling.LTTB:
+        return _select_points(series, _lttb_indexes(xs, ys, max_points))
+
+    if method is SeriesDownsampling.MIN_MAX:
+        return _select_points(series, _min_max_indexes(xs, ys, max_points // 2))
+
+    if method is SeriesDownsampling.AVERAGE:
+        return _bucket_averages(series.unit, xs, ys, max_points)
+
+    raise ValueError(f"Unsupported downsampling method: {method!r}.")
+
+
+def _lttb_indexes(
+    xs: Sequence[float],
+    ys: Sequence[float],
+    threshold: int,
+) -> list[int]:
+    # The first and last points are always kept; the points between them
+    # are split into `threshold - 2` buckets of (almost) equal size.
+    point_count = len(xs)
+    bucket_size = (point_count - 2) / (threshold - 2)
+    indexes = [0]
+    previous = 0
+
+    for bucket in range(threshold - 2):
+        start = int(bucket * bucket_size) + 1
+        end = int((bucket + 1) * bucket_size) + 1
+        next_end = min(int((bucket + 2) * bucket_size) + 1, point_count)
+
+        # The next bucket is represented by its average point; the last
+        # bucket's "next bucket" is the final point.
+        next_count = next_end - end
+        average_x = sum(xs[end:next_end]) / next_count
+        average_y = sum(ys[end:next_end]) / next_count
+
+        previous_x = xs[previous]
+        previous_y = ys[previous]
+        selected = start
+        largest_area = -1.0
+
+        for index in range(start, end):
+            area = abs(
+                (previous_x - average_x) * (ys[index] - previous_y)
+                - (previous_x - xs[index]) * (average_y - previous_y)
+            )
+
+            if area > largest_area:
+                largest_area = area
+                selected = index
+
+        indexes.append(selected)
+        previous = selected
+
+    indexes.append(point_count - 1)
+
+    return indexes
+
+
+def _min_max_indexes(
+    xs: Sequence[float],
+    ys: Sequence[float],
+    bucket_count: int,
+) -> list[int]:
+    indexes = []
+
+    for bucket in _time_buckets(xs, bucket_count):
+        lowest = min(bucket, key=ys.__getitem__)
+        highest = max(bucket, key=ys.__getitem__)
+        indexes.extend(sorted({lowest, highest}))
+
+    return indexes
+
+
+def _bucket_averages(
+    unit: str,
+    xs: Sequence[float],
+    ys: Sequence[float],
+    bucket_count: int,
+) -> ObservationSeries:
+    timestamps = []
+    values = []
+
+    for bucket in _time_buckets(xs, bucket_count):
+        timestamps.append(
+            datetime.fromtimestamp(
+                sum(xs[index] for index in bucket) / len(bucket),
+                tz=timezone.utc,
+            )
+        )
+        values.append(sum(ys[index] for index in bucket) / len(bucket))
+
+    return ObservationSeries(unit=unit, timestamps=timestamps, values=values)
+
+
+def _time_buckets(xs: Sequence[float], bucket_count: int) -> Iterator[list[int]]:
+    # Equal-width time buckets, like the pixel columns of a chart. Points are
+    # ordered by time, so each bucket is a run of consecutive indexes and
+    # empty buckets simply yield nothing.
+    first = xs[0]
+    span = xs[-1] - first
+
+    def bucket_of(index: int) -> int:
+        if span == 0:
+            return 0
+
+        return min(int((xs[index] - first) / span * bucket_count), bucket_count - 1)
+
+    for _bucket, indexes in groupby(range(len(xs)), key=bucket_of):
+        yield list(indexes)
+
+
+def _select_points(
+    series: ObservationSeries,
+    indexes: Sequence[int],
+) -> ObservationSeries:
+    return ObservationSeries(
+        unit=series.unit,
+        timestamps=[series.timestamps[index] for index in indexes],
+        values=[series.values[index] for index in indexes],
+    )
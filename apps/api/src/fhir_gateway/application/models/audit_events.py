@@ -0,0 +1,194 @@
+import base64
+import json
+from dataclasses import dataclass
+from datetime import datetime
+
+from fhir_gateway.application.errors import ApplicationValidationError
+from fhir_gateway.domain.entities.audit_event import AuditAction, AuditEvent
+from fhir_gateway.domain.errors import DomainValidationError
+from fhir_gateway.domain.value_objects.instant import Instant
+from fhir_gateway.domain.value_objects.reference import (
+    ALLOWED_REFERENCE_RESOURCE_TYPES,
+)
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+
+
+@dataclass(frozen=True, slots=True)
+class AuditEventCursor:
+    """Position of the last audit event returned by a page.
+
+    Audit events are ordered newest first by `recorded_at`, then by id, so
+    the pair is a unique keyset that the next page starts strictly after.
+    """
+
+    recorded: Instant
+    event_id: ResourceId
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.recorded, Instant):
+            raise ApplicationValidationError(
+                "AuditEventCursor.recorded",
+                "must be an Instant",
+            )
+
+        if not isinstance(self.event_id, ResourceId):
+            raise ApplicationValidationError(
+                "AuditEventCursor.event_id",
+                "must be a ResourceId",
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class AuditEventFilters:
+    """Optional criteria an audit event must match to be listed.
+
+    `recorded_since` is inclusive and `recorded_before` exclusive. An
+    `entity_id` only makes sense together with its `entity_resource_type`.
+    """
+
+    agent: str | None = None
+    action: AuditAction | None = None
+    entity_resource_type: str | None = None
+    entity_id: ResourceId | None = None
+    recorded_since: Instant | None = None
+    recorded_before: Instant | None = None
+
+    def __post_init__(self) -> None:
+        if self.agent is not None:
+            if not isinstance(self.agent, str) or self.agent.strip() == "":
+                raise ApplicationValidationError(
+                    "AuditEventFilters.agent",
+                    "must be a non-empty string or None",
+                )
+
+            object.__setattr__(self, "agent", self.agent.strip())
+
+        if self.action is not None and not isinstance(self.action, AuditAction):
+            raise ApplicationValidationError(
+                "AuditEventFilters.action",
+                "must be an AuditAction or None",
+            )
+
+        if (
+            self.entity_resource_type is not None
+            and self.entity_resource_type not in ALLOWED_REFERENCE_RESOURCE_TYPES
+        ):
+            raise ApplicationValidationError(
+                "AuditEventFilters.entity_resource_type",
+                "must be one of "
+                + ", ".join(sorted(ALLOWED_REFERENCE_RESOURCE_TYPES)),
+            )
+
+        if self.entity_id is not None:
+            if not isinstance(self.entity_id, ResourceId):
+                raise ApplicationValidationError(
+                    "AuditEventFilters.entity_id",
+                    "must be a ResourceId or None",
+                )
+
+            if self.entity_resource_type is None:
+                raise ApplicationValidationError(
+                    "AuditEventFilters.entity_id",
+                    "requires entity_resource_type",
+                )
+
+        for field_name in ("recorded_since", "recorded_before"):
+            value = getattr(self, field_name)
+
+            if value is not None and not isinstance(value, Instant):
+                raise ApplicationValidationError(
+                    f"AuditEventFilters.{field_name}",
+                    "must be an Instant or None",
+                )
+
+        if (
+            self.recorded_since is not None
+            and self.recorded_before is not None
+            and self.recorded_since.value >= self.recorded_before.value
+        ):
+            raise ApplicationValidationError(
+                "AuditEventFilters.recorded_before",
+                "must be later than recorded_since",
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class AuditEventPage:
+    events: tuple[AuditEvent, ...]
+    next_cursor: AuditEventCursor | None = None
+
+    def __post_init__(self) -> None:
+        if isinstance(self.events, str) or not isinstance(
+            self.events, (list, tuple)
+        ):
+            raise ApplicationValidationError(
+                "AuditEventPage.events",
+                "must be a list or a tuple of AuditEvent",
+            )
+
+        if not all(isinstance(event, AuditEvent) for event in self.events):
+            raise ApplicationValidationError(
+                "AuditEventPage.events",
+                "must contain only AuditEvent",
+            )
+
+        object.__setattr__(self, "events", tuple(self.events))
+
+        if self.next_cursor is not None and not isinstance(
+            self.next_cursor, AuditEventCursor
+        ):
+            raise ApplicationValidationError(
+                "AuditEventPage.next_cursor",
+                "must be an AuditEventCursor or None",
+            )
+
+    @property
+    def next_page_token(self) -> str | None:
+        if self.next_cursor is None:
+            return None
+
+        return encode_audit_event_page_token(self.next_cursor)
+
+
+def encode_audit_event_page_token(cursor: AuditEventCursor) -> str:
+    payload = json.dumps(
+        [cursor.recorded.value.isoformat(), cursor.event_id.value],
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_audit_event_page_token(page_token: str) -> AuditEventCursor:
+    """Decode a token produced by `encode_audit_event_page_token`.
+
+    Like patient search tokens, any malformed token is reported as one
+    validation error.
+    """
+    if not isinstance(page_token, str):
+        raise ApplicationValidationError(
+            "ListAuditEvents.page_token",
+            "must be a string",
+        )
+
+    padding = "=" * (-len(page_token) % 4)
+
+    try:
+        payload = json.loads(
+            base64.urlsafe_b64decode(page_token + padding).decode("utf-8")
+        )
+        recorded, event_id = payload
+        return AuditEventCursor(
+            recorded=Instant(datetime.fromisoformat(recorded)),
+            event_id=ResourceId(event_id),
+        )
+    except (
+        ValueError,
+        TypeError,
+        DomainValidationError,
+        ApplicationValidationError,
+    ) as error:
+        raise ApplicationValidationError(
+            "ListAuditEvents.page_token",
+            "is not a valid page token",
+        ) from error
@@ -0,0 +1,100 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+from fhir_gateway.application.errors import ApplicationValidationError
+
+BULK_EXPORT_RESOURCE_TYPES: tuple[str, ...] = (
+    "Patient",
+    "Condition",
+    "Encounter",
+    "Observation",
+)
+
+
+class BulkExportStatus(str, Enum):
+    ACCEPTED = "accepted"
+    IN_PROGRESS = "in-progress"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True, slots=True)
+class BulkExportOutput:
+    resource_type: str
+    path: str
+    resource_count: int
+
+    def __post_init__(self) -> None:
+        if self.resource_type not in BULK_EXPORT_RESOURCE_TYPES:
+            raise ApplicationValidationError(
+                "BulkExportOutput.resource_type",
+                "must be one of: " + ", ".join(BULK_EXPORT_RESOURCE_TYPES),
+            )
+
+        if (
+            isinstance(self.resource_count, bool)
+            or not isinstance(self.resource_count, int)
+            or self.resource_count < 0
+        ):
+            raise ApplicationValidationError(
+                "BulkExportOutput.resource_count",
+                "must be a non-negative integer",
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class BulkExportJob:
+    """State of one bulk export, replaced as a whole on every transition."""
+
+    id: str
+    status: BulkExportStatus
+    resource_types: tuple[str, ...]
+    requested_at: datetime
+    gzip: bool = False
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+    outputs: tuple[BulkExportOutput, ...] = ()
+    error: str | None = None
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.status, BulkExportStatus):
+            raise ApplicationValidationError(
+                "BulkExportJob.status",
+                "must be a BulkExportStatus",
+            )
+
+        if not isinstance(self.resource_types, tuple) or not self.resource_types:
+            raise ApplicationValidationError(
+                "BulkExportJob.resource_types",
+                "must be a non-empty tuple",
+            )
+
+        if not all(isinstance(output, BulkExportOutput) for output in self.outputs):
+            raise ApplicationValidationError(
+                "BulkExportJob.outputs",
+                "must contain only BulkExportOutput",
+            )
+
+    @property
+    def resource_count(self) -> int:
+        return sum(output.resource_count for output in self.outputs)
+
+    @property
+    def elapsed_seconds(self) -> float | None:
+        if self.started_at is None or self.completed_at is None:
+            return None
+
+        return (self.completed_at - self.started_at).total_seconds()
+
+    @property
+    def resources_per_second(self) -> float | None:
+        elapsed_seconds = self.elapsed_seconds
+
+        if elapsed_seconds is None:
+            return None
+
+        if elapsed_seconds <= 0:
+            return float(self.resource_count)
+
+        return self.resource_count / elapsed_seconds
@@ -0,0 +1,52 @@
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+from fhir_gateway.application.errors import ApplicationValidationError
+
+
+class SeriesDownsampling(str, Enum):
+    LTTB = "lttb"
+    MIN_MAX = "min-max"
+    AVERAGE = "average"
+
+
+@dataclass(frozen=True, slots=True)
+class ObservationSeries:
+    """Numeric values of one observation code for one patient, in one unit.
+
+    The points are stored as parallel columns ordered by `timestamps`, which
+    is the shape a chart consumes and far smaller than one `Observation` per
+    point.
+    """
+
+    unit: str
+    timestamps: tuple[datetime, ...]
+    values: tuple[float, ...]
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.unit, str) or self.unit.strip() == "":
+            raise ApplicationValidationError(
+                "ObservationSeries.unit",
+                "must be a non-empty string",
+            )
+
+        for field_name in ("timestamps", "values"):
+            value = getattr(self, field_name)
+
+            if isinstance(value, str) or not isinstance(value, (list, tuple)):
+                raise ApplicationValidationError(
+                    f"ObservationSeries.{field_name}",
+                    "must be a list or a tuple",
+                )
+
+            object.__setattr__(self, field_name, tuple(value))
+
+        if len(self.timestamps) != len(self.values):
+            raise ApplicationValidationError(
+                "ObservationSeries.values",
+                "must have one value per timestamp",
+            )
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from dataclasses import dataclass
 
 from fhir_gateway.application.errors import ApplicationValidationError
@@ -65,3 +66,47 @@ class PatientBundle:
             )
 
         return tuple(value)
+
+
+@dataclass(frozen=True, slots=True)
+class PatientBundleStream:
+    """Lazily read counterpart of `PatientBundle` for streaming exports.
+
+    Each resource iterator can be consumed once. Items come straight from
+    the stream readers and are not re-validated here, so memory use does not
+    depend on how many resources the patient has.
+    """
+
+    patient: Patient
+    conditions: Iterator[Condition]
+    encounters: Iterator[Encounter]
+    observations: Iterator[Observation]
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.patient, Patient):
+            raise ApplicationValidationError(
+                "PatientBundleStream.patient",
+                "must be a Patient",
+            )
+
+        for field_name in ("conditions", "encounters", "observations"):
+            if not isinstance(getattr(self, field_name), Iterator):
+                raise ApplicationValidationError(
+                    f"PatientBundleStream.{field_name}",
+                    "must be an iterator",
+                )
+
+    @classmethod
+    def from_bundle(cls, bundle: PatientBundle) -> "PatientBundleStream":
+        """Stream an already loaded bundle, e.g. one served from the cache."""
+        return cls(
+            patient=bundle.patient,
+            conditions=iter(bundle.conditions),
+            encounters=iter(bundle.encounters),
+            observations=iter(bundle.observations),
+        )
+
+    def resources(self) -> Iterator[Condition | Encounter | Observation]:
+        yield from self.conditions
+        yield from self.encounters
+        yield from self.observations
@@ -0,0 +1,106 @@
+import base64
+import json
+from dataclasses import dataclass
+
+from fhir_gateway.application.errors import ApplicationValidationError
+from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.domain.errors import DomainValidationError
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+
+
+@dataclass(frozen=True, slots=True)
+class PatientSearchCursor:
+    """Position of the last patient returned by a search page.
+
+    Search pages follow patient id order, so the id is a unique keyset that
+    the next page starts strictly after. Relevance only orders the patients
+    within a page.
+    """
+
+    patient_id: ResourceId
+
+    def __post_init__(self) -> None:
+        if not isinstance(self.patient_id, ResourceId):
+            raise ApplicationValidationError(
+                "PatientSearchCursor.patient_id",
+                "must be a ResourceId",
+            )
+
+
+@dataclass(frozen=True, slots=True)
+class PatientSearchPage:
+    patients: tuple[Patient, ...]
+    next_cursor: PatientSearchCursor | None = None
+
+    def __post_init__(self) -> None:
+        if isinstance(self.patients, str) or not isinstance(
+            self.patients, (list, tuple)
+        ):
+            raise ApplicationValidationError(
+                "PatientSearchPage.patients",
+                "must be a list or a tuple of Patient",
+            )
+
+        if not all(isinstance(patient, Patient) for patient in self.patients):
+            raise ApplicationValidationError(
+                "PatientSearchPage.patients",
+                "must contain only Patient",
+            )
+
+        object.__setattr__(self, "patients", tuple(self.patients))
+
+        if self.next_cursor is not None and not isinstance(
+            self.next_cursor, PatientSearchCursor
+        ):
+            raise ApplicationValidationError(
+                "PatientSearchPage.next_cursor",
+                "must be a PatientSearchCursor or None",
+            )
+
+    @property
+    def next_page_token(self) -> str | None:
+        if self.next_cursor is None:
+            return None
+
+        return encode_patient_search_page_token(self.next_cursor)
+
+
+def encode_patient_search_page_token(cursor: PatientSearchCursor) -> str:
+    payload = json.dumps(
+        [cursor.patient_id.value],
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_patient_search_page_token(page_token: str) -> PatientSearchCursor:
+    """Decode a token produced by `encode_patient_search_page_token`.
+
+    Tokens are opaque to clients, so any malformed token is reported as one
+    validation error instead of leaking which decoding step failed.
+    """
+    if not isinstance(page_token, str):
+        raise ApplicationValidationError(
+            "SearchPatients.page_token",
+            "must be a string",
+        )
+
+    padding = "=" * (-len(page_token) % 4)
+
+    try:
+        payload = json.loads(
+            base64.urlsafe_b64decode(page_token + padding).decode("utf-8")
+        )
+        (patient_id,) = payload
+        return PatientSearchCursor(patient_id=ResourceId(patient_id))
+    except (
+        ValueError,
+        TypeError,
+        DomainValidationError,
+        ApplicationValidationError,
+    ) as error:
+        raise ApplicationValidationError(
+            "SearchPatients.page_token",
+            "is not a valid page token",
+        ) from error
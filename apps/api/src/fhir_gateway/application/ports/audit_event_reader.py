@@ -1,7 +1,32 @@
 from typing import Protocol
 
+from fhir_gateway.application.models.audit_events import (
+    AuditEventCursor,
+    AuditEventFilters,
+    AuditEventPage,
+)
 from fhir_gateway.domain.entities.audit_event import AuditEvent
 
 
 class AuditEventReader(Protocol):
     def list_recent(self, limit: int) -> tuple[AuditEvent, ...]: ...
+
+    def list_page(
+        self,
+        *,
+        limit: int,
+        filters: AuditEventFilters,
+        after: AuditEventCursor | None = None,
+    ) -> AuditEventPage: ...
+
+
+class AsyncAuditEventReader(Protocol):
+    async def list_recent(self, limit: int) -> tuple[AuditEvent, ...]: ...
+
+    async def list_page(
+        self,
+        *,
+        limit: int,
+        filters: AuditEventFilters,
+        after: AuditEventCursor | None = None,
+    ) -> AuditEventPage: ...
@@ -0,0 +1,13 @@
+from typing import Protocol
+
+from fhir_gateway.domain.entities.audit_event import AuditEvent
+
+
+class AuditEventWriter(Protocol):
+    def record(self, event: AuditEvent) -> None:
+        """Persist `event`, possibly after this call returns.
+
+        Implementations may buffer events, but must not drop them: when the
+        buffer is full the call waits for room instead.
+        """
+        ...
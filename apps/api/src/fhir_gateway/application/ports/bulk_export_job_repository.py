@@ -0,0 +1,9 @@
+from typing import Protocol
+
+from fhir_gateway.application.models.bulk_export import BulkExportJob
+
+
+class BulkExportJobRepository(Protocol):
+    def save(self, job: BulkExportJob) -> None: ...
+
+    def get(self, job_id: str) -> BulkExportJob | None: ...
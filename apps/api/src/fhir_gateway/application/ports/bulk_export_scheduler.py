@@ -0,0 +1,9 @@
+from typing import Protocol
+
+from fhir_gateway.application.models.bulk_export import BulkExportJob
+
+
+class BulkExportScheduler(Protocol):
+    def submit(self, job: BulkExportJob) -> None:
+        """Run `job` in the background and record its progress."""
+        ...
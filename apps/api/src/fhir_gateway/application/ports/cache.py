@@ -0,0 +1,13 @@
+from typing import Protocol
+
+
+class Cache(Protocol):
+    """Key-value cache for immutable application results.
+
+    Cached values are shared between callers, so only immutable values such
+    as frozen application models may be stored.
+    """
+
+    def get(self, key: str) -> object | None: ...
+
+    def set(self, key: str, value: object) -> None: ...
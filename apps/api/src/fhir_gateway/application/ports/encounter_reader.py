@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from typing import Protocol
 
 from fhir_gateway.domain.entities.encounter import Encounter
@@ -6,3 +7,14 @@ from fhir_gateway.domain.value_objects.resource_id import ResourceId
 
 class EncounterReader(Protocol):
     def list_by_patient(self, patient_id: ResourceId) -> tuple[Encounter, ...]: ...
+
+
+class AsyncEncounterReader(Protocol):
+    async def list_by_patient(
+        self,
+        patient_id: ResourceId,
+    ) -> tuple[Encounter, ...]: ...
+
+
+class EncounterStreamReader(Protocol):
+    def stream_by_patient(self, patient_id: ResourceId) -> Iterator[Encounter]: ...
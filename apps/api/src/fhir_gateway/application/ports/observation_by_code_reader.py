@@ -11,3 +11,11 @@ class ObservationByCodeReader(Protocol):
         patient_id: ResourceId,
         code: Code,
     ) -> tuple[Observation, ...]: ...
+
+
+class AsyncObservationByCodeReader(Protocol):
+    async def list_by_patient_and_code(
+        self,
+        patient_id: ResourceId,
+        code: Code,
+    ) -> tuple[Observation, ...]: ...
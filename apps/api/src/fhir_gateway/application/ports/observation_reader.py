@@ -1,3 +1,4 @@
+from collections.abc import Iterator
 from typing import Protocol
 
 from fhir_gateway.domain.entities.observation import Observation
@@ -6,3 +7,14 @@ from fhir_gateway.domain.value_objects.resource_id import ResourceId
 
 class ObservationReader(Protocol):
     def list_by_patient(self, patient_id: ResourceId) -> tuple[Observation, ...]: ...
+
+
+class AsyncObservationReader(Protocol):
+    async def list_by_patient(
+        self,
+        patient_id: ResourceId,
+    ) -> tuple[Observation, ...]: ...
+
+
+class ObservationStreamReader(Protocol):
+    def stream_by_patient(self, patient_id: ResourceId) -> Iterator[Observation]: ...
@@ -0,0 +1,21 @@
+from typing import Protocol
+
+from fhir_gateway.application.models.observation_series import ObservationSeries
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+
+
+class ObservationSeriesReader(Protocol):
+    def list_series_by_patient_and_code(
+        self,
+        patient_id: ResourceId,
+        code: Code,
+    ) -> tuple[ObservationSeries, ...]: ...
+
+
+class AsyncObservationSeriesReader(Protocol):
+    async def list_series_by_patient_and_code(
+        self,
+        patient_id: ResourceId,
+        code: Code,
+    ) -> tuple[ObservationSeries, ...]: ...
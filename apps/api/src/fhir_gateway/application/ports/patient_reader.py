@@ -6,3 +6,7 @@ from fhir_gateway.domain.value_objects.resource_id import ResourceId
 
 class PatientReader(Protocol):
     def get_by_id(self, patient_id: ResourceId) -> Patient | None: ...
+
+
+class AsyncPatientReader(Protocol):
+    async def get_by_id(self, patient_id: ResourceId) -> Patient | None: ...
@@ -1,7 +1,26 @@
 from typing import Protocol
 
-from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.application.models.patient_search import (
+    PatientSearchCursor,
+    PatientSearchPage,
+)
 
 
 class PatientSearchReader(Protocol):
-    def search_by_text(self, search_text: str) -> tuple[Patient, ...]: ...
+    def search_by_text(
+        self,
+        search_text: str,
+        *,
+        limit: int,
+        after: PatientSearchCursor | None = None,
+    ) -> PatientSearchPage: ...
+
+
+class AsyncPatientSearchReader(Protocol):
+    async def search_by_text(
+        self,
+        search_text: str,
+        *,
+        limit: int,
+        after: PatientSearchCursor | None = None,
+    ) -> PatientSearchPage: ...
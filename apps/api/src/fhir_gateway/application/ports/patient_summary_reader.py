@@ -0,0 +1,15 @@
+from typing import Protocol
+
+from fhir_gateway.application.models.patient_summary import PatientSummary
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+
+
+class PatientSummaryReader(Protocol):
+    def get_summary(self, patient_id: ResourceId) -> PatientSummary | None: ...
+
+
+class AsyncPatientSummaryReader(Protocol):
+    async def get_summary(
+        self,
+        patient_id: ResourceId,
+    ) -> PatientSummary | None: ...
@@ -0,0 +1,16 @@
+from typing import Protocol
+
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+
+
+class PatientVersionReader(Protocol):
+    def get_version(self, patient_id: ResourceId) -> str | None:
+        """Return a stamp that changes whenever the patient's chart changes.
+
+        Returns None when no patient row exists for `patient_id`.
+        """
+        ...
+
+
+class AsyncPatientVersionReader(Protocol):
+    async def get_version(self, patient_id: ResourceId) -> str | None: ...
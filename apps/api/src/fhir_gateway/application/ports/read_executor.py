@@ -0,0 +1,9 @@
+from collections.abc import Callable, Sequence
+from typing import Protocol
+
+
+class ReadExecutor(Protocol):
+    def run_all(
+        self,
+        reads: Sequence[Callable[[], object]],
+    ) -> tuple[object, ...]: ...
@@ -1,43 +1,112 @@
+from functools import partial
+
+from fhir_gateway.application.caching import (
+    patient_cache_key,
+    validate_cache_collaborators,
+)
 from fhir_gateway.application.errors import (
     ApplicationNotFoundError,
     ApplicationValidationError,
 )
-from fhir_gateway.application.models.patient_bundle import PatientBundle
-from fhir_gateway.application.ports.condition_reader import ConditionReader
-from fhir_gateway.application.ports.encounter_reader import EncounterReader
-from fhir_gateway.application.ports.observation_reader import ObservationReader
-from fhir_gateway.application.ports.patient_reader import PatientReader
+from fhir_gateway.application.models.patient_bundle import (
+    PatientBundle,
+    PatientBundleStream,
+)
+from fhir_gateway.application.ports.cache import Cache
+from fhir_gateway.application.ports.condition_reader import (
+    AsyncConditionReader,
+    ConditionReader,
+    ConditionStreamReader,
+)
+from fhir_gateway.application.ports.encounter_reader import (
+    AsyncEncounterReader,
+    EncounterReader,
+    EncounterStreamReader,
+)
+from fhir_gateway.application.ports.observation_reader import (
+    AsyncObservationReader,
+    ObservationReader,
+    ObservationStreamReader,
+)
+from fhir_gateway.application.ports.patient_reader import (
+    AsyncPatientReader,
+    PatientReader,
+)
+from fhir_gateway.application.ports.patient_version_reader import (
+    AsyncPatientVersionReader,
+    PatientVersionReader,
+)
+from fhir_gateway.application.ports.read_executor import ReadExecutor
+from fhir_gateway.domain.entities.condition import Condition
+from fhir_gateway.domain.entities.encounter import Encounter
+from fhir_gateway.domain.entities.observation import Observation
 from fhir_gateway.domain.value_objects.resource_id import ResourceId
 
+CACHE_NAMESPACE = "patient-bundle"
+
 
 class ExportPatientBundleUseCase:
+    """Load a patient bundle, optionally through a read-through cache.
+
+    The cache follows the same version-stamp scheme as
+    `GetPatientSummaryUseCase`, including its `version` argument.
+    """
+
     def __init__(
         self,
         patient_reader: PatientReader,
         condition_reader: ConditionReader,
         encounter_reader: EncounterReader,
         observation_reader: ObservationReader,
+        read_executor: ReadExecutor | None = None,
+        cache: Cache | None = None,
+        version_reader: PatientVersionReader | None = None,
     ) -> None:
+        validate_cache_collaborators(cache, version_reader)
+
         self._patient_reader = patient_reader
         self._condition_reader = condition_reader
         self._encounter_reader = encounter_reader
         self._observation_reader = observation_reader
+        self._read_executor = read_executor
+        self._cache = cache
+        self._version_reader = version_reader
+
+    def execute(
+        self,
+        patient_id: ResourceId,
+        *,
+        version: str | None = None,
+    ) -> PatientBundle:
+        _validate_patient_id(patient_id)
+
+        if self._cache is None:
+            return self._read_bundle(patient_id)
 
-    def execute(self, patient_id: ResourceId) -> PatientBundle:
-        if not isinstance(patient_id, ResourceId):
-            raise ApplicationValidationError(
-                "ExportPatientBundle.patient_id",
-                "must be a ResourceId",
-            )
+        if version is None:
+            version = self._version_reader.get_version(patient_id)
 
+            if version is None:
+                raise ApplicationNotFoundError("Patient", patient_id.value)
+
+        cache_key = patient_cache_key(CACHE_NAMESPACE, patient_id, version)
+        bundle = self._cache.get(cache_key)
+
+        if bundle is None:
+            bundle = self._read_bundle(patient_id)
+            self._cache.set(cache_key, bundle)
+
+        return bundle
+
+    def _read_bundle(self, patient_id: ResourceId) -> PatientBundle:
         patient = self._patient_reader.get_by_id(patient_id)
 
         if patient is None:
             raise ApplicationNotFoundError("Patient", patient_id.value)
 
-        conditions = self._condition_reader.list_by_patient(patient_id)
-        encounters = self._encounter_reader.list_by_patient(patient_id)
-        observations = self._observation_reader.list_by_patient(patient_id)
+        conditions, encounters, observations = self._list_clinical_resources(
+            patient_id
+        )
 
         return PatientBundle(
             patient=patient,
@@ -45,3 +114,131 @@ class ExportPatientBundleUseCase:
             encounters=encounters,
             observations=observations,
         )
+
+    def _list_clinical_resources(
+        self,
+        patient_id: ResourceId,
+    ) -> tuple[
+        tuple[Condition, ...],
+        tuple[Encounter, ...],
+        tuple[Observation, ...],
+    ]:
+        reads = (
+            partial(self._condition_reader.list_by_patient, patient_id),
+            partial(self._encounter_reader.list_by_patient, patient_id),
+            partial(self._observation_reader.list_by_patient, patient_id),
+        )
+
+        if self._read_executor is None:
+            return tuple(read() for read in reads)
+
+        return self._read_executor.run_all(reads)
+
+
+class AsyncExportPatientBundleUseCase:
+    def __init__(
+        self,
+        patient_reader: AsyncPatientReader,
+        condition_reader: AsyncConditionReader,
+        encounter_reader: AsyncEncounterReader,
+        observation_reader: AsyncObservationReader,
+        cache: Cache | None = None,
+        version_reader: AsyncPatientVersionReader | None = None,
+    ) -> None:
+        validate_cache_collaborators(cache, version_reader)
+
+        self._patient_reader = patient_reader
+        self._condition_reader = condition_reader
+        self._encounter_reader = encounter_reader
+        self._observation_reader = observation_reader
+        self._cache = cache
+        self._version_reader = version_reader
+
+    async def execute(
+        self,
+        patient_id: ResourceId,
+        *,
+        version: str | None = None,
+    ) -> PatientBundle:
+        _validate_patient_id(patient_id)
+
+        if self._cache is None:
+            return await self._read_bundle(patient_id)
+
+        if version is None:
+            version = await self._version_reader.get_version(patient_id)
+
+            if version is None:
+                raise ApplicationNotFoundError("Patient", patient_id.value)
+
+        cache_key = patient_cache_key(CACHE_NAMESPACE, patient_id, version)
+        bundle = self._cache.get(cache_key)
+
+        if bundle is None:
+            bundle = await self._read_bundle(patient_id)
+            self._cache.set(cache_key, bundle)
+
+        return bundle
+
+    async def _read_bundle(self, patient_id: ResourceId) -> PatientBundle:
+        patient = await self._patient_reader.get_by_id(patient_id)
+
+        if patient is None:
+            raise ApplicationNotFoundError("Patient", patient_id.value)
+
+        # An AsyncSession runs one statement at a time, so the reads are
+        # awaited in turn rather than gathered.
+        conditions = await self._condition_reader.list_by_patient(patient_id)
+        encounters = await self._encounter_reader.list_by_patient(patient_id)
+        observations = await self._observation_reader.list_by_patient(patient_id)
+
+        return PatientBundle(
+            patient=patient,
+            conditions=conditions,
+            encounters=encounters,
+            observations=observations,
+        )
+
+
+class StreamPatientBundleUseCase:
+    """Export a patient bundle whose resources are read while being consumed.
+
+    The patient is looked up eagerly so a missing patient is reported before
+    any output is produced; conditions, encounters and observations are only
+    queried as the returned stream is iterated.
+    """
+
+    def __init__(
+        self,
+        patient_reader: PatientReader,
+        condition_reader: ConditionStreamReader,
+        encounter_reader: EncounterStreamReader,
+        observation_reader: ObservationStreamReader,
+    ) -> None:
+        self._patient_reader = patient_reader
+        self._condition_reader = condition_reader
+        self._encounter_reader = encounter_reader
+        self._observation_reader = observation_reader
+
+    def execute(self, patient_id: ResourceId) -> PatientBundleStream:
+        _validate_patient_id(patient_id)
+
+        patient = self._patient_reader.get_by_id(patient_id)
+
+        if patient is None:
+            raise ApplicationNotFoundError("Patient", patient_id.value)
+
+        return PatientBundleStream(
+            patient=patient,
+            conditions=self._condition_reader.stream_by_patient(patient_id),
+            encounters=self._encounter_reader.stream_by_patient(patient_id),
+            observations=self._observation_reader.stream_by_patient(patient_id),
+        )
+
+
+def _validate_patient_id(patient_id: ResourceId) -> None:
+    if not isinstance(patient_id, ResourceId):
+        raise ApplicationValidationError(
+            "ExportPatientBundle.patient_id",
+            "must be a ResourceId",
+        )
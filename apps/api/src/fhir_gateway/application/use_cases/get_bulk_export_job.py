@@ -0,0 +1,27 @@
+from fhir_gateway.application.errors import (
+    ApplicationNotFoundError,
+    ApplicationValidationError,
+)
+from fhir_gateway.application.models.bulk_export import BulkExportJob
+from fhir_gateway.application.ports.bulk_export_job_repository import (
+    BulkExportJobRepository,
+)
+
+
+class GetBulkExportJobUseCase:
+    def __init__(self, job_repository: BulkExportJobRepository) -> None:
+        self._job_repository = job_repository
+
+    def execute(self, job_id: str) -> BulkExportJob:
+        if not isinstance(job_id, str) or not job_id.strip():
+            raise ApplicationValidationError(
+                "GetBulkExportJob.job_id",
+                "must be a non-empty string",
+            )
+
+        job = self._job_repository.get(job_id)
+
+        if job is None:
+            raise ApplicationNotFoundError("BulkExportJob", job_id)
+
+        return job
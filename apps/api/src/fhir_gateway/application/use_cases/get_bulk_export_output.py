@@ -0,0 +1,40 @@
+from fhir_gateway.application.errors import (
+    ApplicationNotFoundError,
+    ApplicationValidationError,
+)
+from fhir_gateway.application.models.bulk_export import BulkExportOutput
+from fhir_gateway.application.ports.bulk_export_job_repository import (
+    BulkExportJobRepository,
+)
+from fhir_gateway.application.use_cases.get_bulk_export_job import (
+    GetBulkExportJobUseCase,
+)
+
+
+class GetBulkExportOutputUseCase:
+    """Find the output file one resource type of an export was written to.
+
+    Outputs exist only once a job has completed, so a job that is still
+    running has none to find yet.
+    """
+
+    def __init__(self, job_repository: BulkExportJobRepository) -> None:
+        self._get_job = GetBulkExportJobUseCase(job_repository)
+
+    def execute(self, job_id: str, resource_type: str) -> BulkExportOutput:
+        if not isinstance(resource_type, str) or not resource_type.strip():
+            raise ApplicationValidationError(
+                "GetBulkExportOutput.resource_type",
+                "must be a non-empty string",
+            )
+
+        job = self._get_job.execute(job_id)
+
+        for output in job.outputs:
+            if output.resource_type == resource_type:
+                return output
+
+        raise ApplicationNotFoundError(
+            "BulkExportOutput",
+            f"{job_id}/{resource_type}",
+        )
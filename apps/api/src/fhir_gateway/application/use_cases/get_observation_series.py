@@ -0,0 +1,149 @@
+from fhir_gateway.application.downsampling import (
+    MIN_DOWNSAMPLED_POINTS,
+    downsample_series,
+)
+from fhir_gateway.application.errors import (
+    ApplicationNotFoundError,
+    ApplicationValidationError,
+)
+from fhir_gateway.application.models.observation_series import (
+    ObservationSeries,
+    SeriesDownsampling,
+)
+from fhir_gateway.application.ports.observation_series_reader import (
+    AsyncObservationSeriesReader,
+    ObservationSeriesReader,
+)
+from fhir_gateway.application.ports.patient_reader import (
+    AsyncPatientReader,
+    PatientReader,
+)
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+
+
+class GetObservationSeriesUseCase:
+    MAX_POINTS = 5000
+
+    def __init__(
+        self,
+        patient_reader: PatientReader,
+        observation_series_reader: ObservationSeriesReader,
+    ) -> None:
+        self._patient_reader = patient_reader
+        self._observation_series_reader = observation_series_reader
+
+    def execute(
+        self,
+        patient_id: ResourceId,
+        code: Code,
+        max_points: int | None = None,
+        method: SeriesDownsampling = SeriesDownsampling.LTTB,
+    ) -> tuple[ObservationSeries, ...]:
+        _validate_arguments(patient_id, code, max_points, method)
+
+        patient = self._patient_reader.get_by_id(patient_id)
+
+        if patient is None:
+            raise ApplicationNotFoundError("Patient", patient_id.value)
+
+        series = self._observation_series_reader.list_series_by_patient_and_code(
+            patient_id,
+            code,
+        )
+
+        return _downsample(series, max_points, method)
+
+
+class AsyncGetObservationSeriesUseCase:
+    MAX_POINTS = GetObservationSeriesUseCase.MAX_POINTS
+
+    def __init__(
+        self,
+        patient_reader: AsyncPatientReader,
+        observation_series_reader: AsyncObservationSeriesReader,
+    ) -> None:
+        self._patient_reader = patient_reader
+        self._observation_series_reader = observation_series_reader
+
+    async def execute(
+        self,
+        patient_id: ResourceId,
+        code: Code,
+        max_points: int | None = None,
+        method: SeriesDownsampling = SeriesDownsampling.LTTB,
+    ) -> tuple[ObservationSeries, ...]:
+        _validate_arguments(patient_id, code, max_points, method)
+
+        patient = await self._patient_reader.get_by_id(patient_id)
+
+        if patient is None:
+            raise ApplicationNotFoundError("Patient", patient_id.value)
+
+        reader = self._observation_series_reader
+        series = await reader.list_series_by_patient_and_code(patient_id, code)
+
+        return _downsample(series, max_points, method)
+
+
+def _downsample(
+    series: tuple[ObservationSeries, ...],
+    max_points: int | None,
+    method: SeriesDownsampling,
+) -> tuple[ObservationSeries, ...]:
+    # Each unit is its own line on the chart, so each gets the full budget.
+    if max_points is None:
+        return series
+
+    return tuple(
+        downsample_series(unit_series, max_points, method)
+        for unit_series in series
+    )
+
+
+def _validate_arguments(
+    patient_id: ResourceId,
+    code: Code,
+    max_points: int | None,
+    method: SeriesDownsampling,
+) -> None:
+    if not isinstance(patient_id, ResourceId):
+        raise ApplicationValidationError(
+            "GetObservationSeries.patient_id",
+            "must be a ResourceId",
+        )
+
+    if not isinstance(code, Code):
+        raise ApplicationValidationError(
+            "GetObservationSeries.code",
+            "must be a Code",
+        )
+
+    if not isinstance(method, SeriesDownsampling):
+        raise ApplicationValidationError(
+            "GetObservationSeries.method",
+            "must be a SeriesDownsampling",
+        )
+
+    if max_points is None:
+        return
+
+    if isinstance(max_points, bool) or not isinstance(max_points, int):
+        raise ApplicationValidationError(
+            "GetObservationSeries.max_points",
+            "must be an integer or None",
+        )
+
+    if max_points < MIN_DOWNSAMPLED_POINTS:
+        raise ApplicationValidationError(
+            "GetObservationSeries.max_points",
+            f"must be greater than or equal to {MIN_DOWNSAMPLED_POINTS}",
+        )
+
+    max_allowed = GetObservationSeriesUseCase.MAX_POINTS
+
+    if max_points > max_allowed:
+        raise ApplicationValidationError(
+            "GetObservationSeries.max_points",
+            f"must be less than or equal to {max_allowed}",
+        )
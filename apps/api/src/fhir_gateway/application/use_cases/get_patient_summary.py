@@ -1,43 +1,121 @@
+from functools import partial
+
+from fhir_gateway.application.caching import (
+    patient_cache_key,
+    validate_cache_collaborators,
+)
 from fhir_gateway.application.errors import (
     ApplicationNotFoundError,
     ApplicationValidationError,
 )
 from fhir_gateway.application.models.patient_summary import PatientSummary
-from fhir_gateway.application.ports.condition_reader import ConditionReader
-from fhir_gateway.application.ports.encounter_reader import EncounterReader
-from fhir_gateway.application.ports.observation_reader import ObservationReader
-from fhir_gateway.application.ports.patient_reader import PatientReader
+from fhir_gateway.application.ports.cache import Cache
+from fhir_gateway.application.ports.condition_reader import (
+    AsyncConditionReader,
+    ConditionReader,
+)
+from fhir_gateway.application.ports.encounter_reader import (
+    AsyncEncounterReader,
+    EncounterReader,
+)
+from fhir_gateway.application.ports.observation_reader import (
+    AsyncObservationReader,
+    ObservationReader,
+)
+from fhir_gateway.application.ports.patient_reader import (
+    AsyncPatientReader,
+    PatientReader,
+)
+from fhir_gateway.application.ports.patient_summary_reader import (
+    AsyncPatientSummaryReader,
+    PatientSummaryReader,
+)
+from fhir_gateway.application.ports.patient_version_reader import (
+    AsyncPatientVersionReader,
+    PatientVersionReader,
+)
+from fhir_gateway.application.ports.read_executor import ReadExecutor
+from fhir_gateway.domain.entities.condition import Condition
+from fhir_gateway.domain.entities.encounter import Encounter
+from fhir_gateway.domain.entities.observation import Observation
 from fhir_gateway.domain.value_objects.resource_id import ResourceId
 
+CACHE_NAMESPACE = "patient-summary"
+
 
 class GetPatientSummaryUseCase:
+    """Load a patient summary, optionally through a read-through cache.
+
+    With a `cache`, the chart's version stamp is read first and used in the
+    cache key, so a hit costs one cheap query instead of the full summary
+    reads and any chart change is a miss. A write landing between the stamp
+    and the reads can only store newer data under the older stamp, never
+    older data under the newer one.
+
+    A caller that already read the stamp, to answer a conditional request,
+    passes it as `version` so it is not read twice.
+    """
+
     def __init__(
         self,
         patient_reader: PatientReader,
         condition_reader: ConditionReader,
         encounter_reader: EncounterReader,
         observation_reader: ObservationReader,
+        patient_summary_reader: PatientSummaryReader | None = None,
+        read_executor: ReadExecutor | None = None,
+        cache: Cache | None = None,
+        version_reader: PatientVersionReader | None = None,
     ) -> None:
+        validate_cache_collaborators(cache, version_reader)
+
         self._patient_reader = patient_reader
         self._condition_reader = condition_reader
         self._encounter_reader = encounter_reader
         self._observation_reader = observation_reader
+        self._patient_summary_reader = patient_summary_reader
+        self._read_executor = read_executor
+        self._cache = cache
+        self._version_reader = version_reader
+
+    def execute(
+        self,
+        patient_id: ResourceId,
+        *,
+        version: str | None = None,
+    ) -> PatientSummary:
+        _validate_patient_id(patient_id)
+
+        if self._cache is None:
+            return self._read_summary(patient_id)
+
+        if version is None:
+            version = self._version_reader.get_version(patient_id)
+
+            if version is None:
+                raise ApplicationNotFoundError("Patient", patient_id.value)
 
-    def execute(self, patient_id: ResourceId) -> PatientSummary:
-        if not isinstance(patient_id, ResourceId):
-            raise ApplicationValidationError(
-                "GetPatientSummary.patient_id",
-                "must be a ResourceId",
-            )
+        cache_key = patient_cache_key(CACHE_NAMESPACE, patient_id, version)
+        summary = self._cache.get(cache_key)
+
+        if summary is None:
+            summary = self._read_summary(patient_id)
+            self._cache.set(cache_key, summary)
+
+        return summary
+
+    def _read_summary(self, patient_id: ResourceId) -> PatientSummary:
+        if self._patient_summary_reader is not None:
+            return self._load_summary(patient_id)
 
         patient = self._patient_reader.get_by_id(patient_id)
 
         if patient is None:
             raise ApplicationNotFoundError("Patient", patient_id.value)
 
-        conditions = self._condition_reader.list_by_patient(patient_id)
-        encounters = self._encounter_reader.list_by_patient(patient_id)
-        observations = self._observation_reader.list_by_patient(patient_id)
+        conditions, encounters, observations = self._list_clinical_resources(
+            patient_id
+        )
 
         return PatientSummary(
             patient=patient,
@@ -45,3 +123,116 @@ class GetPatientSummaryUseCase:
             encounters=encounters,
             observations=observations,
         )
+
+    def _load_summary(self, patient_id: ResourceId) -> PatientSummary:
+        summary = self._patient_summary_reader.get_summary(patient_id)
+
+        if summary is None:
+            raise ApplicationNotFoundError("Patient", patient_id.value)
+
+        return summary
+
+    def _list_clinical_resources(
+        self,
+        patient_id: ResourceId,
+    ) -> tuple[
+        tuple[Condition, ...],
+        tuple[Encounter, ...],
+        tuple[Observation, ...],
+    ]:
+        reads = (
+            partial(self._condition_reader.list_by_patient, patient_id),
+            partial(self._encounter_reader.list_by_patient, patient_id),
+            partial(self._observation_reader.list_by_patient, patient_id),
+        )
+
+        if self._read_executor is None:
+            return tuple(read() for read in reads)
+
+        return self._read_executor.run_all(reads)
+
+
+class AsyncGetPatientSummaryUseCase:
+    def __init__(
+        self,
+        patient_reader: AsyncPatientReader,
+        condition_reader: AsyncConditionReader,
+        encounter_reader: AsyncEncounterReader,
+        observation_reader: AsyncObservationReader,
+        patient_summary_reader: AsyncPatientSummaryReader | None = None,
+        cache: Cache | None = None,
+        version_reader: AsyncPatientVersionReader | None = None,
+    ) -> None:
+        validate_cache_collaborators(cache, version_reader)
+
+        self._patient_reader = patient_reader
+        self._condition_reader = condition_reader
+        self._encounter_reader = encounter_reader
+        self._observation_reader = observation_reader
+        self._patient_summary_reader = patient_summary_reader
+        self._cache = cache
+        self._version_reader = version_reader
+
+    async def execute(
+        self,
+        patient_id: ResourceId,
+        *,
+        version: str | None = None,
+    ) -> PatientSummary:
+        _validate_patient_id(patient_id)
+
+        if self._cache is None:
+            return await self._read_summary(patient_id)
+
+        if version is None:
+            version = await self._version_reader.get_version(patient_id)
+
+            if version is None:
+                raise ApplicationNotFoundError("Patient", patient_id.value)
+
+        cache_key = patient_cache_key(CACHE_NAMESPACE, patient_id, version)
+        summary = self._cache.get(cache_key)
+
+        if summary is None:
+            summary = await self._read_summary(patient_id)
+            self._cache.set(cache_key, summary)
+
+        return summary
+
+    async def _read_summary(self, patient_id: ResourceId) -> PatientSummary:
+        if self._patient_summary_reader is not None:
+            return await self._load_summary(patient_id)
+
+        patient = await self._patient_reader.get_by_id(patient_id)
+
+        if patient is None:
+            raise ApplicationNotFoundError("Patient", patient_id.value)
+
+        # An AsyncSession runs one statement at a time, so the reads are
+        # awaited in turn rather than gathered.
+        conditions = await self._condition_reader.list_by_patient(patient_id)
+        encounters = await self._encounter_reader.list_by_patient(patient_id)
+        observations = await self._observation_reader.list_by_patient(patient_id)
+
+        return PatientSummary(
+            patient=patient,
+            conditions=conditions,
+            encounters=encounters,
+            observations=observations,
+        )
+
+    async def _load_summary(self, patient_id: ResourceId) -> PatientSummary:
+        summary = await self._patient_summary_reader.get_summary(patient_id)
+
+        if summary is None:
+            raise ApplicationNotFoundError("Patient", patient_id.value)
+
+        return summary
+
+
+def _validate_patient_id(patient_id: ResourceId) -> None:
+    if not isinstance(patient_id, ResourceId):
+        raise ApplicationValidationError(
+            "GetPatientSummary.patient_id",
+            "must be a ResourceId",
+        )
@@ -0,0 +1,55 @@
+from fhir_gateway.application.errors import (
+    ApplicationNotFoundError,
+    ApplicationValidationError,
+)
+from fhir_gateway.application.ports.patient_version_reader import (
+    AsyncPatientVersionReader,
+    PatientVersionReader,
+)
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+
+
+class GetPatientVersionUseCase:
+    """Read the version stamp of a patient chart without loading the chart.
+
+    The stamp changes whenever anything a summary or bundle shows changes,
+    so callers can answer conditional requests from it alone, and pass it
+    on to `GetPatientSummaryUseCase` or `ExportPatientBundleUseCase` when
+    the chart has to be loaded after all.
+    """
+
+    def __init__(self, version_reader: PatientVersionReader) -> None:
+        self._version_reader = version_reader
+
+    def execute(self, patient_id: ResourceId) -> str:
+        _validate_patient_id(patient_id)
+
+        version = self._version_reader.get_version(patient_id)
+
+        if version is None:
+            raise ApplicationNotFoundError("Patient", patient_id.value)
+
+        return version
+
+
+class AsyncGetPatientVersionUseCase:
+    def __init__(self, version_reader: AsyncPatientVersionReader) -> None:
+        self._version_reader = version_reader
+
+    async def execute(self, patient_id: ResourceId) -> str:
+        _validate_patient_id(patient_id)
+
+        version = await self._version_reader.get_version(patient_id)
+
+        if version is None:
+            raise ApplicationNotFoundError("Patient", patient_id.value)
+
+        return version
+
+
+def _validate_patient_id(patient_id: ResourceId) -> None:
+    if not isinstance(patient_id, ResourceId):
+        raise ApplicationValidationError(
+            "GetPatientVersion.patient_id",
+            "must be a ResourceId",
+        )
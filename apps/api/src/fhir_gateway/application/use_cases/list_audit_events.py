@@ -1,6 +1,14 @@
 from fhir_gateway.application.errors import ApplicationValidationError
-from fhir_gateway.application.ports.audit_event_reader import AuditEventReader
-from fhir_gateway.domain.entities.audit_event import AuditEvent
+from fhir_gateway.application.models.audit_events import (
+    AuditEventCursor,
+    AuditEventFilters,
+    AuditEventPage,
+    decode_audit_event_page_token,
+)
+from fhir_gateway.application.ports.audit_event_reader import (
+    AsyncAuditEventReader,
+    AuditEventReader,
+)
 
 
 class ListAuditEventsUseCase:
@@ -10,24 +18,84 @@ class ListAuditEventsUseCase:
     def __init__(self, audit_event_reader: AuditEventReader) -> None:
         self._audit_event_reader = audit_event_reader
 
-    def execute(self, limit: int = DEFAULT_LIMIT) -> tuple[AuditEvent, ...]:
+    def execute(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        filters: AuditEventFilters | None = None,
+        page_token: str | None = None,
+    ) -> AuditEventPage:
+        _validate_limit(limit)
+        filters = _validate_filters(filters)
+        after = _decode_page_token(page_token)
 
-        if isinstance(limit, bool) or not isinstance(limit, int):
-            raise ApplicationValidationError(
-                "ListAuditEvents.limit",
-                "must be an integer",
-            )
+        return self._audit_event_reader.list_page(
+            limit=limit,
+            filters=filters,
+            after=after,
+        )
 
-        if limit < 1:
-            raise ApplicationValidationError(
-                "ListAuditEvents.limit",
-                "must be greater than or equal to 1",
-            )
 
-        if limit > self.MAX_LIMIT:
-            raise ApplicationValidationError(
-                "ListAuditEvents.limit",
-                f"must be less than or equal to {self.MAX_LIMIT}",
-            )
+class AsyncListAuditEventsUseCase:
+    DEFAULT_LIMIT = ListAuditEventsUseCase.DEFAULT_LIMIT
+    MAX_LIMIT = ListAuditEventsUseCase.MAX_LIMIT
 
-        return self._audit_event_reader.list_recent(limit)
+    def __init__(self, audit_event_reader: AsyncAuditEventReader) -> None:
+        self._audit_event_reader = audit_event_reader
+
+    async def execute(
+        self,
+        limit: int = DEFAULT_LIMIT,
+        filters: AuditEventFilters | None = None,
+        page_token: str | None = None,
+    ) -> AuditEventPage:
+        _validate_limit(limit)
+        filters = _validate_filters(filters)
+        after = _decode_page_token(page_token)
+
+        return await self._audit_event_reader.list_page(
+            limit=limit,
+            filters=filters,
+            after=after,
+        )
+
+
+def _validate_limit(limit: int) -> None:
+    if isinstance(limit, bool) or not isinstance(limit, int):
+        raise ApplicationValidationError(
+            "ListAuditEvents.limit",
+            "must be an integer",
+        )
+
+    if limit < 1:
+        raise ApplicationValidationError(
+            "ListAuditEvents.limit",
+            "must be greater than or equal to 1",
+        )
+
+    max_limit = ListAuditEventsUseCase.MAX_LIMIT
+
+    if limit > max_limit:
+        raise ApplicationValidationError(
+            "ListAuditEvents.limit",
+            f"must be less than or equal to {max_limit}",
+        )
+
+
+def _validate_filters(filters: AuditEventFilters | None) -> AuditEventFilters:
+    if filters is None:
+        return AuditEventFilters()
+
+    if not isinstance(filters, AuditEventFilters):
+        raise ApplicationValidationError(
+            "ListAuditEvents.filters",
+            "must be AuditEventFilters or None",
+        )
+
+    return filters
+
+
+def _decode_page_token(page_token: str | None) -> AuditEventCursor | None:
+    if page_token is None:
+        return None
+
+    return decode_audit_event_page_token(page_token)
@@ -3,9 +3,13 @@ from fhir_gateway.application.errors import (
     ApplicationValidationError,
 )
 from fhir_gateway.application.ports.observation_by_code_reader import (
+    AsyncObservationByCodeReader,
     ObservationByCodeReader,
 )
-from fhir_gateway.application.ports.patient_reader import PatientReader
+from fhir_gateway.application.ports.patient_reader import (
+    AsyncPatientReader,
+    PatientReader,
+)
 from fhir_gateway.domain.entities.observation import Observation
 from fhir_gateway.domain.value_objects.code import Code
 from fhir_gateway.domain.value_objects.resource_id import ResourceId
@@ -25,18 +29,7 @@ class ListObservationsByCodeUseCase:
         patient_id: ResourceId,
         code: Code,
     ) -> tuple[Observation, ...]:
-
-        if not isinstance(patient_id, ResourceId):
-            raise ApplicationValidationError(
-                "ListObservationsByCode.patient_id",
-                "must be a ResourceId",
-            )
-
-        if not isinstance(code, Code):
-            raise ApplicationValidationError(
-                "ListObservationsByCode.code",
-                "must be a Code",
-            )
+        _validate_arguments(patient_id, code)
 
         patient = self._patient_reader.get_by_id(patient_id)
 
@@ -47,3 +40,44 @@ class ListObservationsByCodeUseCase:
             patient_id,
             code,
         )
+
+
+class AsyncListObservationsByCodeUseCase:
+    def __init__(
+        self,
+        patient_reader: AsyncPatientReader,
+        observation_by_code_reader: AsyncObservationByCodeReader,
+    ) -> None:
+        self._patient_reader = patient_reader
+        self._observation_by_code_reader = observation_by_code_reader
+
+    async def execute(
+        self,
+        patient_id: ResourceId,
+        code: Code,
+    ) -> tuple[Observation, ...]:
+        _validate_arguments(patient_id, code)
+
+        patient = await self._patient_reader.get_by_id(patient_id)
+
+        if patient is None:
+            raise ApplicationNotFoundError("Patient", patient_id.value)
+
+        return await self._observation_by_code_reader.list_by_patient_and_code(
+            patient_id,
+            code,
+        )
+
+
+def _validate_arguments(patient_id: ResourceId, code: Code) -> None:
+    if not isinstance(patient_id, ResourceId):
+        raise ApplicationValidationError(
+            "ListObservationsByCode.patient_id",
+            "must be a ResourceId",
+        )
+
+    if not isinstance(code, Code):
+        raise ApplicationValidationError(
+            "ListObservationsByCode.code",
+            "must be a Code",
+        )
@@ -1,25 +1,105 @@
 from fhir_gateway.application.errors import ApplicationValidationError
-from fhir_gateway.application.ports.patient_search_reader import PatientSearchReader
-from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.application.models.patient_search import (
+    PatientSearchCursor,
+    PatientSearchPage,
+    decode_patient_search_page_token,
+)
+from fhir_gateway.application.ports.patient_search_reader import (
+    AsyncPatientSearchReader,
+    PatientSearchReader,
+)
 
 
 class SearchPatientsUseCase:
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 100
+
     def __init__(self, patient_search_reader: PatientSearchReader) -> None:
         self._patient_search_reader = patient_search_reader
 
-    def execute(self, search_text: str) -> tuple[Patient, ...]:
-        if not isinstance(search_text, str):
-            raise ApplicationValidationError(
-                "SearchPatients.search_text",
-                "must be a string",
-            )
+    def execute(
+        self,
+        search_text: str,
+        limit: int = DEFAULT_LIMIT,
+        page_token: str | None = None,
+    ) -> PatientSearchPage:
+        cleaned_search_text = _clean_search_text(search_text)
+        _validate_limit(limit)
+        after = _decode_page_token(page_token)
+
+        return self._patient_search_reader.search_by_text(
+            cleaned_search_text,
+            limit=limit,
+            after=after,
+        )
+
+
+class AsyncSearchPatientsUseCase:
+    DEFAULT_LIMIT = SearchPatientsUseCase.DEFAULT_LIMIT
+    MAX_LIMIT = SearchPatientsUseCase.MAX_LIMIT
+
+    def __init__(self, patient_search_reader: AsyncPatientSearchReader) -> None:
+        self._patient_search_reader = patient_search_reader
+
+    async def execute(
+        self,
+        search_text: str,
+        limit: int = DEFAULT_LIMIT,
+        page_token: str | None = None,
+    ) -> PatientSearchPage:
+        cleaned_search_text = _clean_search_text(search_text)
+        _validate_limit(limit)
+        after = _decode_page_token(page_token)
+
+        return await self._patient_search_reader.search_by_text(
+            cleaned_search_text,
+            limit=limit,
+            after=after,
+        )
+
+
+def _clean_search_text(search_text: str) -> str:
+    if not isinstance(search_text, str):
+        raise ApplicationValidationError(
+            "SearchPatients.search_text",
+            "must be a string",
+        )
+
+    cleaned_search_text = search_text.strip()
+
+    if cleaned_search_text == "":
+        raise ApplicationValidationError(
+            "SearchPatients.search_text",
+            "cannot be empty",
+        )
+
+    return cleaned_search_text
+
+
+def _validate_limit(limit: int) -> None:
+    if isinstance(limit, bool) or not isinstance(limit, int):
+        raise ApplicationValidationError(
+            "SearchPatients.limit",
+            "must be an integer",
+        )
+
+    if limit < 1:
+        raise ApplicationValidationError(
+            "SearchPatients.limit",
+            "must be greater than or equal to 1",
+        )
+
+    max_limit = SearchPatientsUseCase.MAX_LIMIT
+
+    if limit > max_limit:
+        raise ApplicationValidationError(
+            "SearchPatients.limit",
+            f"must be less than or equal to {max_limit}",
+        )
 
-        cleaned_search_text = search_text.strip()
 
-        if cleaned_search_text == "":
-            raise ApplicationValidationError(
-                "SearchPatients.search_text",
-                "cannot be empty",
-            )
+def _decode_page_token(page_token: str | None) -> PatientSearchCursor | None:
+    if page_token is None:
+        return None
 
-        return self._patient_search_reader.search_by_text(cleaned_search_text)
+    return decode_patient_search_page_token(page_token)
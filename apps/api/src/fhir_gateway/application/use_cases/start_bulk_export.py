@@ -0,0 +1,89 @@
+import uuid
+from collections.abc import Sequence
+from datetime import datetime, timezone
+
+from fhir_gateway.application.errors import ApplicationValidationError
+from fhir_gateway.application.models.bulk_export import (
+    BULK_EXPORT_RESOURCE_TYPES,
+    BulkExportJob,
+    BulkExportStatus,
+)
+from fhir_gateway.application.ports.bulk_export_job_repository import (
+    BulkExportJobRepository,
+)
+from fhir_gateway.application.ports.bulk_export_scheduler import (
+    BulkExportScheduler,
+)
+
+
+class StartBulkExportUseCase:
+    def __init__(
+        self,
+        job_repository: BulkExportJobRepository,
+        scheduler: BulkExportScheduler,
+    ) -> None:
+        self._job_repository = job_repository
+        self._scheduler = scheduler
+
+    def execute(
+        self,
+        resource_types: Sequence[str] | None = None,
+        gzip: bool = False,
+    ) -> BulkExportJob:
+        job = BulkExportJob(
+            id=uuid.uuid4().hex,
+            status=BulkExportStatus.ACCEPTED,
+            resource_types=_clean_resource_types(resource_types),
+            requested_at=datetime.now(timezone.utc),
+            gzip=_validate_gzip(gzip),
+        )
+
+        self._job_repository.save(job)
+        self._scheduler.submit(job)
+
+        return job
+
+
+def _clean_resource_types(resource_types: Sequence[str] | None) -> tuple[str, ...]:
+    if resource_types is None:
+        return BULK_EXPORT_RESOURCE_TYPES
+
+    if isinstance(resource_types, str) or not isinstance(resource_types, (list, tuple)):
+        raise ApplicationValidationError(
+            "StartBulkExport.resource_types",
+            "must be a list or a tuple of resource types",
+        )
+
+    requested = set()
+
+    for resource_type in resource_types:
+        if resource_type not in BULK_EXPORT_RESOURCE_TYPES:
+            raise ApplicationValidationError(
+                "StartBulkExport.resource_types",
+                "must contain only: " + ", ".join(BULK_EXPORT_RESOURCE_TYPES),
+            )
+
+        requested.add(resource_type)
+
+    if not requested:
+        raise ApplicationValidationError(
+            "StartBulkExport.resource_types",
+            "cannot be empty",
+        )
+
+    # Keep the canonical export order regardless of how they were requested.
+    return tuple(
+        resource_type
+        for resource_type in BULK_EXPORT_RESOURCE_TYPES
+        if resource_type in requested
+    )
+
+
+def _validate_gzip(gzip: bool) -> bool:
+    if not isinstance(gzip, bool):
+        raise ApplicationValidationError(
+            "StartBulkExport.gzip",
+            "must be a boolean",
+        )
+
+    return gzip
@@ -26,3 +26,18 @@ class Condition:
 
         if self.recorded_date is not None:
             type_validator(self, "recorded_date", Instant, "must be an Instant")
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        id: ResourceId,
+        code: Code,
+        subject: Reference,
+        recorded_date: Instant | None = None,
+    ) -> "Condition":
+        condition = object.__new__(cls)
+        object.__setattr__(condition, "id", id)
+        object.__setattr__(condition, "code", code)
+        object.__setattr__(condition, "subject", subject)
+        object.__setattr__(condition, "recorded_date", recorded_date)
+        return condition
@@ -23,3 +23,16 @@ class Encounter:
         type_validator(self, "period", Period, "must be a Period")
         if self.period.start is None:
             raise DomainValidationError("Encounter.period", "start must be present")
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        id: ResourceId,
+        subject: Reference,
+        period: Period,
+    ) -> "Encounter":
+        encounter = object.__new__(cls)
+        object.__setattr__(encounter, "id", id)
+        object.__setattr__(encounter, "subject", subject)
+        object.__setattr__(encounter, "period", period)
+        return encounter
@@ -49,3 +49,22 @@ class Observation:
         type_validator(self, "effective", Instant, "must be an Instant")
 
         type_validator(self, "value", Quantity, "must be a Quantity")
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        id: ResourceId,
+        status: ObservationStatus,
+        code: Code,
+        subject: Reference,
+        effective: Instant,
+        value: Quantity,
+    ) -> "Observation":
+        observation = object.__new__(cls)
+        object.__setattr__(observation, "id", id)
+        object.__setattr__(observation, "status", status)
+        object.__setattr__(observation, "code", code)
+        object.__setattr__(observation, "subject", subject)
+        object.__setattr__(observation, "effective", effective)
+        object.__setattr__(observation, "value", value)
+        return observation
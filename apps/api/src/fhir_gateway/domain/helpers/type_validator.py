@@ -1,6 +1,17 @@
 from datetime import datetime
 from fhir_gateway.domain.errors import DomainValidationError
 
+_TYPE_NAMES: dict[type, str] = {
+    str: "string",
+    int: "number",
+    float: "number",
+    list: "list",
+    dict: "dictionary",
+    tuple: "tuple",
+    bool: "boolean",
+    datetime: "datetime",
+}
+
 
 def type_validator(
     instance: object,
@@ -8,26 +19,14 @@ def type_validator(
     expected_type: type | tuple[type, ...],
     optional_error_message: (
         str | None
-    ) = None,  # All the validations with "expected_type: tuple[type,...]" or other "expected_type" with a type not listed in "type_names_map"
+    ) = None,  # All the validations with "expected_type: tuple[type,...]" or other "expected_type" with a type not listed in "_TYPE_NAMES"
     # require an optional_error_message in order to avoid a final error message such as "...must be a None"
 ) -> None:
-    class_name = instance.__class__.__name__
-    value = instance.__getattribute__(attribute_name)
+    value = getattr(instance, attribute_name)
 
     if not isinstance(value, expected_type):
-
-        type_names_map = {
-            str: "string",
-            int: "number",
-            float: "number",
-            list: "list",
-            dict: "dictionary",
-            tuple: "tuple",
-            bool: "boolean",
-            datetime: "datetime",
-        }
-
-        expected_type_name = type_names_map.get(expected_type)
+        class_name = instance.__class__.__name__
+        expected_type_name = _TYPE_NAMES.get(expected_type)
 
         error_message = (
             f"must be a {expected_type_name}"
@@ -27,3 +27,16 @@ class Code:
 
             cleaned_display = normalize_string(self, "display", False)
             object.__setattr__(self, "display", cleaned_display)
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        system: str,
+        code: str,
+        display: str | None = None,
+    ) -> "Code":
+        instance = object.__new__(cls)
+        object.__setattr__(instance, "system", system)
+        object.__setattr__(instance, "code", code)
+        object.__setattr__(instance, "display", display)
+        return instance
@@ -20,3 +20,14 @@ class Period:
         if self.start is not None and self.end is not None:
             if self.start.value > self.end.value:
                 raise DomainValidationError("Period", "start must be <= end")
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        start: Instant | None = None,
+        end: Instant | None = None,
+    ) -> "Period":
+        period = object.__new__(cls)
+        object.__setattr__(period, "start", start)
+        object.__setattr__(period, "end", end)
+        return period
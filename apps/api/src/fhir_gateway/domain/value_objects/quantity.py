@@ -24,3 +24,14 @@ class Quantity:
             raise DomainValidationError(
                 "Quantity.unit", "cannot be empty when Quantity.value is present"
             )
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        value: float | int | None = None,
+        unit: str | None = None,
+    ) -> "Quantity":
+        quantity = object.__new__(cls)
+        object.__setattr__(quantity, "value", value)
+        object.__setattr__(quantity, "unit", unit)
+        return quantity
@@ -37,3 +37,14 @@ class Reference:
         object.__setattr__(self, "resource_type", resource_type_cleaned)
 
         type_validator(self, "id", ResourceId, "must be a ResourceId")
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        resource_type: str,
+        id: ResourceId,
+    ) -> "Reference":
+        reference = object.__new__(cls)
+        object.__setattr__(reference, "resource_type", resource_type)
+        object.__setattr__(reference, "id", id)
+        return reference
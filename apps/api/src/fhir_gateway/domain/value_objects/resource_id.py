@@ -13,3 +13,12 @@ class ResourceId:
 
         cleaned_value = normalize_string(self, "value")
         object.__setattr__(self, "value", cleaned_value)
+
+    @classmethod
+    def _from_trusted(
+        cls,
+        value: str,
+    ) -> "ResourceId":
+        resource_id = object.__new__(cls)
+        object.__setattr__(resource_id, "value", value)
+        return resource_id
@@ -0,0 +1,9 @@
+from fhir_gateway.infrastructure.audit.batching_writer import (
+    AuditEventBatchSink,
+    BatchingAuditEventWriter,
+)
+
+__all__ = (
+    "AuditEventBatchSink",
+    "BatchingAuditEventWriter",
+)
@@ -0,0 +1,159 @@
+import logging
+import queue
+import time
+from collections.abc import Sequence
+from threading import Event, Lock, Thread
+from typing import Protocol
+
+from fhir_gateway.domain.entities.audit_event import AuditEvent
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class AuditEventBatchSink(Protocol):
+    def write_batch(self, events: Sequence[AuditEvent]) -> None: ...
+
+
+class BatchingAuditEventWriter:
+    """Buffer audit events in memory and write them in batches.
+
+    `record` only enqueues the event, so requests do not pay for an INSERT
+    and a commit each. A background thread takes events off the queue and
+    hands them to the sink once `batch_size` events are collected or
+    `flush_interval_seconds` have passed since the first event of the
+    batch, whichever comes first.
+
+    The queue holds at most `max_queue_size` events. When it is full,
+    `record` blocks until the worker makes room; events are never dropped.
+    A failing batch is retried every `retry_delay_seconds`, which keeps the
+    queue full and slows producers down until the database recovers.
+
+    The worker thread starts with the first event. `close` stops accepting
+    events and waits until everything already queued has been written.
+    """
+
+    def __init__(
+        self,
+        sink: AuditEventBatchSink,
+        *,
+        max_queue_size: int,
+        batch_size: int,
+        flush_interval_seconds: float,
+        retry_delay_seconds: float = 1.0,
+    ) -> None:
+        if max_queue_size < 1:
+            raise ValueError("max_queue_size must be at least 1.")
+
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        if flush_interval_seconds <= 0:
+            raise ValueError("flush_interval_seconds must be greater than 0.")
+
+        self._sink = sink
+        self._batch_size = batch_size
+        self._flush_interval_seconds = flush_interval_seconds
+        self._retry_delay_seconds = retry_delay_seconds
+        self._queue: queue.Queue[object] = queue.Queue(maxsize=max_queue_size)
+        self._lock = Lock()
+        self._worker: Thread | None = None
+        self._closed = False
+        self._stopping = Event()
+
+    @property
+    def pending(self) -> int:
+        """Approximate number of queued events not yet handed to the sink."""
+        return self._queue.qsize()
+
+    def record(self, event: AuditEvent) -> None:
+        # The lock keeps `close` from slipping its stop marker in between
+        # the closed check and the put, which would strand this event.
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The audit event writer is closed.")
+
+            if self._worker is None:
+                self._worker = Thread(
+                    target=self._run,
+                    name="fhir-gateway-audit-writer",
+                    daemon=True,
+                )
+                self._worker.start()
+
+            self._queue.put(event)
+
+    def close(self) -> None:
+        # Set before taking the lock: a producer may hold it while blocked
+        # on a full queue, and the worker must stop retrying to drain it.
+        self._stopping.set()
+
+        with self._lock:
+            if self._closed:
+                return
+
+            self._closed = True
+            worker = self._worker
+
+            if worker is not None:
+                self._queue.put(_STOP)
+
+        if worker is not None:
+            worker.join()
+
+    def _run(self) -> None:
+        stopping = False
+
+        while not stopping:
+            batch, stopping = self._next_batch()
+
+            if batch:
+                self._write(batch)
+
+    def _next_batch(self) -> tuple[list[AuditEvent], bool]:
+        first = self._queue.get()
+
+        if first is _STOP:
+            return [], True
+
+        batch = [first]
+        deadline = time.monotonic() + self._flush_interval_seconds
+
+        while len(batch) < self._batch_size:
+            timeout = deadline - time.monotonic()
+
+            if timeout <= 0:
+                break
+
+            try:
+                event = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+
+            if event is _STOP:
+                return batch, True
+
+            batch.append(event)
+
+        return batch, False
+
+    def _write(self, batch: list[AuditEvent]) -> None:
+        while True:
+            try:
+                self._sink.write_batch(batch)
+                return
+            except Exception:
+                if self._stopping.is_set():
+                    logger.exception(
+                        "Dropping %d audit events: write failed during shutdown",
+                        len(batch),
+                    )
+                    return
+
+                logger.exception(
+                    "Writing %d audit events failed; retrying in %.1f s",
+                    len(batch),
+                    self._retry_delay_seconds,
+                )
+                self._stopping.wait(self._retry_delay_seconds)
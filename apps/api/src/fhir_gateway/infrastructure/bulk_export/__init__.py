@@ -0,0 +1,13 @@
+from fhir_gateway.infrastructure.bulk_export.job_repository import (
+    InMemoryBulkExportJobRepository,
+)
+from fhir_gateway.infrastructure.bulk_export.runner import BulkExportRunner
+from fhir_gateway.infrastructure.bulk_export.scheduler import (
+    BackgroundBulkExportScheduler,
+)
+
+__all__ = (
+    "BackgroundBulkExportScheduler",
+    "BulkExportRunner",
+    "InMemoryBulkExportJobRepository",
+)
@@ -0,0 +1,106 @@
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.condition import (
+    condition_record_to_domain,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.encounter import (
+    encounter_record_to_domain,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.observation import (
+    observation_record_to_domain,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.patient import (
+    patient_record_to_domain,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models import (
+    ConditionCodeRecord,
+    ConditionRecord,
+    EncounterRecord,
+    ObservationCodeRecord,
+    ObservationRecord,
+    PatientIdentifierRecord,
+    PatientRecord,
+)
+from fhir_gateway.infrastructure.serialization import encode_fhir_resource
+
+
+def encode_ndjson_batch(resource_type: str, rows: list[dict]) -> bytes:
+    """Map one scanned batch to domain entities and encode it as NDJSON.
+
+    This is the unit of work sent to the bulk export process pool, so it is
+    a module-level function that only takes and returns picklable values.
+    Rows go through the same ORM/domain mappers as the read adapters, so
+    exported resources are validated exactly like API responses.
+    """
+    to_domain = _ROW_MAPPERS[resource_type]
+
+    return b"".join(encode_fhir_resource(to_domain(row)) + b"\n" for row in rows)
+
+
+def _patient_row_to_domain(row: dict):
+    return patient_record_to_domain(
+        PatientRecord(
+            id=row["id"],
+            name_text=row["name_text"],
+            name_family=row["name_family"],
+            name_given=row["name_given"],
+            identifiers=[
+                PatientIdentifierRecord(system=system, value=value)
+                for system, value in row["identifiers"]
+            ],
+        )
+    )
+
+
+def _condition_row_to_domain(row: dict):
+    return condition_record_to_domain(
+        ConditionRecord(
+            id=row["id"],
+            patient_id=row["patient_id"],
+            code_id=row["code_id"],
+            recorded_at=row["recorded_at"],
+        ),
+        ConditionCodeRecord(
+            id=row["code_id"],
+            system=row["code_system"],
+            code=row["code_code"],
+            display=row["code_display"],
+        ),
+    )
+
+
+def _encounter_row_to_domain(row: dict):
+    return encounter_record_to_domain(
+        EncounterRecord(
+            id=row["id"],
+            patient_id=row["patient_id"],
+            period_start_at=row["period_start_at"],
+            period_end_at=row["period_end_at"],
+        )
+    )
+
+
+def _observation_row_to_domain(row: dict):
+    return observation_record_to_domain(
+        ObservationRecord(
+            id=row["id"],
+            patient_id=row["patient_id"],
+            status=row["status"],
+            code_id=row["code_id"],
+            effective_at=row["effective_at"],
+            value_quantity=row["value_quantity"],
+            value_unit=row["value_unit"],
+        ),
+        ObservationCodeRecord(
+            id=row["code_id"],
+            system=row["code_system"],
+            code=row["code_code"],
+            display=row["code_display"],
+        ),
+    )
+
+
+_ROW_MAPPERS = {
+    "Patient": _patient_row_to_domain,
+    "Condition": _condition_row_to_domain,
+    "Encounter": _encounter_row_to_domain,
+    "Observation": _observation_row_to_domain,
+}
@@ -0,0 +1,23 @@
+from threading import Lock
+
+from fhir_gateway.application.models.bulk_export import BulkExportJob
+
+
+class InMemoryBulkExportJobRepository:
+    """Keep bulk export job state in process memory.
+
+    Jobs are lost on restart and are not shared between API processes, which
+    matches the single-process local deployment this engine targets.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: dict[str, BulkExportJob] = {}
+        self._lock = Lock()
+
+    def save(self, job: BulkExportJob) -> None:
+        with self._lock:
+            self._jobs[job.id] = job
+
+    def get(self, job_id: str) -> BulkExportJob | None:
+        with self._lock:
+            return self._jobs.get(job_id)
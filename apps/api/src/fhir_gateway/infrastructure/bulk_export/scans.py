@@ -0,0 +1,171 @@
+from collections.abc import Iterator
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models import (
+    ConditionCodeRecord,
+    ConditionRecord,
+    EncounterRecord,
+    ObservationCodeRecord,
+    ObservationRecord,
+    PatientIdentifierRecord,
+    PatientRecord,
+)
+
+
+def scan_resource_rows(
+    session: Session,
+    resource_type: str,
+    *,
+    batch_size: int,
+) -> Iterator[list[dict]]:
+    """Yield batches of plain row dicts for one resource type, sorted by id.
+
+    Each batch is one keyset query (`id > :last_id ORDER BY id LIMIT n`) on
+    the primary key, so batches stay cheap however deep the scan goes and no
+    cursor is held open between them. Rows are plain dicts so they can be
+    sent to worker processes.
+
+    Conditions, encounters and observations of a logically deleted patient
+    are skipped with the patient, so every subject reference in the export
+    resolves to an exported Patient.
+    """
+    build_statement = _STATEMENT_BUILDERS[resource_type]
+    last_id: str | None = None
+
+    while True:
+        stmt = build_statement(last_id).limit(batch_size)
+        rows = [row._asdict() for row in session.execute(stmt)]
+
+        if not rows:
+            return
+
+        if resource_type == "Patient":
+            _attach_identifiers(session, rows)
+
+        yield rows
+
+        if len(rows) < batch_size:
+            return
+
+        last_id = rows[-1]["id"]
+
+
+def _after(stmt: Select, id_column, last_id: str | None) -> Select:
+    if last_id is not None:
+        stmt = stmt.where(id_column > last_id)
+
+    return stmt.order_by(id_column)
+
+
+def _select_patients(last_id: str | None) -> Select:
+    stmt = select(
+        PatientRecord.id,
+        PatientRecord.name_text,
+        PatientRecord.name_family,
+        PatientRecord.name_given,
+    ).where(PatientRecord.deleted_at.is_(None))
+
+    return _after(stmt, PatientRecord.id, last_id)
+
+
+def _select_conditions(last_id: str | None) -> Select:
+    stmt = (
+        select(
+            ConditionRecord.id,
+            ConditionRecord.patient_id,
+            ConditionRecord.code_id,
+            ConditionRecord.recorded_at,
+            ConditionCodeRecord.system.label("code_system"),
+            ConditionCodeRecord.code.label("code_code"),
+            ConditionCodeRecord.display.label("code_display"),
+        )
+        .join(
+            ConditionCodeRecord,
+            ConditionRecord.code_id == ConditionCodeRecord.id,
+        )
+        .join(PatientRecord, ConditionRecord.patient_id == PatientRecord.id)
+        .where(
+            ConditionRecord.deleted_at.is_(None),
+            PatientRecord.deleted_at.is_(None),
+        )
+    )
+
+    return _after(stmt, ConditionRecord.id, last_id)
+
+
+def _select_encounters(last_id: str | None) -> Select:
+    stmt = (
+        select(
+            EncounterRecord.id,
+            EncounterRecord.patient_id,
+            EncounterRecord.period_start_at,
+            EncounterRecord.period_end_at,
+        )
+        .join(PatientRecord, EncounterRecord.patient_id == PatientRecord.id)
+        .where(
+            EncounterRecord.deleted_at.is_(None),
+            PatientRecord.deleted_at.is_(None),
+        )
+    )
+
+    return _after(stmt, EncounterRecord.id, last_id)
+
+
+def _select_observations(last_id: str | None) -> Select:
+    stmt = (
+        select(
+            ObservationRecord.id,
+            ObservationRecord.patient_id,
+            ObservationRecord.status,
+            ObservationRecord.code_id,
+            ObservationRecord.effective_at,
+            ObservationRecord.value_quantity,
+            ObservationRecord.value_unit,
+            ObservationCodeRecord.system.label("code_system"),
+            ObservationCodeRecord.code.label("code_code"),
+            ObservationCodeRecord.display.label("code_display"),
+        )
+        .join(
+            ObservationCodeRecord,
+            ObservationRecord.code_id == ObservationCodeRecord.id,
+        )
+        .join(PatientRecord, ObservationRecord.patient_id == PatientRecord.id)
+        .where(
+            ObservationRecord.deleted_at.is_(None),
+            PatientRecord.deleted_at.is_(None),
+        )
+    )
+
+    return _after(stmt, ObservationRecord.id, last_id)
+
+
+def _attach_identifiers(session: Session, patient_rows: list[dict]) -> None:
+    identifiers: dict[str, list[tuple[str, str]]] = {
+        row["id"]: [] for row in patient_rows
+    }
+
+    stmt = (
+        select(
+            PatientIdentifierRecord.patient_id,
+            PatientIdentifierRecord.system,
+            PatientIdentifierRecord.value,
+        )
+        .where(PatientIdentifierRecord.patient_id.in_(identifiers))
+        .order_by(PatientIdentifierRecord.patient_id, PatientIdentifierRecord.id)
+    )
+
+    for patient_id, system, value in session.execute(stmt):
+        identifiers[patient_id].append((system, value))
+
+    for row in patient_rows:
+        row["identifiers"] = identifiers[row["id"]]
+
+
+_STATEMENT_BUILDERS = {
+    "Patient": _select_patients,
+    "Condition": _select_conditions,
+    "Encounter": _select_encounters,
+    "Observation": _select_observations,
+}
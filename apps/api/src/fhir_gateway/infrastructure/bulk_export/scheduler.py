@@ -0,0 +1,67 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from datetime import datetime, timezone
+
+from fhir_gateway.application.models.bulk_export import (
+    BulkExportJob,
+    BulkExportStatus,
+)
+from fhir_gateway.application.ports.bulk_export_job_repository import (
+    BulkExportJobRepository,
+)
+from fhir_gateway.infrastructure.bulk_export.runner import BulkExportRunner
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundBulkExportScheduler:
+    """Run bulk export jobs one at a time on a background thread.
+
+    Jobs run in submission order so concurrent exports never compete for
+    the runner's process pool. Every state transition is saved to the job
+    repository, and a failing job is recorded as failed instead of being
+    raised to anyone.
+    """
+
+    def __init__(
+        self,
+        runner: BulkExportRunner,
+        job_repository: BulkExportJobRepository,
+    ) -> None:
+        self._runner = runner
+        self._job_repository = job_repository
+        self._executor = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix="fhir-gateway-bulk-export",
+        )
+
+    def submit(self, job: BulkExportJob) -> None:
+        self._executor.submit(self._run, job)
+
+    def shutdown(self) -> None:
+        # Queued jobs are dropped; the running job is allowed to finish so
+        # its output files are not left half written.
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._runner.shutdown()
+
+    def _run(self, job: BulkExportJob) -> None:
+        job = replace(
+            job,
+            status=BulkExportStatus.IN_PROGRESS,
+            started_at=datetime.now(timezone.utc),
+        )
+        self._job_repository.save(job)
+
+        try:
+            job = self._runner.run(job)
+        except Exception as error:
+            logger.exception("Bulk export %s failed", job.id)
+            job = replace(
+                job,
+                status=BulkExportStatus.FAILED,
+                completed_at=datetime.now(timezone.utc),
+                error=str(error) or type(error).__name__,
+            )
+
+        self._job_repository.save(job)
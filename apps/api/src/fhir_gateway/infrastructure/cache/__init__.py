@@ -0,0 +1,15 @@
+from fhir_gateway.infrastructure.cache.lru_cache import InMemoryLruCache
+from fhir_gateway.infrastructure.cache.shared_cache import (
+    InMemoryKeyValueStore,
+    KeyValueStore,
+    SharedCache,
+)
+from fhir_gateway.infrastructure.cache.stats import CacheStats
+
+__all__ = (
+    "CacheStats",
+    "InMemoryKeyValueStore",
+    "InMemoryLruCache",
+    "KeyValueStore",
+    "SharedCache",
+)
@@ -0,0 +1,76 @@
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
+
+from fhir_gateway.infrastructure.cache.stats import CacheStats
+
+
+class InMemoryLruCache:
+    """Process-local LRU cache bounded by entry count and entry age.
+
+    Values are stored by reference, so callers must only cache immutable
+    values. Expired entries are dropped when they are looked up; the entry
+    limit evicts the least recently used entry on insert. All operations
+    take one lock, which is cheap next to the database reads being cached.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int,
+        ttl_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be greater than 0.")
+
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[float, object]] = OrderedDict()
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: str) -> object | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                self._misses += 1
+                return None
+
+            expires_at, value = entry
+
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def set(self, key: str, value: object) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + self._ttl_seconds, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                backend="memory",
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._entries),
+            )
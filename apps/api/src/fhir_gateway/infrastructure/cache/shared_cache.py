@@ -0,0 +1,107 @@
+import pickle
+import time
+from collections.abc import Callable
+from threading import Lock
+from typing import Protocol
+
+from fhir_gateway.infrastructure.cache.stats import CacheStats
+
+
+class KeyValueStore(Protocol):
+    """Byte store shared by every API process, such as Redis or memcached."""
+
+    def get(self, key: str) -> bytes | None: ...
+
+    def set(self, key: str, value: bytes, *, ttl_seconds: float) -> None: ...
+
+
+class InMemoryKeyValueStore:
+    """Local stand-in for a shared `KeyValueStore`.
+
+    It has the same contract as a networked store: values are bytes and
+    expire after their TTL. It is only shared within one process, which is
+    enough for local runs and tests.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic) -> None:
+        self._clock = clock
+        self._values: dict[str, tuple[float, bytes]] = {}
+        self._lock = Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._values.get(key)
+
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+
+            if expires_at <= self._clock():
+                del self._values[key]
+                return None
+
+            return value
+
+    def set(self, key: str, value: bytes, *, ttl_seconds: float) -> None:
+        with self._lock:
+            self._values[key] = (self._clock() + ttl_seconds, value)
+
+
+class SharedCache:
+    """Cache application results in a `KeyValueStore` shared by processes.
+
+    Values are pickled, so every API process must run the same code version.
+    The store enforces the TTL and its own size limit; hit and miss counters
+    are kept per process.
+    """
+
+    def __init__(
+        self,
+        store: KeyValueStore,
+        *,
+        ttl_seconds: float,
+        key_prefix: str = "fhir-gateway:",
+    ) -> None:
+        if ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be greater than 0.")
+
+        self._store = store
+        self._ttl_seconds = ttl_seconds
+        self._key_prefix = key_prefix
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key: str) -> object | None:
+        payload = self._store.get(self._key_prefix + key)
+        self._record_lookup(hit=payload is not None)
+
+        if payload is None:
+            return None
+
+        return pickle.loads(payload)
+
+    def set(self, key: str, value: object) -> None:
+        self._store.set(
+            self._key_prefix + key,
+            pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL),
+            ttl_seconds=self._ttl_seconds,
+        )
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                backend="shared",
+                hits=self._hits,
+                misses=self._misses,
+                evictions=0,
+                entries=None,
+            )
+
+    def _record_lookup(self, *, hit: bool) -> None:
+        with self._lock:
+            if hit:
+                self._hits += 1
+            else:
+                self._misses += 1
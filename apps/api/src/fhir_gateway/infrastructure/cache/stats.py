@@ -0,0 +1,19 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True, slots=True)
+class CacheStats:
+    backend: str
+    hits: int
+    misses: int
+    evictions: int
+    entries: int | None
+
+    @property
+    def hit_ratio(self) -> float | None:
+        lookups = self.hits + self.misses
+
+        if lookups == 0:
+            return None
+
+        return self.hits / lookups
@@ -0,0 +1,5 @@
+from fhir_gateway.infrastructure.concurrency.thread_pool_read_executor import (
+    ThreadPoolReadExecutor,
+)
+
+__all__ = ("ThreadPoolReadExecutor",)
@@ -0,0 +1,57 @@
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from threading import BoundedSemaphore
+
+
+class ThreadPoolReadExecutor:
+    """Run independent reads of one request in parallel on a shared pool.
+
+    The pool is shared by every request, so `max_concurrent_reads_per_call`
+    caps how many workers a single `run_all` call may occupy at once. A
+    request fanning out more reads than its limit waits for its own reads
+    to finish instead of queueing ahead of other requests.
+
+    Each read must use its own database session: SQLAlchemy sessions are
+    not safe to share between threads.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int,
+        max_concurrent_reads_per_call: int,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1.")
+
+        if max_concurrent_reads_per_call < 1:
+            raise ValueError("max_concurrent_reads_per_call must be at least 1.")
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="fhir-gateway-read",
+        )
+        self._max_concurrent_reads_per_call = max_concurrent_reads_per_call
+
+    def run_all(
+        self,
+        reads: Sequence[Callable[[], object]],
+    ) -> tuple[object, ...]:
+        slots = BoundedSemaphore(self._max_concurrent_reads_per_call)
+        futures: list[Future[object]] = []
+
+        for read in reads:
+            slots.acquire()
+
+            future = self._executor.submit(read)
+            future.add_done_callback(lambda _: slots.release())
+            futures.append(future)
+
+        # Wait for every read before surfacing a failure, so no read is
+        # still using its session when the request closes it.
+        wait(futures)
+
+        return tuple(future.result() for future in futures)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True)
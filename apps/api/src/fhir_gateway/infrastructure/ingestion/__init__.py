@@ -0,0 +1,19 @@
+from fhir_gateway.infrastructure.ingestion.pipeline import (
+    BulkIngestion,
+    IngestionReport,
+    ResourceBatchSink,
+)
+from fhir_gateway.infrastructure.ingestion.sources import (
+    iter_bundle_resources,
+    iter_fhir_file,
+    iter_ndjson_resources,
+)
+
+__all__ = (
+    "BulkIngestion",
+    "IngestionReport",
+    "ResourceBatchSink",
+    "iter_bundle_resources",
+    "iter_fhir_file",
+    "iter_ndjson_resources",
+)
@@ -0,0 +1,79 @@
+import time
+from collections import Counter
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from typing import Protocol
+
+from fhir_gateway.infrastructure.serialization.fhir_json import (
+    FhirResource,
+    resource_from_fhir,
+)
+
+
+class ResourceBatchSink(Protocol):
+    def write_batch(self, resources: Sequence[FhirResource]) -> None: ...
+
+
+@dataclass(frozen=True, slots=True)
+class IngestionReport:
+    resources_by_type: dict[str, int]
+    batches: int
+    seconds: float
+
+    @property
+    def resources(self) -> int:
+        return sum(self.resources_by_type.values())
+
+    @property
+    def resources_per_second(self) -> float:
+        return self.resources / self.seconds if self.seconds else 0.0
+
+
+class BulkIngestion:
+    """Decode FHIR JSON resources and write them in large batches.
+
+    Every resource is decoded through `resource_from_fhir`, so it is
+    validated by the domain entities before anything is written. Resources
+    are handed to the sink `batch_size` at a time; each batch is one
+    transaction of the sink, and a failing batch stops the ingestion with
+    the earlier batches committed.
+
+    Resources are consumed lazily, so memory use depends on `batch_size`,
+    not on the size of the input. Patients must come before, or in the same
+    batch as, the resources that reference them.
+    """
+
+    def __init__(self, sink: ResourceBatchSink, *, batch_size: int = 20_000) -> None:
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        self._sink = sink
+        self._batch_size = batch_size
+
+    def ingest(self, resources: Iterable[dict]) -> IngestionReport:
+        started_at = time.perf_counter()
+        counts: Counter[str] = Counter()
+        batches = 0
+        batch: list[FhirResource] = []
+
+        for resource in resources:
+            batch.append(resource_from_fhir(resource))
+
+            if len(batch) == self._batch_size:
+                self._write(batch, counts)
+                batches += 1
+                batch = []
+
+        if batch:
+            self._write(batch, counts)
+            batches += 1
+
+        return IngestionReport(
+            resources_by_type=dict(counts),
+            batches=batches,
+            seconds=time.perf_counter() - started_at,
+        )
+
+    def _write(self, batch: list[FhirResource], counts: Counter[str]) -> None:
+        self._sink.write_batch(batch)
+        counts.update(type(resource).__name__ for resource in batch)
@@ -0,0 +1,65 @@
+import json
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+
+from fhir_gateway.infrastructure.serialization.errors import FhirDecodingError
+
+
+def iter_ndjson_resources(lines: Iterable[str | bytes]) -> Iterator[dict]:
+    """Yield the FHIR resources of NDJSON `lines`, one line at a time.
+
+    A line holding a `Bundle` yields the resources of its entries, so files
+    of one Bundle per line are read the same way. Blank lines are skipped.
+    Only the current line is held in memory.
+    """
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+
+        try:
+            resource = json.loads(line)
+        except ValueError as error:
+            raise FhirDecodingError(
+                f"Line {line_number} is not valid JSON: {error}"
+            ) from error
+
+        yield from _expand_bundle(resource)
+
+
+def iter_bundle_resources(bundle: dict) -> Iterator[dict]:
+    """Yield the resources of a FHIR `Bundle`, in entry order."""
+    if not isinstance(bundle, dict) or bundle.get("resourceType") != "Bundle":
+        raise FhirDecodingError("Expected a FHIR Bundle.")
+
+    for entry in bundle.get("entry", ()):
+        if not isinstance(entry, dict) or "resource" not in entry:
+            raise FhirDecodingError("Every Bundle entry must hold a resource.")
+
+        yield from _expand_bundle(entry["resource"])
+
+
+def iter_fhir_file(path: Path) -> Iterator[dict]:
+    """Yield the resources of a `.ndjson` file or of a `.json` document.
+
+    NDJSON is streamed line by line. A `.json` file is one JSON document,
+    a Bundle or a single resource, and is parsed whole.
+    """
+    if path.suffix == ".ndjson":
+        with path.open("rb") as lines:
+            yield from iter_ndjson_resources(lines)
+        return
+
+    with path.open("rb") as document:
+        try:
+            resource = json.load(document)
+        except ValueError as error:
+            raise FhirDecodingError(f"{path} is not valid JSON: {error}") from error
+
+    yield from _expand_bundle(resource)
+
+
+def _expand_bundle(resource: object) -> Iterator[dict]:
+    if isinstance(resource, dict) and resource.get("resourceType") == "Bundle":
+        yield from iter_bundle_resources(resource)
+    else:
+        yield resource
@@ -1,25 +1,59 @@
 """SQLAlchemy read adapters for application persistence ports."""
 
 from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.audit_event_reader import (
+    AsyncSqlAlchemyAuditEventReader,
     SqlAlchemyAuditEventReader,
 )
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.audit_event_writer import (
+    SqlAlchemyAuditEventBatchWriter,
+)
 from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.condition_reader import (
+    AsyncSqlAlchemyConditionReader,
     SqlAlchemyConditionReader,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.encounter_reader import (
+    AsyncSqlAlchemyEncounterReader,
     SqlAlchemyEncounterReader,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.observation_reader import (
+    AsyncSqlAlchemyObservationReader,
     SqlAlchemyObservationReader,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.patient_reader import (
+    AsyncSqlAlchemyPatientReader,
     SqlAlchemyPatientReader,
 )
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.patient_summary_reader import (
+    AsyncSqlAlchemyPatientSummaryReader,
+    SqlAlchemyPatientSummaryReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.patient_version_reader import (
+    AsyncSqlAlchemyPatientVersionReader,
+    SqlAlchemyPatientVersionReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.resource_bulk_writer import (
+    SqlAlchemyResourceBulkWriter,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.session_per_call import (
+    SessionPerCallReader,
+)
 
 __all__ = [
+    "AsyncSqlAlchemyAuditEventReader",
+    "AsyncSqlAlchemyConditionReader",
+    "AsyncSqlAlchemyEncounterReader",
+    "AsyncSqlAlchemyObservationReader",
+    "AsyncSqlAlchemyPatientReader",
+    "AsyncSqlAlchemyPatientSummaryReader",
+    "AsyncSqlAlchemyPatientVersionReader",
+    "SessionPerCallReader",
+    "SqlAlchemyAuditEventBatchWriter",
     "SqlAlchemyAuditEventReader",
     "SqlAlchemyConditionReader",
     "SqlAlchemyEncounterReader",
     "SqlAlchemyObservationReader",
     "SqlAlchemyPatientReader",
+    "SqlAlchemyPatientSummaryReader",
+    "SqlAlchemyPatientVersionReader",
+    "SqlAlchemyResourceBulkWriter",
 ]
@@ -1,6 +1,15 @@
-from sqlalchemy import select
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import Select, and_, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from fhir_gateway.application.models.audit_events import (
+    AuditEventCursor,
+    AuditEventFilters,
+    AuditEventPage,
+)
 from fhir_gateway.domain.entities.audit_event import AuditEvent
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.audit_event import (
     audit_event_record_to_domain,
@@ -9,24 +18,208 @@ from fhir_gateway.infrastructure.persistence.sqlalchemy.models.audit_event impor
     AuditEventRecord,
 )
 
+DEFAULT_RECENT_WINDOW = timedelta(days=31)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
 
 class SqlAlchemyAuditEventReader:
-    def __init__(self, session: Session) -> None:
+    """Read audit events newest first, one keyset page at a time.
+
+    Every query first looks only at the `recent_window` before the newest
+    event the page can contain: now, the cursor, or `recorded_before`.
+    PostgreSQL prunes that query to one or two monthly partitions of
+    `audit_events`. Only when the window cannot fill the page does the
+    reader repeat the query without the window.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        *,
+        recent_window: timedelta = DEFAULT_RECENT_WINDOW,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
         self._session = session
+        self._recent_window = recent_window
+        self._clock = clock
 
     def list_recent(self, limit: int) -> tuple[AuditEvent, ...]:
-        stmt = (
-            select(AuditEventRecord)
-            .order_by(
-                AuditEventRecord.recorded_at.desc(),
-                AuditEventRecord.id,
-            )
-            .limit(limit)
+        return self.list_page(limit=limit, filters=AuditEventFilters()).events
+
+    def list_page(
+        self,
+        *,
+        limit: int,
+        filters: AuditEventFilters,
+        after: AuditEventCursor | None = None,
+    ) -> AuditEventPage:
+        window_start = _window_start(
+            self._clock(),
+            self._recent_window,
+            filters,
+            after,
         )
+        stmt = _select_audit_events(limit, filters, after, window_start)
 
         records = self._session.execute(stmt).scalars().all()
 
-        return tuple(
-            audit_event_record_to_domain(record)
-            for record in records
+        if window_start is not None and len(records) <= limit:
+            stmt = _select_audit_events(limit, filters, after)
+
+            records = self._session.execute(stmt).scalars().all()
+
+        return _records_to_page(records, limit)
+
+
+class AsyncSqlAlchemyAuditEventReader:
+    def __init__(
+        self,
+        session: AsyncSession,
+        *,
+        recent_window: timedelta = DEFAULT_RECENT_WINDOW,
+        clock: Callable[[], datetime] = _utc_now,
+    ) -> None:
+        self._session = session
+        self._recent_window = recent_window
+        self._clock = clock
+
+    async def list_recent(self, limit: int) -> tuple[AuditEvent, ...]:
+        page = await self.list_page(limit=limit, filters=AuditEventFilters())
+
+        return page.events
+
+    async def list_page(
+        self,
+        *,
+        limit: int,
+        filters: AuditEventFilters,
+        after: AuditEventCursor | None = None,
+    ) -> AuditEventPage:
+        window_start = _window_start(
+            self._clock(),
+            self._recent_window,
+            filters,
+            after,
+        )
+        stmt = _select_audit_events(limit, filters, after, window_start)
+
+        records = (await self._session.execute(stmt)).scalars().all()
+
+        if window_start is not None and len(records) <= limit:
+            stmt = _select_audit_events(limit, filters, after)
+
+            records = (await self._session.execute(stmt)).scalars().all()
+
+        return _records_to_page(records, limit)
+
+
+def _window_start(
+    now: datetime,
+    recent_window: timedelta,
+    filters: AuditEventFilters,
+    after: AuditEventCursor | None,
+) -> datetime | None:
+    newest = now
+
+    if filters.recorded_before is not None:
+        newest = min(newest, filters.recorded_before.value)
+
+    if after is not None:
+        newest = min(newest, after.recorded.value)
+
+    window_start = newest - recent_window
+
+    # A recorded_since inside the window already bounds the query at least
+    # as tightly, and a fallback query could not find anything more.
+    if (
+        filters.recorded_since is not None
+        and filters.recorded_since.value >= window_start
+    ):
+        return None
+
+    return window_start
+
+
+def _select_audit_events(
+    limit: int,
+    filters: AuditEventFilters,
+    after: AuditEventCursor | None,
+    window_start: datetime | None = None,
+) -> Select:
+    # Events older than the window sort after every event inside it, so a
+    # full page from the window is also the page the whole table would give.
+    stmt = select(AuditEventRecord)
+
+    if filters.agent is not None:
+        stmt = stmt.where(AuditEventRecord.agent == filters.agent)
+
+    if filters.action is not None:
+        stmt = stmt.where(AuditEventRecord.action == filters.action.value)
+
+    if filters.entity_resource_type is not None:
+        stmt = stmt.where(
+            AuditEventRecord.entity_resource_type == filters.entity_resource_type
+        )
+
+    if filters.entity_id is not None:
+        stmt = stmt.where(AuditEventRecord.entity_id == filters.entity_id.value)
+
+    if filters.recorded_since is not None:
+        stmt = stmt.where(
+            AuditEventRecord.recorded_at >= filters.recorded_since.value
         )
+
+    if filters.recorded_before is not None:
+        stmt = stmt.where(
+            AuditEventRecord.recorded_at < filters.recorded_before.value
+        )
+
+    if window_start is not None:
+        stmt = stmt.where(AuditEventRecord.recorded_at >= window_start)
+
+    if after is not None:
+        # The sort mixes DESC and ASC, so no row-value comparison matches it.
+        # The leading `<=` keeps the predicate an index range condition.
+        recorded_at = after.recorded.value
+        stmt = stmt.where(
+            AuditEventRecord.recorded_at <= recorded_at,
+            or_(
+                AuditEventRecord.recorded_at < recorded_at,
+                and_(
+                    AuditEventRecord.recorded_at == recorded_at,
+                    AuditEventRecord.id > after.event_id.value,
+                ),
+            ),
+        )
+
+    return (
+        stmt
+        .order_by(
+            AuditEventRecord.recorded_at.desc(),
+            AuditEventRecord.id,
+        )
+        .limit(limit + 1)
+    )
+
+
+def _records_to_page(records, limit: int) -> AuditEventPage:
+    events = tuple(
+        audit_event_record_to_domain(record)
+        for record in records[:limit]
+    )
+
+    if len(records) <= limit:
+        return AuditEventPage(events=events)
+
+    last_event = events[-1]
+
+    return AuditEventPage(
+        events=events,
+        next_cursor=AuditEventCursor(
+            recorded=last_event.recorded,
+            event_id=last_event.id,
+        ),
+    )
@@ -0,0 +1,57 @@
+from collections.abc import Sequence
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from fhir_gateway.domain.entities.audit_event import AuditEvent
+from fhir_gateway.infrastructure.persistence.sqlalchemy.bulk_copy import (
+    copy_rows,
+    supports_copy,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.audit_event import (
+    audit_event_to_record_values,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.audit_event import (
+    AuditEventRecord,
+)
+
+_COPY_COLUMNS = (
+    "id",
+    "recorded_at",
+    "agent",
+    "action",
+    "entity_resource_type",
+    "entity_id",
+)
+
+
+class SqlAlchemyAuditEventBatchWriter:
+    """Insert batches of audit events, one transaction per batch.
+
+    On PostgreSQL with psycopg the rows are streamed with `COPY ... FROM
+    STDIN`. Other databases get one executemany INSERT, which SQLAlchemy
+    sends as multi-row `VALUES` statements where the driver allows it.
+    Each batch opens its own session, so the writer can be called from a
+    background thread.
+    """
+
+    def __init__(self, session_factory: sessionmaker[Session]) -> None:
+        self._session_factory = session_factory
+
+    def write_batch(self, events: Sequence[AuditEvent]) -> None:
+        if not events:
+            return
+
+        rows = [audit_event_to_record_values(event) for event in events]
+
+        with self._session_factory() as session, session.begin():
+            if supports_copy(session):
+                copy_rows(
+                    session,
+                    AuditEventRecord.__tablename__,
+                    _COPY_COLUMNS,
+                    rows,
+                )
+            else:
+                session.execute(insert(AuditEventRecord), rows)
+
@@ -1,45 +1,158 @@
-from sqlalchemy import select
+from collections.abc import Iterator
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from fhir_gateway.domain.entities.condition import Condition
+from fhir_gateway.domain.value_objects.code import Code
 from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.code_catalog import (
+    CodeCatalog,
+)
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.condition import (
     condition_record_to_domain,
+    condition_record_with_code_to_domain,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.models.condition import (
     ConditionCodeRecord,
     ConditionRecord,
 )
+from fhir_gateway.infrastructure.persistence.sqlalchemy.streaming import (
+    stream_record_batches,
+    stream_rows,
+)
 
 
 class SqlAlchemyConditionReader:
-    def __init__(self, session: Session) -> None:
+    """Read conditions, with their codes, for one patient.
+
+    Without a `CodeCatalog` every query JOINs `condition_codes`. With one,
+    only condition rows are selected and their codes are resolved through
+    the catalog.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        code_catalog: CodeCatalog | None = None,
+    ) -> None:
         self._session = session
+        self._code_catalog = code_catalog
 
     def list_by_patient(
         self,
         patient_id: ResourceId,
     ) -> tuple[Condition, ...]:
-        stmt = (
-            select(ConditionRecord, ConditionCodeRecord)
-            .join(
-                ConditionCodeRecord,
-                ConditionRecord.code_id == ConditionCodeRecord.id,
-            )
-            .where(ConditionRecord.patient_id == patient_id.value)
-            .where(ConditionRecord.deleted_at.is_(None))
-            .order_by(
-                ConditionRecord.recorded_at,
-                ConditionRecord.id,
+        if self._code_catalog is not None:
+            stmt = _select_condition_records_by_patient(patient_id)
+            records = self._session.scalars(stmt).all()
+            codes = self._code_catalog.resolve(
+                self._session,
+                (record.code_id for record in records),
             )
-        )
+
+            return _records_to_domain(records, codes)
+
+        stmt = _select_conditions_by_patient(patient_id)
 
         rows = self._session.execute(stmt).all()
 
-        return tuple(
-            condition_record_to_domain(
-                condition_record,
-                code_record,
+        return _rows_to_domain(rows)
+
+    def stream_by_patient(self, patient_id: ResourceId) -> Iterator[Condition]:
+        if self._code_catalog is not None:
+            stmt = _select_condition_records_by_patient(patient_id)
+
+            for records in stream_record_batches(self._session, stmt):
+                codes = self._code_catalog.resolve(
+                    self._session,
+                    (record.code_id for record in records),
+                )
+                yield from _records_to_domain(records, codes)
+
+            return
+
+        stmt = _select_conditions_by_patient(patient_id)
+
+        for condition_record, code_record in stream_rows(self._session, stmt):
+            yield condition_record_to_domain(condition_record, code_record)
+
+
+class AsyncSqlAlchemyConditionReader:
+    def __init__(
+        self,
+        session: AsyncSession,
+        code_catalog: CodeCatalog | None = None,
+    ) -> None:
+        self._session = session
+        self._code_catalog = code_catalog
+
+    async def list_by_patient(
+        self,
+        patient_id: ResourceId,
+    ) -> tuple[Condition, ...]:
+        if self._code_catalog is not None:
+            stmt = _select_condition_records_by_patient(patient_id)
+            records = (await self._session.scalars(stmt)).all()
+            codes = await self._code_catalog.resolve_async(
+                self._session,
+                (record.code_id for record in records),
             )
-            for condition_record, code_record in rows
+
+            return _records_to_domain(records, codes)
+
+        stmt = _select_conditions_by_patient(patient_id)
+
+        rows = (await self._session.execute(stmt)).all()
+
+        return _rows_to_domain(rows)
+
+
+def _select_conditions_by_patient(patient_id: ResourceId) -> Select:
+    return (
+        select(ConditionRecord, ConditionCodeRecord)
+        .join(
+            ConditionCodeRecord,
+            ConditionRecord.code_id == ConditionCodeRecord.id,
         )
+        .where(ConditionRecord.patient_id == patient_id.value)
+        .where(ConditionRecord.deleted_at.is_(None))
+        .order_by(
+            ConditionRecord.recorded_at,
+            ConditionRecord.id,
+        )
+    )
+
+
+def _select_condition_records_by_patient(patient_id: ResourceId) -> Select:
+    return (
+        select(ConditionRecord)
+        .where(ConditionRecord.patient_id == patient_id.value)
+        .where(ConditionRecord.deleted_at.is_(None))
+        .order_by(
+            ConditionRecord.recorded_at,
+            ConditionRecord.id,
+        )
+    )
+
+
+def _rows_to_domain(rows) -> tuple[Condition, ...]:
+    return tuple(
+        condition_record_to_domain(
+            condition_record,
+            code_record,
+        )
+        for condition_record, code_record in rows
+    )
+
+
+def _records_to_domain(
+    records,
+    codes: dict[int, Code],
+) -> tuple[Condition, ...]:
+    return tuple(
+        condition_record_with_code_to_domain(record, codes[record.code_id])
+        for record in records
+        if record.code_id in codes
+    )
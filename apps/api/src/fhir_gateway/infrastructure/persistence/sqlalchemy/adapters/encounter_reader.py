@@ -1,4 +1,7 @@
-from sqlalchemy import select
+from collections.abc import Iterator
+
+from sqlalchemy import Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from fhir_gateway.domain.entities.encounter import Encounter
@@ -9,6 +12,9 @@ from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.encounter import
 from fhir_gateway.infrastructure.persistence.sqlalchemy.models.encounter import (
     EncounterRecord,
 )
+from fhir_gateway.infrastructure.persistence.sqlalchemy.streaming import (
+    stream_rows,
+)
 
 
 class SqlAlchemyEncounterReader:
@@ -19,15 +25,7 @@ class SqlAlchemyEncounterReader:
         self,
         patient_id: ResourceId,
     ) -> tuple[Encounter, ...]:
-        stmt = (
-            select(EncounterRecord)
-            .where(EncounterRecord.patient_id == patient_id.value)
-            .where(EncounterRecord.deleted_at.is_(None))
-            .order_by(
-                EncounterRecord.period_start_at,
-                EncounterRecord.id,
-            )
-        )
+        stmt = _select_encounters_by_patient(patient_id)
 
         records = self._session.execute(stmt).scalars().all()
 
@@ -35,3 +33,39 @@ class SqlAlchemyEncounterReader:
             encounter_record_to_domain(record)
             for record in records
         )
+
+    def stream_by_patient(self, patient_id: ResourceId) -> Iterator[Encounter]:
+        stmt = _select_encounters_by_patient(patient_id)
+
+        for (record,) in stream_rows(self._session, stmt):
+            yield encounter_record_to_domain(record)
+
+
+class AsyncSqlAlchemyEncounterReader:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def list_by_patient(
+        self,
+        patient_id: ResourceId,
+    ) -> tuple[Encounter, ...]:
+        stmt = _select_encounters_by_patient(patient_id)
+
+        records = (await self._session.execute(stmt)).scalars().all()
+
+        return tuple(
+            encounter_record_to_domain(record)
+            for record in records
+        )
+
+
+def _select_encounters_by_patient(patient_id: ResourceId) -> Select:
+    return (
+        select(EncounterRecord)
+        .where(EncounterRecord.patient_id == patient_id.value)
+        .where(EncounterRecord.deleted_at.is_(None))
+        .order_by(
+            EncounterRecord.period_start_at,
+            EncounterRecord.id,
+        )
+    )
@@ -1,77 +1,412 @@
-from sqlalchemy import select
+from collections.abc import Iterator
+
+from sqlalchemy import ScalarSelect, Select, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from fhir_gateway.domain.entities.observation import Observation
+from fhir_gateway.application.models.observation_series import ObservationSeries
+from fhir_gateway.domain.entities.observation import (
+    Observation,
+    ObservationStatus,
+)
 from fhir_gateway.domain.value_objects.code import Code
 from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.code_catalog import (
+    CodeCatalog,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.datetimes import (
+    ensure_utc,
+)
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.observation import (
     observation_record_to_domain,
+    observation_record_with_code_to_domain,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.models.observation import (
     ObservationCodeRecord,
     ObservationRecord,
 )
+from fhir_gateway.infrastructure.persistence.sqlalchemy.streaming import (
+    stream_record_batches,
+    stream_rows,
+)
+
+
+# Neither status carries a result that belongs on a trend line.
+_SERIES_EXCLUDED_STATUSES = (
+    ObservationStatus.CANCELLED.value,
+    ObservationStatus.ENTERED_IN_ERROR.value,
+)
 
 
 class SqlAlchemyObservationReader:
-    def __init__(self, session: Session) -> None:
+    """Read observations, with their codes, for one patient.
+
+    Without a `CodeCatalog` every query JOINs `observation_codes`. With one,
+    only observation rows are selected and their codes are resolved through
+    the catalog, which returns shared `Code` instances. Reads by code also
+    resolve the code id through the catalog first and select only the
+    columns of `ix_observations_patient_code_effective_at`, which PostgreSQL
+    answers with an index-only scan.
+    """
+
+    def __init__(
+        self,
+        session: Session,
+        code_catalog: CodeCatalog | None = None,
+    ) -> None:
         self._session = session
+        self._code_catalog = code_catalog
 
     def list_by_patient(
         self,
         patient_id: ResourceId,
     ) -> tuple[Observation, ...]:
-        stmt = (
-            select(ObservationRecord, ObservationCodeRecord)
-            .join(
-                ObservationCodeRecord,
-                ObservationRecord.code_id == ObservationCodeRecord.id,
+        if self._code_catalog is not None:
+            return self._list_with_catalog(
+                _select_observation_records_by_patient(patient_id)
             )
-            .where(ObservationRecord.patient_id == patient_id.value)
-            .where(ObservationRecord.deleted_at.is_(None))
-            .order_by(
-                ObservationRecord.effective_at,
-                ObservationRecord.id,
+
+        stmt = _select_observations_by_patient(patient_id)
+
+        rows = self._session.execute(stmt).all()
+
+        return _rows_to_domain(rows)
+
+    def list_by_patient_and_code(
+        self,
+        patient_id: ResourceId,
+        code: Code,
+    ) -> tuple[Observation, ...]:
+        if self._code_catalog is not None:
+            code_id = self._code_catalog.resolve_id(self._session, code)
+
+            if code_id is None:
+                return ()
+
+            stmt = _select_observation_columns_by_patient_and_code(
+                patient_id,
+                code_id,
             )
+
+            rows = self._session.execute(stmt).all()
+            codes = self._code_catalog.resolve(self._session, (code_id,))
+
+            if code_id not in codes:
+                return ()
+
+            return _columns_to_domain(rows, codes[code_id])
+
+        stmt = _select_observation_columns_by_patient_and_code_text(
+            patient_id,
+            code,
         )
 
         rows = self._session.execute(stmt).all()
 
-        return tuple(
-            observation_record_to_domain(
-                observation_record,
-                code_record,
-            )
-            for observation_record, code_record in rows
+        return _columns_with_display_to_domain(rows, code)
+
+    def list_series_by_patient_and_code(
+        self,
+        patient_id: ResourceId,
+        code: Code,
+    ) -> tuple[ObservationSeries, ...]:
+        if self._code_catalog is None:
+            code_id = _select_code_id(code)
+        else:
+            code_id = self._code_catalog.resolve_id(self._session, code)
+
+            if code_id is None:
+                return ()
+
+        stmt = _select_series_by_patient_and_code(patient_id, code_id)
+
+        rows = self._session.execute(stmt).all()
+
+        return _rows_to_series(rows)
+
+    def stream_by_patient(self, patient_id: ResourceId) -> Iterator[Observation]:
+        if self._code_catalog is not None:
+            stmt = _select_observation_records_by_patient(patient_id)
+
+            for records in stream_record_batches(self._session, stmt):
+                codes = self._code_catalog.resolve(
+                    self._session,
+                    (record.code_id for record in records),
+                )
+                yield from _records_to_domain(records, codes)
+
+            return
+
+        stmt = _select_observations_by_patient(patient_id)
+
+        for observation_record, code_record in stream_rows(self._session, stmt):
+            yield observation_record_to_domain(observation_record, code_record)
+
+    def _list_with_catalog(self, stmt: Select) -> tuple[Observation, ...]:
+        records = self._session.scalars(stmt).all()
+        codes = self._code_catalog.resolve(
+            self._session,
+            (record.code_id for record in records),
         )
 
-    def list_by_patient_and_code(
+        return _records_to_domain(records, codes)
+
+
+class AsyncSqlAlchemyObservationReader:
+    def __init__(
+        self,
+        session: AsyncSession,
+        code_catalog: CodeCatalog | None = None,
+    ) -> None:
+        self._session = session
+        self._code_catalog = code_catalog
+
+    async def list_by_patient(
+        self,
+        patient_id: ResourceId,
+    ) -> tuple[Observation, ...]:
+        if self._code_catalog is not None:
+            return await self._list_with_catalog(
+                _select_observation_records_by_patient(patient_id)
+            )
+
+        stmt = _select_observations_by_patient(patient_id)
+
+        rows = (await self._session.execute(stmt)).all()
+
+        return _rows_to_domain(rows)
+
+    async def list_by_patient_and_code(
         self,
         patient_id: ResourceId,
         code: Code,
     ) -> tuple[Observation, ...]:
-        stmt = (
-            select(ObservationRecord, ObservationCodeRecord)
-            .join(
-                ObservationCodeRecord,
-                ObservationRecord.code_id == ObservationCodeRecord.id,
+        if self._code_catalog is not None:
+            code_id = await self._code_catalog.resolve_id_async(
+                self._session,
+                code,
             )
-            .where(ObservationRecord.patient_id == patient_id.value)
-            .where(ObservationRecord.deleted_at.is_(None))
-            .where(ObservationCodeRecord.system == code.system)
-            .where(ObservationCodeRecord.code == code.code)
-            .order_by(
-                ObservationRecord.effective_at,
-                ObservationRecord.id,
+
+            if code_id is None:
+                return ()
+
+            stmt = _select_observation_columns_by_patient_and_code(
+                patient_id,
+                code_id,
             )
+
+            rows = (await self._session.execute(stmt)).all()
+            codes = await self._code_catalog.resolve_async(
+                self._session,
+                (code_id,),
+            )
+
+            if code_id not in codes:
+                return ()
+
+            return _columns_to_domain(rows, codes[code_id])
+
+        stmt = _select_observation_columns_by_patient_and_code_text(
+            patient_id,
+            code,
         )
 
-        rows = self._session.execute(stmt).all()
+        rows = (await self._session.execute(stmt)).all()
+
+        return _columns_with_display_to_domain(rows, code)
 
-        return tuple(
-            observation_record_to_domain(
-                observation_record,
-                code_record,
+    async def list_series_by_patient_and_code(
+        self,
+        patient_id: ResourceId,
+        code: Code,
+    ) -> tuple[ObservationSeries, ...]:
+        if self._code_catalog is None:
+            code_id = _select_code_id(code)
+        else:
+            code_id = await self._code_catalog.resolve_id_async(
+                self._session,
+                code,
             )
-            for observation_record, code_record in rows
+
+            if code_id is None:
+                return ()
+
+        stmt = _select_series_by_patient_and_code(patient_id, code_id)
+
+        rows = (await self._session.execute(stmt)).all()
+
+        return _rows_to_series(rows)
+
+    async def _list_with_catalog(self, stmt: Select) -> tuple[Observation, ...]:
+        records = (await self._session.scalars(stmt)).all()
+        codes = await self._code_catalog.resolve_async(
+            self._session,
+            (record.code_id for record in records),
+        )
+
+        return _records_to_domain(records, codes)
+
+
+def _select_observations_by_patient(patient_id: ResourceId) -> Select:
+    return (
+        select(ObservationRecord, ObservationCodeRecord)
+        .join(
+            ObservationCodeRecord,
+            ObservationRecord.code_id == ObservationCodeRecord.id,
         )
+        .where(ObservationRecord.patient_id == patient_id.value)
+        .where(ObservationRecord.deleted_at.is_(None))
+        .order_by(
+            ObservationRecord.effective_at,
+            ObservationRecord.id,
+        )
+    )
+
+
+def _select_observation_records_by_patient(patient_id: ResourceId) -> Select:
+    return (
+        select(ObservationRecord)
+        .where(ObservationRecord.patient_id == patient_id.value)
+        .where(ObservationRecord.deleted_at.is_(None))
+        .order_by(
+            ObservationRecord.effective_at,
+            ObservationRecord.id,
+        )
+    )
+
+
+def _select_observation_columns_by_patient_and_code(
+    patient_id: ResourceId,
+    code_id: int | ScalarSelect,
+) -> Select:
+    # Every selected column is a key or INCLUDE column of
+    # ix_observations_patient_code_effective_at, and the index order is the
+    # requested order, so neither a heap fetch nor a sort is needed.
+    return (
+        select(
+            ObservationRecord.id,
+            ObservationRecord.patient_id,
+            ObservationRecord.status,
+            ObservationRecord.effective_at,
+            ObservationRecord.value_quantity,
+            ObservationRecord.value_unit,
+        )
+        .where(ObservationRecord.patient_id == patient_id.value)
+        .where(ObservationRecord.code_id == code_id)
+        .where(ObservationRecord.deleted_at.is_(None))
+        .order_by(
+            ObservationRecord.effective_at,
+            ObservationRecord.id,
+        )
+    )
+
+
+def _select_observation_columns_by_patient_and_code_text(
+    patient_id: ResourceId,
+    code: Code,
+) -> Select:
+    # Without a catalog both the code id and its display come from scalar
+    # subqueries, which PostgreSQL runs once as InitPlans, so observations
+    # are still read by the same index-only scan.
+    return _select_observation_columns_by_patient_and_code(
+        patient_id,
+        _select_code_id(code),
+    ).add_columns(_select_code_display(code).label("code_display"))
+
+
+def _select_code_id(code: Code) -> ScalarSelect:
+    # (system, code) is unique, so the code filter is a scalar subquery on
+    # that index instead of a JOIN that would also project code columns.
+    return (
+        select(ObservationCodeRecord.id)
+        .where(ObservationCodeRecord.system == code.system)
+        .where(ObservationCodeRecord.code == code.code)
+        .scalar_subquery()
+    )
+
+
+def _select_code_display(code: Code) -> ScalarSelect:
+    return (
+        select(ObservationCodeRecord.display)
+        .where(ObservationCodeRecord.system == code.system)
+        .where(ObservationCodeRecord.code == code.code)
+        .scalar_subquery()
+    )
+
+
+def _select_series_by_patient_and_code(
+    patient_id: ResourceId,
+    code_id: int | ScalarSelect,
+) -> Select:
+    # Only the three plotted columns are selected; like the by-code read,
+    # the query is covered by ix_observations_patient_code_effective_at.
+    return (
+        select(
+            ObservationRecord.effective_at,
+            ObservationRecord.value_quantity,
+            ObservationRecord.value_unit,
+        )
+        .where(ObservationRecord.patient_id == patient_id.value)
+        .where(ObservationRecord.code_id == code_id)
+        .where(ObservationRecord.deleted_at.is_(None))
+        .where(ObservationRecord.value_quantity.is_not(None))
+        .where(ObservationRecord.status.not_in(_SERIES_EXCLUDED_STATUSES))
+        .order_by(
+            ObservationRecord.effective_at,
+            ObservationRecord.id,
+        )
+    )
+
+
+def _rows_to_series(rows) -> tuple[ObservationSeries, ...]:
+    # One series per unit, in order of each unit's first measurement. The
+    # value_quantity CHECK constraint guarantees a unit for every value.
+    columns: dict[str, tuple[list, list]] = {}
+
+    for effective_at, value_quantity, value_unit in rows:
+        timestamps, values = columns.setdefault(value_unit, ([], []))
+        timestamps.append(ensure_utc(effective_at))
+        values.append(value_quantity)
+
+    return tuple(
+        ObservationSeries(unit=unit, timestamps=timestamps, values=values)
+        for unit, (timestamps, values) in columns.items()
+    )
+
+
+def _columns_to_domain(rows, code: Code) -> tuple[Observation, ...]:
+    # Rows carry the same attribute names as ObservationRecord.
+    return tuple(observation_record_with_code_to_domain(row, code) for row in rows)
+
+
+def _columns_with_display_to_domain(rows, code: Code) -> tuple[Observation, ...]:
+    if not rows:
+        return ()
+
+    # The requested system and code matched the code row exactly; only its
+    # display has to come from the database.
+    return _columns_to_domain(
+        rows,
+        Code(system=code.system, code=code.code, display=rows[0].code_display),
+    )
+
+
+def _rows_to_domain(rows) -> tuple[Observation, ...]:
+    return tuple(
+        observation_record_to_domain(
+            observation_record,
+            code_record,
+        )
+        for observation_record, code_record in rows
+    )
+
+
+def _records_to_domain(
+    records,
+    codes: dict[int, Code],
+) -> tuple[Observation, ...]:
+    return tuple(
+        observation_record_with_code_to_domain(record, codes[record.code_id])
+        for record in records
+        if record.code_id in codes
+    )
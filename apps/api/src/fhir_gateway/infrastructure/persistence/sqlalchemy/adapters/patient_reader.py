@@ -1,6 +1,20 @@
-from sqlalchemy import or_, select
+from sqlalchemy import (
+    Integer,
+    Select,
+    Subquery,
+    case,
+    func,
+    literal_column,
+    select,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, selectinload
 
+from fhir_gateway.application.models.patient_search import (
+    PatientSearchCursor,
+    PatientSearchPage,
+)
 from fhir_gateway.domain.entities.patient import Patient
 from fhir_gateway.domain.value_objects.resource_id import ResourceId
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.patient import (
@@ -11,18 +25,22 @@ from fhir_gateway.infrastructure.persistence.sqlalchemy.models.patient import (
     PatientRecord,
 )
 
+IDENTIFIER_TOKEN_SEPARATOR = "|"
+
+LIKE_ESCAPE = "\\"
+
+# Search relevance tiers, best first.
+EXACT_MATCH_RANK = 0
+PREFIX_MATCH_RANK = 1
+SUBSTRING_MATCH_RANK = 2
+
 
 class SqlAlchemyPatientReader:
     def __init__(self, session: Session) -> None:
         self._session = session
 
     def get_by_id(self, patient_id: ResourceId) -> Patient | None:
-        stmt = (
-            select(PatientRecord)
-            .options(selectinload(PatientRecord.identifiers))
-            .where(PatientRecord.id == patient_id.value)
-            .where(PatientRecord.deleted_at.is_(None))
-        )
+        stmt = _select_patient_by_id(patient_id)
 
         record = self._session.execute(stmt).scalar_one_or_none()
 
@@ -31,27 +49,220 @@ class SqlAlchemyPatientReader:
 
         return patient_record_to_domain(record)
 
-    def search_by_text(self, search_text: str) -> tuple[Patient, ...]:
-        search_pattern = f"%{search_text}%"
-
-        stmt = (
-            select(PatientRecord)
-            .outerjoin(PatientIdentifierRecord)
-            .options(selectinload(PatientRecord.identifiers))
-            .where(PatientRecord.deleted_at.is_(None))
-            .where(
-                or_(
-                    PatientRecord.id.ilike(search_pattern),
-                    PatientRecord.name_text.ilike(search_pattern),
-                    PatientRecord.name_family.ilike(search_pattern),
-                    PatientIdentifierRecord.system.ilike(search_pattern),
-                    PatientIdentifierRecord.value.ilike(search_pattern),
-                )
-            )
-            .distinct()
-            .order_by(PatientRecord.id)
+    def search_by_text(
+        self,
+        search_text: str,
+        *,
+        limit: int,
+        after: PatientSearchCursor | None = None,
+    ) -> PatientSearchPage:
+        stmt = _select_patients_by_text(search_text, limit=limit, after=after)
+
+        rows = self._session.execute(stmt).all()
+
+        return _rows_to_search_page(rows, limit)
+
+
+class AsyncSqlAlchemyPatientReader:
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_by_id(self, patient_id: ResourceId) -> Patient | None:
+        stmt = _select_patient_by_id(patient_id)
+
+        record = (await self._session.execute(stmt)).scalar_one_or_none()
+
+        if record is None:
+            return None
+
+        return patient_record_to_domain(record)
+
+    async def search_by_text(
+        self,
+        search_text: str,
+        *,
+        limit: int,
+        after: PatientSearchCursor | None = None,
+    ) -> PatientSearchPage:
+        stmt = _select_patients_by_text(search_text, limit=limit, after=after)
+
+        rows = (await self._session.execute(stmt)).all()
+
+        return _rows_to_search_page(rows, limit)
+
+
+def _select_patient_by_id(patient_id: ResourceId) -> Select:
+    return (
+        select(PatientRecord)
+        .options(selectinload(PatientRecord.identifiers))
+        .where(PatientRecord.id == patient_id.value)
+        .where(PatientRecord.deleted_at.is_(None))
+    )
+
+
+def _select_patients_by_text(
+    search_text: str,
+    *,
+    limit: int,
+    after: PatientSearchCursor | None,
+) -> Select:
+    # Pages follow the `patients.id` keyset; ranking only orders the
+    # patients within a page (see `_rows_to_search_page`).
+    after_id = None if after is None else after.patient_id.value
+    identifier = _parse_identifier_token(search_text)
+
+    if identifier is not None:
+        stmt = _select_patients_by_identifier(*identifier)
+
+        if after_id is not None:
+            stmt = stmt.where(PatientRecord.id > after_id)
+    else:
+        ranked_matches = _ranked_matches(search_text, limit=limit, after_id=after_id)
+        stmt = select(PatientRecord, ranked_matches.c.rank).join(
+            ranked_matches,
+            ranked_matches.c.patient_id == PatientRecord.id,
         )
 
-        records = self._session.execute(stmt).scalars().all()
+    return (
+        stmt.options(selectinload(PatientRecord.identifiers))
+        .where(PatientRecord.deleted_at.is_(None))
+        .order_by(PatientRecord.id)
+        # One extra row tells whether another page exists without a COUNT.
+        .limit(limit + 1)
+    )
+
+
+def _parse_identifier_token(search_text: str) -> tuple[str, str] | None:
+    # FHIR token syntax: `system|value` names one exact identifier.
+    system, separator, value = search_text.partition(IDENTIFIER_TOKEN_SEPARATOR)
+
+    if not separator or not system or not value:
+        return None
+
+    return system, value
+
+
+def _select_patients_by_identifier(system: str, value: str) -> Select:
+    # Exact lookup served by ix_patient_identifiers_system_value; every
+    # match is exact, so all rows share the best rank.
+    exact_rank = literal_column(str(EXACT_MATCH_RANK), Integer).label("rank")
+
+    return (
+        select(PatientRecord, exact_rank)
+        .join(PatientIdentifierRecord)
+        .where(PatientIdentifierRecord.system == system)
+        .where(PatientIdentifierRecord.value == value)
+    )
+
+
+def _ranked_matches(
+    search_text: str,
+    *,
+    limit: int,
+    after_id: str | None,
+) -> Subquery:
+    # One branch per searched column instead of an OR over an outer join:
+    # each `ILIKE '%text%'` branch can use its own pg_trgm GIN index. Each
+    # branch keeps only the first `limit + 1` live patients after the
+    # cursor, which is enough for the page whatever the other branches
+    # return, so at most five such sets are grouped.
+    branches = [
+        (_column_matches(column, PatientRecord.id, search_text), PatientRecord.id)
+        for column in (
+            PatientRecord.id,
+            PatientRecord.name_text,
+            PatientRecord.name_family,
+        )
+    ]
+    # Identifier branches exclude deleted patients themselves, so those
+    # cannot take up a branch's limit.
+    branches += [
+        (
+            _column_matches(
+                column,
+                PatientIdentifierRecord.patient_id,
+                search_text,
+            ).join(
+                PatientRecord,
+                PatientRecord.id == PatientIdentifierRecord.patient_id,
+            ),
+            PatientIdentifierRecord.patient_id,
+        )
+        for column in (
+            PatientIdentifierRecord.system,
+            PatientIdentifierRecord.value,
+        )
+    ]
+
+    pages = []
+
+    for index, (branch, patient_id) in enumerate(branches):
+        branch = (
+            branch.where(PatientRecord.deleted_at.is_(None))
+            .group_by(patient_id)
+            .order_by(patient_id)
+            .limit(limit + 1)
+        )
+
+        if after_id is not None:
+            branch = branch.where(patient_id > after_id)
+
+        # SQLite only accepts ORDER BY and LIMIT on a whole compound select.
+        page = branch.subquery(f"patient_search_branch_{index}")
+        pages.append(select(page.c.patient_id, page.c.rank))
+
+    matches = union_all(*pages).subquery("patient_search_matches")
+
+    return (
+        select(
+            matches.c.patient_id,
+            func.min(matches.c.rank).label("rank"),
+        )
+        .group_by(matches.c.patient_id)
+        .subquery("ranked_patient_search_matches")
+    )
+
+
+def _column_matches(column, patient_id_column, search_text: str) -> Select:
+    escaped_search_text = _escape_like(search_text)
+
+    rank = case(
+        (func.lower(column) == search_text.lower(), EXACT_MATCH_RANK),
+        (
+            column.ilike(f"{escaped_search_text}%", escape=LIKE_ESCAPE),
+            PREFIX_MATCH_RANK,
+        ),
+        else_=SUBSTRING_MATCH_RANK,
+    )
+
+    return select(
+        patient_id_column.label("patient_id"),
+        func.min(rank).label("rank"),
+    ).where(column.ilike(f"%{escaped_search_text}%", escape=LIKE_ESCAPE))
+
+
+def _escape_like(value: str) -> str:
+    return (
+        value.replace(LIKE_ESCAPE, LIKE_ESCAPE * 2)
+        .replace("%", f"{LIKE_ESCAPE}%")
+        .replace("_", f"{LIKE_ESCAPE}_")
+    )
+
+
+def _rows_to_search_page(rows, limit: int) -> PatientSearchPage:
+    page_rows = rows[:limit]
+    # Rows come in id order; the page is shown best match first.
+    patients = tuple(
+        patient_record_to_domain(record)
+        for record, _ in sorted(page_rows, key=lambda row: (row[1], row[0].id))
+    )
+
+    if len(rows) <= limit:
+        return PatientSearchPage(patients=patients)
+
+    last_record, _ = page_rows[-1]
 
-        return tuple(patient_record_to_domain(record) for record in records)
+    return PatientSearchPage(
+        patients=patients,
+        next_cursor=PatientSearchCursor(patient_id=ResourceId(last_record.id)),
+    )
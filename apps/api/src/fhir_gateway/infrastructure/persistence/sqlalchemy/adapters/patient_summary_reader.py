@@ -0,0 +1,237 @@
+from sqlalchemy import (
+    JSON,
+    DateTime,
+    Float,
+    Integer,
+    Select,
+    String,
+    bindparam,
+    cast,
+    literal_column,
+    null,
+    select,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from fhir_gateway.application.models.patient_summary import PatientSummary
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.patient_summary import (
+    PatientSummaryRowKind,
+    patient_summary_rows_to_domain,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.condition import (
+    ConditionCodeRecord,
+    ConditionRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.encounter import (
+    EncounterRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.observation import (
+    ObservationCodeRecord,
+    ObservationRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.patient import (
+    PatientIdentifierRecord,
+    PatientRecord,
+)
+
+_PATIENT_ID = bindparam("patient_id", type_=String)
+
+
+class SqlAlchemyPatientSummaryReader:
+    """Load a whole patient summary with a single UNION ALL statement.
+
+    Every branch of the statement projects the same column layout and tags
+    its rows with a `PatientSummaryRowKind`, so the patient, its identifiers
+    and its non-deleted conditions, encounters and observations come back in
+    one database round trip. The statement only uses portable SQL and runs
+    unchanged on PostgreSQL and SQLite. It is built once at import time so
+    each call only binds the patient id and reuses the compiled SQL.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def get_summary(self, patient_id: ResourceId) -> PatientSummary | None:
+        rows = self._session.execute(
+            _PATIENT_SUMMARY_STMT,
+            {"patient_id": patient_id.value},
+        ).all()
+
+        return patient_summary_rows_to_domain(rows)
+
+
+class AsyncSqlAlchemyPatientSummaryReader:
+    """Async counterpart of `SqlAlchemyPatientSummaryReader`."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_summary(self, patient_id: ResourceId) -> PatientSummary | None:
+        result = await self._session.execute(
+            _PATIENT_SUMMARY_STMT,
+            {"patient_id": patient_id.value},
+        )
+
+        return patient_summary_rows_to_domain(result.all())
+
+
+def _summary_columns(
+    kind: PatientSummaryRowKind,
+    *,
+    resource_id,
+    patient_id,
+    position=None,
+    sort_at=None,
+    end_at=None,
+    status=None,
+    code_system=None,
+    code_code=None,
+    code_display=None,
+    value_quantity=None,
+    value_unit=None,
+    name_text=None,
+    name_family=None,
+    name_given=None,
+    identifier_system=None,
+    identifier_value=None,
+) -> tuple:
+    # Every UNION ALL branch must project the same columns in the same order.
+    # Missing values are typed NULLs so PostgreSQL can resolve column types.
+    def column(value, type_):
+        return cast(null(), type_) if value is None else value
+
+    return (
+        literal_column(str(int(kind)), Integer).label("kind"),
+        resource_id.label("resource_id"),
+        patient_id.label("patient_id"),
+        column(position, Integer).label("position"),
+        column(sort_at, DateTime(timezone=True)).label("sort_at"),
+        column(end_at, DateTime(timezone=True)).label("end_at"),
+        column(status, String).label("status"),
+        column(code_system, String).label("code_system"),
+        column(code_code, String).label("code_code"),
+        column(code_display, String).label("code_display"),
+        column(value_quantity, Float).label("value_quantity"),
+        column(value_unit, String).label("value_unit"),
+        column(name_text, String).label("name_text"),
+        column(name_family, String).label("name_family"),
+        column(name_given, JSON).label("name_given"),
+        column(identifier_system, String).label("identifier_system"),
+        column(identifier_value, String).label("identifier_value"),
+    )
+
+
+def _patient_rows() -> Select:
+    return (
+        select(
+            *_summary_columns(
+                PatientSummaryRowKind.PATIENT,
+                resource_id=PatientRecord.id,
+                patient_id=PatientRecord.id,
+                name_text=PatientRecord.name_text,
+                name_family=PatientRecord.name_family,
+                name_given=PatientRecord.name_given,
+            )
+        )
+        .where(PatientRecord.id == _PATIENT_ID)
+        .where(PatientRecord.deleted_at.is_(None))
+    )
+
+
+def _identifier_rows() -> Select:
+    return select(
+        *_summary_columns(
+            PatientSummaryRowKind.IDENTIFIER,
+            resource_id=PatientIdentifierRecord.patient_id,
+            patient_id=PatientIdentifierRecord.patient_id,
+            position=PatientIdentifierRecord.id,
+            identifier_system=PatientIdentifierRecord.system,
+            identifier_value=PatientIdentifierRecord.value,
+        )
+    ).where(PatientIdentifierRecord.patient_id == _PATIENT_ID)
+
+
+def _condition_rows() -> Select:
+    return (
+        select(
+            *_summary_columns(
+                PatientSummaryRowKind.CONDITION,
+                resource_id=ConditionRecord.id,
+                patient_id=ConditionRecord.patient_id,
+                sort_at=ConditionRecord.recorded_at,
+                code_system=ConditionCodeRecord.system,
+                code_code=ConditionCodeRecord.code,
+                code_display=ConditionCodeRecord.display,
+            )
+        )
+        .join(
+            ConditionCodeRecord,
+            ConditionRecord.code_id == ConditionCodeRecord.id,
+        )
+        .where(ConditionRecord.patient_id == _PATIENT_ID)
+        .where(ConditionRecord.deleted_at.is_(None))
+    )
+
+
+def _encounter_rows() -> Select:
+    return (
+        select(
+            *_summary_columns(
+                PatientSummaryRowKind.ENCOUNTER,
+                resource_id=EncounterRecord.id,
+                patient_id=EncounterRecord.patient_id,
+                sort_at=EncounterRecord.period_start_at,
+                end_at=EncounterRecord.period_end_at,
+            )
+        )
+        .where(EncounterRecord.patient_id == _PATIENT_ID)
+        .where(EncounterRecord.deleted_at.is_(None))
+    )
+
+
+def _observation_rows() -> Select:
+    return (
+        select(
+            *_summary_columns(
+                PatientSummaryRowKind.OBSERVATION,
+                resource_id=ObservationRecord.id,
+                patient_id=ObservationRecord.patient_id,
+                sort_at=ObservationRecord.effective_at,
+                status=ObservationRecord.status,
+                code_system=ObservationCodeRecord.system,
+                code_code=ObservationCodeRecord.code,
+                code_display=ObservationCodeRecord.display,
+                value_quantity=ObservationRecord.value_quantity,
+                value_unit=ObservationRecord.value_unit,
+            )
+        )
+        .join(
+            ObservationCodeRecord,
+            ObservationRecord.code_id == ObservationCodeRecord.id,
+        )
+        .where(ObservationRecord.patient_id == _PATIENT_ID)
+        .where(ObservationRecord.deleted_at.is_(None))
+    )
+
+
+def _build_patient_summary_statement() -> Select:
+    summary_rows = union_all(
+        _patient_rows(),
+        _identifier_rows(),
+        _condition_rows(),
+        _encounter_rows(),
+        _observation_rows(),
+    ).subquery("patient_summary_rows")
+
+    return select(summary_rows).order_by(
+        summary_rows.c.kind,
+        summary_rows.c.sort_at,
+        summary_rows.c.position,
+        summary_rows.c.resource_id,
+    )
+
+
+_PATIENT_SUMMARY_STMT = _build_patient_summary_statement()
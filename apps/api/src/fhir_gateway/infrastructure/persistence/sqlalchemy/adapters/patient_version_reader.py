@@ -0,0 +1,161 @@
+import hashlib
+
+from sqlalchemy import (
+    CompoundSelect,
+    DateTime,
+    Integer,
+    Select,
+    String,
+    bindparam,
+    cast,
+    func,
+    literal_column,
+    null,
+    select,
+    union_all,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.condition import (
+    ConditionCodeRecord,
+    ConditionRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.encounter import (
+    EncounterRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.observation import (
+    ObservationCodeRecord,
+    ObservationRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.patient import (
+    PatientIdentifierRecord,
+    PatientRecord,
+)
+
+_PATIENT_ID = bindparam("patient_id", type_=String)
+
+
+class SqlAlchemyPatientVersionReader:
+    """Derive a patient chart version stamp with one aggregate statement.
+
+    For the patient row the statement reads its `updated_at`, and only if
+    the patient is not logically deleted: a deleted patient has no chart, so
+    it gets no stamp, exactly like an unknown one. For each of its
+    condition, encounter and observation tables it reads the count and
+    latest `updated_at` of the rows that are not deleted, the only rows a
+    chart shows: a logical deletion or restore changes the count, and counts
+    also catch inserts and hard deletes that leave the timestamps unchanged.
+    `patient_identifiers` has no timestamps, so its count and highest id
+    stand in for them. The code tables are shared by every patient and are
+    small, so their latest `updated_at` is included to pick up display
+    changes.
+
+    Every branch is an index lookup on `patient_id`, on the same partial
+    indexes as the clinical reads, so a stamp is far cheaper than the
+    summary or bundle reads it guards.
+    """
+
+    def __init__(self, session: Session) -> None:
+        self._session = session
+
+    def get_version(self, patient_id: ResourceId) -> str | None:
+        rows = self._session.execute(
+            _PATIENT_VERSION_STMT,
+            {"patient_id": patient_id.value},
+        ).all()
+
+        return _rows_to_version(rows)
+
+
+class AsyncSqlAlchemyPatientVersionReader:
+    """Async counterpart of `SqlAlchemyPatientVersionReader`."""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def get_version(self, patient_id: ResourceId) -> str | None:
+        result = await self._session.execute(
+            _PATIENT_VERSION_STMT,
+            {"patient_id": patient_id.value},
+        )
+
+        return _rows_to_version(result.all())
+
+
+def _rows_to_version(rows) -> str | None:
+    rows = sorted(rows, key=lambda row: row.source)
+
+    if not rows or rows[0].source != 0 or rows[0].row_count == 0:
+        return None
+
+    fingerprint = "|".join(
+        f"{row.row_count}:{row.max_id}:{row.max_updated_at}" for row in rows
+    )
+
+    return hashlib.blake2b(fingerprint.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def _version_columns(
+    source: int,
+    *,
+    max_id=None,
+    max_updated_at=None,
+) -> tuple:
+    # Every UNION ALL branch must project the same columns in the same order.
+    def column(value, type_):
+        return cast(null(), type_) if value is None else value
+
+    return (
+        literal_column(str(source), Integer).label("source"),
+        func.count().label("row_count"),
+        column(max_id, Integer).label("max_id"),
+        column(max_updated_at, DateTime(timezone=True)).label("max_updated_at"),
+    )
+
+
+def _clinical_versions(source: int, record) -> Select:
+    return select(
+        *_version_columns(
+            source,
+            max_updated_at=func.max(record.updated_at),
+        )
+    ).where(
+        record.patient_id == _PATIENT_ID,
+        record.deleted_at.is_(None),
+    )
+
+
+def _code_versions(source: int, record) -> Select:
+    return select(
+        *_version_columns(
+            source,
+            max_updated_at=func.max(record.updated_at),
+        )
+    )
+
+
+def _build_patient_version_statement() -> CompoundSelect:
+    return union_all(
+        select(
+            *_version_columns(
+                0,
+                max_updated_at=func.max(PatientRecord.updated_at),
+            )
+        ).where(
+            PatientRecord.id == _PATIENT_ID,
+            PatientRecord.deleted_at.is_(None),
+        ),
+        select(*_version_columns(1, max_id=func.max(PatientIdentifierRecord.id))).where(
+            PatientIdentifierRecord.patient_id == _PATIENT_ID
+        ),
+        _clinical_versions(2, ConditionRecord),
+        _clinical_versions(3, EncounterRecord),
+        _clinical_versions(4, ObservationRecord),
+        _code_versions(5, ConditionCodeRecord),
+        _code_versions(6, ObservationCodeRecord),
+    )
+
+
+_PATIENT_VERSION_STMT = _build_patient_version_statement()
@@ -0,0 +1,226 @@
+import json
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm import Session, sessionmaker
+
+from fhir_gateway.domain.entities.condition import Condition
+from fhir_gateway.domain.entities.encounter import Encounter
+from fhir_gateway.domain.entities.observation import Observation
+from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.infrastructure.persistence.sqlalchemy.bulk_copy import (
+    copy_rows,
+    supports_copy,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.condition import (
+    condition_to_record_values,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.encounter import (
+    encounter_to_record_values,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.observation import (
+    observation_to_record_values,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.patient import (
+    patient_identifiers_to_record_values,
+    patient_to_record_values,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models import (
+    ConditionCodeRecord,
+    ConditionRecord,
+    EncounterRecord,
+    ObservationCodeRecord,
+    ObservationRecord,
+    PatientIdentifierRecord,
+    PatientRecord,
+)
+
+ClinicalResource = Patient | Condition | Encounter | Observation
+
+CodeKey = tuple[str, str]
+
+# COPY sends text, so JSON columns are serialized up front.
+_COPY_JSON_COLUMNS = {PatientRecord.__tablename__: ("name_given",)}
+
+
+class SqlAlchemyResourceBulkWriter:
+    """Insert batches of clinical resources, one transaction per batch.
+
+    Rows are written in foreign-key order: patients and their identifiers,
+    then conditions, encounters and observations. A resource may reference
+    a patient from the same batch or from an earlier one. On PostgreSQL
+    with psycopg each table is streamed with `COPY ... FROM STDIN`; other
+    databases get one executemany INSERT per table.
+
+    Condition and observation codes are resolved through in-memory maps
+    from `(system, code)` to id, filled from the code tables on first use.
+    A code seen for the first time is inserted in the transaction of the
+    batch that uses it, and only enters the map once that transaction has
+    committed. The maps assume no other writer adds codes meanwhile.
+    """
+
+    def __init__(self, session_factory: sessionmaker[Session]) -> None:
+        self._session_factory = session_factory
+        self._condition_codes = _CodeIds(ConditionCodeRecord)
+        self._observation_codes = _CodeIds(ObservationCodeRecord)
+
+    def write_batch(self, resources: Sequence[ClinicalResource]) -> None:
+        if not resources:
+            return
+
+        patients: list[Patient] = []
+        conditions: list[Condition] = []
+        encounters: list[Encounter] = []
+        observations: list[Observation] = []
+        by_type = {
+            Patient: patients,
+            Condition: conditions,
+            Encounter: encounters,
+            Observation: observations,
+        }
+
+        for resource in resources:
+            resources_of_type = by_type.get(type(resource))
+
+            if resources_of_type is None:
+                raise TypeError(
+                    f"Unsupported resource: {type(resource).__name__}"
+                )
+
+            resources_of_type.append(resource)
+
+        with self._session_factory() as session, session.begin():
+            condition_code_ids = self._condition_codes.resolve(
+                session,
+                (condition.code for condition in conditions),
+            )
+            observation_code_ids = self._observation_codes.resolve(
+                session,
+                (observation.code for observation in observations),
+            )
+
+            _write_rows(
+                session,
+                PatientRecord,
+                [patient_to_record_values(patient) for patient in patients],
+            )
+            _write_rows(
+                session,
+                PatientIdentifierRecord,
+                [
+                    row
+                    for patient in patients
+                    for row in patient_identifiers_to_record_values(patient)
+                ],
+            )
+            _write_rows(
+                session,
+                ConditionRecord,
+                [
+                    condition_to_record_values(
+                        condition,
+                        condition_code_ids[_code_key(condition.code)],
+                    )
+                    for condition in conditions
+                ],
+            )
+            _write_rows(
+                session,
+                EncounterRecord,
+                [encounter_to_record_values(encounter) for encounter in encounters],
+            )
+            _write_rows(
+                session,
+                ObservationRecord,
+                [
+                    observation_to_record_values(
+                        observation,
+                        observation_code_ids[_code_key(observation.code)],
+                    )
+                    for observation in observations
+                ],
+            )
+
+        self._condition_codes.remember(condition_code_ids)
+        self._observation_codes.remember(observation_code_ids)
+
+
+class _CodeIds:
+    def __init__(
+        self,
+        record_type: type[ConditionCodeRecord] | type[ObservationCodeRecord],
+    ) -> None:
+        self._record_type = record_type
+        self._ids: dict[CodeKey, int] | None = None
+
+    def resolve(self, session: Session, codes: Iterable[Code]) -> dict[CodeKey, int]:
+        """Return the id of every code, inserting the codes not yet stored."""
+        record_type = self._record_type
+
+        if self._ids is None:
+            rows = session.execute(
+                select(record_type.system, record_type.code, record_type.id)
+            )
+            self._ids = {(system, code): code_id for system, code, code_id in rows}
+
+        resolved: dict[CodeKey, int] = {}
+        missing: dict[CodeKey, Code] = {}
+
+        for code in codes:
+            key = _code_key(code)
+
+            if key in resolved or key in missing:
+                continue
+
+            code_id = self._ids.get(key)
+
+            if code_id is None:
+                missing[key] = code
+            else:
+                resolved[key] = code_id
+
+        if missing:
+            rows = session.execute(
+                insert(record_type).returning(
+                    record_type.system,
+                    record_type.code,
+                    record_type.id,
+                ),
+                [
+                    {"system": code.system, "code": code.code, "display": code.display}
+                    for code in missing.values()
+                ],
+            )
+            resolved.update(
+                ((system, code), code_id) for system, code, code_id in rows
+            )
+
+        return resolved
+
+    def remember(self, resolved: dict[CodeKey, int]) -> None:
+        if self._ids is not None:
+            self._ids.update(resolved)
+
+
+def _code_key(code: Code) -> CodeKey:
+    return code.system, code.code
+
+
+def _write_rows(session: Session, record_type, rows: list[dict[str, object]]) -> None:
+    if not rows:
+        return
+
+    if not supports_copy(session):
+        # A Core insert on the table skips the ORM bulk-insert bookkeeping.
+        session.execute(insert(record_type.__table__), rows)
+        return
+
+    table_name = record_type.__tablename__
+
+    for column in _COPY_JSON_COLUMNS.get(table_name, ()):
+        for row in rows:
+            if row[column] is not None:
+                row[column] = json.dumps(row[column])
+
+    copy_rows(session, table_name, tuple(rows[0]), rows)
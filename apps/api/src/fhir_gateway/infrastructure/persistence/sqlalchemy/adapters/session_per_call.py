@@ -0,0 +1,35 @@
+from collections.abc import Callable
+from typing import Generic, TypeVar
+
+from sqlalchemy.orm import Session, sessionmaker
+
+ReaderT = TypeVar("ReaderT")
+
+
+class SessionPerCallReader(Generic[ReaderT]):
+    """Run every call of a reader in a session of its own.
+
+    Concurrent fan-out reads run on worker threads, and a session must not
+    be shared between threads. Opening the session inside the call and
+    closing it when the call returns means a read holds its pooled
+    connection only while it runs, so a request never holds more
+    connections than it has reads in flight.
+
+    Calls return domain objects built before the session closes. Methods
+    that return generators, such as `stream_by_patient`, are not supported.
+    """
+
+    def __init__(
+        self,
+        session_factory: sessionmaker[Session],
+        build_reader: Callable[[Session], ReaderT],
+    ) -> None:
+        self._session_factory = session_factory
+        self._build_reader = build_reader
+
+    def __getattr__(self, name: str) -> Callable[..., object]:
+        def call(*args: object, **kwargs: object) -> object:
+            with self._session_factory() as session:
+                return getattr(self._build_reader(session), name)(*args, **kwargs)
+
+        return call
@@ -0,0 +1,295 @@
+"""Monthly partition maintenance for the PostgreSQL `audit_events` table.
+
+`audit_events` is range-partitioned on `recorded_at`, one partition per
+calendar month (UTC), named `audit_events_yYYYYmMM`. A default partition
+catches rows outside every monthly range, so inserts never fail. It should
+stay empty: PostgreSQL refuses to create a monthly partition whose range
+already has rows in the default partition, so `create` first moves such
+rows out of it, which locks the table while they are copied.
+
+Run from `apps/api` against the configured database, typically daily:
+
+    PYTHONPATH=src python -m fhir_gateway.infrastructure.persistence.sqlalchemy.audit_partitions create --months-ahead 3
+    PYTHONPATH=src python -m fhir_gateway.infrastructure.persistence.sqlalchemy.audit_partitions detach --retention-months 24
+
+Detached partitions stay in the database as ordinary tables, ready to be
+dumped to archive storage and dropped.
+"""
+
+import argparse
+import logging
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from sqlalchemy import Connection, create_engine, text
+
+from fhir_gateway.infrastructure.config.settings import get_settings
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.audit_event import (
+    AUDIT_EVENTS_DEFAULT_PARTITION,
+    AuditEventRecord,
+)
+
+logger = logging.getLogger(__name__)
+
+AUDIT_EVENTS_TABLE = AuditEventRecord.__tablename__
+
+_AUDIT_EVENT_COLUMNS = ", ".join(
+    column.name for column in AuditEventRecord.__table__.columns
+)
+
+_PARTITION_NAME = re.compile(rf"^{AUDIT_EVENTS_TABLE}_y(\d{{4}})m(\d{{2}})$")
+
+_SELECT_PARTITION_NAMES = text(
+    """
+    SELECT child.relname
+    FROM pg_inherits
+    JOIN pg_class AS parent ON parent.oid = pg_inherits.inhparent
+    JOIN pg_class AS child ON child.oid = pg_inherits.inhrelid
+    WHERE parent.relname = :table_name
+    ORDER BY child.relname
+    """
+)
+
+_COUNT_DEFAULT_PARTITION_ROWS = text(
+    f"""
+    SELECT count(*)
+    FROM {AUDIT_EVENTS_DEFAULT_PARTITION}
+    WHERE recorded_at >= :starts_at AND recorded_at < :ends_at
+    """
+)
+
+
+@dataclass(frozen=True, slots=True)
+class AuditEventPartition:
+    name: str
+    starts_at: datetime
+    ends_at: datetime
+
+    @classmethod
+    def for_month(cls, year: int, month: int) -> "AuditEventPartition":
+        starts_at = datetime(year, month, 1, tzinfo=timezone.utc)
+
+        return cls(
+            name=f"{AUDIT_EVENTS_TABLE}_y{year:04d}m{month:02d}",
+            starts_at=starts_at,
+            ends_at=_add_months(starts_at, 1),
+        )
+
+    @classmethod
+    def containing(cls, instant: datetime) -> "AuditEventPartition":
+        instant = instant.astimezone(timezone.utc)
+
+        return cls.for_month(instant.year, instant.month)
+
+    @classmethod
+    def from_name(cls, name: str) -> "AuditEventPartition | None":
+        match = _PARTITION_NAME.match(name)
+
+        if match is None:
+            return None
+
+        return cls.for_month(int(match.group(1)), int(match.group(2)))
+
+    def create_sql(self) -> str:
+        return (
+            f"CREATE TABLE IF NOT EXISTS {self.name} "
+            f"PARTITION OF {AUDIT_EVENTS_TABLE} "
+            f"FOR VALUES FROM ('{self.starts_at.isoformat()}') "
+            f"TO ('{self.ends_at.isoformat()}')"
+        )
+
+    def detach_sql(self) -> str:
+        return f"ALTER TABLE {AUDIT_EVENTS_TABLE} DETACH PARTITION {self.name}"
+
+    def move_rows_sql(self, source: str) -> str:
+        """Move the rows of this month from `source` into this partition."""
+        return (
+            f"WITH moved AS ("
+            f"DELETE FROM {source} "
+            f"WHERE recorded_at >= '{self.starts_at.isoformat()}' "
+            f"AND recorded_at < '{self.ends_at.isoformat()}' "
+            f"RETURNING {_AUDIT_EVENT_COLUMNS}"
+            f") "
+            f"INSERT INTO {self.name} ({_AUDIT_EVENT_COLUMNS}) "
+            f"SELECT {_AUDIT_EVENT_COLUMNS} FROM moved"
+        )
+
+
+def monthly_partitions(
+    first: datetime,
+    last: datetime,
+) -> tuple[AuditEventPartition, ...]:
+    """Return the partitions covering every month from `first` to `last`."""
+    partitions = []
+    partition = AuditEventPartition.containing(first)
+    last_partition = AuditEventPartition.containing(last)
+
+    while partition.starts_at <= last_partition.starts_at:
+        partitions.append(partition)
+        partition = AuditEventPartition.containing(partition.ends_at)
+
+    return tuple(partitions)
+
+
+def list_audit_event_partitions(connection: Connection) -> tuple[str, ...]:
+    """Return the names of the partitions attached to `audit_events`."""
+    names = connection.execute(
+        _SELECT_PARTITION_NAMES,
+        {"table_name": AUDIT_EVENTS_TABLE},
+    ).scalars()
+
+    return tuple(names)
+
+
+def create_audit_event_partitions(
+    connection: Connection,
+    *,
+    now: datetime,
+    months_ahead: int,
+) -> tuple[str, ...]:
+    """Create the current month's partition and `months_ahead` after it.
+
+    A month whose rows already landed in the default partition is created
+    with the default partition detached, and its rows are moved into the
+    new partition before the default partition is attached again. The
+    steps run in the caller's transaction, so a failure leaves the table
+    as it was.
+
+    Returns the names of the partitions that did not exist yet.
+    """
+    if months_ahead < 0:
+        raise ValueError("months_ahead must not be negative.")
+
+    existing = set(list_audit_event_partitions(connection))
+    created = []
+
+    for partition in monthly_partitions(now, _add_months(now, months_ahead)):
+        if partition.name in existing:
+            continue
+
+        if AUDIT_EVENTS_DEFAULT_PARTITION in existing:
+            _create_partition_from_default(connection, partition)
+        else:
+            connection.execute(text(partition.create_sql()))
+
+        created.append(partition.name)
+
+    return tuple(created)
+
+
+def detach_audit_event_partitions(
+    connection: Connection,
+    *,
+    now: datetime,
+    retention_months: int,
+) -> tuple[str, ...]:
+    """Detach monthly partitions that ended more than `retention_months` ago.
+
+    Only partitions following the monthly naming scheme are considered; the
+    default partition is never detached. Returns the detached names.
+    """
+    if retention_months < 1:
+        raise ValueError("retention_months must be at least 1.")
+
+    cutoff = _add_months(
+        AuditEventPartition.containing(now).starts_at,
+        -retention_months,
+    )
+    detached = []
+
+    for name in list_audit_event_partitions(connection):
+        partition = AuditEventPartition.from_name(name)
+
+        if partition is None or partition.ends_at > cutoff:
+            continue
+
+        connection.execute(text(partition.detach_sql()))
+        detached.append(partition.name)
+
+    return tuple(detached)
+
+
+def _create_partition_from_default(
+    connection: Connection,
+    partition: AuditEventPartition,
+) -> None:
+    stranded_rows = connection.execute(
+        _COUNT_DEFAULT_PARTITION_ROWS,
+        {"starts_at": partition.starts_at, "ends_at": partition.ends_at},
+    ).scalar_one()
+
+    if not stranded_rows:
+        connection.execute(text(partition.create_sql()))
+        return
+
+    logger.warning(
+        "Moving %d audit events from %s into new partition %s",
+        stranded_rows,
+        AUDIT_EVENTS_DEFAULT_PARTITION,
+        partition.name,
+    )
+
+    connection.execute(
+        text(
+            f"ALTER TABLE {AUDIT_EVENTS_TABLE} "
+            f"DETACH PARTITION {AUDIT_EVENTS_DEFAULT_PARTITION}"
+        )
+    )
+    connection.execute(text(partition.create_sql()))
+    connection.execute(text(partition.move_rows_sql(AUDIT_EVENTS_DEFAULT_PARTITION)))
+    connection.execute(
+        text(
+            f"ALTER TABLE {AUDIT_EVENTS_TABLE} "
+            f"ATTACH PARTITION {AUDIT_EVENTS_DEFAULT_PARTITION} DEFAULT"
+        )
+    )
+
+
+def _add_months(instant: datetime, months: int) -> datetime:
+    month_index = instant.year * 12 + instant.month - 1 + months
+
+    return datetime(
+        month_index // 12,
+        month_index % 12 + 1,
+        1,
+        tzinfo=timezone.utc,
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    create = commands.add_parser("create", help="create upcoming partitions")
+    create.add_argument("--months-ahead", type=int, default=3)
+    detach = commands.add_parser("detach", help="detach expired partitions")
+    detach.add_argument("--retention-months", type=int, required=True)
+    arguments = parser.parse_args(argv)
+
+    engine = create_engine(get_settings().database_url)
+    now = datetime.now(timezone.utc)
+
+    try:
+        with engine.begin() as connection:
+            if arguments.command == "create":
+                names = create_audit_event_partitions(
+                    connection,
+                    now=now,
+                    months_ahead=arguments.months_ahead,
+                )
+            else:
+                names = detach_audit_event_partitions(
+                    connection,
+                    now=now,
+                    retention_months=arguments.retention_months,
+                )
+    finally:
+        engine.dispose()
+
+    for name in names:
+        print(f"{arguments.command}: {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,34 @@
+from collections.abc import Iterable, Sequence
+
+from sqlalchemy.orm import Session
+
+
+def supports_copy(session: Session) -> bool:
+    """Whether rows can be streamed with `COPY ... FROM STDIN`.
+
+    Only PostgreSQL through psycopg 3 exposes the COPY protocol used here.
+    """
+    dialect = session.get_bind().dialect
+
+    return dialect.name == "postgresql" and dialect.driver == "psycopg"
+
+
+def copy_rows(
+    session: Session,
+    table_name: str,
+    columns: Sequence[str],
+    rows: Iterable[dict[str, object]],
+) -> None:
+    """Stream `rows` into `table_name` with one `COPY ... FROM STDIN`.
+
+    COPY runs on the psycopg connection behind the session, inside the
+    transaction the session already opened on it. Columns left out of
+    `columns` get their server defaults.
+    """
+    driver_connection = session.connection().connection.driver_connection
+    statement = f"COPY {table_name} ({', '.join(columns)}) FROM STDIN"
+
+    with driver_connection.cursor() as cursor:
+        with cursor.copy(statement) as copy:
+            for row in rows:
+                copy.write_row(tuple(row[column] for column in columns))
@@ -0,0 +1,295 @@
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from threading import Lock
+
+from sqlalchemy import Row, Select, bindparam, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.infrastructure.cache.stats import CacheStats
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.condition import (
+    ConditionCodeRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.observation import (
+    ObservationCodeRecord,
+)
+
+CodeRecordType = type[ObservationCodeRecord] | type[ConditionCodeRecord]
+
+logger = logging.getLogger(__name__)
+
+
+class CodeCatalog:
+    """Process-local, interned view of one code table keyed by code id.
+
+    Readers select only the resource rows and ask the catalog for the codes
+    of the `code_id`s they saw, so the code table JOIN disappears from the
+    hot queries and every row that shares a code shares one immutable `Code`
+    instance. Codes are loaded lazily, one `IN` query per batch of unknown
+    ids, and the least recently used codes are evicted past `max_entries`.
+
+    At most once every `refresh_interval_seconds` the catalog compares the
+    table's row count, max id and max `updated_at` with the values it last
+    saw and drops every entry when they differ, so an edited display is
+    picked up within one interval. New codes need no refresh: their ids
+    are simply unknown and get loaded on first use.
+
+    `resolve_id` answers the reverse question, the id of a (system, code)
+    pair, so a query by code can filter on `code_id` directly. Pairs are
+    cached the same way; a pair with no row is not cached, so a code added
+    later is found on its first use.
+
+    An id with no row, a code deleted after the resource row was read, is
+    left out of the result with a logged warning, so readers drop its
+    resources just as the JOIN would.
+    """
+
+    def __init__(
+        self,
+        record_type: CodeRecordType,
+        *,
+        max_entries: int,
+        refresh_interval_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1.")
+
+        if refresh_interval_seconds <= 0:
+            raise ValueError("refresh_interval_seconds must be greater than 0.")
+
+        self._record_type = record_type
+        self._max_entries = max_entries
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._clock = clock
+        self._version_stmt = _select_catalog_version(record_type)
+        self._codes_stmt = _select_codes_by_id(record_type)
+        self._code_id_stmt = _select_code_by_system_and_code(record_type)
+        self._codes: OrderedDict[int, Code] = OrderedDict()
+        self._code_ids: OrderedDict[tuple[str, str], int] = OrderedDict()
+        self._version: tuple | None = None
+        self._next_version_check_at: float | None = None
+        self._lock = Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def table_name(self) -> str:
+        return self._record_type.__tablename__
+
+    def resolve(self, session: Session, code_ids: Iterable[int]) -> dict[int, Code]:
+        """Return the `Code` of every id in `code_ids`, loading unknown ones."""
+        if self._version_check_due():
+            self._apply_version(tuple(session.execute(self._version_stmt).one()))
+
+        codes, missing_ids = self._lookup(code_ids)
+
+        if missing_ids:
+            rows = session.execute(
+                self._codes_stmt,
+                {"code_ids": sorted(missing_ids)},
+            ).all()
+            codes.update(self._store(rows, missing_ids))
+
+        return codes
+
+    async def resolve_async(
+        self,
+        session: AsyncSession,
+        code_ids: Iterable[int],
+    ) -> dict[int, Code]:
+        """Async counterpart of `resolve`."""
+        if self._version_check_due():
+            result = await session.execute(self._version_stmt)
+            self._apply_version(tuple(result.one()))
+
+        codes, missing_ids = self._lookup(code_ids)
+
+        if missing_ids:
+            result = await session.execute(
+                self._codes_stmt,
+                {"code_ids": sorted(missing_ids)},
+            )
+            codes.update(self._store(result.all(), missing_ids))
+
+        return codes
+
+    def resolve_id(self, session: Session, code: Code) -> int | None:
+        """Return the id of the row for `code`'s system and code, if any."""
+        if self._version_check_due():
+            self._apply_version(tuple(session.execute(self._version_stmt).one()))
+
+        code_id = self._lookup_id(code)
+
+        if code_id is None:
+            row = session.execute(
+                self._code_id_stmt,
+                {"system": code.system, "code": code.code},
+            ).one_or_none()
+            code_id = None if row is None else self._store_id(row)
+
+        return code_id
+
+    async def resolve_id_async(
+        self,
+        session: AsyncSession,
+        code: Code,
+    ) -> int | None:
+        """Async counterpart of `resolve_id`."""
+        if self._version_check_due():
+            result = await session.execute(self._version_stmt)
+            self._apply_version(tuple(result.one()))
+
+        code_id = self._lookup_id(code)
+
+        if code_id is None:
+            result = await session.execute(
+                self._code_id_stmt,
+                {"system": code.system, "code": code.code},
+            )
+            row = result.one_or_none()
+            code_id = None if row is None else self._store_id(row)
+
+        return code_id
+
+    def stats(self) -> CacheStats:
+        with self._lock:
+            return CacheStats(
+                backend=f"code-catalog:{self.table_name}",
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._codes),
+            )
+
+    def _version_check_due(self) -> bool:
+        with self._lock:
+            return (
+                self._next_version_check_at is None
+                or self._next_version_check_at <= self._clock()
+            )
+
+    def _apply_version(self, version: tuple) -> None:
+        with self._lock:
+            if version != self._version:
+                self._codes.clear()
+                self._code_ids.clear()
+                self._version = version
+
+            self._next_version_check_at = (
+                self._clock() + self._refresh_interval_seconds
+            )
+
+    def _lookup(self, code_ids: Iterable[int]) -> tuple[dict[int, Code], set[int]]:
+        codes: dict[int, Code] = {}
+        missing_ids: set[int] = set()
+
+        with self._lock:
+            for code_id in set(code_ids):
+                code = self._codes.get(code_id)
+
+                if code is None:
+                    missing_ids.add(code_id)
+                    self._misses += 1
+                    continue
+
+                self._codes.move_to_end(code_id)
+                codes[code_id] = code
+                self._hits += 1
+
+        return codes, missing_ids
+
+    def _lookup_id(self, code: Code) -> int | None:
+        key = (code.system, code.code)
+
+        with self._lock:
+            code_id = self._code_ids.get(key)
+
+            if code_id is None:
+                self._misses += 1
+                return None
+
+            self._code_ids.move_to_end(key)
+            self._hits += 1
+
+        return code_id
+
+    def _store_id(self, row: Row) -> int:
+        code = Code(system=row.system, code=row.code, display=row.display)
+
+        with self._lock:
+            self._codes.setdefault(row.id, code)
+            self._codes.move_to_end(row.id)
+            self._code_ids[(code.system, code.code)] = row.id
+            self._code_ids.move_to_end((code.system, code.code))
+            self._evict()
+
+        return row.id
+
+    def _store(self, rows: Iterable[Row], requested_ids: set[int]) -> dict[int, Code]:
+        loaded = {
+            row.id: Code(system=row.system, code=row.code, display=row.display)
+            for row in rows
+        }
+
+        unknown_ids = requested_ids - loaded.keys()
+
+        if unknown_ids:
+            logger.warning(
+                "%s has no rows with id %s; dropping the resources that use them",
+                self.table_name,
+                ", ".join(str(code_id) for code_id in sorted(unknown_ids)),
+            )
+
+        with self._lock:
+            for code_id, code in loaded.items():
+                # Another thread may have loaded the same id meanwhile; keep
+                # the instance already handed out so codes stay interned.
+                loaded[code_id] = self._codes.setdefault(code_id, code)
+                self._codes.move_to_end(code_id)
+
+            self._evict()
+
+        return loaded
+
+    def _evict(self) -> None:
+        while len(self._codes) > self._max_entries:
+            self._codes.popitem(last=False)
+            self._evictions += 1
+
+        while len(self._code_ids) > self._max_entries:
+            self._code_ids.popitem(last=False)
+            self._evictions += 1
+
+
+def _select_catalog_version(record_type: CodeRecordType) -> Select:
+    return select(
+        func.count(record_type.id),
+        func.max(record_type.id),
+        func.max(record_type.updated_at),
+    )
+
+
+def _select_codes_by_id(record_type: CodeRecordType) -> Select:
+    return select(
+        record_type.id,
+        record_type.system,
+        record_type.code,
+        record_type.display,
+    ).where(record_type.id.in_(bindparam("code_ids", expanding=True)))
+
+
+def _select_code_by_system_and_code(record_type: CodeRecordType) -> Select:
+    return select(
+        record_type.id,
+        record_type.system,
+        record_type.code,
+        record_type.display,
+    ).where(
+        record_type.system == bindparam("system"),
+        record_type.code == bindparam("code"),
+    )
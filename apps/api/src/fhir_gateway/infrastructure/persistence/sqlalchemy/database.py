@@ -1,9 +1,56 @@
+from dataclasses import dataclass
+from typing import Any
+
 from sqlalchemy import Engine, create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import QueuePool
+
+from fhir_gateway.infrastructure.persistence.sqlalchemy.pool_metrics import (
+    InstrumentedAsyncAdaptedQueuePool,
+    InstrumentedQueuePool,
+    PoolMetrics,
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DatabaseEngineOptions:
+    """Connection pool and session tuning for an engine.
 
+    The defaults are SQLAlchemy's and psycopg's own. Pool options only apply
+    when the dialect pools connections in a queue, which excludes in-memory
+    SQLite. `statement_timeout_ms` and `prepare_threshold` are psycopg
+    connection settings and are ignored for other drivers; a
+    `prepare_threshold` of `None` disables server-side prepared statements,
+    as transaction-mode PgBouncer requires.
+    """
 
-def create_database_engine(database_url: str) -> Engine:
-    return create_engine(database_url)
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout_seconds: float = 30.0
+    pool_recycle_seconds: int | None = None
+    pool_pre_ping: bool = False
+    pool_use_lifo: bool = False
+    statement_timeout_ms: int | None = None
+    prepare_threshold: int | None = 5
+
+
+def create_database_engine(
+    database_url: str,
+    options: DatabaseEngineOptions | None = None,
+    *,
+    pool_metrics: PoolMetrics | None = None,
+) -> Engine:
+    return create_engine(
+        database_url,
+        **_engine_arguments(database_url, options, pool_metrics, asynchronous=False),
+    )
 
 
 def create_session_factory(engine: Engine) -> sessionmaker[Session]:
@@ -12,3 +59,72 @@ def create_session_factory(engine: Engine) -> sessionmaker[Session]:
         autoflush=False,
         expire_on_commit=False,
     )
+
+
+def create_async_database_engine(
+    database_url: str,
+    options: DatabaseEngineOptions | None = None,
+    *,
+    pool_metrics: PoolMetrics | None = None,
+) -> AsyncEngine:
+    return create_async_engine(
+        database_url,
+        **_engine_arguments(database_url, options, pool_metrics, asynchronous=True),
+    )
+
+
+def create_async_session_factory(
+    engine: AsyncEngine,
+) -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(
+        bind=engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+def _engine_arguments(
+    database_url: str,
+    options: DatabaseEngineOptions | None,
+    pool_metrics: PoolMetrics | None,
+    *,
+    asynchronous: bool,
+) -> dict[str, Any]:
+    if options is None and pool_metrics is None:
+        return {}
+
+    options = options or DatabaseEngineOptions()
+    url = make_url(database_url)
+    arguments: dict[str, Any] = {}
+
+    if issubclass(url.get_dialect().get_pool_class(url), QueuePool):
+        arguments.update(
+            pool_size=options.pool_size,
+            max_overflow=options.max_overflow,
+            pool_timeout=options.pool_timeout_seconds,
+            pool_recycle=options.pool_recycle_seconds or -1,
+            pool_pre_ping=options.pool_pre_ping,
+            pool_use_lifo=options.pool_use_lifo,
+        )
+
+        if pool_metrics is not None:
+            # An async driver URL, as given to both engines of the async
+            # stack, needs the async-adapted pool even on the sync engine.
+            arguments["poolclass"] = (
+                InstrumentedAsyncAdaptedQueuePool
+                if asynchronous or url.get_dialect().is_async
+                else InstrumentedQueuePool
+            )
+            arguments["pool_metrics"] = pool_metrics
+
+    if url.get_backend_name() == "postgresql" and url.get_driver_name() == "psycopg":
+        connect_args: dict[str, Any] = {"prepare_threshold": options.prepare_threshold}
+
+        if options.statement_timeout_ms is not None:
+            connect_args["options"] = (
+                f"-c statement_timeout={options.statement_timeout_ms}"
+            )
+
+        arguments["connect_args"] = connect_args
+
+    return arguments
@@ -1,23 +1,43 @@
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.audit_event import (
     audit_event_record_to_domain,
+    audit_event_to_record_values,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.condition import (
     condition_record_to_domain,
+    condition_record_with_code_to_domain,
+    condition_to_record_values,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.encounter import (
     encounter_record_to_domain,
+    encounter_to_record_values,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.observation import (
     observation_record_to_domain,
+    observation_record_with_code_to_domain,
+    observation_to_record_values,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.patient import (
+    patient_identifiers_to_record_values,
     patient_record_to_domain,
+    patient_to_record_values,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.patient_summary import (
+    patient_summary_rows_to_domain,
 )
 
 __all__ = [
     "audit_event_record_to_domain",
+    "audit_event_to_record_values",
     "condition_record_to_domain",
+    "condition_record_with_code_to_domain",
+    "condition_to_record_values",
     "encounter_record_to_domain",
+    "encounter_to_record_values",
     "observation_record_to_domain",
+    "observation_record_with_code_to_domain",
+    "observation_to_record_values",
+    "patient_identifiers_to_record_values",
     "patient_record_to_domain",
+    "patient_summary_rows_to_domain",
+    "patient_to_record_values",
 ]
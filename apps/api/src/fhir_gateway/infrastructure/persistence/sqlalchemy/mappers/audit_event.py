@@ -2,6 +2,9 @@ from fhir_gateway.domain.entities.audit_event import AuditAction, AuditEvent
 from fhir_gateway.domain.value_objects.instant import Instant
 from fhir_gateway.domain.value_objects.reference import Reference
 from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.datetimes import (
+    ensure_utc,
+)
 from fhir_gateway.infrastructure.persistence.sqlalchemy.models.audit_event import (
     AuditEventRecord,
 )
@@ -10,7 +13,7 @@ from fhir_gateway.infrastructure.persistence.sqlalchemy.models.audit_event impor
 def audit_event_record_to_domain(record: AuditEventRecord) -> AuditEvent:
     return AuditEvent(
         id=ResourceId(record.id),
-        recorded=Instant(record.recorded_at),
+        recorded=Instant(ensure_utc(record.recorded_at)),
         agent=record.agent,
         action=AuditAction(record.action),
         entity=Reference(
@@ -18,3 +21,19 @@ def audit_event_record_to_domain(record: AuditEventRecord) -> AuditEvent:
             id=ResourceId(record.entity_id),
         ),
     )
+
+
+def audit_event_to_record_values(event: AuditEvent) -> dict[str, object]:
+    """Column values of the `audit_events` row for `event`.
+
+    Used for bulk inserts, which take plain parameter dictionaries rather
+    than ORM objects.
+    """
+    return {
+        "id": event.id.value,
+        "recorded_at": event.recorded.value,
+        "agent": event.agent,
+        "action": event.action.value,
+        "entity_resource_type": event.entity.resource_type,
+        "entity_id": event.entity.id.value,
+    }
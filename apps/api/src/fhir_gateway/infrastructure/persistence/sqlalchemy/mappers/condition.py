@@ -1,8 +1,6 @@
 from fhir_gateway.domain.entities.condition import Condition
 from fhir_gateway.domain.value_objects.code import Code
-from fhir_gateway.domain.value_objects.instant import Instant
-from fhir_gateway.domain.value_objects.reference import Reference
-from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers import trusted
 from fhir_gateway.infrastructure.persistence.sqlalchemy.models.condition import (
     ConditionCodeRecord,
     ConditionRecord,
@@ -18,15 +16,23 @@ def condition_record_to_domain(
             "ConditionRecord.code_id must match ConditionCodeRecord.id"
         )
 
-    return Condition(
-        id=ResourceId(record.id),
-        code=_condition_code_to_domain(code_record),
-        subject=Reference(
-            resource_type="Patient",
-            id=ResourceId(record.patient_id),
-        ),
+    return condition_record_with_code_to_domain(
+        record,
+        _condition_code_to_domain(code_record),
+    )
+
+
+def condition_record_with_code_to_domain(
+    record: ConditionRecord,
+    code: Code,
+) -> Condition:
+    """Map `record` with a `Code` already resolved from its `code_id`."""
+    return trusted.condition(
+        id=trusted.resource_id(record.id),
+        code=code,
+        subject=trusted.patient_reference(record.patient_id),
         recorded_date=(
-            Instant(record.recorded_at)
+            trusted.instant(record.recorded_at)
             if record.recorded_at is not None
             else None
         ),
@@ -36,8 +42,29 @@ def condition_record_to_domain(
 def _condition_code_to_domain(
     code_record: ConditionCodeRecord,
 ) -> Code:
-    return Code(
-        system=code_record.system,
-        code=code_record.code,
-        display=code_record.display,
+    return trusted.code(
+        code_record.system,
+        code_record.code,
+        code_record.display,
     )
+
+
+def condition_to_record_values(
+    condition: Condition,
+    code_id: int,
+) -> dict[str, object]:
+    """Column values of the `conditions` row for `condition`.
+
+    `code_id` is the `condition_codes` id of `condition.code`, resolved by
+    the caller.
+    """
+    return {
+        "id": condition.id.value,
+        "patient_id": condition.subject.id.value,
+        "code_id": code_id,
+        "recorded_at": (
+            condition.recorded_date.value
+            if condition.recorded_date is not None
+            else None
+        ),
+    }
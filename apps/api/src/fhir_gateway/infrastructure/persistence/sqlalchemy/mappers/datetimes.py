@@ -0,0 +1,15 @@
+from datetime import datetime, timezone
+
+
+def ensure_utc(value: datetime) -> datetime:
+    """Return a timezone-aware datetime for a value read from the database.
+
+    `DateTime(timezone=True)` columns come back timezone-aware from PostgreSQL.
+    SQLite drops the offset on storage, so the same columns come back naive.
+    Persisted instants are stored in UTC (ADR 0001), so a naive value is read
+    as UTC instead of being rejected later by `Instant`.
+    """
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+
+    return value
@@ -1,26 +1,32 @@
 from fhir_gateway.domain.entities.encounter import Encounter
-from fhir_gateway.domain.value_objects.instant import Instant
-from fhir_gateway.domain.value_objects.period import Period
-from fhir_gateway.domain.value_objects.reference import Reference
-from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers import trusted
 from fhir_gateway.infrastructure.persistence.sqlalchemy.models.encounter import (
     EncounterRecord,
 )
 
 
 def encounter_record_to_domain(record: EncounterRecord) -> Encounter:
-    return Encounter(
-        id=ResourceId(record.id),
-        subject=Reference(
-            resource_type="Patient",
-            id=ResourceId(record.patient_id),
-        ),
-        period=Period(
-            start=Instant(record.period_start_at),
+    return trusted.encounter(
+        id=trusted.resource_id(record.id),
+        subject=trusted.patient_reference(record.patient_id),
+        period=trusted.period(
+            start=trusted.instant(record.period_start_at),
             end=(
-                Instant(record.period_end_at)
+                trusted.instant(record.period_end_at)
                 if record.period_end_at is not None
                 else None
             ),
         ),
     )
+
+
+def encounter_to_record_values(encounter: Encounter) -> dict[str, object]:
+    """Column values of the `encounters` row for `encounter`."""
+    return {
+        "id": encounter.id.value,
+        "patient_id": encounter.subject.id.value,
+        "period_start_at": encounter.period.start.value,
+        "period_end_at": (
+            encounter.period.end.value if encounter.period.end is not None else None
+        ),
+    }
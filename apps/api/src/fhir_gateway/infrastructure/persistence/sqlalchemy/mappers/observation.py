@@ -3,10 +3,7 @@ from fhir_gateway.domain.entities.observation import (
     ObservationStatus,
 )
 from fhir_gateway.domain.value_objects.code import Code
-from fhir_gateway.domain.value_objects.instant import Instant
-from fhir_gateway.domain.value_objects.quantity import Quantity
-from fhir_gateway.domain.value_objects.reference import Reference
-from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers import trusted
 from fhir_gateway.infrastructure.persistence.sqlalchemy.models.observation import (
     ObservationCodeRecord,
     ObservationRecord,
@@ -22,27 +19,52 @@ def observation_record_to_domain(
             "ObservationRecord.code_id must match ObservationCodeRecord.id"
         )
 
-    return Observation(
-        id=ResourceId(record.id),
+    return observation_record_with_code_to_domain(
+        record,
+        _observation_code_to_domain(code_record),
+    )
+
+
+def observation_record_with_code_to_domain(
+    record: ObservationRecord,
+    code: Code,
+) -> Observation:
+    """Map `record` with a `Code` already resolved from its `code_id`."""
+    return trusted.observation(
+        id=trusted.resource_id(record.id),
         status=ObservationStatus(record.status),
-        code=_observation_code_to_domain(code_record),
-        subject=Reference(
-            resource_type="Patient",
-            id=ResourceId(record.patient_id),
-        ),
-        effective=Instant(record.effective_at),
-        value=Quantity(
-            value=record.value_quantity,
-            unit=record.value_unit,
-        ),
+        code=code,
+        subject=trusted.patient_reference(record.patient_id),
+        effective=trusted.instant(record.effective_at),
+        value=trusted.quantity(record.value_quantity, record.value_unit),
     )
 
 
 def _observation_code_to_domain(
     code_record: ObservationCodeRecord,
 ) -> Code:
-    return Code(
-        system=code_record.system,
-        code=code_record.code,
-        display=code_record.display,
+    return trusted.code(
+        code_record.system,
+        code_record.code,
+        code_record.display,
     )
+
+
+def observation_to_record_values(
+    observation: Observation,
+    code_id: int,
+) -> dict[str, object]:
+    """Column values of the `observations` row for `observation`.
+
+    `code_id` is the `observation_codes` id of `observation.code`, resolved
+    by the caller.
+    """
+    return {
+        "id": observation.id.value,
+        "patient_id": observation.subject.id.value,
+        "status": observation.status.value,
+        "code_id": code_id,
+        "effective_at": observation.effective.value,
+        "value_quantity": observation.value.value,
+        "value_unit": observation.value.unit,
+    }
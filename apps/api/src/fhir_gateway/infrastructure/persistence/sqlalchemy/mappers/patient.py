@@ -40,3 +40,33 @@ def _patient_name_to_domain(record: PatientRecord) -> HumanName | None:
         family=name_family,
         text=name_text,
     )
+
+
+def patient_to_record_values(patient: Patient) -> dict[str, object]:
+    """Column values of the `patients` row for `patient`.
+
+    Used for bulk inserts, which take plain parameter dictionaries rather
+    than ORM objects. Identifiers are separate rows, see
+    `patient_identifiers_to_record_values`.
+    """
+    name = patient.name
+
+    return {
+        "id": patient.id.value,
+        "name_text": name.text if name is not None else None,
+        "name_family": name.family if name is not None else None,
+        "name_given": list(name.given) if name is not None and name.given else None,
+    }
+
+
+def patient_identifiers_to_record_values(
+    patient: Patient,
+) -> list[dict[str, object]]:
+    return [
+        {
+            "patient_id": patient.id.value,
+            "system": identifier.system,
+            "value": identifier.value,
+        }
+        for identifier in patient.identifiers
+    ]
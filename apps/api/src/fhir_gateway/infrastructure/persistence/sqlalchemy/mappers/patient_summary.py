@@ -0,0 +1,130 @@
+from collections.abc import Iterable
+from enum import IntEnum
+from typing import Any
+
+from fhir_gateway.application.models.patient_summary import PatientSummary
+from fhir_gateway.domain.entities.condition import Condition
+from fhir_gateway.domain.entities.encounter import Encounter
+from fhir_gateway.domain.entities.observation import (
+    Observation,
+    ObservationStatus,
+)
+from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.human_name import HumanName
+from fhir_gateway.domain.value_objects.identifier import Identifier
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers import trusted
+
+
+class PatientSummaryRowKind(IntEnum):
+    """Discriminator of the rows returned by the patient summary statement.
+
+    The values also define the order in which rows are returned, so the
+    patient row always precedes its identifiers and clinical resources.
+    """
+
+    PATIENT = 0
+    IDENTIFIER = 1
+    CONDITION = 2
+    ENCOUNTER = 3
+    OBSERVATION = 4
+
+
+def patient_summary_rows_to_domain(
+    rows: Iterable[Any],
+) -> PatientSummary | None:
+    patient_row = None
+    identifiers: list[Identifier] = []
+    conditions: list[Condition] = []
+    encounters: list[Encounter] = []
+    observations: list[Observation] = []
+
+    for row in rows:
+        kind = row.kind
+
+        if kind == PatientSummaryRowKind.PATIENT:
+            patient_row = row
+        elif kind == PatientSummaryRowKind.IDENTIFIER:
+            identifiers.append(_identifier_row_to_domain(row))
+        elif kind == PatientSummaryRowKind.CONDITION:
+            conditions.append(_condition_row_to_domain(row))
+        elif kind == PatientSummaryRowKind.ENCOUNTER:
+            encounters.append(_encounter_row_to_domain(row))
+        elif kind == PatientSummaryRowKind.OBSERVATION:
+            observations.append(_observation_row_to_domain(row))
+        else:
+            raise ValueError(f"Unknown patient summary row kind: {kind}")
+
+    if patient_row is None:
+        return None
+
+    return PatientSummary(
+        patient=Patient(
+            id=ResourceId(patient_row.resource_id),
+            identifiers=tuple(identifiers),
+            name=_patient_name_row_to_domain(patient_row),
+        ),
+        conditions=tuple(conditions),
+        encounters=tuple(encounters),
+        observations=tuple(observations),
+    )
+
+
+def _patient_name_row_to_domain(row: Any) -> HumanName | None:
+    name_text = row.name_text
+    name_family = row.name_family
+    name_given = tuple(row.name_given or ())
+
+    if name_text is None and name_family is None and not name_given:
+        return None
+
+    return HumanName(
+        given=name_given,
+        family=name_family,
+        text=name_text,
+    )
+
+
+def _identifier_row_to_domain(row: Any) -> Identifier:
+    return Identifier(
+        system=row.identifier_system,
+        value=row.identifier_value,
+    )
+
+
+def _condition_row_to_domain(row: Any) -> Condition:
+    return trusted.condition(
+        id=trusted.resource_id(row.resource_id),
+        code=_code_row_to_domain(row),
+        subject=trusted.patient_reference(row.patient_id),
+        recorded_date=(
+            trusted.instant(row.sort_at) if row.sort_at is not None else None
+        ),
+    )
+
+
+def _encounter_row_to_domain(row: Any) -> Encounter:
+    return trusted.encounter(
+        id=trusted.resource_id(row.resource_id),
+        subject=trusted.patient_reference(row.patient_id),
+        period=trusted.period(
+            start=trusted.instant(row.sort_at),
+            end=trusted.instant(row.end_at) if row.end_at is not None else None,
+        ),
+    )
+
+
+def _observation_row_to_domain(row: Any) -> Observation:
+    return trusted.observation(
+        id=trusted.resource_id(row.resource_id),
+        status=ObservationStatus(row.status),
+        code=_code_row_to_domain(row),
+        subject=trusted.patient_reference(row.patient_id),
+        effective=trusted.instant(row.sort_at),
+        value=trusted.quantity(row.value_quantity, row.value_unit),
+    )
+
+
+def _code_row_to_domain(row: Any) -> Code:
+    return trusted.code(row.code_system, row.code_code, row.code_display)
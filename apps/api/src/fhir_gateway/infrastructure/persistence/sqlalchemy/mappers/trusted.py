@@ -0,0 +1,140 @@
+"""Build clinical domain objects from database rows without re-validating them.
+
+Rows read back were validated by the domain when they were written and are
+still guarded by column types, NOT NULL, foreign keys and CHECK constraints.
+Running every `__post_init__` again, per field and per row, dominates the
+cost of mapping large reads, so the mappers build value objects and entities
+through their `_from_trusted` constructors instead.
+
+`set_full_validation(True)` switches every builder back to the validating
+constructors. The app sets it from `persistence_full_validation`, which is
+meant for debugging data written outside the application.
+"""
+
+from datetime import datetime, timezone
+
+from fhir_gateway.domain.entities.condition import Condition
+from fhir_gateway.domain.entities.encounter import Encounter
+from fhir_gateway.domain.entities.observation import (
+    Observation,
+    ObservationStatus,
+)
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.instant import Instant
+from fhir_gateway.domain.value_objects.period import Period
+from fhir_gateway.domain.value_objects.quantity import Quantity
+from fhir_gateway.domain.value_objects.reference import Reference
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.datetimes import (
+    ensure_utc,
+)
+
+_full_validation = False
+
+
+def set_full_validation(enabled: bool) -> None:
+    global _full_validation
+    _full_validation = enabled
+
+
+def full_validation_enabled() -> bool:
+    return _full_validation
+
+
+def resource_id(value: str) -> ResourceId:
+    if _full_validation:
+        return ResourceId(value)
+
+    return ResourceId._from_trusted(value)
+
+
+def instant(value: datetime) -> Instant:
+    value = ensure_utc(value)
+
+    if _full_validation:
+        return Instant(value)
+
+    if value.tzinfo is not timezone.utc:
+        value = value.astimezone(timezone.utc)
+
+    return Instant._from_trusted(value)
+
+
+def patient_reference(patient_id: str) -> Reference:
+    if _full_validation:
+        return Reference(resource_type="Patient", id=ResourceId(patient_id))
+
+    return Reference._from_trusted("Patient", ResourceId._from_trusted(patient_id))
+
+
+def code(system: str, code: str, display: str | None) -> Code:
+    if _full_validation:
+        return Code(system=system, code=code, display=display)
+
+    return Code._from_trusted(system, code, display)
+
+
+def quantity(value: float | None, unit: str | None) -> Quantity:
+    if _full_validation:
+        return Quantity(value=value, unit=unit)
+
+    return Quantity._from_trusted(value, unit)
+
+
+def period(start: Instant, end: Instant | None) -> Period:
+    if _full_validation:
+        return Period(start=start, end=end)
+
+    return Period._from_trusted(start, end)
+
+
+def observation(
+    *,
+    id: ResourceId,
+    status: ObservationStatus,
+    code: Code,
+    subject: Reference,
+    effective: Instant,
+    value: Quantity,
+) -> Observation:
+    if _full_validation:
+        return Observation(
+            id=id,
+            status=status,
+            code=code,
+            subject=subject,
+            effective=effective,
+            value=value,
+        )
+
+    return Observation._from_trusted(id, status, code, subject, effective, value)
+
+
+def condition(
+    *,
+    id: ResourceId,
+    code: Code,
+    subject: Reference,
+    recorded_date: Instant | None,
+) -> Condition:
+    if _full_validation:
+        return Condition(
+            id=id,
+            code=code,
+            subject=subject,
+            recorded_date=recorded_date,
+        )
+
+    return Condition._from_trusted(id, code, subject, recorded_date)
+
+
+def encounter(
+    *,
+    id: ResourceId,
+    subject: Reference,
+    period: Period,
+) -> Encounter:
+    if _full_validation:
+        return Encounter(id=id, subject=subject, period=period)
+
+    return Encounter._from_trusted(id, subject, period)
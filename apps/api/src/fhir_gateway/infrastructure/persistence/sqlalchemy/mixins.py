@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, func
+from sqlalchemy import DateTime, Index, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 
@@ -18,8 +18,27 @@ class TimestampMixin:
     )
 
 
+NOT_DELETED_SQL = "deleted_at IS NULL"
+
+
 class LogicalDeletionMixin:
     deleted_at: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True),
         nullable=True,
     )
+
+
+def not_deleted_index(name: str, *columns: str, **dialect_kwargs) -> Index:
+    """Build a partial index over the rows that are not logically deleted.
+
+    Every read of a `LogicalDeletionMixin` table filters on `deleted_at IS
+    NULL`, so deleted rows only make such an index larger. Both PostgreSQL
+    and SQLite support the predicate.
+    """
+    return Index(
+        name,
+        *columns,
+        postgresql_where=text(NOT_DELETED_SQL),
+        sqlite_where=text(NOT_DELETED_SQL),
+        **dialect_kwargs,
+    )
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, DateTime, Index, String, func
+from sqlalchemy import DDL, CheckConstraint, DateTime, Index, String, event, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from fhir_gateway.domain.entities.audit_event import AuditAction
@@ -28,9 +28,16 @@ _AUDIT_ENTITY_RESOURCE_TYPE_CHECK_SQL = (
 )
 
 
+AUDIT_EVENTS_DEFAULT_PARTITION = "audit_events_default"
+
+
 class AuditEventRecord(Base):
     __tablename__ = "audit_events"
 
+    # On PostgreSQL the table is range-partitioned by month on recorded_at,
+    # which therefore has to be part of the primary key. Monthly partitions
+    # are managed by `audit_partitions`; rows outside every monthly range
+    # land in the default partition.
     __table_args__ = (
         CheckConstraint(
             _AUDIT_ACTION_CHECK_SQL,
@@ -44,12 +51,42 @@ class AuditEventRecord(Base):
             "btrim(agent) <> ''",
             name="ck_audit_events_agent_not_empty",
         ),
-        Index("ix_audit_events_recorded_at", "recorded_at"),
+        Index(
+            "ix_audit_events_recorded_at_id",
+            text("recorded_at DESC"),
+            "id",
+        ),
+        Index(
+            "ix_audit_events_agent_recorded_at_id",
+            "agent",
+            text("recorded_at DESC"),
+            "id",
+        ),
+        Index(
+            "ix_audit_events_action_recorded_at_id",
+            "action",
+            text("recorded_at DESC"),
+            "id",
+        ),
+        Index(
+            "ix_audit_events_entity_recorded_at_id",
+            "entity_resource_type",
+            "entity_id",
+            text("recorded_at DESC"),
+            "id",
+        ),
+        {"postgresql_partition_by": "RANGE (recorded_at)"},
     )
 
+    # Nothing reads created_at back after an insert. Without RETURNING,
+    # batched inserts also need not match returned (id, recorded_at) keys,
+    # which fails when the driver hands datetimes back in another timezone.
+    __mapper_args__ = {"eager_defaults": False}
+
     id: Mapped[str] = mapped_column(String, primary_key=True)
     recorded_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
+        primary_key=True,
         nullable=False,
     )
     agent: Mapped[str] = mapped_column(String, nullable=False)
@@ -61,3 +98,16 @@ class AuditEventRecord(Base):
         server_default=func.now(),
         nullable=False,
     )
+
+
+# A partitioned table accepts no rows until it has a partition. The default
+# partition keeps `create_all` databases writable before any monthly
+# partition exists.
+event.listen(
+    AuditEventRecord.__table__,
+    "after_create",
+    DDL(
+        f"CREATE TABLE {AUDIT_EVENTS_DEFAULT_PARTITION} "
+        "PARTITION OF audit_events DEFAULT"
+    ).execute_if(dialect="postgresql"),
+)
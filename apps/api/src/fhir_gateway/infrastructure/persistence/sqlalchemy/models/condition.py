@@ -1,12 +1,13 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Index, String, UniqueConstraint
+from sqlalchemy import DateTime, ForeignKey, String, UniqueConstraint
 from sqlalchemy.orm import Mapped, mapped_column
 
 from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mixins import (
     LogicalDeletionMixin,
     TimestampMixin,
+    not_deleted_index,
 )
 
 
@@ -31,7 +32,12 @@ class ConditionRecord(LogicalDeletionMixin, TimestampMixin, Base):
     __tablename__ = "conditions"
 
     __table_args__ = (
-        Index("ix_conditions_patient_code", "patient_id", "code_id"),
+        not_deleted_index(
+            "ix_conditions_patient_recorded_at",
+            "patient_id",
+            "recorded_at",
+            "id",
+        ),
     )
 
     id: Mapped[str] = mapped_column(String, primary_key=True)
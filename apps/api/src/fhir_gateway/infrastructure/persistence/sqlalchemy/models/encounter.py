@@ -1,12 +1,13 @@
 from datetime import datetime
 
-from sqlalchemy import CheckConstraint, DateTime, ForeignKey, Index, String
+from sqlalchemy import CheckConstraint, DateTime, ForeignKey, String
 from sqlalchemy.orm import Mapped, mapped_column
 
 from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mixins import (
     LogicalDeletionMixin,
     TimestampMixin,
+    not_deleted_index,
 )
 
 
@@ -18,10 +19,11 @@ class EncounterRecord(LogicalDeletionMixin, TimestampMixin, Base):
             "period_end_at IS NULL OR period_start_at <= period_end_at",
             name="ck_encounters_period_start_before_end",
         ),
-        Index(
+        not_deleted_index(
             "ix_encounters_patient_period_start_at",
             "patient_id",
             "period_start_at",
+            "id",
         ),
     )
 
@@ -5,7 +5,6 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
-    Index,
     String,
     UniqueConstraint,
 )
@@ -16,6 +15,7 @@ from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mixins import (
     LogicalDeletionMixin,
     TimestampMixin,
+    not_deleted_index,
 )
 
 
@@ -55,11 +55,23 @@ class ObservationRecord(LogicalDeletionMixin, TimestampMixin, Base):
             "value_quantity IS NULL OR value_unit IS NOT NULL",
             name="ck_observations_value_quantity_requires_unit",
         ),
-        Index("ix_observations_patient_code", "patient_id", "code_id"),
-        Index(
+        # Covers the by-code reads: equality on (patient_id, code_id), rows
+        # already in (effective_at, id) order, and every other column those
+        # reads select, so PostgreSQL can answer them with an index-only
+        # scan. Deleted rows are never read by code, so they are left out.
+        not_deleted_index(
+            "ix_observations_patient_code_effective_at",
+            "patient_id",
+            "code_id",
+            "effective_at",
+            "id",
+            postgresql_include=["status", "value_quantity", "value_unit"],
+        ),
+        not_deleted_index(
             "ix_observations_patient_effective_at",
             "patient_id",
             "effective_at",
+            "id",
         ),
     )
 
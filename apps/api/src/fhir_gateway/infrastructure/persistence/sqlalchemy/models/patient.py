@@ -1,18 +1,59 @@
 from __future__ import annotations
 
-from sqlalchemy import ForeignKey, Index, JSON, String, UniqueConstraint
+from sqlalchemy import (
+    DDL,
+    ForeignKey,
+    Index,
+    JSON,
+    String,
+    UniqueConstraint,
+    event,
+    text,
+)
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mixins import (
+    NOT_DELETED_SQL,
     LogicalDeletionMixin,
     TimestampMixin,
 )
 
 
+def _trigram_index(
+    name: str,
+    column_name: str,
+    *,
+    not_deleted: bool = False,
+) -> Index:
+    # pg_trgm GIN index serving ILIKE '%text%' patient search. It is only
+    # created on PostgreSQL; other dialects fall back to scanning.
+    return Index(
+        name,
+        column_name,
+        postgresql_using="gin",
+        postgresql_ops={column_name: "gin_trgm_ops"},
+        postgresql_where=text(NOT_DELETED_SQL) if not_deleted else None,
+    ).ddl_if(dialect="postgresql")
+
+
 class PatientRecord(LogicalDeletionMixin, TimestampMixin, Base):
     __tablename__ = "patients"
 
+    __table_args__ = (
+        _trigram_index("ix_patients_id_trgm", "id", not_deleted=True),
+        _trigram_index(
+            "ix_patients_name_text_trgm",
+            "name_text",
+            not_deleted=True,
+        ),
+        _trigram_index(
+            "ix_patients_name_family_trgm",
+            "name_family",
+            not_deleted=True,
+        ),
+    )
+
     id: Mapped[str] = mapped_column(String, primary_key=True)
     name_text: Mapped[str | None] = mapped_column(String, nullable=True)
     name_family: Mapped[str | None] = mapped_column(String, nullable=True)
@@ -39,6 +80,8 @@ class PatientIdentifierRecord(Base):
             "system",
             "value",
         ),
+        _trigram_index("ix_patient_identifiers_system_trgm", "system"),
+        _trigram_index("ix_patient_identifiers_value_trgm", "value"),
     )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
@@ -50,3 +93,10 @@ class PatientIdentifierRecord(Base):
     value: Mapped[str] = mapped_column(String, nullable=False)
 
     patient: Mapped[PatientRecord] = relationship(back_populates="identifiers")
+
+
+event.listen(
+    PatientRecord.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql"),
+)
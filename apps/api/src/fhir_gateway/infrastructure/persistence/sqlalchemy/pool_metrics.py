@@ -0,0 +1,149 @@
+import bisect
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from threading import Lock
+from typing import TypeVar
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+T = TypeVar("T")
+
+# Upper bounds of the checkout wait histogram buckets, in milliseconds.
+WAIT_BUCKET_BOUNDS_MS = (1.0, 5.0, 10.0, 25.0, 50.0, 100.0, 250.0, 500.0, 1000.0)
+
+
+@dataclass(frozen=True, slots=True)
+class PoolStats:
+    """Point-in-time view of a connection pool.
+
+    `wait_buckets` is cumulative: each `(upper_bound_ms, count)` pair counts
+    the checkouts that waited at most `upper_bound_ms`, and the last bound,
+    `None`, counts every checkout.
+    """
+
+    pool_size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_buckets: tuple[tuple[float | None, int], ...]
+
+
+class PoolMetrics:
+    """Checkout counts and wait times of one engine's connection pool.
+
+    Pass an instance to `create_database_engine`. The engine then uses an
+    instrumented queue pool that times every `connect()`, including the
+    time spent waiting for a free connection, and counts checkouts that
+    gave up after `pool_timeout_seconds`. Current checked-out and overflow
+    counts are read from the pool itself when `stats()` is called.
+    """
+
+    def __init__(self, *, clock: Callable[[], float] = time.perf_counter) -> None:
+        self._clock = clock
+        self._lock = Lock()
+        self._pool: QueuePool | None = None
+        self._bucket_counts = [0] * (len(WAIT_BUCKET_BOUNDS_MS) + 1)
+        self._checkouts = 0
+        self._timeouts = 0
+        self._wait_seconds_total = 0.0
+
+    def attach(self, pool: QueuePool) -> None:
+        # A disposed engine replaces its pool; the newest one is reported.
+        self._pool = pool
+
+    def measure_checkout(self, connect: Callable[[], T]) -> T:
+        """Call `connect` and record how long it took to get a connection."""
+        started_at = self._clock()
+
+        try:
+            connection = connect()
+        except PoolTimeoutError:
+            self._record(self._clock() - started_at, timed_out=True)
+            raise
+
+        self._record(self._clock() - started_at, timed_out=False)
+
+        return connection
+
+    def _record(self, wait_seconds: float, *, timed_out: bool) -> None:
+        bucket = bisect.bisect_left(WAIT_BUCKET_BOUNDS_MS, wait_seconds * 1000)
+
+        with self._lock:
+            self._bucket_counts[bucket] += 1
+            self._checkouts += 1
+            self._wait_seconds_total += wait_seconds
+
+            if timed_out:
+                self._timeouts += 1
+
+    def stats(self) -> PoolStats:
+        pool = self._pool
+
+        with self._lock:
+            bucket_counts = list(self._bucket_counts)
+            checkouts = self._checkouts
+            timeouts = self._timeouts
+            wait_seconds_total = self._wait_seconds_total
+
+        cumulative = 0
+        wait_buckets = []
+
+        for bound, count in zip(
+            (*WAIT_BUCKET_BOUNDS_MS, None),
+            bucket_counts,
+            strict=True,
+        ):
+            cumulative += count
+            wait_buckets.append((bound, cumulative))
+
+        return PoolStats(
+            pool_size=pool.size() if pool is not None else 0,
+            checked_out=pool.checkedout() if pool is not None else 0,
+            checked_in=pool.checkedin() if pool is not None else 0,
+            overflow=max(pool.overflow(), 0) if pool is not None else 0,
+            checkouts=checkouts,
+            timeouts=timeouts,
+            wait_seconds_total=wait_seconds_total,
+            wait_buckets=tuple(wait_buckets),
+        )
+
+
+class _InstrumentedPoolMixin:
+    _pool_metrics: PoolMetrics | None
+
+    # `create_engine` forwards only the keyword arguments it finds in the
+    # pool's signature, so `pool_metrics` must not be keyword-only.
+    def __init__(self, creator, pool_metrics: PoolMetrics | None = None, **kwargs):
+        super().__init__(creator, **kwargs)
+        self._pool_metrics = pool_metrics
+
+        if pool_metrics is not None:
+            pool_metrics.attach(self)
+
+    def connect(self):
+        if self._pool_metrics is None:
+            return super().connect()
+
+        return self._pool_metrics.measure_checkout(super().connect)
+
+    def recreate(self):
+        pool = super().recreate()
+        pool._pool_metrics = self._pool_metrics
+
+        if self._pool_metrics is not None:
+            self._pool_metrics.attach(pool)
+
+        return pool
+
+
+class InstrumentedQueuePool(_InstrumentedPoolMixin, QueuePool):
+    pass
+
+
+class InstrumentedAsyncAdaptedQueuePool(_InstrumentedPoolMixin, AsyncAdaptedQueuePool):
+    pass
@@ -0,0 +1,127 @@
+import itertools
+import time
+from collections.abc import Callable, Sequence
+from threading import Lock
+from typing import Generic, Literal, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+ReplicaSelection = Literal["round-robin", "least-connections"]
+
+SessionFactoryT = TypeVar("SessionFactoryT")
+
+
+class ReplicaRouter(Generic[SessionFactoryT]):
+    """Choose the session factory for each unit of work.
+
+    Writes always use the primary factory. Reads use a replica factory,
+    picked in turn (`round-robin`) or by the fewest checked-out pool
+    connections (`least-connections`, ties broken in turn). Without
+    replicas every read uses the primary.
+
+    With a positive `read_your_writes_seconds`, a key that committed a
+    write through `track_writes` reads from the primary for that many
+    seconds, so the caller sees its own writes despite replication lag.
+    Keys live in process memory: with several worker processes a read may
+    reach another process, which does not know about the write.
+
+    Works with `sessionmaker` and `async_sessionmaker` alike.
+    """
+
+    def __init__(
+        self,
+        primary: SessionFactoryT,
+        replicas: Sequence[SessionFactoryT] = (),
+        *,
+        selection: ReplicaSelection = "round-robin",
+        read_your_writes_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if selection not in ("round-robin", "least-connections"):
+            raise ValueError(f"Unsupported replica selection: {selection}")
+
+        if read_your_writes_seconds < 0:
+            raise ValueError("read_your_writes_seconds must not be negative.")
+
+        self._primary = primary
+        self._replicas = tuple(replicas)
+        self._selection = selection
+        self._read_your_writes_seconds = read_your_writes_seconds
+        self._clock = clock
+        self._turns = itertools.count()
+        self._lock = Lock()
+        self._sticky_until: dict[str, float] = {}
+
+    @property
+    def primary(self) -> SessionFactoryT:
+        return self._primary
+
+    @property
+    def replicas(self) -> tuple[SessionFactoryT, ...]:
+        return self._replicas
+
+    @property
+    def read_your_writes_enabled(self) -> bool:
+        return bool(self._replicas) and self._read_your_writes_seconds > 0
+
+    def for_read(self, sticky_key: str | None = None) -> SessionFactoryT:
+        if not self._replicas:
+            return self._primary
+
+        if sticky_key is not None and self._is_sticky(sticky_key):
+            return self._primary
+
+        # `next` on itertools.count is atomic under the GIL.
+        turn = next(self._turns)
+
+        if self._selection == "round-robin":
+            return self._replicas[turn % len(self._replicas)]
+
+        count = len(self._replicas)
+        candidates = [self._replicas[(turn + offset) % count] for offset in range(count)]
+
+        return min(candidates, key=_checked_out_connections)
+
+    def track_writes(self, session: Session, sticky_key: str | None) -> None:
+        """Make `sticky_key` read from the primary after `session` commits."""
+        if sticky_key is None or not self.read_your_writes_enabled:
+            return
+
+        def _after_commit(committed_session: Session) -> None:
+            self.record_write(sticky_key)
+
+        event.listen(session, "after_commit", _after_commit)
+
+    def record_write(self, sticky_key: str) -> None:
+        if not self.read_your_writes_enabled:
+            return
+
+        now = self._clock()
+
+        with self._lock:
+            self._sticky_until[sticky_key] = now + self._read_your_writes_seconds
+
+            # Drop expired keys while writing, so the map stays as small as
+            # the number of keys that wrote within one window.
+            expired = [
+                key for key, until in self._sticky_until.items() if until <= now
+            ]
+
+            for key in expired:
+                del self._sticky_until[key]
+
+    def _is_sticky(self, sticky_key: str) -> bool:
+        with self._lock:
+            until = self._sticky_until.get(sticky_key)
+
+        return until is not None and until > self._clock()
+
+
+def _checked_out_connections(session_factory: object) -> int:
+    bind = getattr(session_factory, "kw", {}).get("bind")
+    pool = getattr(bind, "pool", None)
+    checked_out = getattr(pool, "checkedout", None)
+
+    # Pools without a queue, such as in-memory SQLite, do not count.
+    return checked_out() if checked_out is not None else 0
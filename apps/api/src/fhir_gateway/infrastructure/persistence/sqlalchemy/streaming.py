@@ -0,0 +1,47 @@
+from collections.abc import Iterator
+from itertools import islice
+
+from sqlalchemy import Row, Select
+from sqlalchemy.orm import Session
+
+STREAM_BATCH_SIZE = 1000
+
+
+def stream_rows(
+    session: Session,
+    stmt: Select,
+    *,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[Row]:
+    """Yield the rows of `stmt` while fetching `batch_size` rows at a time.
+
+    `yield_per` makes drivers that support it (psycopg) use a server-side
+    cursor, so only one batch of rows and ORM objects is held in memory.
+    Closing the generator early closes the cursor.
+    """
+    result = session.execute(stmt, execution_options={"yield_per": batch_size})
+
+    try:
+        yield from result
+    finally:
+        result.close()
+
+
+def stream_record_batches(
+    session: Session,
+    stmt: Select,
+    *,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[list]:
+    """Yield the single-entity rows of `stmt` as lists of up to `batch_size`.
+
+    Used by readers that resolve something per batch (such as codes from a
+    `CodeCatalog`) rather than per row.
+    """
+    rows = stream_rows(session, stmt, batch_size=batch_size)
+
+    try:
+        while batch := [row[0] for row in islice(rows, batch_size)]:
+            yield batch
+    finally:
+        rows.close()
@@ -2,12 +2,15 @@ from fhir_gateway.infrastructure.security.errors import (
     TokenVerificationError,
     TokenVerifierConfigurationError,
 )
+from fhir_gateway.infrastructure.security.jwks import JwksKeyProvider, jwks_fetcher
 from fhir_gateway.infrastructure.security.jwt_claims import VerifiedJwtClaims
 from fhir_gateway.infrastructure.security.jwt_token_verifier import JwtTokenVerifier
 
 __all__ = (
+    "JwksKeyProvider",
     "JwtTokenVerifier",
     "TokenVerificationError",
     "TokenVerifierConfigurationError",
     "VerifiedJwtClaims",
+    "jwks_fetcher",
 )
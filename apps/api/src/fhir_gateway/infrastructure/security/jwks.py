@@ -0,0 +1,205 @@
+import json
+import logging
+import time
+import urllib.request
+from collections.abc import Callable
+from pathlib import Path
+from threading import Event, Lock, Thread
+from typing import Any
+
+from jwt import PyJWK, PyJWTError
+
+logger = logging.getLogger(__name__)
+
+
+def jwks_fetcher(location: str, *, timeout_seconds: float = 5.0) -> Callable[[], bytes]:
+    """Return a callable that reads the JWKS document at `location`.
+
+    `location` is an `http://` or `https://` URL, such as an identity
+    provider's `jwks_uri` or a local stand-in, or a file path.
+    """
+    if location.startswith(("http://", "https://")):
+
+        def fetch_url() -> bytes:
+            request = urllib.request.Request(
+                location,
+                headers={"Accept": "application/json"},
+            )
+
+            with urllib.request.urlopen(request, timeout=timeout_seconds) as response:
+                return response.read()
+
+        return fetch_url
+
+    path = Path(location)
+
+    return path.read_bytes
+
+
+class JwksKeyProvider:
+    """Signing keys of a JWKS document, indexed by `kid`.
+
+    Keys are parsed into `PyJWK` objects once per fetch, so a lookup is a
+    dictionary read that never waits for the network. `start()` loads the
+    key set and starts a daemon thread that reloads it every
+    `refresh_interval_seconds`. A token signed with an unknown `kid` wakes
+    that thread early, at most once per `min_refresh_interval_seconds`, so
+    a newly published key is picked up without waiting a full interval.
+
+    A key that disappears from the document is still served for
+    `rotation_overlap_seconds`, so tokens signed just before the identity
+    provider rotated keep verifying until they expire. A failed fetch keeps
+    the current keys and is retried on the next interval.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[], bytes],
+        *,
+        refresh_interval_seconds: float = 300.0,
+        rotation_overlap_seconds: float = 600.0,
+        min_refresh_interval_seconds: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if refresh_interval_seconds <= 0:
+            raise ValueError("refresh_interval_seconds must be greater than 0.")
+
+        if rotation_overlap_seconds < 0:
+            raise ValueError("rotation_overlap_seconds must not be negative.")
+
+        if min_refresh_interval_seconds < 0:
+            raise ValueError("min_refresh_interval_seconds must not be negative.")
+
+        self._fetch = fetch
+        self._refresh_interval_seconds = refresh_interval_seconds
+        self._rotation_overlap_seconds = rotation_overlap_seconds
+        self._min_refresh_interval_seconds = min_refresh_interval_seconds
+        self._clock = clock
+        # kid -> (key, monotonic time it retires at; None while published).
+        self._keys: dict[str, tuple[PyJWK, float | None]] = {}
+        self._refresh_lock = Lock()
+        self._last_refresh_at: float | None = None
+        self._wake = Event()
+        self._stopping = Event()
+        self._worker: Thread | None = None
+
+    @property
+    def key_ids(self) -> tuple[str, ...]:
+        return tuple(self._keys)
+
+    def get_signing_key(self, kid: str) -> PyJWK | None:
+        entry = self._keys.get(kid)
+
+        if entry is not None:
+            key, retires_at = entry
+
+            if retires_at is None or retires_at > self._clock():
+                return key
+
+        self._request_refresh()
+
+        return None
+
+    def refresh(self) -> None:
+        """Fetch the key set now and replace the published keys."""
+        with self._refresh_lock:
+            self._last_refresh_at = self._clock()
+            published = _parse_jwks(self._fetch())
+            now = self._clock()
+            keys: dict[str, tuple[PyJWK, float | None]] = {
+                kid: (key, None) for kid, key in published.items()
+            }
+
+            for kid, (key, retires_at) in self._keys.items():
+                if kid in keys:
+                    continue
+
+                if retires_at is None:
+                    retires_at = now + self._rotation_overlap_seconds
+
+                if retires_at > now:
+                    keys[kid] = (key, retires_at)
+
+            # Readers see either the old or the new dictionary, never a
+            # half-updated one.
+            self._keys = keys
+
+    def start(self) -> None:
+        if self._worker is not None:
+            return
+
+        self._refresh_logging_errors()
+
+        self._worker = Thread(
+            target=self._run,
+            name="fhir-gateway-jwks-refresh",
+            daemon=True,
+        )
+        self._worker.start()
+
+    def close(self) -> None:
+        self._stopping.set()
+        self._wake.set()
+
+        if self._worker is not None:
+            self._worker.join()
+
+    def _request_refresh(self) -> None:
+        last_refresh_at = self._last_refresh_at
+
+        if (
+            last_refresh_at is None
+            or self._clock() - last_refresh_at >= self._min_refresh_interval_seconds
+        ):
+            self._wake.set()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            self._wake.wait(self._refresh_interval_seconds)
+            self._wake.clear()
+
+            if self._stopping.is_set():
+                return
+
+            self._refresh_logging_errors()
+
+    def _refresh_logging_errors(self) -> None:
+        try:
+            self.refresh()
+        except Exception:
+            logger.exception("Refreshing the JWKS key set failed.")
+
+
+def _parse_jwks(document: bytes) -> dict[str, PyJWK]:
+    try:
+        key_set = json.loads(document)
+    except ValueError as exc:
+        raise ValueError("JWKS document is not valid JSON.") from exc
+
+    if not isinstance(key_set, dict) or not isinstance(key_set.get("keys"), list):
+        raise ValueError("JWKS document must contain a 'keys' list.")
+
+    keys: dict[str, PyJWK] = {}
+
+    for jwk in key_set["keys"]:
+        key = _parse_signing_key(jwk)
+
+        if key is not None:
+            keys[jwk["kid"]] = key
+
+    return keys
+
+
+def _parse_signing_key(jwk: Any) -> PyJWK | None:
+    if not isinstance(jwk, dict) or not isinstance(jwk.get("kid"), str):
+        logger.warning("Skipping a JWKS key without a 'kid'.")
+        return None
+
+    if jwk.get("use", "sig") != "sig":
+        return None
+
+    try:
+        return PyJWK(jwk)
+    except PyJWTError:
+        logger.warning("Skipping unusable JWKS key '%s'.", jwk["kid"])
+        return None
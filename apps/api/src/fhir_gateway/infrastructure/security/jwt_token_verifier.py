@@ -1,3 +1,8 @@
+import hashlib
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from threading import Lock
 from typing import Any
 
 import jwt
@@ -7,6 +12,7 @@ from fhir_gateway.infrastructure.security.errors import (
     TokenVerificationError,
     TokenVerifierConfigurationError,
 )
+from fhir_gateway.infrastructure.security.jwks import JwksKeyProvider
 from fhir_gateway.infrastructure.security.jwt_claims import VerifiedJwtClaims
 
 REQUIRED_CLAIMS = (
@@ -20,8 +26,30 @@ REQUIRED_CLAIMS = (
 
 MINIMUM_HMAC_SECRET_LENGTH_BYTES = 32
 
+HMAC_ALGORITHMS = ("HS256",)
+
+ASYMMETRIC_ALGORITHMS = ("RS256", "ES256", "EdDSA")
+
 
 class JwtTokenVerifier:
+    """Verify bearer tokens and keep the claims of recently verified ones.
+
+    Verified claims are cached by the SHA-256 digest of the token, at most
+    `cache_max_entries` of them (least recently used first out), until the
+    token's `exp` plus `clock_skew_seconds`, the same instant `jwt.decode`
+    starts rejecting it. A cache hit skips the signature check, so a token
+    stays accepted until it expires; `cache_max_entries=0` disables the
+    cache. Invalid tokens are never cached.
+
+    HMAC tokens are checked against `secret`. Asymmetric tokens are checked
+    against the key that `key_provider` publishes under the token's `kid`
+    header; an unknown `kid` fails verification without fetching anything.
+
+    The configuration is checked, and the secret encoded, once here. A
+    misconfigured verifier is still built, so the application starts, and
+    raises `TokenVerifierConfigurationError` on every `verify` call.
+    """
+
     def __init__(
         self,
         *,
@@ -29,31 +57,77 @@ class JwtTokenVerifier:
         issuer: str,
         audience: str,
         algorithm: str,
+        key_provider: JwksKeyProvider | None = None,
+        cache_max_entries: int = 1024,
+        clock_skew_seconds: int = 0,
+        clock: Callable[[], float] = time.time,
     ) -> None:
-        self._secret = secret
+        if cache_max_entries < 0:
+            raise ValueError("cache_max_entries must not be negative.")
+
+        if clock_skew_seconds < 0:
+            raise ValueError("clock_skew_seconds must not be negative.")
+
+        self._configuration_error_message = _check_configuration(
+            algorithm,
+            secret,
+            key_provider,
+        )
+        self._key = secret.encode("utf-8") if secret is not None else b""
+        self._key_provider = (
+            key_provider if algorithm in ASYMMETRIC_ALGORITHMS else None
+        )
         self._issuer = issuer
         self._audience = audience
-        self._algorithm = algorithm
+        self._algorithms = [algorithm]
+        self._cache_max_entries = cache_max_entries
+        self._clock_skew_seconds = clock_skew_seconds
+        self._clock = clock
+        self._cache: OrderedDict[bytes, VerifiedJwtClaims] = OrderedDict()
+        self._lock = Lock()
 
     def verify(self, token: str) -> VerifiedJwtClaims:
         if not isinstance(token, str) or not token.strip():
             raise TokenVerificationError("Token is missing.")
 
-        if self._secret is None or not self._secret.strip():
-            raise TokenVerifierConfigurationError("JWT secret is not configured.")
+        if self._configuration_error_message is not None:
+            raise TokenVerifierConfigurationError(self._configuration_error_message)
 
-        if len(self._secret.encode("utf-8")) < MINIMUM_HMAC_SECRET_LENGTH_BYTES:
-            raise TokenVerifierConfigurationError(
-                "JWT secret must be at least 32 bytes long.",
-            )
+        if self._cache_max_entries == 0:
+            return self._decode(token)
+
+        digest = hashlib.sha256(token.encode("utf-8")).digest()
+
+        with self._lock:
+            claims = self._cache.get(digest)
+
+            if claims is not None:
+                if claims.expires_at + self._clock_skew_seconds > self._clock():
+                    self._cache.move_to_end(digest)
+                    return claims
+
+                del self._cache[digest]
+
+        claims = self._decode(token)
+
+        with self._lock:
+            self._cache[digest] = claims
+            self._cache.move_to_end(digest)
 
+            while len(self._cache) > self._cache_max_entries:
+                self._cache.popitem(last=False)
+
+        return claims
+
+    def _decode(self, token: str) -> VerifiedJwtClaims:
         try:
             decoded_claims = jwt.decode(
                 token,
-                self._secret,
-                algorithms=[self._algorithm],
+                self._signing_key(token),
+                algorithms=self._algorithms,
                 issuer=self._issuer,
                 audience=self._audience,
+                leeway=self._clock_skew_seconds,
                 options={"require": list(REQUIRED_CLAIMS)},
             )
         except PyJWTError as exc:
@@ -61,6 +135,43 @@ class JwtTokenVerifier:
 
         return _build_verified_jwt_claims(decoded_claims)
 
+    def _signing_key(self, token: str) -> Any:
+        if self._key_provider is None:
+            return self._key
+
+        kid = jwt.get_unverified_header(token).get("kid")
+        signing_key = (
+            self._key_provider.get_signing_key(kid) if isinstance(kid, str) else None
+        )
+
+        if signing_key is None:
+            raise TokenVerificationError("Token signing key is unknown.")
+
+        return signing_key.key
+
+
+def _check_configuration(
+    algorithm: str,
+    secret: str | None,
+    key_provider: JwksKeyProvider | None,
+) -> str | None:
+    if algorithm in ASYMMETRIC_ALGORITHMS:
+        if key_provider is None:
+            return "JWKS key set is not configured."
+
+        return None
+
+    if algorithm not in HMAC_ALGORITHMS:
+        return f"Unsupported JWT algorithm: {algorithm}."
+
+    if secret is None or not secret.strip():
+        return "JWT secret is not configured."
+
+    if len(secret.encode("utf-8")) < MINIMUM_HMAC_SECRET_LENGTH_BYTES:
+        return "JWT secret must be at least 32 bytes long."
+
+    return None
+
 
 def _build_verified_jwt_claims(
     claims: dict[str, Any],
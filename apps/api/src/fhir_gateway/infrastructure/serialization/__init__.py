@@ -0,0 +1,19 @@
+from fhir_gateway.infrastructure.serialization.errors import FhirDecodingError
+from fhir_gateway.infrastructure.serialization.fhir_bytes import (
+    encode_fhir,
+    encode_resource,
+)
+from fhir_gateway.infrastructure.serialization.fhir_json import (
+    encode_fhir_resource,
+    resource_from_fhir,
+    resource_to_fhir,
+)
+
+__all__ = (
+    "FhirDecodingError",
+    "encode_fhir",
+    "encode_fhir_resource",
+    "encode_resource",
+    "resource_from_fhir",
+    "resource_to_fhir",
+)
@@ -0,0 +1,4 @@
+class FhirDecodingError(Exception):
+    def __init__(self, message: str = "Invalid FHIR resource.") -> None:
+        self.message = message
+        super().__init__(message)
@@ -0,0 +1,250 @@
+import json
+import math
+from collections.abc import Callable
+from json.encoder import encode_basestring
+
+from fhir_gateway.application.models.patient_bundle import PatientBundle
+from fhir_gateway.application.models.patient_summary import PatientSummary
+from fhir_gateway.domain.entities.audit_event import AuditAction, AuditEvent
+from fhir_gateway.domain.entities.condition import Condition
+from fhir_gateway.domain.entities.encounter import Encounter
+from fhir_gateway.domain.entities.observation import Observation
+from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.reference import Reference
+
+# Encoders write `str` fragments straight from the domain objects into one
+# list, which is joined and UTF-8 encoded once per document. There is no
+# intermediate dict, so the output matches `json.dumps(resource_to_fhir(...),
+# ensure_ascii=False, separators=(",", ":"))` byte for byte without paying
+# for the dict. `encode_basestring` is the C string escaper `json` uses.
+
+Append = Callable[[str], None]
+
+AUDIT_EVENT_TYPE_SYSTEM = "http://terminology.hl7.org/CodeSystem/audit-event-type"
+
+# FHIR `AuditEvent.action`: R(ead) for reads, E(xecute) for searches and
+# operations such as exports.
+AUDIT_ACTION_CODES = {
+    AuditAction.READ: "R",
+    AuditAction.SEARCH: "E",
+    AuditAction.EXPORT: "E",
+}
+
+
+def encode_fhir(value: object) -> bytes:
+    """Encode a resource, summary or bundle as compact UTF-8 FHIR JSON."""
+    parts: list[str] = []
+    _encoder_for(value)(parts.append, value)
+
+    return "".join(parts).encode("utf-8")
+
+
+def encode_resource(
+    resource: Patient | Condition | Encounter | Observation | AuditEvent,
+) -> bytes:
+    """Encode one resource; the fast path behind `encode_fhir_resource`."""
+    encode = _RESOURCE_ENCODERS.get(type(resource))
+
+    if encode is None:
+        raise TypeError(f"Unsupported FHIR resource: {type(resource).__name__}")
+
+    parts: list[str] = []
+    encode(parts.append, resource)
+
+    return "".join(parts).encode("utf-8")
+
+
+def _encoder_for(value: object) -> Callable[[Append, object], None]:
+    encode = _ENCODERS.get(type(value))
+
+    if encode is None:
+        raise TypeError(f"Unsupported FHIR value: {type(value).__name__}")
+
+    return encode
+
+
+def _encode_patient(append: Append, patient: Patient) -> None:
+    append('{"resourceType":"Patient","id":')
+    append(encode_basestring(patient.id.value))
+
+    if patient.identifiers:
+        append(',"identifier":[')
+
+        for index, identifier in enumerate(patient.identifiers):
+            append('{"system":' if index == 0 else ',{"system":')
+            append(encode_basestring(identifier.system))
+            append(',"value":')
+            append(encode_basestring(identifier.value))
+            append("}")
+
+        append("]")
+
+    name = patient.name
+
+    if name is not None:
+        append(',"name":[{')
+        separator = ""
+
+        if name.text is not None:
+            append('"text":')
+            append(encode_basestring(name.text))
+            separator = ","
+
+        if name.family is not None:
+            append(separator + '"family":')
+            append(encode_basestring(name.family))
+            separator = ","
+
+        if name.given:
+            append(separator + '"given":[')
+            append(",".join(map(encode_basestring, name.given)))
+            append("]")
+
+        append("}]")
+
+    append("}")
+
+
+def _encode_condition(append: Append, condition: Condition) -> None:
+    append('{"resourceType":"Condition","id":')
+    append(encode_basestring(condition.id.value))
+    append(',"code":')
+    _encode_code(append, condition.code)
+    append(',"subject":')
+    _encode_reference(append, condition.subject)
+
+    if condition.recorded_date is not None:
+        append(',"recordedDate":"')
+        append(condition.recorded_date.value.isoformat())
+        append('"')
+
+    append("}")
+
+
+def _encode_encounter(append: Append, encounter: Encounter) -> None:
+    append('{"resourceType":"Encounter","id":')
+    append(encode_basestring(encounter.id.value))
+    append(',"subject":')
+    _encode_reference(append, encounter.subject)
+    append(',"period":{')
+
+    start = encounter.period.start
+    end = encounter.period.end
+
+    if start is not None:
+        append('"start":"')
+        append(start.value.isoformat())
+        append('"')
+
+    if end is not None:
+        append(',"end":"' if start is not None else '"end":"')
+        append(end.value.isoformat())
+        append('"')
+
+    append("}}")
+
+
+def _encode_observation(append: Append, observation: Observation) -> None:
+    append('{"resourceType":"Observation","id":')
+    append(encode_basestring(observation.id.value))
+    append(',"status":')
+    append(encode_basestring(observation.status.value))
+    append(',"code":')
+    _encode_code(append, observation.code)
+    append(',"subject":')
+    _encode_reference(append, observation.subject)
+    append(',"effectiveDateTime":"')
+    append(observation.effective.value.isoformat())
+    append('","valueQuantity":{')
+
+    value = observation.value.value
+    unit = observation.value.unit
+
+    if value is not None:
+        append('"value":')
+        append(_encode_number(value))
+
+    if unit is not None:
+        append(',"unit":' if value is not None else '"unit":')
+        append(encode_basestring(unit))
+
+    append("}}")
+
+
+def _encode_audit_event(append: Append, audit_event: AuditEvent) -> None:
+    append('{"resourceType":"AuditEvent","id":')
+    append(encode_basestring(audit_event.id.value))
+    append(',"type":{"system":"' + AUDIT_EVENT_TYPE_SYSTEM + '","code":"rest"}')
+    append(',"action":"')
+    append(AUDIT_ACTION_CODES[audit_event.action])
+    append('","recorded":"')
+    append(audit_event.recorded.value.isoformat())
+    append('","agent":[{"who":{"identifier":{"value":')
+    append(encode_basestring(audit_event.agent))
+    append('}},"requestor":true}],"entity":[{"what":')
+    _encode_reference(append, audit_event.entity)
+    append("}]}")
+
+
+def _encode_collection(append: Append, value: PatientSummary | PatientBundle) -> None:
+    append('{"resourceType":"Bundle","type":"collection","entry":[{"resource":')
+    _encode_patient(append, value.patient)
+
+    for resources, encode in (
+        (value.conditions, _encode_condition),
+        (value.encounters, _encode_encounter),
+        (value.observations, _encode_observation),
+    ):
+        for resource in resources:
+            append('},{"resource":')
+            encode(append, resource)
+
+    append("}]}")
+
+
+def _encode_code(append: Append, code: Code) -> None:
+    append('{"coding":[{"system":')
+    append(encode_basestring(code.system))
+    append(',"code":')
+    append(encode_basestring(code.code))
+
+    if code.display is not None:
+        append(',"display":')
+        append(encode_basestring(code.display))
+
+    append("}]}")
+
+
+def _encode_reference(append: Append, reference: Reference) -> None:
+    append('{"reference":')
+    append(encode_basestring(f"{reference.resource_type}/{reference.id.value}"))
+    append("}")
+
+
+def _encode_number(value: float | int) -> str:
+    value_type = type(value)
+
+    if value_type is int:
+        return int.__repr__(value)
+
+    if value_type is float and math.isfinite(value):
+        return float.__repr__(value)
+
+    # `bool`, other `int` subclasses and NaN/Infinity take `json`'s spelling.
+    return json.dumps(value)
+
+
+_RESOURCE_ENCODERS: dict[type, Callable[[Append, object], None]] = {
+    Patient: _encode_patient,
+    Condition: _encode_condition,
+    Encounter: _encode_encounter,
+    Observation: _encode_observation,
+    AuditEvent: _encode_audit_event,
+}
+
+_ENCODERS: dict[type, Callable[[Append, object], None]] = {
+    **_RESOURCE_ENCODERS,
+    PatientSummary: _encode_collection,
+    PatientBundle: _encode_collection,
+}
@@ -0,0 +1,294 @@
+from datetime import datetime
+
+from fhir_gateway.domain.entities.audit_event import AuditEvent
+from fhir_gateway.domain.entities.condition import Condition
+from fhir_gateway.domain.entities.encounter import Encounter
+from fhir_gateway.domain.entities.observation import Observation, ObservationStatus
+from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.domain.errors import DomainValidationError
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.human_name import HumanName
+from fhir_gateway.domain.value_objects.identifier import Identifier
+from fhir_gateway.domain.value_objects.instant import Instant
+from fhir_gateway.domain.value_objects.period import Period
+from fhir_gateway.domain.value_objects.quantity import Quantity
+from fhir_gateway.domain.value_objects.reference import Reference
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.serialization.errors import FhirDecodingError
+from fhir_gateway.infrastructure.serialization.fhir_bytes import (
+    AUDIT_ACTION_CODES,
+    AUDIT_EVENT_TYPE_SYSTEM,
+    encode_resource,
+)
+
+FhirResource = Patient | Condition | Encounter | Observation
+
+
+def encode_fhir_resource(resource: FhirResource) -> bytes:
+    """Encode a resource as compact UTF-8 FHIR JSON on a single line.
+
+    The bytes are those of `json.dumps(resource_to_fhir(resource),
+    ensure_ascii=False, separators=(",", ":"))`, written by the
+    fragment encoders in `fhir_bytes` without building the dict.
+    """
+    return encode_resource(resource)
+
+
+def resource_to_fhir(resource: FhirResource | AuditEvent) -> dict:
+    if isinstance(resource, Patient):
+        return patient_to_fhir(resource)
+
+    if isinstance(resource, Condition):
+        return condition_to_fhir(resource)
+
+    if isinstance(resource, Encounter):
+        return encounter_to_fhir(resource)
+
+    if isinstance(resource, Observation):
+        return observation_to_fhir(resource)
+
+    if isinstance(resource, AuditEvent):
+        return audit_event_to_fhir(resource)
+
+    raise TypeError(f"Unsupported FHIR resource: {type(resource).__name__}")
+
+
+def patient_to_fhir(patient: Patient) -> dict:
+    resource: dict = {
+        "resourceType": "Patient",
+        "id": patient.id.value,
+    }
+
+    if patient.identifiers:
+        resource["identifier"] = [
+            {"system": identifier.system, "value": identifier.value}
+            for identifier in patient.identifiers
+        ]
+
+    if patient.name is not None:
+        resource["name"] = [_human_name_to_fhir(patient.name)]
+
+    return resource
+
+
+def condition_to_fhir(condition: Condition) -> dict:
+    resource = {
+        "resourceType": "Condition",
+        "id": condition.id.value,
+        "code": _code_to_fhir(condition.code),
+        "subject": _reference_to_fhir(condition.subject),
+    }
+
+    if condition.recorded_date is not None:
+        resource["recordedDate"] = _instant_to_fhir(condition.recorded_date)
+
+    return resource
+
+
+def encounter_to_fhir(encounter: Encounter) -> dict:
+    period = {}
+
+    if encounter.period.start is not None:
+        period["start"] = _instant_to_fhir(encounter.period.start)
+
+    if encounter.period.end is not None:
+        period["end"] = _instant_to_fhir(encounter.period.end)
+
+    return {
+        "resourceType": "Encounter",
+        "id": encounter.id.value,
+        "subject": _reference_to_fhir(encounter.subject),
+        "period": period,
+    }
+
+
+def observation_to_fhir(observation: Observation) -> dict:
+    value_quantity = {}
+
+    if observation.value.value is not None:
+        value_quantity["value"] = observation.value.value
+
+    if observation.value.unit is not None:
+        value_quantity["unit"] = observation.value.unit
+
+    return {
+        "resourceType": "Observation",
+        "id": observation.id.value,
+        "status": observation.status.value,
+        "code": _code_to_fhir(observation.code),
+        "subject": _reference_to_fhir(observation.subject),
+        "effectiveDateTime": _instant_to_fhir(observation.effective),
+        "valueQuantity": value_quantity,
+    }
+
+
+def audit_event_to_fhir(audit_event: AuditEvent) -> dict:
+    return {
+        "resourceType": "AuditEvent",
+        "id": audit_event.id.value,
+        "type": {"system": AUDIT_EVENT_TYPE_SYSTEM, "code": "rest"},
+        "action": AUDIT_ACTION_CODES[audit_event.action],
+        "recorded": _instant_to_fhir(audit_event.recorded),
+        "agent": [
+            {"who": {"identifier": {"value": audit_event.agent}}, "requestor": True}
+        ],
+        "entity": [{"what": _reference_to_fhir(audit_event.entity)}],
+    }
+
+
+def _human_name_to_fhir(name: HumanName) -> dict:
+    fhir_name: dict = {}
+
+    if name.text is not None:
+        fhir_name["text"] = name.text
+
+    if name.family is not None:
+        fhir_name["family"] = name.family
+
+    if name.given:
+        fhir_name["given"] = list(name.given)
+
+    return fhir_name
+
+
+def _code_to_fhir(code: Code) -> dict:
+    coding = {"system": code.system, "code": code.code}
+
+    if code.display is not None:
+        coding["display"] = code.display
+
+    return {"coding": [coding]}
+
+
+def _reference_to_fhir(reference: Reference) -> dict:
+    return {"reference": f"{reference.resource_type}/{reference.id.value}"}
+
+
+def _instant_to_fhir(instant: Instant) -> str:
+    return instant.value.isoformat()
+
+
+def resource_from_fhir(resource: dict) -> FhirResource:
+    """Decode one FHIR JSON resource into its domain entity.
+
+    This is the inverse of `resource_to_fhir`. The entities validate every
+    value on construction, so a decoded resource is as trustworthy as one
+    built by the application. Unsupported resource types, missing or
+    malformed elements and domain validation failures all raise
+    `FhirDecodingError`.
+    """
+    if not isinstance(resource, dict):
+        raise FhirDecodingError("A FHIR resource must be a JSON object.")
+
+    resource_type = resource.get("resourceType")
+    decode = _DECODERS.get(resource_type)
+
+    if decode is None:
+        raise FhirDecodingError(f"Unsupported resourceType: {resource_type!r}.")
+
+    try:
+        return decode(resource)
+    except DomainValidationError as error:
+        raise FhirDecodingError(
+            f"{resource_type}/{resource.get('id')}: {error}"
+        ) from error
+    except (KeyError, IndexError, TypeError, ValueError) as error:
+        raise FhirDecodingError(
+            f"{resource_type}/{resource.get('id')}: malformed element {error!r}"
+        ) from error
+
+
+def patient_from_fhir(resource: dict) -> Patient:
+    names = resource.get("name") or ()
+
+    return Patient(
+        id=ResourceId(resource["id"]),
+        identifiers=tuple(
+            Identifier(system=identifier["system"], value=identifier["value"])
+            for identifier in resource.get("identifier", ())
+        ),
+        name=_human_name_from_fhir(names[0]) if names else None,
+    )
+
+
+def condition_from_fhir(resource: dict) -> Condition:
+    recorded_date = resource.get("recordedDate")
+
+    return Condition(
+        id=ResourceId(resource["id"]),
+        code=_code_from_fhir(resource["code"]),
+        subject=_reference_from_fhir(resource["subject"]),
+        recorded_date=(
+            _instant_from_fhir(recorded_date) if recorded_date is not None else None
+        ),
+    )
+
+
+def encounter_from_fhir(resource: dict) -> Encounter:
+    period = resource.get("period", {})
+    end = period.get("end")
+
+    return Encounter(
+        id=ResourceId(resource["id"]),
+        subject=_reference_from_fhir(resource["subject"]),
+        period=Period(
+            start=_instant_from_fhir(period["start"]),
+            end=_instant_from_fhir(end) if end is not None else None,
+        ),
+    )
+
+
+def observation_from_fhir(resource: dict) -> Observation:
+    value_quantity = resource.get("valueQuantity", {})
+
+    return Observation(
+        id=ResourceId(resource["id"]),
+        status=ObservationStatus(resource["status"]),
+        code=_code_from_fhir(resource["code"]),
+        subject=_reference_from_fhir(resource["subject"]),
+        effective=_instant_from_fhir(resource["effectiveDateTime"]),
+        value=Quantity(
+            value=value_quantity.get("value"),
+            unit=value_quantity.get("unit"),
+        ),
+    )
+
+
+def _human_name_from_fhir(name: dict) -> HumanName:
+    return HumanName(
+        given=tuple(name.get("given", ())),
+        family=name.get("family"),
+        text=name.get("text"),
+    )
+
+
+def _code_from_fhir(code: dict) -> Code:
+    # Only the first coding is kept, as `_code_to_fhir` writes exactly one.
+    coding = code["coding"][0]
+
+    return Code(
+        system=coding["system"],
+        code=coding["code"],
+        display=coding.get("display"),
+    )
+
+
+def _reference_from_fhir(reference: dict) -> Reference:
+    resource_type, separator, resource_id = reference["reference"].partition("/")
+
+    if not separator:
+        raise ValueError(f"reference {reference['reference']!r} has no id")
+
+    return Reference(resource_type=resource_type, id=ResourceId(resource_id))
+
+
+def _instant_from_fhir(value: str) -> Instant:
+    return Instant(datetime.fromisoformat(value))
+
+
+_DECODERS = {
+    "Patient": patient_from_fhir,
+    "Condition": condition_from_fhir,
+    "Encounter": encounter_from_fhir,
+    "Observation": observation_from_fhir,
+}
@@ -1,50 +1,342 @@
 import logging
+import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
 
 from fastapi import FastAPI
+from sqlalchemy.orm import Session, sessionmaker
 
-from fhir_gateway.infrastructure.config.settings import get_settings
+from fhir_gateway.infrastructure.audit import BatchingAuditEventWriter
+from fhir_gateway.infrastructure.bulk_export import (
+    BackgroundBulkExportScheduler,
+    BulkExportRunner,
+    InMemoryBulkExportJobRepository,
+)
+from fhir_gateway.infrastructure.cache import (
+    InMemoryKeyValueStore,
+    InMemoryLruCache,
+    SharedCache,
+)
+from fhir_gateway.infrastructure.concurrency import ThreadPoolReadExecutor
+from fhir_gateway.infrastructure.config.settings import Settings, get_settings
 from fhir_gateway.infrastructure.logging import configure_logging
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    SqlAlchemyAuditEventBatchWriter,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.code_catalog import (
+    CodeCatalog,
+    CodeRecordType,
+)
 from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    DatabaseEngineOptions,
+    create_async_database_engine,
+    create_async_session_factory,
     create_database_engine,
     create_session_factory,
 )
-from fhir_gateway.infrastructure.security import JwtTokenVerifier
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.trusted import (
+    set_full_validation,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models import (
+    ConditionCodeRecord,
+    ObservationCodeRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.pool_metrics import (
+    PoolMetrics,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.routing import ReplicaRouter
+from fhir_gateway.infrastructure.security import (
+    JwksKeyProvider,
+    JwtTokenVerifier,
+    jwks_fetcher,
+)
+from fhir_gateway.interfaces.http.compression import CompressionMiddleware
 from fhir_gateway.interfaces.http.error_handlers import register_exception_handlers
+from fhir_gateway.interfaces.http.routers.async_patients import (
+    router as async_patients_router,
+)
+from fhir_gateway.interfaces.http.routers.bulk_export import (
+    router as bulk_export_router,
+)
 from fhir_gateway.interfaces.http.routers.health import router as health_router
+from fhir_gateway.interfaces.http.routers.patients import router as patients_router
 
 logger = logging.getLogger(__name__)
 
+# Routes compressed at `compression_export_level`: large streamed bodies
+# where compression throughput matters more than the last percent of size.
+EXPORT_ROUTE_NAMES = ("export_patient_bundle",)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    yield
+
+    app.state.bulk_export_scheduler.shutdown()
+    app.state.audit_event_writer.close()
+
+    jwks_key_provider = app.state.jwks_key_provider
+
+    if jwks_key_provider is not None:
+        jwks_key_provider.close()
+
+    read_executor = app.state.read_executor
+
+    if read_executor is not None:
+        read_executor.shutdown()
+
+    async_engine = app.state.async_engine
+
+    if async_engine is not None:
+        await async_engine.dispose()
+
+    for async_replica_engine in app.state.async_replica_engines:
+        await async_replica_engine.dispose()
+
+
+def create_database_engine_options(settings: Settings) -> DatabaseEngineOptions:
+    return DatabaseEngineOptions(
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_timeout_seconds=settings.db_pool_timeout_seconds,
+        pool_recycle_seconds=settings.db_pool_recycle_seconds,
+        pool_pre_ping=settings.db_pool_pre_ping,
+        pool_use_lifo=settings.db_pool_use_lifo,
+        statement_timeout_ms=settings.db_statement_timeout_ms,
+        prepare_threshold=(
+            settings.db_prepare_threshold
+            if settings.db_prepared_statements_enabled
+            else None
+        ),
+    )
+
+
+def create_session_router(
+    settings: Settings,
+    session_factory: sessionmaker[Session],
+    engine_options: DatabaseEngineOptions,
+) -> ReplicaRouter[sessionmaker[Session]]:
+    replica_factories = [
+        create_session_factory(create_database_engine(replica_url, engine_options))
+        for replica_url in settings.db_replica_urls
+    ]
+
+    return ReplicaRouter(
+        session_factory,
+        replica_factories,
+        selection=settings.db_replica_selection,
+        read_your_writes_seconds=settings.db_read_your_writes_seconds,
+    )
+
+
+def create_jwks_key_provider(settings: Settings) -> JwksKeyProvider | None:
+    if settings.auth_jwt_algorithm == "HS256" or settings.auth_jwks_location is None:
+        return None
+
+    return JwksKeyProvider(
+        jwks_fetcher(
+            settings.auth_jwks_location,
+            timeout_seconds=settings.auth_jwks_fetch_timeout_seconds,
+        ),
+        refresh_interval_seconds=settings.auth_jwks_refresh_seconds,
+        rotation_overlap_seconds=settings.auth_jwks_rotation_overlap_seconds,
+    )
+
+
+def create_read_executor(settings: Settings) -> ThreadPoolReadExecutor | None:
+    if settings.read_fanout_mode == "sequential":
+        return None
+
+    return ThreadPoolReadExecutor(
+        max_workers=settings.read_fanout_max_workers,
+        max_concurrent_reads_per_call=(
+            settings.read_fanout_max_concurrent_reads_per_request
+        ),
+    )
+
+
+def create_patient_cache(settings: Settings) -> InMemoryLruCache | SharedCache | None:
+    if settings.patient_cache_backend == "memory":
+        return InMemoryLruCache(
+            max_entries=settings.patient_cache_max_entries,
+            ttl_seconds=settings.patient_cache_ttl_seconds,
+        )
+
+    if settings.patient_cache_backend == "shared":
+        # No networked store is configured yet; the in-memory stand-in keeps
+        # the shared code path (pickled values, store-side TTL) exercised.
+        return SharedCache(
+            InMemoryKeyValueStore(),
+            ttl_seconds=settings.patient_cache_ttl_seconds,
+        )
+
+    return None
+
+
+def create_code_catalog(
+    settings: Settings,
+    record_type: CodeRecordType,
+) -> CodeCatalog | None:
+    if not settings.code_catalog_enabled:
+        return None
+
+    return CodeCatalog(
+        record_type,
+        max_entries=settings.code_catalog_max_entries,
+        refresh_interval_seconds=settings.code_catalog_refresh_seconds,
+    )
+
+
+def create_audit_event_writer(
+    settings: Settings,
+    session_factory: sessionmaker[Session],
+) -> BatchingAuditEventWriter:
+    return BatchingAuditEventWriter(
+        SqlAlchemyAuditEventBatchWriter(session_factory),
+        max_queue_size=settings.audit_writer_queue_size,
+        batch_size=settings.audit_writer_batch_size,
+        flush_interval_seconds=settings.audit_writer_flush_interval_seconds,
+    )
+
+
+def create_bulk_export_scheduler(
+    settings: Settings,
+    session_factory: sessionmaker[Session],
+    job_repository: InMemoryBulkExportJobRepository,
+) -> BackgroundBulkExportScheduler:
+    max_workers = settings.bulk_export_max_workers or os.cpu_count() or 1
+
+    # With a single worker a process pool only adds pickling overhead, so
+    # batches are encoded inline instead.
+    runner = BulkExportRunner(
+        session_factory,
+        output_directory=Path(settings.bulk_export_output_directory),
+        batch_size=settings.bulk_export_batch_size,
+        max_workers=max_workers if max_workers > 1 else None,
+    )
+
+    return BackgroundBulkExportScheduler(runner, job_repository)
+
 
 def create_app() -> FastAPI:
     settings = get_settings()
 
     configure_logging(settings.log_level)
+    set_full_validation(settings.persistence_full_validation)
 
     logger.info(
         "Creating FastAPI application for environment: %s",
         settings.environment,
     )
 
-    engine = create_database_engine(settings.database_url)
+    engine_options = create_database_engine_options(settings)
+    database_pool_metrics = PoolMetrics()
+    engine = create_database_engine(
+        settings.database_url,
+        engine_options,
+        pool_metrics=database_pool_metrics,
+    )
     session_factory = create_session_factory(engine)
 
+    session_router = create_session_router(settings, session_factory, engine_options)
+
+    async_engine = None
+    async_session_factory = None
+    async_session_router = None
+    async_replica_engines = []
+
+    if settings.database_stack == "async":
+        async_engine = create_async_database_engine(
+            settings.database_url,
+            engine_options,
+        )
+        async_session_factory = create_async_session_factory(async_engine)
+        async_replica_engines = [
+            create_async_database_engine(replica_url, engine_options)
+            for replica_url in settings.db_replica_urls
+        ]
+        async_session_router = ReplicaRouter(
+            async_session_factory,
+            [create_async_session_factory(item) for item in async_replica_engines],
+            selection=settings.db_replica_selection,
+            read_your_writes_seconds=settings.db_read_your_writes_seconds,
+        )
+
+    jwks_key_provider = create_jwks_key_provider(settings)
+
+    if jwks_key_provider is not None:
+        jwks_key_provider.start()
+
     jwt_token_verifier = JwtTokenVerifier(
         secret=settings.auth_jwt_secret,
         issuer=settings.auth_jwt_issuer,
         audience=settings.auth_jwt_audience,
         algorithm=settings.auth_jwt_algorithm,
+        key_provider=jwks_key_provider,
+        cache_max_entries=settings.auth_jwt_cache_max_entries,
+        clock_skew_seconds=settings.auth_jwt_clock_skew_seconds,
     )
 
     app = FastAPI(
         title=settings.app_name,
         version=settings.app_version,
+        lifespan=lifespan,
     )
 
     app.state.session_factory = session_factory
+    app.state.session_router = session_router
+    app.state.database_pool_metrics = database_pool_metrics
+    app.state.async_engine = async_engine
+    app.state.async_replica_engines = async_replica_engines
+    app.state.async_session_factory = async_session_factory
+    app.state.async_session_router = async_session_router
+    app.state.jwks_key_provider = jwks_key_provider
     app.state.jwt_token_verifier = jwt_token_verifier
+    app.state.read_executor = create_read_executor(settings)
+    app.state.patient_cache = create_patient_cache(settings)
+    app.state.observation_code_catalog = create_code_catalog(
+        settings,
+        ObservationCodeRecord,
+    )
+    app.state.condition_code_catalog = create_code_catalog(
+        settings,
+        ConditionCodeRecord,
+    )
+
+    app.state.audit_event_writer = create_audit_event_writer(
+        settings,
+        session_factory,
+    )
+
+    bulk_export_job_repository = InMemoryBulkExportJobRepository()
+    app.state.bulk_export_job_repository = bulk_export_job_repository
+    app.state.bulk_export_scheduler = create_bulk_export_scheduler(
+        settings,
+        session_factory,
+        bulk_export_job_repository,
+    )
 
     register_exception_handlers(app)
 
     app.include_router(health_router)
+    # Both patient routers serve the same paths and route names, so only one
+    # of them is included.
+    if settings.database_stack == "async":
+        app.include_router(async_patients_router)
+    else:
+        app.include_router(patients_router)
+    app.include_router(bulk_export_router)
+
+    if settings.compression_enabled:
+        app.add_middleware(
+            CompressionMiddleware,
+            minimum_size=settings.compression_minimum_size,
+            level=settings.compression_level,
+            route_levels=dict.fromkeys(
+                EXPORT_ROUTE_NAMES,
+                settings.compression_export_level,
+            ),
+        )
 
     return app
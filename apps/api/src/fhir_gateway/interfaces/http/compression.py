@@ -0,0 +1,347 @@
+import zlib
+from collections.abc import Callable, Mapping
+from typing import Protocol
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Optional: `br` is offered only when installed.
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # Optional: `zstd` is offered only when installed.
+    zstandard = None
+
+DEFAULT_MINIMUM_SIZE = 1024
+DEFAULT_LEVEL = 6
+
+# Responses that never carry a body.
+_BODYLESS_STATUS_CODES = frozenset({204, 205, 304})
+
+
+class Compressor(Protocol):
+    def compress(self, data: bytes) -> bytes: ...
+
+    def flush(self) -> bytes:
+        """Return everything compressed so far, keeping the stream open."""
+        ...
+
+    def finish(self) -> bytes: ...
+
+
+class GzipCompressor:
+    def __init__(self, level: int) -> None:
+        # wbits 16 + 15 writes the gzip header and trailer around deflate.
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zlib.Z_FINISH)
+
+
+class BrotliCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush()
+
+    def finish(self) -> bytes:
+        return self._compressor.finish()
+
+
+class ZstdCompressor:
+    def __init__(self, level: int) -> None:
+        self._compressor = zstandard.ZstdCompressor(level=level).compressobj()
+
+    def compress(self, data: bytes) -> bytes:
+        return self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+
+    def finish(self) -> bytes:
+        return self._compressor.flush(zstandard.COMPRESSOBJ_FLUSH_FINISH)
+
+
+def available_encodings() -> dict[str, Callable[[int], Compressor]]:
+    """Content codings this process can produce, most preferred first."""
+    encodings: dict[str, Callable[[int], Compressor]] = {}
+
+    if zstandard is not None:
+        encodings["zstd"] = ZstdCompressor
+
+    if brotli is not None:
+        encodings["br"] = BrotliCompressor
+
+    encodings["gzip"] = GzipCompressor
+
+    return encodings
+
+
+def negotiate_encoding(accept_encoding: str | None, encodings: Mapping) -> str | None:
+    """Pick the content coding to use for an `Accept-Encoding` header.
+
+    The highest `q` wins; ties go to the first coding in `encodings`. A
+    coding the header does not list takes the `q` of `*`, if any. Returns
+    None when the response should be sent as is.
+    """
+    if not accept_encoding:
+        return None
+
+    weights: dict[str, float] = {}
+
+    for item in accept_encoding.split(","):
+        coding, _, parameters = item.partition(";")
+        coding = coding.strip().lower()
+
+        if not coding:
+            continue
+
+        weights["gzip" if coding == "x-gzip" else coding] = _quality(parameters)
+
+    best_encoding = None
+    best_weight = 0.0
+
+    for encoding in encodings:
+        weight = weights.get(encoding, weights.get("*", 0.0))
+
+        if weight > best_weight:
+            best_encoding = encoding
+            best_weight = weight
+
+    return best_encoding
+
+
+def _quality(parameters: str) -> float:
+    for parameter in parameters.split(";"):
+        name, _, value = parameter.partition("=")
+
+        if name.strip().lower() == "q":
+            try:
+                return min(max(float(value), 0.0), 1.0)
+            except ValueError:
+                return 0.0
+
+    return 1.0
+
+
+def is_compressible(content_type: str | None) -> bool:
+    if content_type is None:
+        return False
+
+    media_type = content_type.partition(";")[0].strip().lower()
+
+    return media_type.startswith("text/") or media_type.endswith(
+        ("json", "xml", "javascript")
+    )
+
+
+class CompressionMiddleware:
+    """Compress response bodies with the best coding the client accepts.
+
+    FHIR JSON repeats the same keys, systems and units in every resource,
+    so it shrinks by an order of magnitude. `gzip` is always offered; `zstd`
+    and `br` are preferred when their packages are installed.
+
+    A single-message body is compressed only when it is at least
+    `minimum_size` bytes, and gets an exact `Content-Length`. A streamed
+    body is compressed message by message and flushed after each one, so
+    clients can decode an export while it is still being written and
+    nothing is buffered beyond one message.
+
+    `route_levels` maps route names to compression levels for routes that
+    need a different trade-off than `level`, such as large exports where
+    throughput matters more than the last few percent of size.
+
+    Compressed responses drop `Content-Length` when streamed, and their
+    strong `ETag` becomes weak, since the bytes differ from the identity
+    representation. `304 Not Modified` responses pass through unchanged:
+    without a body there is no telling whether the 200 would have been
+    compressed. `If-None-Match` uses the weak comparison, so revalidation
+    matches either way.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        level: int = DEFAULT_LEVEL,
+        route_levels: Mapping[str, int] | None = None,
+        encodings: Mapping[str, Callable[[int], Compressor]] | None = None,
+    ) -> None:
+        if minimum_size < 0:
+            raise ValueError("minimum_size must not be negative.")
+
+        route_levels = dict(route_levels or {})
+
+        for route_level in (level, *route_levels.values()):
+            if not 1 <= route_level <= 9:
+                raise ValueError("Compression levels must be between 1 and 9.")
+
+        self.app = app
+        self._minimum_size = minimum_size
+        self._level = level
+        self._route_levels = route_levels
+        self._encodings = dict(
+            available_encodings() if encodings is None else encodings
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(
+            Headers(scope=scope).get("accept-encoding"),
+            self._encodings,
+        )
+        compressor_factory = None
+
+        if encoding is not None:
+
+            def compressor_factory() -> Compressor:
+                return self._encodings[encoding](self._level_for(scope))
+
+        responder = _CompressionResponder(
+            send,
+            encoding=encoding,
+            compressor_factory=compressor_factory,
+            minimum_size=self._minimum_size,
+        )
+
+        await self.app(scope, receive, responder.send)
+
+    def _level_for(self, scope: Scope) -> int:
+        # The router stores the matched route in the scope before the
+        # endpoint runs, so it is known by the time the response starts.
+        route_name = getattr(scope.get("route"), "name", None)
+
+        return self._route_levels.get(route_name, self._level)
+
+
+class _CompressionResponder:
+    def __init__(
+        self,
+        send: Send,
+        *,
+        encoding: str | None,
+        compressor_factory: Callable[[], Compressor] | None,
+        minimum_size: int,
+    ) -> None:
+        self._send = send
+        self._encoding = encoding
+        self._compressor_factory = compressor_factory
+        self._minimum_size = minimum_size
+        self._start_message: Message | None = None
+        self._compressor: Compressor | None = None
+        self._passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self._passthrough:
+            await self._send(message)
+            return
+
+        if message["type"] == "http.response.start":
+            self._start_message = message
+            return
+
+        if self._compressor is not None:
+            await self._send_compressed(message)
+            return
+
+        await self._start(message)
+
+    async def _start(self, message: Message) -> None:
+        start_message = self._start_message
+        headers = MutableHeaders(scope=start_message)
+
+        if message["type"] != "http.response.body" or not self._can_compress(
+            start_message["status"],
+            headers,
+        ):
+            await self._send_unchanged(message)
+            return
+
+        headers.add_vary_header("Accept-Encoding")
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self._compressor_factory is None or (
+            not more_body and len(body) < self._minimum_size
+        ):
+            await self._send_unchanged(message)
+            return
+
+        self._compressor = self._compressor_factory()
+
+        headers["Content-Encoding"] = self._encoding
+        _weaken_etag(headers)
+
+        if more_body:
+            del headers["Content-Length"]
+            await self._send(start_message)
+            await self._send_compressed(message)
+            return
+
+        body = self._compressor.compress(body) + self._compressor.finish()
+        headers["Content-Length"] = str(len(body))
+
+        await self._send(start_message)
+        await self._send({"type": "http.response.body", "body": body})
+
+    async def _send_compressed(self, message: Message) -> None:
+        data = self._compressor.compress(message.get("body", b""))
+
+        if message.get("more_body", False):
+            await self._send(
+                {
+                    "type": "http.response.body",
+                    "body": data + self._compressor.flush(),
+                    "more_body": True,
+                }
+            )
+            return
+
+        await self._send(
+            {"type": "http.response.body", "body": data + self._compressor.finish()}
+        )
+
+    async def _send_unchanged(self, message: Message) -> None:
+        self._passthrough = True
+
+        await self._send(self._start_message)
+        await self._send(message)
+
+    @staticmethod
+    def _can_compress(status: int, headers: MutableHeaders) -> bool:
+        if status < 200 or status in _BODYLESS_STATUS_CODES:
+            return False
+
+        if "content-encoding" in headers:
+            return False
+
+        if "no-transform" in headers.get("cache-control", "").lower():
+            return False
+
+        return is_compressible(headers.get("content-type"))
+
+
+def _weaken_etag(headers: MutableHeaders) -> None:
+    etag = headers.get("etag")
+
+    if etag is not None and not etag.startswith("W/"):
+        headers["ETag"] = f"W/{etag}"
@@ -0,0 +1,53 @@
+import re
+
+from fastapi import status
+from fastapi.responses import Response
+
+# Charts are patient data: browsers may keep a copy, shared caches may not,
+# and every reuse is revalidated with `If-None-Match`.
+CACHE_CONTROL = "private, no-cache"
+
+_ENTITY_TAG = re.compile(r'(?:W/)?"[^"]*"')
+
+
+def entity_tag(version: str, representation: str | None = None) -> str:
+    """Build the strong ETag of a chart representation from its version stamp.
+
+    `representation` tells apart the formats one URL can serve, such as
+    the `bundle` and `ndjson` exports, which never share an ETag.
+    """
+    if representation is None:
+        return f'"{version}"'
+
+    return f'"{version}-{representation}"'
+
+
+def is_not_modified(if_none_match: str | None, etag: str) -> bool:
+    """Whether `If-None-Match` already names the current representation.
+
+    `If-None-Match` uses the weak comparison, so a `W/` prefix is ignored,
+    and `*` matches any representation of an existing chart.
+    """
+    if if_none_match is None:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    opaque_tag = etag.removeprefix("W/")
+
+    return any(
+        candidate.removeprefix("W/") == opaque_tag
+        for candidate in _ENTITY_TAG.findall(if_none_match)
+    )
+
+
+def conditional_headers(etag: str) -> dict[str, str]:
+    return {"ETag": etag, "Cache-Control": CACHE_CONTROL}
+
+
+def not_modified_response(etag: str) -> Response:
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=conditional_headers(etag),
+    )
@@ -1,45 +1,222 @@
-from typing import Annotated
+from collections.abc import Callable
+from functools import partial
+from typing import Annotated, TypeVar
 
 from fastapi import Depends
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
 
+from fhir_gateway.infrastructure.concurrency import ThreadPoolReadExecutor
 from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    AsyncSqlAlchemyAuditEventReader,
+    AsyncSqlAlchemyConditionReader,
+    AsyncSqlAlchemyEncounterReader,
+    AsyncSqlAlchemyObservationReader,
+    AsyncSqlAlchemyPatientReader,
+    AsyncSqlAlchemyPatientSummaryReader,
+    AsyncSqlAlchemyPatientVersionReader,
+    SessionPerCallReader,
     SqlAlchemyAuditEventReader,
     SqlAlchemyConditionReader,
     SqlAlchemyEncounterReader,
     SqlAlchemyObservationReader,
     SqlAlchemyPatientReader,
+    SqlAlchemyPatientSummaryReader,
+    SqlAlchemyPatientVersionReader,
 )
+from fhir_gateway.infrastructure.persistence.sqlalchemy.code_catalog import (
+    CodeCatalog,
+)
+from fhir_gateway.interfaces.http.dependencies.code_catalog import (
+    get_condition_code_catalog,
+    get_observation_code_catalog,
+)
+from fhir_gateway.interfaces.http.dependencies.concurrency import get_read_executor
 from fhir_gateway.interfaces.http.dependencies.database import (
-    get_database_session,
+    get_async_read_database_session,
+    get_read_database_session,
+    get_read_session_factory,
 )
 
+ReaderT = TypeVar("ReaderT")
+
 
 def get_patient_reader(
-    session: Annotated[Session, Depends(get_database_session)],
+    session: Annotated[Session, Depends(get_read_database_session)],
 ) -> SqlAlchemyPatientReader:
     return SqlAlchemyPatientReader(session)
 
 
+def get_patient_summary_reader(
+    session: Annotated[Session, Depends(get_read_database_session)],
+) -> SqlAlchemyPatientSummaryReader:
+    return SqlAlchemyPatientSummaryReader(session)
+
+
+def get_patient_version_reader(
+    session: Annotated[Session, Depends(get_read_database_session)],
+) -> SqlAlchemyPatientVersionReader:
+    return SqlAlchemyPatientVersionReader(session)
+
+
 def get_observation_reader(
-    session: Annotated[Session, Depends(get_database_session)],
+    session: Annotated[Session, Depends(get_read_database_session)],
+    code_catalog: Annotated[
+        CodeCatalog | None,
+        Depends(get_observation_code_catalog),
+    ],
 ) -> SqlAlchemyObservationReader:
-    return SqlAlchemyObservationReader(session)
+    return SqlAlchemyObservationReader(session, code_catalog)
 
 
 def get_condition_reader(
-    session: Annotated[Session, Depends(get_database_session)],
+    session: Annotated[Session, Depends(get_read_database_session)],
+    code_catalog: Annotated[
+        CodeCatalog | None,
+        Depends(get_condition_code_catalog),
+    ],
 ) -> SqlAlchemyConditionReader:
-    return SqlAlchemyConditionReader(session)
+    return SqlAlchemyConditionReader(session, code_catalog)
 
 
 def get_encounter_reader(
-    session: Annotated[Session, Depends(get_database_session)],
+    session: Annotated[Session, Depends(get_read_database_session)],
 ) -> SqlAlchemyEncounterReader:
     return SqlAlchemyEncounterReader(session)
 
 
+def get_fanout_observation_reader(
+    session: Annotated[Session, Depends(get_read_database_session)],
+    session_factory: Annotated[
+        sessionmaker[Session],
+        Depends(get_read_session_factory),
+    ],
+    read_executor: Annotated[
+        ThreadPoolReadExecutor | None,
+        Depends(get_read_executor),
+    ],
+    code_catalog: Annotated[
+        CodeCatalog | None,
+        Depends(get_observation_code_catalog),
+    ],
+) -> SqlAlchemyObservationReader | SessionPerCallReader[SqlAlchemyObservationReader]:
+    return _fanout_reader(
+        partial(SqlAlchemyObservationReader, code_catalog=code_catalog),
+        session,
+        session_factory,
+        read_executor,
+    )
+
+
+def get_fanout_condition_reader(
+    session: Annotated[Session, Depends(get_read_database_session)],
+    session_factory: Annotated[
+        sessionmaker[Session],
+        Depends(get_read_session_factory),
+    ],
+    read_executor: Annotated[
+        ThreadPoolReadExecutor | None,
+        Depends(get_read_executor),
+    ],
+    code_catalog: Annotated[
+        CodeCatalog | None,
+        Depends(get_condition_code_catalog),
+    ],
+) -> SqlAlchemyConditionReader | SessionPerCallReader[SqlAlchemyConditionReader]:
+    return _fanout_reader(
+        partial(SqlAlchemyConditionReader, code_catalog=code_catalog),
+        session,
+        session_factory,
+        read_executor,
+    )
+
+
+def get_fanout_encounter_reader(
+    session: Annotated[Session, Depends(get_read_database_session)],
+    session_factory: Annotated[
+        sessionmaker[Session],
+        Depends(get_read_session_factory),
+    ],
+    read_executor: Annotated[
+        ThreadPoolReadExecutor | None,
+        Depends(get_read_executor),
+    ],
+) -> SqlAlchemyEncounterReader | SessionPerCallReader[SqlAlchemyEncounterReader]:
+    return _fanout_reader(
+        SqlAlchemyEncounterReader,
+        session,
+        session_factory,
+        read_executor,
+    )
+
+
+def _fanout_reader(
+    build_reader: Callable[[Session], ReaderT],
+    session: Session,
+    session_factory: sessionmaker[Session],
+    read_executor: ThreadPoolReadExecutor | None,
+) -> ReaderT | SessionPerCallReader[ReaderT]:
+    # Sequential reads share the request session. Concurrent reads run on
+    # worker threads, so each read opens its own session and closes it as
+    # soon as it returns: a request then holds at most as many pooled
+    # connections as the executor lets it run reads at once.
+    if read_executor is None:
+        return build_reader(session)
+
+    return SessionPerCallReader(session_factory, build_reader)
+
+
 def get_audit_event_reader(
-    session: Annotated[Session, Depends(get_database_session)],
+    session: Annotated[Session, Depends(get_read_database_session)],
 ) -> SqlAlchemyAuditEventReader:
     return SqlAlchemyAuditEventReader(session)
+
+
+async def get_async_patient_reader(
+    session: Annotated[AsyncSession, Depends(get_async_read_database_session)],
+) -> AsyncSqlAlchemyPatientReader:
+    return AsyncSqlAlchemyPatientReader(session)
+
+
+async def get_async_patient_summary_reader(
+    session: Annotated[AsyncSession, Depends(get_async_read_database_session)],
+) -> AsyncSqlAlchemyPatientSummaryReader:
+    return AsyncSqlAlchemyPatientSummaryReader(session)
+
+
+async def get_async_patient_version_reader(
+    session: Annotated[AsyncSession, Depends(get_async_read_database_session)],
+) -> AsyncSqlAlchemyPatientVersionReader:
+    return AsyncSqlAlchemyPatientVersionReader(session)
+
+
+async def get_async_observation_reader(
+    session: Annotated[AsyncSession, Depends(get_async_read_database_session)],
+    code_catalog: Annotated[
+        CodeCatalog | None,
+        Depends(get_observation_code_catalog),
+    ],
+) -> AsyncSqlAlchemyObservationReader:
+    return AsyncSqlAlchemyObservationReader(session, code_catalog)
+
+
+async def get_async_condition_reader(
+    session: Annotated[AsyncSession, Depends(get_async_read_database_session)],
+    code_catalog: Annotated[
+        CodeCatalog | None,
+        Depends(get_condition_code_catalog),
+    ],
+) -> AsyncSqlAlchemyConditionReader:
+    return AsyncSqlAlchemyConditionReader(session, code_catalog)
+
+
+async def get_async_encounter_reader(
+    session: Annotated[AsyncSession, Depends(get_async_read_database_session)],
+) -> AsyncSqlAlchemyEncounterReader:
+    return AsyncSqlAlchemyEncounterReader(session)
+
+
+async def get_async_audit_event_reader(
+    session: Annotated[AsyncSession, Depends(get_async_read_database_session)],
+) -> AsyncSqlAlchemyAuditEventReader:
+    return AsyncSqlAlchemyAuditEventReader(session)
@@ -0,0 +1,7 @@
+from fastapi import Request
+
+from fhir_gateway.infrastructure.audit import BatchingAuditEventWriter
+
+
+def get_audit_event_writer(request: Request) -> BatchingAuditEventWriter:
+    return request.app.state.audit_event_writer
@@ -0,0 +1,18 @@
+from fastapi import Request
+
+from fhir_gateway.infrastructure.bulk_export import (
+    BackgroundBulkExportScheduler,
+    InMemoryBulkExportJobRepository,
+)
+
+
+def get_bulk_export_job_repository(
+    request: Request,
+) -> InMemoryBulkExportJobRepository:
+    return request.app.state.bulk_export_job_repository
+
+
+def get_bulk_export_scheduler(
+    request: Request,
+) -> BackgroundBulkExportScheduler:
+    return request.app.state.bulk_export_scheduler
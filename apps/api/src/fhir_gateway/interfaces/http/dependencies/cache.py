@@ -0,0 +1,9 @@
+from fastapi import Request
+
+from fhir_gateway.infrastructure.cache import InMemoryLruCache, SharedCache
+
+
+def get_patient_cache(
+    request: Request,
+) -> InMemoryLruCache | SharedCache | None:
+    return request.app.state.patient_cache
@@ -0,0 +1,13 @@
+from fastapi import Request
+
+from fhir_gateway.infrastructure.persistence.sqlalchemy.code_catalog import (
+    CodeCatalog,
+)
+
+
+def get_observation_code_catalog(request: Request) -> CodeCatalog | None:
+    return request.app.state.observation_code_catalog
+
+
+def get_condition_code_catalog(request: Request) -> CodeCatalog | None:
+    return request.app.state.condition_code_catalog
@@ -0,0 +1,9 @@
+from fastapi import Request
+
+from fhir_gateway.infrastructure.concurrency import ThreadPoolReadExecutor
+
+
+def get_read_executor(
+    request: Request,
+) -> ThreadPoolReadExecutor | None:
+    return request.app.state.read_executor
@@ -1,17 +1,139 @@
-from collections.abc import Iterator
+from collections.abc import AsyncIterator, Iterator
+from typing import Annotated
 
-from fastapi import Request
+from fastapi import Depends, Request
+from fastapi.security.utils import get_authorization_scheme_param
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
 
+from fhir_gateway.infrastructure.persistence.sqlalchemy.pool_metrics import (
+    PoolMetrics,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.routing import ReplicaRouter
+from fhir_gateway.infrastructure.security import TokenVerificationError
+
 
 def get_session_factory(request: Request) -> sessionmaker[Session]:
     return request.app.state.session_factory
 
 
+def get_session_router(request: Request) -> ReplicaRouter[sessionmaker[Session]]:
+    return request.app.state.session_router
+
+
+def get_read_your_writes_key(request: Request) -> str | None:
+    # Only pay for token verification when stickiness is on. An unverified
+    # token must not pin reads to the primary, so it gets no key.
+    router = request.app.state.session_router
+    async_router = request.app.state.async_session_router
+
+    if not router.read_your_writes_enabled and not (
+        async_router is not None and async_router.read_your_writes_enabled
+    ):
+        return None
+
+    scheme, token = get_authorization_scheme_param(
+        request.headers.get("Authorization")
+    )
+
+    if scheme.lower() != "bearer" or not token:
+        return None
+
+    try:
+        claims = request.app.state.jwt_token_verifier.verify(token)
+    except TokenVerificationError:
+        return None
+
+    return claims.subject
+
+
 def get_database_session(
     request: Request,
+    read_your_writes_key: Annotated[
+        str | None,
+        Depends(get_read_your_writes_key),
+    ] = None,
 ) -> Iterator[Session]:
+    # The primary session, for units of work that write.
     session_factory = get_session_factory(request)
 
     with session_factory() as session:
+        get_session_router(request).track_writes(session, read_your_writes_key)
         yield session
+
+
+def get_read_session_factory(
+    request: Request,
+    read_your_writes_key: Annotated[
+        str | None,
+        Depends(get_read_your_writes_key),
+    ] = None,
+) -> sessionmaker[Session]:
+    # Cached per request, so every reader of one request uses one replica.
+    return get_session_router(request).for_read(read_your_writes_key)
+
+
+def get_read_database_session(
+    session_factory: Annotated[
+        sessionmaker[Session],
+        Depends(get_read_session_factory),
+    ],
+) -> Iterator[Session]:
+    with session_factory() as session:
+        yield session
+
+
+def get_async_session_factory(
+    request: Request,
+) -> async_sessionmaker[AsyncSession]:
+    async_session_factory = request.app.state.async_session_factory
+
+    if async_session_factory is None:
+        raise RuntimeError(
+            "Async database stack is not enabled. "
+            "Set FHIR_GATEWAY_DATABASE_STACK=async."
+        )
+
+    return async_session_factory
+
+
+def get_async_session_router(
+    request: Request,
+) -> ReplicaRouter[async_sessionmaker[AsyncSession]]:
+    get_async_session_factory(request)
+
+    return request.app.state.async_session_router
+
+
+async def get_async_database_session(
+    request: Request,
+    read_your_writes_key: Annotated[
+        str | None,
+        Depends(get_read_your_writes_key),
+    ] = None,
+) -> AsyncIterator[AsyncSession]:
+    async_session_factory = get_async_session_factory(request)
+
+    async with async_session_factory() as session:
+        get_async_session_router(request).track_writes(
+            session.sync_session,
+            read_your_writes_key,
+        )
+        yield session
+
+
+async def get_async_read_database_session(
+    request: Request,
+    read_your_writes_key: Annotated[
+        str | None,
+        Depends(get_read_your_writes_key),
+    ] = None,
+) -> AsyncIterator[AsyncSession]:
+    router = get_async_session_router(request)
+
+    async with router.for_read(read_your_writes_key)() as session:
+        yield session
+
+
+def get_database_pool_metrics(request: Request) -> PoolMetrics:
+    return request.app.state.database_pool_metrics
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from typing import Annotated
 
 from fastapi import Depends, Request
@@ -8,7 +9,10 @@ from fhir_gateway.infrastructure.security import (
     JwtTokenVerifier,
     TokenVerificationError,
 )
-from fhir_gateway.interfaces.http.errors import AuthenticationError
+from fhir_gateway.interfaces.http.errors import (
+    AuthenticationError,
+    AuthorizationError,
+)
 
 
 bearer_scheme = HTTPBearer(
@@ -47,3 +51,28 @@ def get_current_principal(
         roles=claims.roles,
         display_name=claims.name,
     )
+
+
+def require_roles(*roles: str) -> Callable[..., CurrentPrincipal]:
+    """Build a dependency that admits principals holding any of `roles`.
+
+    Missing or invalid credentials are still a `401`; a verified principal
+    without one of the roles is a `403`.
+    """
+    if not roles:
+        raise ValueError("require_roles needs at least one role.")
+
+    allowed_roles = frozenset(roles)
+
+    def get_authorized_principal(
+        principal: Annotated[
+            CurrentPrincipal,
+            Depends(get_current_principal),
+        ],
+    ) -> CurrentPrincipal:
+        if allowed_roles.isdisjoint(principal.roles):
+            raise AuthorizationError()
+
+        return principal
+
+    return get_authorized_principal
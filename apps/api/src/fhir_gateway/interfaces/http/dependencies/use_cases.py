@@ -2,34 +2,92 @@ from typing import Annotated
 
 from fastapi import Depends
 
+from fhir_gateway.application.use_cases.get_bulk_export_job import (
+    GetBulkExportJobUseCase,
+)
+from fhir_gateway.application.use_cases.get_bulk_export_output import (
+    GetBulkExportOutputUseCase,
+)
 from fhir_gateway.application.use_cases.export_patient_bundle import (
+    AsyncExportPatientBundleUseCase,
     ExportPatientBundleUseCase,
+    StreamPatientBundleUseCase,
+)
+from fhir_gateway.application.use_cases.get_observation_series import (
+    AsyncGetObservationSeriesUseCase,
+    GetObservationSeriesUseCase,
 )
 from fhir_gateway.application.use_cases.get_patient_summary import (
+    AsyncGetPatientSummaryUseCase,
     GetPatientSummaryUseCase,
 )
+from fhir_gateway.application.use_cases.get_patient_version import (
+    AsyncGetPatientVersionUseCase,
+    GetPatientVersionUseCase,
+)
 from fhir_gateway.application.use_cases.list_audit_events import (
+    AsyncListAuditEventsUseCase,
     ListAuditEventsUseCase,
 )
 from fhir_gateway.application.use_cases.list_observations_by_code import (
+    AsyncListObservationsByCodeUseCase,
     ListObservationsByCodeUseCase,
 )
 from fhir_gateway.application.use_cases.search_patients import (
+    AsyncSearchPatientsUseCase,
     SearchPatientsUseCase,
 )
+from fhir_gateway.application.use_cases.start_bulk_export import (
+    StartBulkExportUseCase,
+)
+from fhir_gateway.infrastructure.bulk_export import (
+    BackgroundBulkExportScheduler,
+    InMemoryBulkExportJobRepository,
+)
+from fhir_gateway.infrastructure.cache import InMemoryLruCache, SharedCache
+from fhir_gateway.infrastructure.concurrency import ThreadPoolReadExecutor
 from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    AsyncSqlAlchemyAuditEventReader,
+    AsyncSqlAlchemyConditionReader,
+    AsyncSqlAlchemyEncounterReader,
+    AsyncSqlAlchemyObservationReader,
+    AsyncSqlAlchemyPatientReader,
+    AsyncSqlAlchemyPatientSummaryReader,
+    AsyncSqlAlchemyPatientVersionReader,
     SqlAlchemyAuditEventReader,
     SqlAlchemyConditionReader,
     SqlAlchemyEncounterReader,
     SqlAlchemyObservationReader,
     SqlAlchemyPatientReader,
+    SqlAlchemyPatientSummaryReader,
+    SqlAlchemyPatientVersionReader,
 )
 from fhir_gateway.interfaces.http.dependencies.adapters import (
+    get_async_audit_event_reader,
+    get_async_condition_reader,
+    get_async_encounter_reader,
+    get_async_observation_reader,
+    get_async_patient_reader,
+    get_async_patient_summary_reader,
+    get_async_patient_version_reader,
     get_audit_event_reader,
     get_condition_reader,
     get_encounter_reader,
+    get_fanout_condition_reader,
+    get_fanout_encounter_reader,
+    get_fanout_observation_reader,
     get_observation_reader,
     get_patient_reader,
+    get_patient_summary_reader,
+    get_patient_version_reader,
+)
+from fhir_gateway.interfaces.http.dependencies.bulk_export import (
+    get_bulk_export_job_repository,
+    get_bulk_export_scheduler,
+)
+from fhir_gateway.interfaces.http.dependencies.cache import get_patient_cache
+from fhir_gateway.interfaces.http.dependencies.concurrency import (
+    get_read_executor,
 )
 
 
@@ -42,6 +100,15 @@ def get_search_patients_use_case(
     return SearchPatientsUseCase(patient_reader)
 
 
+def get_patient_version_use_case(
+    version_reader: Annotated[
+        SqlAlchemyPatientVersionReader,
+        Depends(get_patient_version_reader),
+    ],
+) -> GetPatientVersionUseCase:
+    return GetPatientVersionUseCase(version_reader)
+
+
 def get_patient_summary_use_case(
     patient_reader: Annotated[
         SqlAlchemyPatientReader,
@@ -49,22 +116,47 @@ def get_patient_summary_use_case(
     ],
     condition_reader: Annotated[
         SqlAlchemyConditionReader,
-        Depends(get_condition_reader),
+        Depends(get_fanout_condition_reader),
     ],
     encounter_reader: Annotated[
         SqlAlchemyEncounterReader,
-        Depends(get_encounter_reader),
+        Depends(get_fanout_encounter_reader),
     ],
     observation_reader: Annotated[
         SqlAlchemyObservationReader,
-        Depends(get_observation_reader),
+        Depends(get_fanout_observation_reader),
+    ],
+    patient_summary_reader: Annotated[
+        SqlAlchemyPatientSummaryReader,
+        Depends(get_patient_summary_reader),
+    ],
+    read_executor: Annotated[
+        ThreadPoolReadExecutor | None,
+        Depends(get_read_executor),
+    ],
+    version_reader: Annotated[
+        SqlAlchemyPatientVersionReader,
+        Depends(get_patient_version_reader),
+    ],
+    patient_cache: Annotated[
+        InMemoryLruCache | SharedCache | None,
+        Depends(get_patient_cache),
     ],
 ) -> GetPatientSummaryUseCase:
+    # The concurrent fan-out mode replaces the single-statement summary read
+    # with parallel per-resource reads.
+    if read_executor is not None:
+        patient_summary_reader = None
+
     return GetPatientSummaryUseCase(
         patient_reader=patient_reader,
         condition_reader=condition_reader,
         encounter_reader=encounter_reader,
         observation_reader=observation_reader,
+        patient_summary_reader=patient_summary_reader,
+        read_executor=read_executor,
+        cache=patient_cache,
+        version_reader=version_reader if patient_cache is not None else None,
     )
 
 
@@ -84,7 +176,69 @@ def get_list_observations_by_code_use_case(
     )
 
 
+def get_observation_series_use_case(
+    patient_reader: Annotated[
+        SqlAlchemyPatientReader,
+        Depends(get_patient_reader),
+    ],
+    observation_reader: Annotated[
+        SqlAlchemyObservationReader,
+        Depends(get_observation_reader),
+    ],
+) -> GetObservationSeriesUseCase:
+    return GetObservationSeriesUseCase(
+        patient_reader=patient_reader,
+        observation_series_reader=observation_reader,
+    )
+
+
 def get_export_patient_bundle_use_case(
+    patient_reader: Annotated[
+        SqlAlchemyPatientReader,
+        Depends(get_patient_reader),
+    ],
+    condition_reader: Annotated[
+        SqlAlchemyConditionReader,
+        Depends(get_fanout_condition_reader),
+    ],
+    encounter_reader: Annotated[
+        SqlAlchemyEncounterReader,
+        Depends(get_fanout_encounter_reader),
+    ],
+    observation_reader: Annotated[
+        SqlAlchemyObservationReader,
+        Depends(get_fanout_observation_reader),
+    ],
+    read_executor: Annotated[
+        ThreadPoolReadExecutor | None,
+        Depends(get_read_executor),
+    ],
+    version_reader: Annotated[
+        SqlAlchemyPatientVersionReader,
+        Depends(get_patient_version_reader),
+    ],
+    patient_cache: Annotated[
+        InMemoryLruCache | SharedCache | None,
+        Depends(get_patient_cache),
+    ],
+) -> ExportPatientBundleUseCase | None:
+    # Without a cache or a fan-out executor the bundle route streams instead,
+    # so nothing is gained from loading the whole bundle into memory first.
+    if patient_cache is None and read_executor is None:
+        return None
+
+    return ExportPatientBundleUseCase(
+        patient_reader=patient_reader,
+        condition_reader=condition_reader,
+        encounter_reader=encounter_reader,
+        observation_reader=observation_reader,
+        read_executor=read_executor,
+        cache=patient_cache,
+        version_reader=version_reader if patient_cache is not None else None,
+    )
+
+
+def get_stream_patient_bundle_use_case(
     patient_reader: Annotated[
         SqlAlchemyPatientReader,
         Depends(get_patient_reader),
@@ -101,8 +255,11 @@ def get_export_patient_bundle_use_case(
         SqlAlchemyObservationReader,
         Depends(get_observation_reader),
     ],
-) -> ExportPatientBundleUseCase:
-    return ExportPatientBundleUseCase(
+) -> StreamPatientBundleUseCase:
+    # Streams are consumed one after another on the request session, so the
+    # fan-out readers and executor are not used here; with a fan-out executor
+    # the route loads the bundle through `ExportPatientBundleUseCase`.
+    return StreamPatientBundleUseCase(
         patient_reader=patient_reader,
         condition_reader=condition_reader,
         encounter_reader=encounter_reader,
@@ -117,3 +274,170 @@ def get_list_audit_events_use_case(
     ],
 ) -> ListAuditEventsUseCase:
     return ListAuditEventsUseCase(audit_event_reader)
+
+
+def get_start_bulk_export_use_case(
+    job_repository: Annotated[
+        InMemoryBulkExportJobRepository,
+        Depends(get_bulk_export_job_repository),
+    ],
+    scheduler: Annotated[
+        BackgroundBulkExportScheduler,
+        Depends(get_bulk_export_scheduler),
+    ],
+) -> StartBulkExportUseCase:
+    return StartBulkExportUseCase(job_repository, scheduler)
+
+
+def get_bulk_export_job_use_case(
+    job_repository: Annotated[
+        InMemoryBulkExportJobRepository,
+        Depends(get_bulk_export_job_repository),
+    ],
+) -> GetBulkExportJobUseCase:
+    return GetBulkExportJobUseCase(job_repository)
+
+
+def get_bulk_export_output_use_case(
+    job_repository: Annotated[
+        InMemoryBulkExportJobRepository,
+        Depends(get_bulk_export_job_repository),
+    ],
+) -> GetBulkExportOutputUseCase:
+    return GetBulkExportOutputUseCase(job_repository)
+
+
+async def get_async_search_patients_use_case(
+    patient_reader: Annotated[
+        AsyncSqlAlchemyPatientReader,
+        Depends(get_async_patient_reader),
+    ],
+) -> AsyncSearchPatientsUseCase:
+    return AsyncSearchPatientsUseCase(patient_reader)
+
+
+async def get_async_patient_version_use_case(
+    version_reader: Annotated[
+        AsyncSqlAlchemyPatientVersionReader,
+        Depends(get_async_patient_version_reader),
+    ],
+) -> AsyncGetPatientVersionUseCase:
+    return AsyncGetPatientVersionUseCase(version_reader)
+
+
+async def get_async_patient_summary_use_case(
+    patient_reader: Annotated[
+        AsyncSqlAlchemyPatientReader,
+        Depends(get_async_patient_reader),
+    ],
+    condition_reader: Annotated[
+        AsyncSqlAlchemyConditionReader,
+        Depends(get_async_condition_reader),
+    ],
+    encounter_reader: Annotated[
+        AsyncSqlAlchemyEncounterReader,
+        Depends(get_async_encounter_reader),
+    ],
+    observation_reader: Annotated[
+        AsyncSqlAlchemyObservationReader,
+        Depends(get_async_observation_reader),
+    ],
+    patient_summary_reader: Annotated[
+        AsyncSqlAlchemyPatientSummaryReader,
+        Depends(get_async_patient_summary_reader),
+    ],
+    version_reader: Annotated[
+        AsyncSqlAlchemyPatientVersionReader,
+        Depends(get_async_patient_version_reader),
+    ],
+    patient_cache: Annotated[
+        InMemoryLruCache | SharedCache | None,
+        Depends(get_patient_cache),
+    ],
+) -> AsyncGetPatientSummaryUseCase:
+    return AsyncGetPatientSummaryUseCase(
+        patient_reader=patient_reader,
+        condition_reader=condition_reader,
+        encounter_reader=encounter_reader,
+        observation_reader=observation_reader,
+        patient_summary_reader=patient_summary_reader,
+        cache=patient_cache,
+        version_reader=version_reader if patient_cache is not None else None,
+    )
+
+
+async def get_async_list_observations_by_code_use_case(
+    patient_reader: Annotated[
+        AsyncSqlAlchemyPatientReader,
+        Depends(get_async_patient_reader),
+    ],
+    observation_reader: Annotated[
+        AsyncSqlAlchemyObservationReader,
+        Depends(get_async_observation_reader),
+    ],
+) -> AsyncListObservationsByCodeUseCase:
+    return AsyncListObservationsByCodeUseCase(
+        patient_reader=patient_reader,
+        observation_by_code_reader=observation_reader,
+    )
+
+
+async def get_async_observation_series_use_case(
+    patient_reader: Annotated[
+        AsyncSqlAlchemyPatientReader,
+        Depends(get_async_patient_reader),
+    ],
+    observation_reader: Annotated[
+        AsyncSqlAlchemyObservationReader,
+        Depends(get_async_observation_reader),
+    ],
+) -> AsyncGetObservationSeriesUseCase:
+    return AsyncGetObservationSeriesUseCase(
+        patient_reader=patient_reader,
+        observation_series_reader=observation_reader,
+    )
+
+
+async def get_async_export_patient_bundle_use_case(
+    patient_reader: Annotated[
+        AsyncSqlAlchemyPatientReader,
+        Depends(get_async_patient_reader),
+    ],
+    condition_reader: Annotated[
+        AsyncSqlAlchemyConditionReader,
+        Depends(get_async_condition_reader),
+    ],
+    encounter_reader: Annotated[
+        AsyncSqlAlchemyEncounterReader,
+        Depends(get_async_encounter_reader),
+    ],
+    observation_reader: Annotated[
+        AsyncSqlAlchemyObservationReader,
+        Depends(get_async_observation_reader),
+    ],
+    version_reader: Annotated[
+        AsyncSqlAlchemyPatientVersionReader,
+        Depends(get_async_patient_version_reader),
+    ],
+    patient_cache: Annotated[
+        InMemoryLruCache | SharedCache | None,
+        Depends(get_patient_cache),
+    ],
+) -> AsyncExportPatientBundleUseCase:
+    return AsyncExportPatientBundleUseCase(
+        patient_reader=patient_reader,
+        condition_reader=condition_reader,
+        encounter_reader=encounter_reader,
+        observation_reader=observation_reader,
+        cache=patient_cache,
+        version_reader=version_reader if patient_cache is not None else None,
+    )
+
+
+async def get_async_list_audit_events_use_case(
+    audit_event_reader: Annotated[
+        AsyncSqlAlchemyAuditEventReader,
+        Depends(get_async_audit_event_reader),
+    ],
+) -> AsyncListAuditEventsUseCase:
+    return AsyncListAuditEventsUseCase(audit_event_reader)
@@ -11,7 +11,10 @@ from fhir_gateway.domain.errors import DomainValidationError
 from fhir_gateway.infrastructure.security import (
     TokenVerifierConfigurationError,
 )
-from fhir_gateway.interfaces.http.errors import AuthenticationError
+from fhir_gateway.interfaces.http.errors import (
+    AuthenticationError,
+    AuthorizationError,
+)
 from fhir_gateway.interfaces.http.schemas.errors import ApiError, ApiErrorResponse
 
 logger = logging.getLogger(__name__)
@@ -93,6 +96,17 @@ async def handle_authentication_error(
     )
 
 
+async def handle_authorization_error(
+    _request: Request,
+    _exc: AuthorizationError,
+) -> JSONResponse:
+    return _build_error_response(
+        status_code=status.HTTP_403_FORBIDDEN,
+        code="forbidden",
+        message="The authenticated principal does not have permission to perform this operation.",
+    )
+
+
 async def handle_token_verifier_configuration_error(
     request: Request,
     exc: TokenVerifierConfigurationError,
@@ -148,6 +162,10 @@ def register_exception_handlers(app: FastAPI) -> None:
         AuthenticationError,
         handle_authentication_error,
     )
+    app.add_exception_handler(
+        AuthorizationError,
+        handle_authorization_error,
+    )
     app.add_exception_handler(
         TokenVerifierConfigurationError,
         handle_token_verifier_configuration_error,
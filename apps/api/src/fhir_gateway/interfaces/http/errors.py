@@ -1,2 +1,6 @@
 class AuthenticationError(Exception):
     pass
+
+
+class AuthorizationError(Exception):
+    pass
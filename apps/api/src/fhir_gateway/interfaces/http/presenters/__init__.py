@@ -0,0 +1 @@
+"""FHIR JSON presenters for the HTTP interface layer."""
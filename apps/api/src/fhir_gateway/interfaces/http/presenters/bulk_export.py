@@ -0,0 +1,43 @@
+from collections.abc import Callable
+
+from fhir_gateway.application.models.bulk_export import (
+    BulkExportJob,
+    BulkExportOutput,
+)
+from fhir_gateway.interfaces.http.schemas.bulk_export import (
+    BulkExportJobResponse,
+    BulkExportOutputResponse,
+)
+
+
+def bulk_export_job_to_response(
+    job: BulkExportJob,
+    *,
+    output_url: Callable[[BulkExportOutput], str],
+) -> BulkExportJobResponse:
+    """Present a job; `output_url` turns each output into its download URL.
+
+    Output files are only reachable through the download endpoint, so
+    their server paths are never part of the response.
+    """
+    return BulkExportJobResponse(
+        id=job.id,
+        status=job.status.value,
+        resource_types=list(job.resource_types),
+        gzip=job.gzip,
+        requested_at=job.requested_at,
+        started_at=job.started_at,
+        completed_at=job.completed_at,
+        resource_count=job.resource_count,
+        elapsed_seconds=job.elapsed_seconds,
+        resources_per_second=job.resources_per_second,
+        outputs=[
+            BulkExportOutputResponse(
+                type=output.resource_type,
+                url=output_url(output),
+                count=output.resource_count,
+            )
+            for output in job.outputs
+        ],
+        error=job.error,
+    )
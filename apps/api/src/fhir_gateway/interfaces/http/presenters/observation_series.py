@@ -0,0 +1,32 @@
+from fhir_gateway.application.models.observation_series import (
+    ObservationSeries,
+    SeriesDownsampling,
+)
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.interfaces.http.schemas.observation_series import (
+    ObservationSeriesColumnsResponse,
+    ObservationSeriesResponse,
+)
+
+
+def observation_series_to_response(
+    patient_id: ResourceId,
+    code: Code,
+    series: tuple[ObservationSeries, ...],
+    downsampling: SeriesDownsampling | None,
+) -> ObservationSeriesResponse:
+    return ObservationSeriesResponse(
+        patient_id=patient_id.value,
+        system=code.system,
+        code=code.code,
+        downsampling=None if downsampling is None else downsampling.value,
+        series=[
+            ObservationSeriesColumnsResponse(
+                unit=unit_series.unit,
+                timestamps=list(unit_series.timestamps),
+                values=list(unit_series.values),
+            )
+            for unit_series in series
+        ],
+    )
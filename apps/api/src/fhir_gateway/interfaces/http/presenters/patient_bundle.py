@@ -0,0 +1,59 @@
+from collections.abc import Iterable, Iterator
+
+from fhir_gateway.application.models.patient_bundle import PatientBundleStream
+from fhir_gateway.infrastructure.serialization.fhir_json import (
+    encode_fhir_resource,
+)
+
+FHIR_JSON_MEDIA_TYPE = "application/fhir+json"
+FHIR_NDJSON_MEDIA_TYPE = "application/fhir+ndjson"
+
+# Resources are small, so they are buffered into chunks of roughly this
+# size instead of sending one ASGI message per resource.
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def iter_patient_bundle_ndjson(stream: PatientBundleStream) -> Iterator[bytes]:
+    """Encode the patient and its resources as one FHIR JSON object per line."""
+    lines = (
+        encode_fhir_resource(resource) + b"\n"
+        for resource in _iter_resources(stream)
+    )
+
+    return _chunked(lines)
+
+
+def iter_patient_bundle_json(stream: PatientBundleStream) -> Iterator[bytes]:
+    """Encode the patient and its resources as a FHIR `collection` Bundle."""
+    return _chunked(_iter_bundle_parts(stream))
+
+
+def _iter_bundle_parts(stream: PatientBundleStream) -> Iterator[bytes]:
+    yield b'{"resourceType":"Bundle","type":"collection","entry":['
+
+    for index, resource in enumerate(_iter_resources(stream)):
+        if index:
+            yield b","
+
+        yield b'{"resource":' + encode_fhir_resource(resource) + b"}"
+
+    yield b"]}"
+
+
+def _iter_resources(stream: PatientBundleStream) -> Iterator:
+    yield stream.patient
+    yield from stream.resources()
+
+
+def _chunked(parts: Iterable[bytes]) -> Iterator[bytes]:
+    buffer = bytearray()
+
+    for part in parts:
+        buffer += part
+
+        if len(buffer) >= STREAM_CHUNK_SIZE:
+            yield bytes(buffer)
+            buffer.clear()
+
+    if buffer:
+        yield bytes(buffer)
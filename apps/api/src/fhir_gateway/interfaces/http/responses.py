@@ -0,0 +1,30 @@
+from typing import Any
+
+from fastapi.responses import Response
+
+from fhir_gateway.infrastructure.serialization import encode_fhir
+from fhir_gateway.interfaces.http.presenters.patient_bundle import (
+    FHIR_JSON_MEDIA_TYPE,
+)
+
+
+class FhirJsonResponse(Response):
+    """Render domain resources, summaries and bundles as FHIR JSON.
+
+    Routes return the domain object itself, `Patient` up to `PatientBundle`,
+    and the response encodes it with the fragment encoders of
+    `fhir_bytes`: no Pydantic model and no intermediate dict. Bytes are
+    sent unchanged.
+
+    FastAPI runs `jsonable_encoder` on a return value unless the route
+    returns a `Response`, so routes return `FhirJsonResponse(value)` rather
+    than setting it as `response_class`.
+    """
+
+    media_type = FHIR_JSON_MEDIA_TYPE
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, bytes):
+            return content
+
+        return encode_fhir(content)
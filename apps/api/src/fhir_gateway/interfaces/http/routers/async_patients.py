@@ -0,0 +1,152 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import Response
+
+from fhir_gateway.application.models.observation_series import SeriesDownsampling
+from fhir_gateway.application.models.patient_bundle import PatientBundleStream
+from fhir_gateway.application.security.current_principal import CurrentPrincipal
+from fhir_gateway.application.use_cases.export_patient_bundle import (
+    AsyncExportPatientBundleUseCase,
+)
+from fhir_gateway.application.use_cases.get_observation_series import (
+    AsyncGetObservationSeriesUseCase,
+)
+from fhir_gateway.application.use_cases.get_patient_summary import (
+    AsyncGetPatientSummaryUseCase,
+)
+from fhir_gateway.application.use_cases.get_patient_version import (
+    AsyncGetPatientVersionUseCase,
+)
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.interfaces.http.conditional import (
+    conditional_headers,
+    entity_tag,
+    is_not_modified,
+    not_modified_response,
+)
+from fhir_gateway.interfaces.http.dependencies.security import (
+    get_current_principal,
+)
+from fhir_gateway.interfaces.http.dependencies.use_cases import (
+    get_async_export_patient_bundle_use_case,
+    get_async_observation_series_use_case,
+    get_async_patient_summary_use_case,
+    get_async_patient_version_use_case,
+)
+from fhir_gateway.interfaces.http.presenters.observation_series import (
+    observation_series_to_response,
+)
+from fhir_gateway.interfaces.http.responses import FhirJsonResponse
+from fhir_gateway.interfaces.http.routers.patients import (
+    BundleExportFormat,
+    patient_bundle_response,
+)
+from fhir_gateway.interfaces.http.schemas.observation_series import (
+    ObservationSeriesResponse,
+)
+
+router = APIRouter(prefix="/patients", tags=["patients"])
+
+
+@router.get("/{patient_id}/summary", response_class=FhirJsonResponse)
+async def get_patient_summary(
+    patient_id: str,
+    _principal: Annotated[
+        CurrentPrincipal,
+        Depends(get_current_principal),
+    ],
+    version_use_case: Annotated[
+        AsyncGetPatientVersionUseCase,
+        Depends(get_async_patient_version_use_case),
+    ],
+    use_case: Annotated[
+        AsyncGetPatientSummaryUseCase,
+        Depends(get_async_patient_summary_use_case),
+    ],
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    resource_id = ResourceId(patient_id)
+    version = await version_use_case.execute(resource_id)
+    etag = entity_tag(version)
+
+    if is_not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+
+    summary = await use_case.execute(resource_id, version=version)
+
+    return FhirJsonResponse(summary, headers=conditional_headers(etag))
+
+
+@router.get("/{patient_id}/bundle")
+async def export_patient_bundle(
+    patient_id: str,
+    _principal: Annotated[
+        CurrentPrincipal,
+        Depends(get_current_principal),
+    ],
+    version_use_case: Annotated[
+        AsyncGetPatientVersionUseCase,
+        Depends(get_async_patient_version_use_case),
+    ],
+    use_case: Annotated[
+        AsyncExportPatientBundleUseCase,
+        Depends(get_async_export_patient_bundle_use_case),
+    ],
+    export_format: Annotated[
+        BundleExportFormat,
+        Query(alias="_format"),
+    ] = "bundle",
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    resource_id = ResourceId(patient_id)
+    version = await version_use_case.execute(resource_id)
+    etag = entity_tag(version, export_format)
+
+    if is_not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+
+    # The async readers have no streaming counterpart, so the bundle is loaded
+    # whole and then encoded by the streaming presenters.
+    bundle = await use_case.execute(resource_id, version=version)
+
+    return patient_bundle_response(
+        PatientBundleStream.from_bundle(bundle),
+        export_format,
+        etag,
+    )
+
+
+@router.get("/{patient_id}/observations/series")
+async def get_observation_series(
+    patient_id: str,
+    system: str,
+    code: str,
+    _principal: Annotated[
+        CurrentPrincipal,
+        Depends(get_current_principal),
+    ],
+    use_case: Annotated[
+        AsyncGetObservationSeriesUseCase,
+        Depends(get_async_observation_series_use_case),
+    ],
+    max_points: int | None = None,
+    method: SeriesDownsampling = SeriesDownsampling.LTTB,
+) -> ObservationSeriesResponse:
+    resource_id = ResourceId(patient_id)
+    observation_code = Code(system=system, code=code)
+
+    series = await use_case.execute(
+        resource_id,
+        observation_code,
+        max_points=max_points,
+        method=method,
+    )
+
+    return observation_series_to_response(
+        resource_id,
+        observation_code,
+        series,
+        None if max_points is None else method,
+    )
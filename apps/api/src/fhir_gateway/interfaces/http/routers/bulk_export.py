@@ -0,0 +1,141 @@
+from collections.abc import Callable
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from fastapi.responses import FileResponse
+
+from fhir_gateway.application.models.bulk_export import (
+    BulkExportOutput,
+    BulkExportStatus,
+)
+from fhir_gateway.application.security.current_principal import CurrentPrincipal
+from fhir_gateway.application.use_cases.get_bulk_export_job import (
+    GetBulkExportJobUseCase,
+)
+from fhir_gateway.application.use_cases.get_bulk_export_output import (
+    GetBulkExportOutputUseCase,
+)
+from fhir_gateway.application.use_cases.start_bulk_export import (
+    StartBulkExportUseCase,
+)
+from fhir_gateway.interfaces.http.dependencies.security import require_roles
+from fhir_gateway.interfaces.http.dependencies.use_cases import (
+    get_bulk_export_job_use_case,
+    get_bulk_export_output_use_case,
+    get_start_bulk_export_use_case,
+)
+from fhir_gateway.interfaces.http.presenters.bulk_export import (
+    bulk_export_job_to_response,
+)
+from fhir_gateway.interfaces.http.schemas.bulk_export import BulkExportJobResponse
+
+router = APIRouter(tags=["bulk-export"])
+
+BULK_EXPORT_JOB_PATH = "/bulk-export/jobs/{job_id}"
+BULK_EXPORT_OUTPUT_PATH = BULK_EXPORT_JOB_PATH + "/outputs/{resource_type}"
+
+# An export holds every patient in the database, not one chart, so it is
+# limited to administrators rather than to `bundle:export`.
+BULK_EXPORT_ROLES = ("admin",)
+
+_require_bulk_export_role = require_roles(*BULK_EXPORT_ROLES)
+
+_RUNNING_STATUSES = frozenset(
+    {BulkExportStatus.ACCEPTED, BulkExportStatus.IN_PROGRESS},
+)
+
+
+@router.get("/$export", status_code=status.HTTP_202_ACCEPTED)
+def start_bulk_export(
+    request: Request,
+    response: Response,
+    _principal: Annotated[
+        CurrentPrincipal,
+        Depends(_require_bulk_export_role),
+    ],
+    use_case: Annotated[
+        StartBulkExportUseCase,
+        Depends(get_start_bulk_export_use_case),
+    ],
+    resource_types: Annotated[
+        str | None,
+        Query(alias="_type"),
+    ] = None,
+    gzip: bool = False,
+) -> BulkExportJobResponse:
+    job = use_case.execute(
+        resource_types=(
+            None
+            if resource_types is None
+            else [resource_type.strip() for resource_type in resource_types.split(",")]
+        ),
+        gzip=gzip,
+    )
+
+    response.headers["Content-Location"] = BULK_EXPORT_JOB_PATH.format(
+        job_id=job.id,
+    )
+
+    return bulk_export_job_to_response(job, output_url=_output_url(request, job.id))
+
+
+@router.get(BULK_EXPORT_JOB_PATH)
+def get_bulk_export_job(
+    job_id: str,
+    request: Request,
+    response: Response,
+    _principal: Annotated[
+        CurrentPrincipal,
+        Depends(_require_bulk_export_role),
+    ],
+    use_case: Annotated[
+        GetBulkExportJobUseCase,
+        Depends(get_bulk_export_job_use_case),
+    ],
+) -> BulkExportJobResponse:
+    job = use_case.execute(job_id)
+
+    if job.status in _RUNNING_STATUSES:
+        response.status_code = status.HTTP_202_ACCEPTED
+        response.headers["X-Progress"] = job.status.value
+
+    return bulk_export_job_to_response(job, output_url=_output_url(request, job.id))
+
+
+@router.get(BULK_EXPORT_OUTPUT_PATH)
+def download_bulk_export_output(
+    job_id: str,
+    resource_type: str,
+    _principal: Annotated[
+        CurrentPrincipal,
+        Depends(_require_bulk_export_role),
+    ],
+    use_case: Annotated[
+        GetBulkExportOutputUseCase,
+        Depends(get_bulk_export_output_use_case),
+    ],
+) -> FileResponse:
+    output = use_case.execute(job_id, resource_type)
+    gzipped = output.path.endswith(".gz")
+
+    return FileResponse(
+        output.path,
+        media_type="application/gzip" if gzipped else "application/fhir+ndjson",
+        filename=f"{resource_type}.ndjson" + (".gz" if gzipped else ""),
+    )
+
+
+def _output_url(
+    request: Request,
+    job_id: str,
+) -> Callable[[BulkExportOutput], str]:
+    def output_url(output: BulkExportOutput) -> str:
+        return str(
+            request.url_for(
+                "download_bulk_export_output",
+                job_id=job_id,
+                resource_type=output.resource_type,
+            )
+        )
+
+    return output_url
@@ -1,8 +1,83 @@
-from fastapi import APIRouter
+from typing import Annotated
+
+from fastapi import APIRouter, Depends
+
+from fhir_gateway.application.security.current_principal import CurrentPrincipal
+from fhir_gateway.infrastructure.cache import InMemoryLruCache, SharedCache
+from fhir_gateway.infrastructure.persistence.sqlalchemy.pool_metrics import (
+    PoolMetrics,
+)
+from fhir_gateway.interfaces.http.dependencies.cache import get_patient_cache
+from fhir_gateway.interfaces.http.dependencies.database import (
+    get_database_pool_metrics,
+)
+from fhir_gateway.interfaces.http.dependencies.security import require_roles
+from fhir_gateway.interfaces.http.schemas.cache import CacheStatsResponse
+from fhir_gateway.interfaces.http.schemas.database import (
+    DatabasePoolStatsResponse,
+    PoolWaitBucketResponse,
+)
 
 router = APIRouter(tags=["health"])
 
+# `/health` stays public for probes; cache and pool statistics describe
+# the deployment and its traffic, so only operators may read them.
+HEALTH_METRICS_ROLES = ("admin",)
+
+_require_health_metrics_role = require_roles(*HEALTH_METRICS_ROLES)
+
 
 @router.get("/health")
 def get_health() -> dict[str, str]:
     return {"status": "ok"}
+
+
+@router.get("/health/cache")
+def get_cache_health(
+    _principal: Annotated[
+        CurrentPrincipal,
+        Depends(_require_health_metrics_role),
+    ],
+    patient_cache: Annotated[
+        InMemoryLruCache | SharedCache | None,
+        Depends(get_patient_cache),
+    ],
+) -> CacheStatsResponse:
+    if patient_cache is None:
+        return CacheStatsResponse(backend="disabled")
+
+    stats = patient_cache.stats()
+
+    return CacheStatsResponse(
+        backend=stats.backend,
+        hits=stats.hits,
+        misses=stats.misses,
+        evictions=stats.evictions,
+        entries=stats.entries,
+        hit_ratio=stats.hit_ratio,
+    )
+
+
+@router.get("/health/database-pool")
+def get_database_pool_health(
+    _principal: Annotated[
+        CurrentPrincipal,
+        Depends(_require_health_metrics_role),
+    ],
+    pool_metrics: Annotated[PoolMetrics, Depends(get_database_pool_metrics)],
+) -> DatabasePoolStatsResponse:
+    stats = pool_metrics.stats()
+
+    return DatabasePoolStatsResponse(
+        pool_size=stats.pool_size,
+        checked_out=stats.checked_out,
+        checked_in=stats.checked_in,
+        overflow=stats.overflow,
+        checkouts=stats.checkouts,
+        timeouts=stats.timeouts,
+        wait_seconds_total=stats.wait_seconds_total,
+        wait_buckets=[
+            PoolWaitBucketResponse(le_ms=bound, count=count)
+            for bound, count in stats.wait_buckets
+        ],
+    )
@@ -0,0 +1,185 @@
+from typing import Annotated, Literal
+
+from fastapi import APIRouter, Depends, Header, Query
+from fastapi.responses import Response, StreamingResponse
+
+from fhir_gateway.application.models.observation_series import SeriesDownsampling
+from fhir_gateway.application.models.patient_bundle import PatientBundleStream
+from fhir_gateway.application.security.current_principal import CurrentPrincipal
+from fhir_gateway.application.use_cases.export_patient_bundle import (
+    ExportPatientBundleUseCase,
+    StreamPatientBundleUseCase,
+)
+from fhir_gateway.application.use_cases.get_observation_series import (
+    GetObservationSeriesUseCase,
+)
+from fhir_gateway.application.use_cases.get_patient_summary import (
+    GetPatientSummaryUseCase,
+)
+from fhir_gateway.application.use_cases.get_patient_version import (
+    GetPatientVersionUseCase,
+)
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.interfaces.http.conditional import (
+    conditional_headers,
+    entity_tag,
+    is_not_modified,
+    not_modified_response,
+)
+from fhir_gateway.interfaces.http.dependencies.security import (
+    get_current_principal,
+)
+from fhir_gateway.interfaces.http.dependencies.use_cases import (
+    get_export_patient_bundle_use_case,
+    get_observation_series_use_case,
+    get_patient_summary_use_case,
+    get_patient_version_use_case,
+    get_stream_patient_bundle_use_case,
+)
+from fhir_gateway.interfaces.http.presenters.observation_series import (
+    observation_series_to_response,
+)
+from fhir_gateway.interfaces.http.presenters.patient_bundle import (
+    FHIR_JSON_MEDIA_TYPE,
+    FHIR_NDJSON_MEDIA_TYPE,
+    iter_patient_bundle_json,
+    iter_patient_bundle_ndjson,
+)
+from fhir_gateway.interfaces.http.responses import FhirJsonResponse
+from fhir_gateway.interfaces.http.schemas.observation_series import (
+    ObservationSeriesResponse,
+)
+
+router = APIRouter(prefix="/patients", tags=["patients"])
+
+BundleExportFormat = Literal["bundle", "ndjson"]
+
+
+@router.get("/{patient_id}/summary", response_class=FhirJsonResponse)
+def get_patient_summary(
+    patient_id: str,
+    _principal: Annotated[
+        CurrentPrincipal,
+        Depends(get_current_principal),
+    ],
+    version_use_case: Annotated[
+        GetPatientVersionUseCase,
+        Depends(get_patient_version_use_case),
+    ],
+    use_case: Annotated[
+        GetPatientSummaryUseCase,
+        Depends(get_patient_summary_use_case),
+    ],
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    resource_id = ResourceId(patient_id)
+    # The stamp is read before the chart, so a write landing in between can
+    # only pair newer data with the older ETag, which the next request
+    # refetches, never older data with the newer ETag.
+    version = version_use_case.execute(resource_id)
+    etag = entity_tag(version)
+
+    if is_not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+
+    summary = use_case.execute(resource_id, version=version)
+
+    return FhirJsonResponse(summary, headers=conditional_headers(etag))
+
+
+@router.get("/{patient_id}/bundle")
+def export_patient_bundle(
+    patient_id: str,
+    _principal: Annotated[
+        CurrentPrincipal,
+        Depends(get_current_principal),
+    ],
+    version_use_case: Annotated[
+        GetPatientVersionUseCase,
+        Depends(get_patient_version_use_case),
+    ],
+    use_case: Annotated[
+        StreamPatientBundleUseCase,
+        Depends(get_stream_patient_bundle_use_case),
+    ],
+    cached_use_case: Annotated[
+        ExportPatientBundleUseCase | None,
+        Depends(get_export_patient_bundle_use_case),
+    ],
+    export_format: Annotated[
+        BundleExportFormat,
+        Query(alias="_format"),
+    ] = "bundle",
+    if_none_match: Annotated[str | None, Header()] = None,
+) -> Response:
+    resource_id = ResourceId(patient_id)
+    version = version_use_case.execute(resource_id)
+    etag = entity_tag(version, export_format)
+
+    if is_not_modified(if_none_match, etag):
+        return not_modified_response(etag)
+
+    if cached_use_case is None:
+        stream = use_case.execute(resource_id)
+    else:
+        # Both formats share one cache entry, stamped with the version the
+        # ETag was built from.
+        stream = PatientBundleStream.from_bundle(
+            cached_use_case.execute(resource_id, version=version)
+        )
+
+    return patient_bundle_response(stream, export_format, etag)
+
+
+def patient_bundle_response(
+    stream: PatientBundleStream,
+    export_format: BundleExportFormat,
+    etag: str,
+) -> StreamingResponse:
+    if export_format == "ndjson":
+        return StreamingResponse(
+            iter_patient_bundle_ndjson(stream),
+            media_type=FHIR_NDJSON_MEDIA_TYPE,
+            headers=conditional_headers(etag),
+        )
+
+    return StreamingResponse(
+        iter_patient_bundle_json(stream),
+        media_type=FHIR_JSON_MEDIA_TYPE,
+        headers=conditional_headers(etag),
+    )
+
+
+@router.get("/{patient_id}/observations/series")
+def get_observation_series(
+    patient_id: str,
+    system: str,
+    code: str,
+    _principal: Annotated[
+        CurrentPrincipal,
+        Depends(get_current_principal),
+    ],
+    use_case: Annotated[
+        GetObservationSeriesUseCase,
+        Depends(get_observation_series_use_case),
+    ],
+    max_points: int | None = None,
+    method: SeriesDownsampling = SeriesDownsampling.LTTB,
+) -> ObservationSeriesResponse:
+    resource_id = ResourceId(patient_id)
+    observation_code = Code(system=system, code=code)
+
+    series = use_case.execute(
+        resource_id,
+        observation_code,
+        max_points=max_points,
+        method=method,
+    )
+
+    return observation_series_to_response(
+        resource_id,
+        observation_code,
+        series,
+        None if max_points is None else method,
+    )
@@ -0,0 +1,24 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class BulkExportOutputResponse(BaseModel):
+    type: str
+    url: str
+    count: int
+
+
+class BulkExportJobResponse(BaseModel):
+    id: str
+    status: str
+    resource_types: list[str]
+    gzip: bool
+    requested_at: datetime
+    started_at: datetime | None = None
+    completed_at: datetime | None = None
+    resource_count: int
+    elapsed_seconds: float | None = None
+    resources_per_second: float | None = None
+    outputs: list[BulkExportOutputResponse]
+    error: str | None = None
@@ -0,0 +1,10 @@
+from pydantic import BaseModel
+
+
+class CacheStatsResponse(BaseModel):
+    backend: str
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    entries: int | None = None
+    hit_ratio: float | None = None
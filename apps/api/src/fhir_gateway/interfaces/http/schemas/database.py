@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+
+
+class PoolWaitBucketResponse(BaseModel):
+    le_ms: float | None
+    count: int
+
+
+class DatabasePoolStatsResponse(BaseModel):
+    pool_size: int
+    checked_out: int
+    checked_in: int
+    overflow: int
+    checkouts: int
+    timeouts: int
+    wait_seconds_total: float
+    wait_buckets: list[PoolWaitBucketResponse]
@@ -0,0 +1,17 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class ObservationSeriesColumnsResponse(BaseModel):
+    unit: str
+    timestamps: list[datetime]
+    values: list[float]
+
+
+class ObservationSeriesResponse(BaseModel):
+    patient_id: str
+    system: str
+    code: str
+    downsampling: str | None = None
+    series: list[ObservationSeriesColumnsResponse]
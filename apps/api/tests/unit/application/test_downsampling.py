@@ -0,0 +1,113 @@
+import math
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from fhir_gateway.application.downsampling import downsample_series
+from fhir_gateway.application.models.observation_series import (
+    ObservationSeries,
+    SeriesDownsampling,
+)
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _build_series(values: list[float], unit: str = "%") -> ObservationSeries:
+    return ObservationSeries(
+        unit=unit,
+        timestamps=[START + timedelta(days=day) for day in range(len(values))],
+        values=values,
+    )
+
+
+def _sine_values(count: int) -> list[float]:
+    return [math.sin(index / 25) * 10 for index in range(count)]
+
+
+@pytest.mark.parametrize("method", list(SeriesDownsampling))
+def test_series_that_fits_is_returned_unchanged(method: SeriesDownsampling):
+    series = _build_series([7.0, 7.2, 6.9])
+
+    assert downsample_series(series, 3, method) is series
+
+
+@pytest.mark.parametrize("method", list(SeriesDownsampling))
+def test_downsampled_series_respects_max_points_and_time_order(
+    method: SeriesDownsampling,
+):
+    series = _build_series(_sine_values(1000))
+
+    downsampled = downsample_series(series, 100, method)
+
+    assert 3 <= len(downsampled) <= 100
+    assert downsampled.unit == "%"
+    assert list(downsampled.timestamps) == sorted(downsampled.timestamps)
+
+
+def test_lttb_keeps_first_last_and_original_points():
+    series = _build_series(_sine_values(1000))
+    original_points = set(zip(series.timestamps, series.values))
+
+    downsampled = downsample_series(series, 50, SeriesDownsampling.LTTB)
+
+    assert len(downsampled) == 50
+    assert downsampled.timestamps[0] == series.timestamps[0]
+    assert downsampled.timestamps[-1] == series.timestamps[-1]
+    assert set(zip(downsampled.timestamps, downsampled.values)) <= original_points
+
+
+def test_lttb_keeps_an_isolated_spike():
+    values = [7.0] * 500
+    values[321] = 14.0
+    series = _build_series(values)
+
+    downsampled = downsample_series(series, 10, SeriesDownsampling.LTTB)
+
+    assert 14.0 in downsampled.values
+    assert series.timestamps[321] in downsampled.timestamps
+
+
+def test_min_max_keeps_each_bucket_extremes():
+    values = [7.0] * 100
+    values[10] = 3.0
+    values[90] = 12.0
+    series = _build_series(values)
+
+    downsampled = downsample_series(series, 4, SeriesDownsampling.MIN_MAX)
+
+    assert min(downsampled.values) == 3.0
+    assert max(downsampled.values) == 12.0
+    assert len(downsampled) <= 4
+
+
+def test_average_replaces_each_time_bucket_by_its_mean():
+    series = _build_series([1.0, 3.0, 5.0, 7.0, 9.0, 11.0])
+
+    downsampled = downsample_series(series, 3, SeriesDownsampling.AVERAGE)
+
+    assert downsampled.values == (2.0, 6.0, 10.0)
+    assert downsampled.timestamps == (
+        START + timedelta(days=0.5),
+        START + timedelta(days=2.5),
+        START + timedelta(days=4.5),
+    )
+
+
+def test_average_of_identical_timestamps_is_one_point():
+    series = ObservationSeries(
+        unit="mmol/L",
+        timestamps=[START] * 5,
+        values=[1.0, 2.0, 3.0, 4.0, 5.0],
+    )
+
+    downsampled = downsample_series(series, 3, SeriesDownsampling.AVERAGE)
+
+    assert downsampled.timestamps == (START,)
+    assert downsampled.values == (3.0,)
+
+
+def test_downsample_rejects_too_few_points():
+    series = _build_series(_sine_values(10))
+
+    with pytest.raises(ValueError, match="max_points must be at least 3."):
+        downsample_series(series, 2, SeriesDownsampling.LTTB)
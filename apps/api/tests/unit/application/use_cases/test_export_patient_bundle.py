@@ -1,3 +1,5 @@
+import asyncio
+from collections.abc import Iterator
 from datetime import datetime, timezone
 
 import pytest
@@ -6,9 +8,14 @@ from fhir_gateway.application.errors import (
     ApplicationNotFoundError,
     ApplicationValidationError,
 )
-from fhir_gateway.application.models.patient_bundle import PatientBundle
+from fhir_gateway.application.models.patient_bundle import (
+    PatientBundle,
+    PatientBundleStream,
+)
 from fhir_gateway.application.use_cases.export_patient_bundle import (
+    AsyncExportPatientBundleUseCase,
     ExportPatientBundleUseCase,
+    StreamPatientBundleUseCase,
 )
 from fhir_gateway.domain.entities.condition import Condition
 from fhir_gateway.domain.entities.encounter import Encounter
@@ -44,6 +51,11 @@ class InMemoryConditionReader:
         self.received_patient_id = patient_id
         return self.conditions
 
+    def stream_by_patient(self, patient_id: ResourceId) -> Iterator[Condition]:
+        self.call_count += 1
+        self.received_patient_id = patient_id
+        yield from self.conditions
+
 
 class InMemoryEncounterReader:
     def __init__(self, encounters: tuple[Encounter, ...]) -> None:
@@ -56,6 +68,11 @@ class InMemoryEncounterReader:
         self.received_patient_id = patient_id
         return self.encounters
 
+    def stream_by_patient(self, patient_id: ResourceId) -> Iterator[Encounter]:
+        self.call_count += 1
+        self.received_patient_id = patient_id
+        yield from self.encounters
+
 
 class InMemoryObservationReader:
     def __init__(self, observations: tuple[Observation, ...]) -> None:
@@ -68,6 +85,54 @@ class InMemoryObservationReader:
         self.received_patient_id = patient_id
         return self.observations
 
+    def stream_by_patient(self, patient_id: ResourceId) -> Iterator[Observation]:
+        self.call_count += 1
+        self.received_patient_id = patient_id
+        yield from self.observations
+
+
+class InMemoryPatientVersionReader:
+    def __init__(self, version: str | None) -> None:
+        self.version = version
+
+    def get_version(self, patient_id: ResourceId) -> str | None:
+        return self.version
+
+
+class DictCache:
+    def __init__(self) -> None:
+        self.values: dict[str, object] = {}
+
+    def get(self, key: str) -> object | None:
+        return self.values.get(key)
+
+    def set(self, key: str, value: object) -> None:
+        self.values[key] = value
+
+
+class RecordingReadExecutor:
+    def __init__(self) -> None:
+        self.read_count = 0
+
+    def run_all(self, reads):
+        self.read_count += len(reads)
+        return tuple(read() for read in reads)
+
+
+class AsyncInMemoryReader:
+    """Expose the methods of an in-memory reader as coroutines."""
+
+    def __init__(self, reader: object) -> None:
+        self.reader = reader
+
+    def __getattr__(self, name: str):
+        method = getattr(self.reader, name)
+
+        async def call(*args):
+            return method(*args)
+
+        return call
+
 
 def _build_patient() -> Patient:
     return Patient(
@@ -322,6 +387,32 @@ def test_export_patient_bundle_passes_patient_id_to_all_readers():
     assert observation_reader.received_patient_id == patient_id
 
 
+def test_export_patient_bundle_runs_related_reads_through_read_executor():
+    patient_id = ResourceId("pat-001")
+    condition = _build_condition()
+    encounter = _build_encounter()
+    observation = _build_observation()
+
+    read_executor = RecordingReadExecutor()
+
+    use_case = ExportPatientBundleUseCase(
+        patient_reader=InMemoryPatientReader(patient=_build_patient()),
+        condition_reader=InMemoryConditionReader(conditions=(condition,)),
+        encounter_reader=InMemoryEncounterReader(encounters=(encounter,)),
+        observation_reader=InMemoryObservationReader(
+            observations=(observation,),
+        ),
+        read_executor=read_executor,
+    )
+
+    bundle = use_case.execute(patient_id)
+
+    assert read_executor.read_count == 3
+    assert bundle.conditions == (condition,)
+    assert bundle.encounters == (encounter,)
+    assert bundle.observations == (observation,)
+
+
 ###################################
 # USE CASE NOT VALID CASES:
 
@@ -379,3 +470,264 @@ def test_export_patient_bundle_does_not_call_related_readers_when_patient_does_n
     assert condition_reader.call_count == 0
     assert encounter_reader.call_count == 0
     assert observation_reader.call_count == 0
+
+
+###################################
+# ASYNC USE CASE:
+
+
+def test_async_export_patient_bundle_returns_structured_bundle_with_resources():
+    patient = _build_patient()
+    condition = _build_condition()
+    encounter = _build_encounter()
+    observation = _build_observation()
+
+    use_case = AsyncExportPatientBundleUseCase(
+        patient_reader=AsyncInMemoryReader(InMemoryPatientReader(patient=patient)),
+        condition_reader=AsyncInMemoryReader(
+            InMemoryConditionReader(conditions=(condition,)),
+        ),
+        encounter_reader=AsyncInMemoryReader(
+            InMemoryEncounterReader(encounters=(encounter,)),
+        ),
+        observation_reader=AsyncInMemoryReader(
+            InMemoryObservationReader(observations=(observation,)),
+        ),
+    )
+
+    bundle = asyncio.run(use_case.execute(ResourceId("pat-001")))
+
+    assert bundle.patient == patient
+    assert bundle.conditions == (condition,)
+    assert bundle.encounters == (encounter,)
+    assert bundle.observations == (observation,)
+
+
+def test_async_export_patient_bundle_raises_not_found_when_patient_does_not_exist():
+    condition_reader = InMemoryConditionReader(conditions=())
+
+    use_case = AsyncExportPatientBundleUseCase(
+        patient_reader=AsyncInMemoryReader(InMemoryPatientReader(patient=None)),
+        condition_reader=AsyncInMemoryReader(condition_reader),
+        encounter_reader=AsyncInMemoryReader(InMemoryEncounterReader(encounters=())),
+        observation_reader=AsyncInMemoryReader(
+            InMemoryObservationReader(observations=()),
+        ),
+    )
+
+    with pytest.raises(ApplicationNotFoundError):
+        asyncio.run(use_case.execute(ResourceId("pat-999")))
+
+    assert condition_reader.received_patient_id is None
+
+
+###################################
+# STREAMING USE CASE:
+
+
+def _build_stream_use_case(
+    patient: Patient | None,
+) -> tuple[
+    StreamPatientBundleUseCase,
+    InMemoryConditionReader,
+    InMemoryEncounterReader,
+    InMemoryObservationReader,
+]:
+    condition_reader = InMemoryConditionReader(conditions=(_build_condition(),))
+    encounter_reader = InMemoryEncounterReader(encounters=(_build_encounter(),))
+    observation_reader = InMemoryObservationReader(
+        observations=(_build_observation(),),
+    )
+    use_case = StreamPatientBundleUseCase(
+        patient_reader=InMemoryPatientReader(patient=patient),
+        condition_reader=condition_reader,
+        encounter_reader=encounter_reader,
+        observation_reader=observation_reader,
+    )
+
+    return use_case, condition_reader, encounter_reader, observation_reader
+
+
+def test_stream_patient_bundle_yields_resources_in_bundle_order():
+    use_case, *_ = _build_stream_use_case(_build_patient())
+
+    stream = use_case.execute(ResourceId("pat-001"))
+
+    assert stream.patient == _build_patient()
+    assert tuple(stream.resources()) == (
+        _build_condition(),
+        _build_encounter(),
+        _build_observation(),
+    )
+
+
+def test_stream_patient_bundle_reads_resources_only_when_iterated():
+    use_case, *readers = _build_stream_use_case(_build_patient())
+
+    stream = use_case.execute(ResourceId("pat-001"))
+
+    assert [reader.call_count for reader in readers] == [0, 0, 0]
+
+    tuple(stream.resources())
+
+    assert [reader.call_count for reader in readers] == [1, 1, 1]
+    assert all(
+        reader.received_patient_id == ResourceId("pat-001") for reader in readers
+    )
+
+
+def test_stream_patient_bundle_raises_not_found_before_streaming():
+    use_case, *readers = _build_stream_use_case(patient=None)
+
+    with pytest.raises(ApplicationNotFoundError) as exc:
+        use_case.execute(ResourceId("pat-404"))
+
+    assert exc.value.identifier == "pat-404"
+    assert [reader.call_count for reader in readers] == [0, 0, 0]
+
+
+def test_stream_patient_bundle_rejects_non_resource_id():
+    use_case, *_ = _build_stream_use_case(_build_patient())
+
+    with pytest.raises(ApplicationValidationError) as exc:
+        use_case.execute("pat-001")  # type: ignore[arg-type]
+
+    assert exc.value.field == "ExportPatientBundle.patient_id"
+
+
+def test_patient_bundle_stream_rejects_invalid_patient():
+    with pytest.raises(ApplicationValidationError) as exc:
+        PatientBundleStream(
+            patient="pat-001",  # type: ignore[arg-type]
+            conditions=iter(()),
+            encounters=iter(()),
+            observations=iter(()),
+        )
+
+    assert exc.value.field == "PatientBundleStream.patient"
+
+
+def test_patient_bundle_stream_rejects_materialized_collections():
+    with pytest.raises(ApplicationValidationError) as exc:
+        PatientBundleStream(
+            patient=_build_patient(),
+            conditions=iter(()),
+            encounters=(),  # type: ignore[arg-type]
+            observations=iter(()),
+        )
+
+    assert exc.value.field == "PatientBundleStream.encounters"
+    assert exc.value.message == "must be an iterator"
+
+
+def test_patient_bundle_stream_from_bundle_yields_loaded_resources():
+    observation = _build_observation()
+    bundle = PatientBundle(
+        patient=_build_patient(),
+        conditions=(),
+        encounters=(),
+        observations=(observation,),
+    )
+
+    stream = PatientBundleStream.from_bundle(bundle)
+
+    assert stream.patient is bundle.patient
+    assert list(stream.resources()) == [observation]
+
+
+def test_export_patient_bundle_serves_repeated_exports_from_cache():
+    observation_reader = InMemoryObservationReader(observations=(_build_observation(),))
+    version_reader = InMemoryPatientVersionReader("v1")
+    cache = DictCache()
+
+    use_case = ExportPatientBundleUseCase(
+        patient_reader=InMemoryPatientReader(patient=_build_patient()),
+        condition_reader=InMemoryConditionReader(conditions=()),
+        encounter_reader=InMemoryEncounterReader(encounters=()),
+        observation_reader=observation_reader,
+        cache=cache,
+        version_reader=version_reader,
+    )
+
+    first = use_case.execute(ResourceId("pat-001"))
+    second = use_case.execute(ResourceId("pat-001"))
+    version_reader.version = "v2"
+    third = use_case.execute(ResourceId("pat-001"))
+
+    assert second is first
+    assert third == first
+    assert observation_reader.call_count == 2
+    assert sorted(cache.values) == [
+        "patient-bundle:pat-001:v1",
+        "patient-bundle:pat-001:v2",
+    ]
+
+
+def test_export_patient_bundle_uses_given_version_without_reading_it():
+    cache = DictCache()
+
+    use_case = ExportPatientBundleUseCase(
+        patient_reader=InMemoryPatientReader(patient=_build_patient()),
+        condition_reader=InMemoryConditionReader(conditions=()),
+        encounter_reader=InMemoryEncounterReader(encounters=()),
+        observation_reader=InMemoryObservationReader(observations=()),
+        cache=cache,
+        version_reader=InMemoryPatientVersionReader(None),
+    )
+
+    use_case.execute(ResourceId("pat-001"), version="v7")
+
+    assert list(cache.values) == ["patient-bundle:pat-001:v7"]
+
+
+def test_export_patient_bundle_raises_not_found_without_version():
+    patient_reader = InMemoryPatientReader(patient=_build_patient())
+
+    use_case = ExportPatientBundleUseCase(
+        patient_reader=patient_reader,
+        condition_reader=InMemoryConditionReader(conditions=()),
+        encounter_reader=InMemoryEncounterReader(encounters=()),
+        observation_reader=InMemoryObservationReader(observations=()),
+        cache=DictCache(),
+        version_reader=InMemoryPatientVersionReader(None),
+    )
+
+    with pytest.raises(ApplicationNotFoundError):
+        use_case.execute(ResourceId("pat-404"))
+
+    assert patient_reader.received_patient_id is None
+
+
+def test_export_patient_bundle_requires_cache_with_version_reader():
+    with pytest.raises(ValueError):
+        ExportPatientBundleUseCase(
+            patient_reader=InMemoryPatientReader(patient=None),
+            condition_reader=InMemoryConditionReader(conditions=()),
+            encounter_reader=InMemoryEncounterReader(encounters=()),
+            observation_reader=InMemoryObservationReader(observations=()),
+            version_reader=InMemoryPatientVersionReader("v1"),
+        )
+
+
+def test_async_export_patient_bundle_serves_repeated_exports_from_cache():
+    observation_reader = InMemoryObservationReader(observations=(_build_observation(),))
+
+    use_case = AsyncExportPatientBundleUseCase(
+        patient_reader=AsyncInMemoryReader(InMemoryPatientReader(_build_patient())),
+        condition_reader=AsyncInMemoryReader(InMemoryConditionReader(conditions=())),
+        encounter_reader=AsyncInMemoryReader(InMemoryEncounterReader(encounters=())),
+        observation_reader=AsyncInMemoryReader(observation_reader),
+        cache=DictCache(),
+        version_reader=AsyncInMemoryReader(InMemoryPatientVersionReader("v1")),
+    )
+
+    async def execute_twice():
+        return (
+            await use_case.execute(ResourceId("pat-001")),
+            await use_case.execute(ResourceId("pat-001")),
+        )
+
+    first, second = asyncio.run(execute_twice())
+
+    assert second is first
+    assert observation_reader.call_count == 1
@@ -0,0 +1,62 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from fhir_gateway.application.errors import (
+    ApplicationNotFoundError,
+    ApplicationValidationError,
+)
+from fhir_gateway.application.models.bulk_export import (
+    BulkExportJob,
+    BulkExportStatus,
+)
+from fhir_gateway.application.use_cases.get_bulk_export_job import (
+    GetBulkExportJobUseCase,
+)
+
+
+class InMemoryBulkExportJobRepository:
+    def __init__(self, jobs: tuple[BulkExportJob, ...] = ()) -> None:
+        self.jobs = {job.id: job for job in jobs}
+
+    def save(self, job: BulkExportJob) -> None:
+        self.jobs[job.id] = job
+
+    def get(self, job_id: str) -> BulkExportJob | None:
+        return self.jobs.get(job_id)
+
+
+def _build_job(job_id: str = "job-001") -> BulkExportJob:
+    return BulkExportJob(
+        id=job_id,
+        status=BulkExportStatus.ACCEPTED,
+        resource_types=("Patient",),
+        requested_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_get_bulk_export_job_returns_saved_job():
+    job = _build_job()
+    use_case = GetBulkExportJobUseCase(InMemoryBulkExportJobRepository((job,)))
+
+    assert use_case.execute("job-001") == job
+
+
+def test_get_bulk_export_job_raises_not_found_for_unknown_job():
+    use_case = GetBulkExportJobUseCase(InMemoryBulkExportJobRepository())
+
+    with pytest.raises(ApplicationNotFoundError) as error:
+        use_case.execute("job-404")
+
+    assert error.value.resource == "BulkExportJob"
+    assert error.value.identifier == "job-404"
+
+
+@pytest.mark.parametrize("job_id", ["", "   ", None])
+def test_get_bulk_export_job_rejects_blank_job_id(job_id):
+    use_case = GetBulkExportJobUseCase(InMemoryBulkExportJobRepository())
+
+    with pytest.raises(ApplicationValidationError) as error:
+        use_case.execute(job_id)
+
+    assert error.value.field == "GetBulkExportJob.job_id"
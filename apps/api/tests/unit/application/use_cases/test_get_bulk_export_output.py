@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from fhir_gateway.application.errors import (
+    ApplicationNotFoundError,
+    ApplicationValidationError,
+)
+from fhir_gateway.application.models.bulk_export import (
+    BulkExportJob,
+    BulkExportOutput,
+    BulkExportStatus,
+)
+from fhir_gateway.application.use_cases.get_bulk_export_output import (
+    GetBulkExportOutputUseCase,
+)
+
+
+class InMemoryBulkExportJobRepository:
+    def __init__(self, jobs: tuple[BulkExportJob, ...] = ()) -> None:
+        self.jobs = {job.id: job for job in jobs}
+
+    def save(self, job: BulkExportJob) -> None:
+        self.jobs[job.id] = job
+
+    def get(self, job_id: str) -> BulkExportJob | None:
+        return self.jobs.get(job_id)
+
+
+PATIENT_OUTPUT = BulkExportOutput(
+    resource_type="Patient",
+    path="/exports/job-001/Patient.ndjson",
+    resource_count=2,
+)
+
+
+def _build_use_case() -> GetBulkExportOutputUseCase:
+    job = BulkExportJob(
+        id="job-001",
+        status=BulkExportStatus.COMPLETED,
+        resource_types=("Patient",),
+        requested_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        outputs=(PATIENT_OUTPUT,),
+    )
+
+    return GetBulkExportOutputUseCase(InMemoryBulkExportJobRepository((job,)))
+
+
+def test_get_bulk_export_output_returns_output_of_resource_type():
+    assert _build_use_case().execute("job-001", "Patient") == PATIENT_OUTPUT
+
+
+@pytest.mark.parametrize(
+    ("job_id", "resource_type", "identifier"),
+    [
+        ("job-001", "Observation", "job-001/Observation"),
+        ("job-404", "Patient", "job-404"),
+    ],
+)
+def test_get_bulk_export_output_raises_not_found(job_id, resource_type, identifier):
+    with pytest.raises(ApplicationNotFoundError) as error:
+        _build_use_case().execute(job_id, resource_type)
+
+    assert error.value.identifier == identifier
+
+
+def test_get_bulk_export_output_rejects_blank_resource_type():
+    with pytest.raises(ApplicationValidationError) as error:
+        _build_use_case().execute("job-001", " ")
+
+    assert error.value.field == "GetBulkExportOutput.resource_type"
@@ -0,0 +1,175 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from fhir_gateway.application.errors import (
+    ApplicationNotFoundError,
+    ApplicationValidationError,
+)
+from fhir_gateway.application.models.observation_series import (
+    ObservationSeries,
+    SeriesDownsampling,
+)
+from fhir_gateway.application.use_cases.get_observation_series import (
+    AsyncGetObservationSeriesUseCase,
+    GetObservationSeriesUseCase,
+)
+from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.human_name import HumanName
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+
+HBA1C = Code(system="http://loinc.org", code="4548-4")
+
+
+class InMemoryPatientReader:
+    def __init__(self, patients: tuple[Patient, ...]) -> None:
+        self.patients = patients
+
+    def get_by_id(self, patient_id: ResourceId) -> Patient | None:
+        for patient in self.patients:
+            if patient.id == patient_id:
+                return patient
+
+        return None
+
+
+class InMemoryObservationSeriesReader:
+    def __init__(self, series: tuple[ObservationSeries, ...]) -> None:
+        self.series = series
+        self.calls: list[tuple[ResourceId, Code]] = []
+
+    def list_series_by_patient_and_code(
+        self,
+        patient_id: ResourceId,
+        code: Code,
+    ) -> tuple[ObservationSeries, ...]:
+        self.calls.append((patient_id, code))
+
+        return self.series
+
+
+class AsyncInMemoryReader:
+    """Expose the methods of an in-memory reader as coroutines."""
+
+    def __init__(self, reader: object) -> None:
+        self.reader = reader
+
+    def __getattr__(self, name: str):
+        method = getattr(self.reader, name)
+
+        async def call(*args):
+            return method(*args)
+
+        return call
+
+
+def _build_patient(patient_id: str = "pat-001") -> Patient:
+    return Patient(
+        id=ResourceId(patient_id),
+        name=HumanName(given=("Ana",), family="García"),
+    )
+
+
+def _build_series(count: int, unit: str = "%") -> ObservationSeries:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    return ObservationSeries(
+        unit=unit,
+        timestamps=[start + timedelta(days=day) for day in range(count)],
+        values=[7.0 + (day % 7) / 10 for day in range(count)],
+    )
+
+
+def _build_use_case(
+    series: tuple[ObservationSeries, ...] = (),
+) -> tuple[GetObservationSeriesUseCase, InMemoryObservationSeriesReader]:
+    series_reader = InMemoryObservationSeriesReader(series)
+    use_case = GetObservationSeriesUseCase(
+        patient_reader=InMemoryPatientReader((_build_patient(),)),
+        observation_series_reader=series_reader,
+    )
+
+    return use_case, series_reader
+
+
+def test_execute_returns_full_series_without_max_points():
+    series = (_build_series(500),)
+    use_case, series_reader = _build_use_case(series)
+
+    result = use_case.execute(ResourceId("pat-001"), HBA1C)
+
+    assert result == series
+    assert series_reader.calls == [(ResourceId("pat-001"), HBA1C)]
+
+
+def test_execute_downsamples_each_unit_series_to_max_points():
+    use_case, _series_reader = _build_use_case(
+        (_build_series(500, "%"), _build_series(40, "mmol/mol"))
+    )
+
+    result = use_case.execute(
+        ResourceId("pat-001"),
+        HBA1C,
+        max_points=50,
+        method=SeriesDownsampling.MIN_MAX,
+    )
+
+    assert [unit_series.unit for unit_series in result] == ["%", "mmol/mol"]
+    assert len(result[0]) <= 50
+    assert len(result[1]) == 40
+
+
+def test_execute_raises_not_found_before_reading_series():
+    use_case, series_reader = _build_use_case((_build_series(5),))
+
+    with pytest.raises(ApplicationNotFoundError):
+        use_case.execute(ResourceId("pat-404"), HBA1C)
+
+    assert series_reader.calls == []
+
+
+@pytest.mark.parametrize(
+    ("arguments", "field"),
+    [
+        ({"patient_id": "pat-001"}, "GetObservationSeries.patient_id"),
+        ({"code": "4548-4"}, "GetObservationSeries.code"),
+        ({"method": "lttb"}, "GetObservationSeries.method"),
+        ({"max_points": True}, "GetObservationSeries.max_points"),
+        ({"max_points": 2}, "GetObservationSeries.max_points"),
+        (
+            {"max_points": GetObservationSeriesUseCase.MAX_POINTS + 1},
+            "GetObservationSeries.max_points",
+        ),
+    ],
+)
+def test_execute_validates_arguments(arguments: dict, field: str):
+    use_case, series_reader = _build_use_case()
+    call_arguments = {"patient_id": ResourceId("pat-001"), "code": HBA1C}
+    call_arguments.update(arguments)
+
+    with pytest.raises(ApplicationValidationError) as error:
+        use_case.execute(**call_arguments)
+
+    assert error.value.field == field
+    assert series_reader.calls == []
+
+
+def test_async_execute_matches_sync_execute():
+    series = (_build_series(300),)
+    use_case, _series_reader = _build_use_case(series)
+    async_use_case = AsyncGetObservationSeriesUseCase(
+        patient_reader=AsyncInMemoryReader(
+            InMemoryPatientReader((_build_patient(),))
+        ),
+        observation_series_reader=AsyncInMemoryReader(
+            InMemoryObservationSeriesReader(series)
+        ),
+    )
+
+    result = asyncio.run(
+        async_use_case.execute(ResourceId("pat-001"), HBA1C, max_points=30)
+    )
+
+    assert result == use_case.execute(ResourceId("pat-001"), HBA1C, max_points=30)
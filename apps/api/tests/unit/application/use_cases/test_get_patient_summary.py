@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 
 import pytest
@@ -6,7 +7,9 @@ from fhir_gateway.application.errors import (
     ApplicationNotFoundError,
     ApplicationValidationError,
 )
+from fhir_gateway.application.models.patient_summary import PatientSummary
 from fhir_gateway.application.use_cases.get_patient_summary import (
+    AsyncGetPatientSummaryUseCase,
     GetPatientSummaryUseCase,
 )
 from fhir_gateway.domain.entities.condition import Condition
@@ -62,6 +65,61 @@ class InMemoryObservationReader:
         return self.observations
 
 
+class InMemoryPatientSummaryReader:
+    def __init__(self, summary: PatientSummary | None) -> None:
+        self.summary = summary
+        self.received_patient_id: ResourceId | None = None
+        self.call_count = 0
+
+    def get_summary(self, patient_id: ResourceId) -> PatientSummary | None:
+        self.received_patient_id = patient_id
+        self.call_count += 1
+        return self.summary
+
+
+class InMemoryPatientVersionReader:
+    def __init__(self, version: str | None) -> None:
+        self.version = version
+
+    def get_version(self, patient_id: ResourceId) -> str | None:
+        return self.version
+
+
+class DictCache:
+    def __init__(self) -> None:
+        self.values: dict[str, object] = {}
+
+    def get(self, key: str) -> object | None:
+        return self.values.get(key)
+
+    def set(self, key: str, value: object) -> None:
+        self.values[key] = value
+
+
+class RecordingReadExecutor:
+    def __init__(self) -> None:
+        self.read_count = 0
+
+    def run_all(self, reads):
+        self.read_count += len(reads)
+        return tuple(read() for read in reads)
+
+
+class AsyncInMemoryReader:
+    """Expose the methods of an in-memory reader as coroutines."""
+
+    def __init__(self, reader: object) -> None:
+        self.reader = reader
+
+    def __getattr__(self, name: str):
+        method = getattr(self.reader, name)
+
+        async def call(*args):
+            return method(*args)
+
+        return call
+
+
 def _build_patient() -> Patient:
     return Patient(
         id=ResourceId("pat-001"),
@@ -196,6 +254,65 @@ def test_get_patient_summary_passes_patient_id_to_all_readers():
     assert observation_reader.received_patient_id == patient_id
 
 
+def test_get_patient_summary_uses_patient_summary_reader_when_provided():
+    patient_id = ResourceId("pat-001")
+    summary = PatientSummary(
+        patient=_build_patient(),
+        conditions=(_build_condition(),),
+        encounters=(_build_encounter(),),
+        observations=(_build_observation(),),
+    )
+
+    patient_reader = InMemoryPatientReader(patient=None)
+    condition_reader = InMemoryConditionReader(conditions=())
+    encounter_reader = InMemoryEncounterReader(encounters=())
+    observation_reader = InMemoryObservationReader(observations=())
+    patient_summary_reader = InMemoryPatientSummaryReader(summary=summary)
+
+    use_case = GetPatientSummaryUseCase(
+        patient_reader=patient_reader,
+        condition_reader=condition_reader,
+        encounter_reader=encounter_reader,
+        observation_reader=observation_reader,
+        patient_summary_reader=patient_summary_reader,
+    )
+
+    result = use_case.execute(patient_id)
+
+    assert result is summary
+    assert patient_summary_reader.received_patient_id == patient_id
+    assert patient_reader.received_patient_id is None
+    assert condition_reader.received_patient_id is None
+    assert encounter_reader.received_patient_id is None
+    assert observation_reader.received_patient_id is None
+
+
+def test_get_patient_summary_runs_related_reads_through_read_executor():
+    patient_id = ResourceId("pat-001")
+    condition = _build_condition()
+    encounter = _build_encounter()
+    observation = _build_observation()
+
+    read_executor = RecordingReadExecutor()
+
+    use_case = GetPatientSummaryUseCase(
+        patient_reader=InMemoryPatientReader(patient=_build_patient()),
+        condition_reader=InMemoryConditionReader(conditions=(condition,)),
+        encounter_reader=InMemoryEncounterReader(encounters=(encounter,)),
+        observation_reader=InMemoryObservationReader(
+            observations=(observation,),
+        ),
+        read_executor=read_executor,
+    )
+
+    summary = use_case.execute(patient_id)
+
+    assert read_executor.read_count == 3
+    assert summary.conditions == (condition,)
+    assert summary.encounters == (encounter,)
+    assert summary.observations == (observation,)
+
+
 ################################### NOT VALID CASES:
 
 
@@ -230,3 +347,247 @@ def test_get_patient_summary_raises_not_found_when_patient_does_not_exist():
     assert exc.value.resource == "Patient"
     assert exc.value.identifier == "pat-999"
     assert exc.value.message == "Patient not found: pat-999"
+
+
+def test_get_patient_summary_raises_not_found_when_summary_reader_finds_no_patient():
+    use_case = GetPatientSummaryUseCase(
+        patient_reader=InMemoryPatientReader(patient=None),
+        condition_reader=InMemoryConditionReader(conditions=()),
+        encounter_reader=InMemoryEncounterReader(encounters=()),
+        observation_reader=InMemoryObservationReader(observations=()),
+        patient_summary_reader=InMemoryPatientSummaryReader(summary=None),
+    )
+
+    with pytest.raises(ApplicationNotFoundError) as exc:
+        use_case.execute(ResourceId("pat-999"))
+
+    assert exc.value.resource == "Patient"
+    assert exc.value.identifier == "pat-999"
+
+
+###################################
+# ASYNC USE CASE:
+
+
+def test_async_get_patient_summary_returns_structured_summary_with_resources():
+    patient = _build_patient()
+    condition = _build_condition()
+    encounter = _build_encounter()
+    observation = _build_observation()
+
+    use_case = AsyncGetPatientSummaryUseCase(
+        patient_reader=AsyncInMemoryReader(InMemoryPatientReader(patient=patient)),
+        condition_reader=AsyncInMemoryReader(
+            InMemoryConditionReader(conditions=(condition,)),
+        ),
+        encounter_reader=AsyncInMemoryReader(
+            InMemoryEncounterReader(encounters=(encounter,)),
+        ),
+        observation_reader=AsyncInMemoryReader(
+            InMemoryObservationReader(observations=(observation,)),
+        ),
+    )
+
+    summary = asyncio.run(use_case.execute(ResourceId("pat-001")))
+
+    assert summary.patient == patient
+    assert summary.conditions == (condition,)
+    assert summary.encounters == (encounter,)
+    assert summary.observations == (observation,)
+
+
+def test_async_get_patient_summary_raises_not_found_when_patient_does_not_exist():
+    condition_reader = InMemoryConditionReader(conditions=())
+
+    use_case = AsyncGetPatientSummaryUseCase(
+        patient_reader=AsyncInMemoryReader(InMemoryPatientReader(patient=None)),
+        condition_reader=AsyncInMemoryReader(condition_reader),
+        encounter_reader=AsyncInMemoryReader(InMemoryEncounterReader(encounters=())),
+        observation_reader=AsyncInMemoryReader(
+            InMemoryObservationReader(observations=()),
+        ),
+    )
+
+    with pytest.raises(ApplicationNotFoundError):
+        asyncio.run(use_case.execute(ResourceId("pat-999")))
+
+    assert condition_reader.received_patient_id is None
+
+
+def test_async_get_patient_summary_uses_patient_summary_reader_when_provided():
+    summary = PatientSummary(
+        patient=_build_patient(),
+        conditions=(),
+        encounters=(),
+        observations=(),
+    )
+    patient_reader = InMemoryPatientReader(patient=None)
+    patient_summary_reader = InMemoryPatientSummaryReader(summary=summary)
+
+    use_case = AsyncGetPatientSummaryUseCase(
+        patient_reader=AsyncInMemoryReader(patient_reader),
+        condition_reader=AsyncInMemoryReader(InMemoryConditionReader(conditions=())),
+        encounter_reader=AsyncInMemoryReader(InMemoryEncounterReader(encounters=())),
+        observation_reader=AsyncInMemoryReader(
+            InMemoryObservationReader(observations=()),
+        ),
+        patient_summary_reader=AsyncInMemoryReader(patient_summary_reader),
+    )
+
+    result = asyncio.run(use_case.execute(ResourceId("pat-001")))
+
+    assert result is summary
+    assert patient_reader.received_patient_id is None
+
+
+def _build_cached_use_case(
+    summary: PatientSummary | None,
+    version_reader: InMemoryPatientVersionReader,
+    cache: DictCache,
+) -> tuple[GetPatientSummaryUseCase, InMemoryPatientSummaryReader]:
+    patient_summary_reader = InMemoryPatientSummaryReader(summary=summary)
+
+    use_case = GetPatientSummaryUseCase(
+        patient_reader=InMemoryPatientReader(patient=None),
+        condition_reader=InMemoryConditionReader(conditions=()),
+        encounter_reader=InMemoryEncounterReader(encounters=()),
+        observation_reader=InMemoryObservationReader(observations=()),
+        patient_summary_reader=patient_summary_reader,
+        cache=cache,
+        version_reader=version_reader,
+    )
+
+    return use_case, patient_summary_reader
+
+
+def test_get_patient_summary_serves_repeated_reads_from_cache():
+    summary = PatientSummary(
+        patient=_build_patient(),
+        conditions=(_build_condition(),),
+        encounters=(),
+        observations=(),
+    )
+    cache = DictCache()
+    use_case, patient_summary_reader = _build_cached_use_case(
+        summary,
+        InMemoryPatientVersionReader("v1"),
+        cache,
+    )
+
+    first = use_case.execute(ResourceId("pat-001"))
+    second = use_case.execute(ResourceId("pat-001"))
+
+    assert first is summary
+    assert second is summary
+    assert patient_summary_reader.call_count == 1
+    assert list(cache.values) == ["patient-summary:pat-001:v1"]
+
+
+def test_get_patient_summary_reloads_when_patient_version_changes():
+    summary = PatientSummary(
+        patient=_build_patient(),
+        conditions=(),
+        encounters=(),
+        observations=(),
+    )
+    version_reader = InMemoryPatientVersionReader("v1")
+    use_case, patient_summary_reader = _build_cached_use_case(
+        summary,
+        version_reader,
+        DictCache(),
+    )
+
+    use_case.execute(ResourceId("pat-001"))
+    version_reader.version = "v2"
+    use_case.execute(ResourceId("pat-001"))
+
+    assert patient_summary_reader.call_count == 2
+
+
+def test_get_patient_summary_uses_given_version_without_reading_it():
+    summary = PatientSummary(
+        patient=_build_patient(),
+        conditions=(),
+        encounters=(),
+        observations=(),
+    )
+    cache = DictCache()
+    use_case, _ = _build_cached_use_case(
+        summary,
+        InMemoryPatientVersionReader(None),
+        cache,
+    )
+
+    assert use_case.execute(ResourceId("pat-001"), version="v7") is summary
+    assert list(cache.values) == ["patient-summary:pat-001:v7"]
+
+
+def test_get_patient_summary_raises_not_found_without_version_and_skips_reads():
+    cache = DictCache()
+    use_case, patient_summary_reader = _build_cached_use_case(
+        None,
+        InMemoryPatientVersionReader(None),
+        cache,
+    )
+
+    with pytest.raises(ApplicationNotFoundError):
+        use_case.execute(ResourceId("pat-404"))
+
+    assert patient_summary_reader.call_count == 0
+    assert cache.values == {}
+
+
+def test_get_patient_summary_does_not_cache_missing_patient():
+    cache = DictCache()
+    use_case, _ = _build_cached_use_case(
+        None,
+        InMemoryPatientVersionReader("v1"),
+        cache,
+    )
+
+    with pytest.raises(ApplicationNotFoundError):
+        use_case.execute(ResourceId("pat-001"))
+
+    assert cache.values == {}
+
+
+def test_get_patient_summary_requires_version_reader_with_cache():
+    with pytest.raises(ValueError):
+        GetPatientSummaryUseCase(
+            patient_reader=InMemoryPatientReader(patient=None),
+            condition_reader=InMemoryConditionReader(conditions=()),
+            encounter_reader=InMemoryEncounterReader(encounters=()),
+            observation_reader=InMemoryObservationReader(observations=()),
+            cache=DictCache(),
+        )
+
+
+def test_async_get_patient_summary_serves_repeated_reads_from_cache():
+    summary = PatientSummary(
+        patient=_build_patient(),
+        conditions=(),
+        encounters=(),
+        observations=(),
+    )
+    patient_summary_reader = InMemoryPatientSummaryReader(summary=summary)
+
+    use_case = AsyncGetPatientSummaryUseCase(
+        patient_reader=AsyncInMemoryReader(InMemoryPatientReader(patient=None)),
+        condition_reader=AsyncInMemoryReader(InMemoryConditionReader(conditions=())),
+        encounter_reader=AsyncInMemoryReader(InMemoryEncounterReader(encounters=())),
+        observation_reader=AsyncInMemoryReader(
+            InMemoryObservationReader(observations=()),
+        ),
+        patient_summary_reader=AsyncInMemoryReader(patient_summary_reader),
+        cache=DictCache(),
+        version_reader=AsyncInMemoryReader(InMemoryPatientVersionReader("v1")),
+    )
+
+    async def execute_twice() -> tuple[PatientSummary, PatientSummary]:
+        return (
+            await use_case.execute(ResourceId("pat-001")),
+            await use_case.execute(ResourceId("pat-001")),
+        )
+
+    assert asyncio.run(execute_twice()) == (summary, summary)
+    assert patient_summary_reader.call_count == 1
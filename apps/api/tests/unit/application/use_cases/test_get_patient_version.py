@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from fhir_gateway.application.errors import (
+    ApplicationNotFoundError,
+    ApplicationValidationError,
+)
+from fhir_gateway.application.use_cases.get_patient_version import (
+    AsyncGetPatientVersionUseCase,
+    GetPatientVersionUseCase,
+)
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+
+
+class InMemoryPatientVersionReader:
+    def __init__(self, version: str | None) -> None:
+        self.version = version
+        self.received_patient_id: ResourceId | None = None
+
+    def get_version(self, patient_id: ResourceId) -> str | None:
+        self.received_patient_id = patient_id
+        return self.version
+
+
+class AsyncInMemoryPatientVersionReader:
+    def __init__(self, version: str | None) -> None:
+        self.reader = InMemoryPatientVersionReader(version)
+
+    async def get_version(self, patient_id: ResourceId) -> str | None:
+        return self.reader.get_version(patient_id)
+
+
+def test_get_patient_version_returns_version_stamp():
+    version_reader = InMemoryPatientVersionReader("v1")
+
+    version = GetPatientVersionUseCase(version_reader).execute(ResourceId("pat-001"))
+
+    assert version == "v1"
+    assert version_reader.received_patient_id == ResourceId("pat-001")
+
+
+def test_get_patient_version_raises_not_found_for_unknown_patient():
+    use_case = GetPatientVersionUseCase(InMemoryPatientVersionReader(None))
+
+    with pytest.raises(ApplicationNotFoundError) as exc:
+        use_case.execute(ResourceId("pat-404"))
+
+    assert exc.value.identifier == "pat-404"
+
+
+def test_get_patient_version_rejects_non_resource_id():
+    use_case = GetPatientVersionUseCase(InMemoryPatientVersionReader("v1"))
+
+    with pytest.raises(ApplicationValidationError) as exc:
+        use_case.execute("pat-001")  # type: ignore[arg-type]
+
+    assert exc.value.field == "GetPatientVersion.patient_id"
+
+
+def test_async_get_patient_version_returns_version_stamp():
+    use_case = AsyncGetPatientVersionUseCase(AsyncInMemoryPatientVersionReader("v1"))
+
+    assert asyncio.run(use_case.execute(ResourceId("pat-001"))) == "v1"
+
+
+def test_async_get_patient_version_raises_not_found_for_unknown_patient():
+    use_case = AsyncGetPatientVersionUseCase(AsyncInMemoryPatientVersionReader(None))
+
+    with pytest.raises(ApplicationNotFoundError):
+        asyncio.run(use_case.execute(ResourceId("pat-404")))
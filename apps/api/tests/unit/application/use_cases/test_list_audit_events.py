@@ -1,9 +1,18 @@
+import asyncio
 from datetime import datetime, timezone
 
 import pytest
 
 from fhir_gateway.application.errors import ApplicationValidationError
+from fhir_gateway.application.models.audit_events import (
+    AuditEventCursor,
+    AuditEventFilters,
+    AuditEventPage,
+    decode_audit_event_page_token,
+    encode_audit_event_page_token,
+)
 from fhir_gateway.application.use_cases.list_audit_events import (
+    AsyncListAuditEventsUseCase,
     ListAuditEventsUseCase,
 )
 from fhir_gateway.domain.entities.audit_event import AuditAction, AuditEvent
@@ -13,22 +22,53 @@ from fhir_gateway.domain.value_objects.resource_id import ResourceId
 
 
 class InMemoryAuditEventReader:
-    def __init__(self, audit_events: tuple[AuditEvent, ...]) -> None:
+    def __init__(
+        self,
+        audit_events: tuple[AuditEvent, ...],
+        next_cursor: AuditEventCursor | None = None,
+    ) -> None:
         self.audit_events = audit_events
+        self.next_cursor = next_cursor
         self.received_limit: int | None = None
-
-    def list_recent(self, limit: int) -> tuple[AuditEvent, ...]:
+        self.received_filters: AuditEventFilters | None = None
+        self.received_after: AuditEventCursor | None = None
+
+    def list_page(
+        self,
+        *,
+        limit: int,
+        filters: AuditEventFilters,
+        after: AuditEventCursor | None = None,
+    ) -> AuditEventPage:
         self.received_limit = limit
+        self.received_filters = filters
+        self.received_after = after
 
-        return tuple(
-            sorted(
+        return AuditEventPage(
+            events=sorted(
                 self.audit_events,
                 key=lambda audit_event: audit_event.recorded.value,
                 reverse=True,
             )[:limit],
+            next_cursor=self.next_cursor,
         )
 
 
+class AsyncInMemoryReader:
+    """Expose the methods of an in-memory reader as coroutines."""
+
+    def __init__(self, reader: object) -> None:
+        self.reader = reader
+
+    def __getattr__(self, name: str):
+        method = getattr(self.reader, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+
+        return call
+
+
 def _build_instant(year: int, month: int, day: int, hour: int, minute: int) -> Instant:
     return Instant(
         value=datetime(year, month, day, hour, minute, 0, tzinfo=timezone.utc),
@@ -86,7 +126,7 @@ def test_list_audit_events_returns_recent_audit_events_newest_first():
 
     result = use_case.execute(limit=2)
 
-    assert result == (newest_event, middle_event)
+    assert result.events == (newest_event, middle_event)
 
 
 def test_list_audit_events_returns_empty_tuple_when_there_are_no_events():
@@ -95,7 +135,8 @@ def test_list_audit_events_returns_empty_tuple_when_there_are_no_events():
 
     result = use_case.execute()
 
-    assert result == ()
+    assert result.events == ()
+    assert result.next_page_token is None
 
 
 def test_list_audit_events_uses_default_limit_when_none_is_provided():
@@ -125,6 +166,74 @@ def test_list_audit_events_accepts_max_limit():
     assert reader.received_limit == ListAuditEventsUseCase.MAX_LIMIT
 
 
+def test_list_audit_events_passes_filters_to_reader():
+    reader = InMemoryAuditEventReader(audit_events=())
+    use_case = ListAuditEventsUseCase(audit_event_reader=reader)
+    filters = AuditEventFilters(
+        agent=" doctor.alvarez ",
+        action=AuditAction.READ,
+        entity_resource_type="Patient",
+        entity_id=ResourceId("pat-001"),
+        recorded_since=_build_instant(2026, 5, 1, 0, 0),
+        recorded_before=_build_instant(2026, 6, 1, 0, 0),
+    )
+
+    use_case.execute(filters=filters)
+
+    assert reader.received_filters == filters
+    assert reader.received_filters.agent == "doctor.alvarez"
+
+
+def test_list_audit_events_uses_empty_filters_by_default():
+    reader = InMemoryAuditEventReader(audit_events=())
+    use_case = ListAuditEventsUseCase(audit_event_reader=reader)
+
+    use_case.execute()
+
+    assert reader.received_filters == AuditEventFilters()
+    assert reader.received_after is None
+
+
+def test_list_audit_events_returns_next_page_token_from_reader_cursor():
+    cursor = AuditEventCursor(
+        recorded=_build_instant(2026, 5, 2, 9, 12),
+        event_id=ResourceId("aud-002"),
+    )
+    reader = InMemoryAuditEventReader(audit_events=(), next_cursor=cursor)
+    use_case = ListAuditEventsUseCase(audit_event_reader=reader)
+
+    result = use_case.execute()
+
+    assert result.next_page_token == encode_audit_event_page_token(cursor)
+
+
+def test_list_audit_events_resumes_after_page_token_cursor():
+    cursor = AuditEventCursor(
+        recorded=_build_instant(2026, 5, 2, 9, 12),
+        event_id=ResourceId("aud-002"),
+    )
+    reader = InMemoryAuditEventReader(audit_events=())
+    use_case = ListAuditEventsUseCase(audit_event_reader=reader)
+
+    use_case.execute(page_token=encode_audit_event_page_token(cursor))
+
+    assert reader.received_after == cursor
+
+
+def test_audit_event_page_token_round_trips_cursor():
+    cursor = AuditEventCursor(
+        recorded=Instant(
+            datetime(2026, 5, 2, 9, 12, 30, 123456, tzinfo=timezone.utc)
+        ),
+        event_id=ResourceId("aud-002"),
+    )
+
+    token = encode_audit_event_page_token(cursor)
+
+    assert "=" not in token
+    assert decode_audit_event_page_token(token) == cursor
+
+
 ###################################
 # NOT VALID CASES:
 
@@ -195,3 +304,103 @@ def test_list_audit_events_rejects_limit_greater_than_max_limit():
     assert exc.value.message == (
         f"must be less than or equal to {ListAuditEventsUseCase.MAX_LIMIT}"
     )
+
+
+###################################
+# ASYNC USE CASE:
+
+
+def test_async_list_audit_events_passes_default_limit_to_reader():
+    reader = InMemoryAuditEventReader(audit_events=())
+    use_case = AsyncListAuditEventsUseCase(AsyncInMemoryReader(reader))
+
+    result = asyncio.run(use_case.execute())
+
+    assert result.events == ()
+    assert reader.received_limit == AsyncListAuditEventsUseCase.DEFAULT_LIMIT
+
+
+def test_async_list_audit_events_rejects_limit_greater_than_max_limit():
+    reader = InMemoryAuditEventReader(audit_events=())
+    use_case = AsyncListAuditEventsUseCase(AsyncInMemoryReader(reader))
+
+    with pytest.raises(ApplicationValidationError) as exc:
+        asyncio.run(use_case.execute(limit=ListAuditEventsUseCase.MAX_LIMIT + 1))
+
+    assert exc.value.field == "ListAuditEvents.limit"
+    assert reader.received_limit is None
+
+
+@pytest.mark.parametrize(
+    "page_token",
+    [
+        "not-base64-json",
+        "aGVsbG8",
+        "WyIyMDI2LTA1LTAyVDA5OjEyOjAwIiwiYXVkLTAwMiJd",
+        "WzEsMl0",
+    ],
+    ids=["garbage", "not-json", "naive-datetime", "wrong-types"],
+)
+def test_list_audit_events_rejects_invalid_page_token(page_token: str):
+    reader = InMemoryAuditEventReader(audit_events=())
+    use_case = ListAuditEventsUseCase(audit_event_reader=reader)
+
+    with pytest.raises(ApplicationValidationError) as exc:
+        use_case.execute(page_token=page_token)
+
+    assert exc.value.field == "ListAuditEvents.page_token"
+    assert exc.value.message == "is not a valid page token"
+    assert reader.received_limit is None
+
+
+def test_list_audit_events_rejects_filters_of_wrong_type():
+    reader = InMemoryAuditEventReader(audit_events=())
+    use_case = ListAuditEventsUseCase(audit_event_reader=reader)
+
+    with pytest.raises(ApplicationValidationError) as exc:
+        use_case.execute(filters={"agent": "system"})  # type: ignore[arg-type]
+
+    assert exc.value.field == "ListAuditEvents.filters"
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "field"),
+    [
+        ({"agent": "   "}, "AuditEventFilters.agent"),
+        ({"action": "read"}, "AuditEventFilters.action"),
+        (
+            {"entity_resource_type": "Practitioner"},
+            "AuditEventFilters.entity_resource_type",
+        ),
+        ({"entity_id": ResourceId("pat-001")}, "AuditEventFilters.entity_id"),
+        (
+            {"entity_resource_type": "Patient", "entity_id": "pat-001"},
+            "AuditEventFilters.entity_id",
+        ),
+        (
+            {"recorded_since": datetime(2026, 5, 1)},
+            "AuditEventFilters.recorded_since",
+        ),
+        (
+            {
+                "recorded_since": _build_instant(2026, 6, 1, 0, 0),
+                "recorded_before": _build_instant(2026, 6, 1, 0, 0),
+            },
+            "AuditEventFilters.recorded_before",
+        ),
+    ],
+    ids=[
+        "blank-agent",
+        "string-action",
+        "unknown-resource-type",
+        "entity-id-without-type",
+        "string-entity-id",
+        "naive-since",
+        "empty-range",
+    ],
+)
+def test_audit_event_filters_reject_invalid_values(kwargs: dict, field: str):
+    with pytest.raises(ApplicationValidationError) as exc:
+        AuditEventFilters(**kwargs)
+
+    assert exc.value.field == field
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 
 import pytest
@@ -7,6 +8,7 @@ from fhir_gateway.application.errors import (
     ApplicationValidationError,
 )
 from fhir_gateway.application.use_cases.list_observations_by_code import (
+    AsyncListObservationsByCodeUseCase,
     ListObservationsByCodeUseCase,
 )
 from fhir_gateway.domain.entities.observation import Observation, ObservationStatus
@@ -59,6 +61,21 @@ class InMemoryObservationByCodeReader:
         )
 
 
+class AsyncInMemoryReader:
+    """Expose the methods of an in-memory reader as coroutines."""
+
+    def __init__(self, reader: object) -> None:
+        self.reader = reader
+
+    def __getattr__(self, name: str):
+        method = getattr(self.reader, name)
+
+        async def call(*args):
+            return method(*args)
+
+        return call
+
+
 def _build_patient(
     patient_id: str = "pat-001",
     given: str = "Ana",
@@ -348,3 +365,51 @@ def test_list_observations_by_code_does_not_call_observation_reader_when_patient
         use_case.execute(patient_id, hba1c_code)
 
     assert observation_reader.call_count == 0
+
+
+###################################
+# ASYNC USE CASE:
+
+
+def test_async_list_observations_by_code_returns_matching_observations():
+    patient = _build_patient()
+    hba1c_code = _build_hba1c_code()
+    observation = _build_observation(
+        observation_id="obs-001",
+        patient_id="pat-001",
+        code=hba1c_code,
+        value=7.2,
+        unit="%",
+        year=2026,
+        month=1,
+        day=12,
+    )
+
+    use_case = AsyncListObservationsByCodeUseCase(
+        patient_reader=AsyncInMemoryReader(
+            InMemoryPatientReader(patients=(patient,)),
+        ),
+        observation_by_code_reader=AsyncInMemoryReader(
+            InMemoryObservationByCodeReader(observations=(observation,)),
+        ),
+    )
+
+    result = asyncio.run(use_case.execute(patient.id, hba1c_code))
+
+    assert result == (observation,)
+
+
+def test_async_list_observations_by_code_raises_not_found_when_patient_does_not_exist():
+    observation_reader = InMemoryObservationByCodeReader(observations=())
+
+    use_case = AsyncListObservationsByCodeUseCase(
+        patient_reader=AsyncInMemoryReader(InMemoryPatientReader(patients=())),
+        observation_by_code_reader=AsyncInMemoryReader(observation_reader),
+    )
+
+    with pytest.raises(ApplicationNotFoundError):
+        asyncio.run(
+            use_case.execute(ResourceId("pat-999"), _build_hba1c_code()),
+        )
+
+    assert observation_reader.call_count == 0
@@ -1,7 +1,18 @@
+import asyncio
+
 import pytest
 
 from fhir_gateway.application.errors import ApplicationValidationError
-from fhir_gateway.application.use_cases.search_patients import SearchPatientsUseCase
+from fhir_gateway.application.models.patient_search import (
+    PatientSearchCursor,
+    PatientSearchPage,
+    decode_patient_search_page_token,
+    encode_patient_search_page_token,
+)
+from fhir_gateway.application.use_cases.search_patients import (
+    AsyncSearchPatientsUseCase,
+    SearchPatientsUseCase,
+)
 from fhir_gateway.domain.entities.patient import Patient
 from fhir_gateway.domain.value_objects.human_name import HumanName
 from fhir_gateway.domain.value_objects.identifier import Identifier
@@ -10,13 +21,46 @@ from fhir_gateway.domain.value_objects.resource_id import ResourceId
 
 #### FAKE ADAPTER (INFRASTRUCTURE LAYER):
 class InMemoryPatientSearchReader:
-    def __init__(self, patients: tuple[Patient, ...]) -> None:
+    def __init__(
+        self,
+        patients: tuple[Patient, ...],
+        next_cursor: PatientSearchCursor | None = None,
+    ) -> None:
         self.patients = patients
+        self.next_cursor = next_cursor
         self.received_search_text: str | None = None
-
-    def search_by_text(self, search_text: str) -> tuple[Patient, ...]:
+        self.received_limit: int | None = None
+        self.received_after: PatientSearchCursor | None = None
+
+    def search_by_text(
+        self,
+        search_text: str,
+        *,
+        limit: int,
+        after: PatientSearchCursor | None = None,
+    ) -> PatientSearchPage:
         self.received_search_text = search_text
-        return self.patients
+        self.received_limit = limit
+        self.received_after = after
+        return PatientSearchPage(
+            patients=self.patients,
+            next_cursor=self.next_cursor,
+        )
+
+
+class AsyncInMemoryReader:
+    """Expose the methods of an in-memory reader as coroutines."""
+
+    def __init__(self, reader: object) -> None:
+        self.reader = reader
+
+    def __getattr__(self, name: str):
+        method = getattr(self.reader, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+
+        return call
 
 
 ################################### VALID CASES:
@@ -33,7 +77,7 @@ def test_search_patients_returns_patients_from_reader():
 
     result = use_case.execute("garcia")
 
-    assert result == (patient,)
+    assert result.patients == (patient,)
     assert reader.received_search_text == "garcia"
 
 
@@ -47,7 +91,7 @@ def test_search_patients_trims_search_text_before_calling_reader():
 
     result = use_case.execute("   garcia   ")
 
-    assert result == (patient,)
+    assert result.patients == (patient,)
     assert reader.received_search_text == "garcia"
 
 
@@ -57,10 +101,62 @@ def test_search_patients_returns_empty_tuple_when_reader_finds_nothing():
 
     result = use_case.execute("unknown")
 
-    assert result == ()
+    assert result.patients == ()
+    assert result.next_page_token is None
     assert reader.received_search_text == "unknown"
 
 
+def test_search_patients_uses_default_limit():
+    reader = InMemoryPatientSearchReader(patients=())
+    use_case = SearchPatientsUseCase(patient_search_reader=reader)
+
+    use_case.execute("garcia")
+
+    assert reader.received_limit == SearchPatientsUseCase.DEFAULT_LIMIT
+    assert reader.received_after is None
+
+
+def test_search_patients_passes_limit_to_reader():
+    reader = InMemoryPatientSearchReader(patients=())
+    use_case = SearchPatientsUseCase(patient_search_reader=reader)
+
+    use_case.execute("garcia", limit=SearchPatientsUseCase.MAX_LIMIT)
+
+    assert reader.received_limit == SearchPatientsUseCase.MAX_LIMIT
+
+
+def test_search_patients_returns_next_page_token_from_reader_cursor():
+    cursor = PatientSearchCursor(patient_id=ResourceId("pat-001"))
+    reader = InMemoryPatientSearchReader(patients=(), next_cursor=cursor)
+    use_case = SearchPatientsUseCase(patient_search_reader=reader)
+
+    result = use_case.execute("garcia")
+
+    assert result.next_page_token == encode_patient_search_page_token(cursor)
+
+
+def test_search_patients_resumes_after_page_token_cursor():
+    cursor = PatientSearchCursor(patient_id=ResourceId("pat-042"))
+    reader = InMemoryPatientSearchReader(patients=())
+    use_case = SearchPatientsUseCase(patient_search_reader=reader)
+
+    use_case.execute(
+        "garcia",
+        page_token=encode_patient_search_page_token(cursor),
+    )
+
+    assert reader.received_after == cursor
+
+
+def test_patient_search_page_token_round_trips_cursor():
+    cursor = PatientSearchCursor(patient_id=ResourceId("pat-ü|001"))
+
+    token = encode_patient_search_page_token(cursor)
+
+    assert "=" not in token
+    assert decode_patient_search_page_token(token) == cursor
+
+
 ################################### NOT VALID CASES:
 
 
@@ -95,3 +191,85 @@ def test_search_patients_rejects_whitespace_only_search_text():
 
     assert exc.value.field == "SearchPatients.search_text"
     assert exc.value.message == "cannot be empty"
+
+
+@pytest.mark.parametrize(
+    ("limit", "message"),
+    [
+        (True, "must be an integer"),
+        ("10", "must be an integer"),
+        (0, "must be greater than or equal to 1"),
+        (
+            SearchPatientsUseCase.MAX_LIMIT + 1,
+            f"must be less than or equal to {SearchPatientsUseCase.MAX_LIMIT}",
+        ),
+    ],
+)
+def test_search_patients_rejects_invalid_limit(limit, message):
+    reader = InMemoryPatientSearchReader(patients=())
+    use_case = SearchPatientsUseCase(patient_search_reader=reader)
+
+    with pytest.raises(ApplicationValidationError) as exc:
+        use_case.execute("garcia", limit=limit)
+
+    assert exc.value.field == "SearchPatients.limit"
+    assert exc.value.message == message
+    assert reader.received_search_text is None
+
+
+@pytest.mark.parametrize(
+    "page_token",
+    [
+        "",
+        "not base64!",
+        "bm90IGpzb24",  # "not json"
+        "WzFd",  # [1]
+        "InBhdC0wMDEi",  # "pat-001"
+        "WyJwYXQtMDAxIiwicGF0LTAwMiJd",  # ["pat-001","pat-002"]
+        "WzAsInBhdC0wMDEiXQ",  # [0,"pat-001"]
+        "WyIgICJd",  # ["  "]
+    ],
+)
+def test_search_patients_rejects_invalid_page_token(page_token):
+    reader = InMemoryPatientSearchReader(patients=())
+    use_case = SearchPatientsUseCase(patient_search_reader=reader)
+
+    with pytest.raises(ApplicationValidationError) as exc:
+        use_case.execute("garcia", page_token=page_token)
+
+    assert exc.value.field == "SearchPatients.page_token"
+    assert exc.value.message == "is not a valid page token"
+    assert reader.received_search_text is None
+
+
+################################### ASYNC USE CASE:
+
+
+def test_async_search_patients_returns_patients_from_reader():
+    patient = Patient(
+        id=ResourceId("pat-001"),
+        name=HumanName(given=("Ana",), family="García"),
+    )
+    reader = InMemoryPatientSearchReader(patients=(patient,))
+    use_case = AsyncSearchPatientsUseCase(
+        patient_search_reader=AsyncInMemoryReader(reader),
+    )
+
+    result = asyncio.run(use_case.execute("  garcia  ", limit=5))
+
+    assert result.patients == (patient,)
+    assert reader.received_search_text == "garcia"
+    assert reader.received_limit == 5
+
+
+def test_async_search_patients_rejects_empty_search_text():
+    reader = InMemoryPatientSearchReader(patients=())
+    use_case = AsyncSearchPatientsUseCase(
+        patient_search_reader=AsyncInMemoryReader(reader),
+    )
+
+    with pytest.raises(ApplicationValidationError) as exc:
+        asyncio.run(use_case.execute("   "))
+
+    assert exc.value.field == "SearchPatients.search_text"
+    assert reader.received_search_text is None
@@ -0,0 +1,147 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from fhir_gateway.application.errors import ApplicationValidationError
+from fhir_gateway.application.models.bulk_export import (
+    BULK_EXPORT_RESOURCE_TYPES,
+    BulkExportJob,
+    BulkExportOutput,
+    BulkExportStatus,
+)
+from fhir_gateway.application.use_cases.start_bulk_export import (
+    StartBulkExportUseCase,
+)
+
+
+class InMemoryBulkExportJobRepository:
+    def __init__(self) -> None:
+        self.jobs: dict[str, BulkExportJob] = {}
+
+    def save(self, job: BulkExportJob) -> None:
+        self.jobs[job.id] = job
+
+    def get(self, job_id: str) -> BulkExportJob | None:
+        return self.jobs.get(job_id)
+
+
+class RecordingBulkExportScheduler:
+    def __init__(self) -> None:
+        self.submitted: list[BulkExportJob] = []
+
+    def submit(self, job: BulkExportJob) -> None:
+        self.submitted.append(job)
+
+
+def _build_use_case() -> tuple[
+    StartBulkExportUseCase,
+    InMemoryBulkExportJobRepository,
+    RecordingBulkExportScheduler,
+]:
+    job_repository = InMemoryBulkExportJobRepository()
+    scheduler = RecordingBulkExportScheduler()
+
+    return StartBulkExportUseCase(job_repository, scheduler), job_repository, scheduler
+
+
+def test_start_bulk_export_saves_and_submits_accepted_job():
+    use_case, job_repository, scheduler = _build_use_case()
+
+    job = use_case.execute()
+
+    assert job.status is BulkExportStatus.ACCEPTED
+    assert job.resource_types == BULK_EXPORT_RESOURCE_TYPES
+    assert job.gzip is False
+    assert job.requested_at.tzinfo is not None
+    assert job_repository.get(job.id) == job
+    assert scheduler.submitted == [job]
+
+
+def test_start_bulk_export_assigns_unique_job_ids():
+    use_case, _, _ = _build_use_case()
+
+    assert use_case.execute().id != use_case.execute().id
+
+
+def test_start_bulk_export_keeps_canonical_resource_type_order():
+    use_case, _, _ = _build_use_case()
+
+    job = use_case.execute(
+        resource_types=["Observation", "Patient", "Observation"],
+        gzip=True,
+    )
+
+    assert job.resource_types == ("Patient", "Observation")
+    assert job.gzip is True
+
+
+@pytest.mark.parametrize(
+    "resource_types",
+    [
+        [],
+        ["Medication"],
+        "Patient",
+    ],
+)
+def test_start_bulk_export_rejects_invalid_resource_types(resource_types):
+    use_case, job_repository, scheduler = _build_use_case()
+
+    with pytest.raises(ApplicationValidationError) as error:
+        use_case.execute(resource_types=resource_types)
+
+    assert error.value.field == "StartBulkExport.resource_types"
+    assert job_repository.jobs == {}
+    assert scheduler.submitted == []
+
+
+def test_start_bulk_export_rejects_non_boolean_gzip():
+    use_case, _, _ = _build_use_case()
+
+    with pytest.raises(ApplicationValidationError) as error:
+        use_case.execute(gzip="yes")
+
+    assert error.value.field == "StartBulkExport.gzip"
+
+
+def test_bulk_export_job_reports_throughput():
+    started_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    job = BulkExportJob(
+        id="job-001",
+        status=BulkExportStatus.COMPLETED,
+        resource_types=("Patient", "Observation"),
+        requested_at=started_at,
+        started_at=started_at,
+        completed_at=started_at + timedelta(seconds=4),
+        outputs=(
+            BulkExportOutput("Patient", "exports/job-001/Patient.ndjson", 100),
+            BulkExportOutput(
+                "Observation",
+                "exports/job-001/Observation.ndjson",
+                700,
+            ),
+        ),
+    )
+
+    assert job.resource_count == 800
+    assert job.elapsed_seconds == 4.0
+    assert job.resources_per_second == 200.0
+
+
+def test_bulk_export_job_has_no_throughput_until_completed():
+    job = BulkExportJob(
+        id="job-001",
+        status=BulkExportStatus.IN_PROGRESS,
+        resource_types=("Patient",),
+        requested_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        started_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+    assert job.elapsed_seconds is None
+    assert job.resources_per_second is None
+
+
+def test_bulk_export_output_rejects_unknown_resource_type():
+    with pytest.raises(ApplicationValidationError) as error:
+        BulkExportOutput("Medication", "exports/Medication.ndjson", 1)
+
+    assert error.value.field == "BulkExportOutput.resource_type"
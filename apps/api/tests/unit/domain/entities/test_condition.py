@@ -126,3 +126,16 @@ def test_rejects_non_instant_recorded_date():
 
     assert exc.value.field == "Condition.recorded_date"
     assert exc.value.message == "must be an Instant"
+
+
+################################### TRUSTED CONSTRUCTION:
+
+
+def test_from_trusted_equals_validated_condition():
+    fields = dict(
+        id=ResourceId("cond-001"),
+        code=Code(system="http://snomed.info/sct", code="44054006"),
+        subject=Reference(resource_type="Patient", id=ResourceId("pat-001")),
+    )
+
+    assert Condition._from_trusted(**fields) == Condition(**fields)
@@ -120,3 +120,16 @@ def test_rejects_period_without_start():
 
     assert exc.value.field == "Encounter.period"
     assert exc.value.message == "start must be present"
+
+
+################################### TRUSTED CONSTRUCTION:
+
+
+def test_from_trusted_equals_validated_encounter():
+    fields = dict(
+        id=ResourceId("enc-001"),
+        subject=Reference(resource_type="Patient", id=ResourceId("pat-001")),
+        period=Period(start=Instant(value=datetime(2026, 2, 14, 10, 0, 0, tzinfo=timezone.utc))),
+    )
+
+    assert Encounter._from_trusted(**fields) == Encounter(**fields)
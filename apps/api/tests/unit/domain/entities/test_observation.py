@@ -167,3 +167,19 @@ def test_rejects_non_quantity():
 
     assert exc.value.field == "Observation.value"
     assert exc.value.message == "must be a Quantity"
+
+
+################################### TRUSTED CONSTRUCTION:
+
+
+def test_from_trusted_equals_validated_observation():
+    fields = dict(
+        id=ResourceId("obs-001"),
+        status=ObservationStatus.FINAL,
+        code=Code(system="http://loinc.org", code="4548-4", display="HbA1c"),
+        subject=Reference(resource_type="Patient", id=ResourceId("pat-001")),
+        effective=Instant(value=datetime(2026, 2, 14, 10, 0, 0, tzinfo=timezone.utc)),
+        value=Quantity(value=6.2, unit="%"),
+    )
+
+    assert Observation._from_trusted(**fields) == Observation(**fields)
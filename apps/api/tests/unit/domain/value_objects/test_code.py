@@ -104,3 +104,16 @@ def test_rejects_not_string_display():
 
     assert exc.value.field == "Code.display"
     assert exc.value.message == "must be a string"
+
+
+####################################TRUSTED CONSTRUCTION:
+
+
+# Trusted construction keeps the values as given and equals a validated Code.
+def test_from_trusted_equals_validated_code():
+    code = Code._from_trusted("http://loinc.org", "4548-4", "HbA1c")
+
+    assert code == Code(system="http://loinc.org", code="4548-4", display="HbA1c")
+    assert hash(code) == hash(
+        Code(system="http://loinc.org", code="4548-4", display="HbA1c")
+    )
@@ -45,3 +45,12 @@ def test_rejects_naive_datetime():
 
     assert exc.value.field == "Instant.value"
     assert exc.value.message == "must be timezone-aware"
+
+
+################################### TRUSTED CONSTRUCTION:
+
+
+def test_from_trusted_equals_validated_instant():
+    value = datetime(2026, 2, 14, 10, 0, 0, tzinfo=timezone.utc)
+
+    assert Instant._from_trusted(value) == Instant(value)
@@ -77,3 +77,12 @@ def test_rejects_start_after_end():
 
     assert exc.value.field == "Period"
     assert exc.value.message == "start must be <= end"
+
+
+################################### TRUSTED CONSTRUCTION:
+
+
+def test_from_trusted_equals_validated_period():
+    start = Instant(value=datetime(2026, 2, 14, 10, 0, 0, tzinfo=timezone.utc))
+
+    assert Period._from_trusted(start) == Period(start=start)
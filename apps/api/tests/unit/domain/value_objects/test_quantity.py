@@ -64,3 +64,11 @@ def test_requires_unit_even_when_value_is_zero():
 
     assert exc.value.field == "Quantity.unit"
     assert "cannot be empty" in exc.value.message
+
+
+################################### TRUSTED CONSTRUCTION:
+
+
+def test_from_trusted_equals_validated_quantity():
+    assert Quantity._from_trusted(6.2, "%") == Quantity(value=6.2, unit="%")
+    assert Quantity._from_trusted() == Quantity()
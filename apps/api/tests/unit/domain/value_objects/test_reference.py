@@ -101,3 +101,13 @@ def test_rejects_non_resource_id():
 
     assert exc.value.field == "Reference.id"
     assert exc.value.message == "must be a ResourceId"
+
+
+################################### TRUSTED CONSTRUCTION:
+
+
+def test_from_trusted_equals_validated_reference():
+    assert Reference._from_trusted(
+        "Patient",
+        ResourceId("pat-001"),
+    ) == Reference(resource_type="Patient", id=ResourceId("pat-001"))
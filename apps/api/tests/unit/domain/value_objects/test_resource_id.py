@@ -46,3 +46,14 @@ def test_resource_id_rejects_non_string_and_exposes_context():
 
     assert exc.value.field == "ResourceId.value"
     assert "string" in exc.value.message
+
+
+################################### TRUSTED CONSTRUCTION:
+
+
+def test_from_trusted_equals_validated_resource_id():
+    assert ResourceId._from_trusted("pat-001") == ResourceId("pat-001")
+
+
+def test_from_trusted_skips_normalization():
+    assert ResourceId._from_trusted(" pat-001 ").value == " pat-001 "
@@ -0,0 +1,162 @@
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from threading import Event, Thread
+
+import pytest
+
+from fhir_gateway.domain.entities.audit_event import AuditAction, AuditEvent
+from fhir_gateway.domain.value_objects.instant import Instant
+from fhir_gateway.domain.value_objects.reference import Reference
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.audit import BatchingAuditEventWriter
+
+
+class RecordingSink:
+    def __init__(self, failures: int = 0) -> None:
+        self.failures = failures
+        self.attempts = 0
+        self.batches: list[list[str]] = []
+        self.written = Event()
+        self.release = Event()
+        self.release.set()
+
+    def write_batch(self, events: Sequence[AuditEvent]) -> None:
+        self.release.wait(timeout=5)
+        self.attempts += 1
+
+        if self.attempts <= self.failures:
+            raise RuntimeError("database unavailable")
+
+        self.batches.append([event.id.value for event in events])
+        self.written.set()
+
+
+def _build_event(index: int) -> AuditEvent:
+    return AuditEvent(
+        id=ResourceId(f"audit-{index:03d}"),
+        recorded=Instant(datetime(2026, 6, 1, tzinfo=timezone.utc)),
+        agent="user-001",
+        action=AuditAction.READ,
+        entity=Reference(resource_type="Patient", id=ResourceId("pat-001")),
+    )
+
+
+def _writer(
+    sink: RecordingSink,
+    *,
+    max_queue_size: int = 100,
+    batch_size: int = 10,
+    flush_interval_seconds: float = 60,
+) -> BatchingAuditEventWriter:
+    return BatchingAuditEventWriter(
+        sink,
+        max_queue_size=max_queue_size,
+        batch_size=batch_size,
+        flush_interval_seconds=flush_interval_seconds,
+        retry_delay_seconds=0.01,
+    )
+
+
+def test_batching_writer_flushes_full_batches():
+    sink = RecordingSink()
+    writer = _writer(sink, batch_size=2)
+
+    for index in range(3):
+        writer.record(_build_event(index))
+
+    assert sink.written.wait(timeout=5)
+
+    writer.close()
+
+    assert sink.batches == [
+        ["audit-000", "audit-001"],
+        ["audit-002"],
+    ]
+
+
+def test_batching_writer_flushes_partial_batch_after_interval():
+    sink = RecordingSink()
+    writer = _writer(sink, flush_interval_seconds=0.05)
+
+    writer.record(_build_event(0))
+
+    assert sink.written.wait(timeout=5)
+    assert sink.batches == [["audit-000"]]
+
+    writer.close()
+
+
+def test_batching_writer_blocks_producers_when_queue_is_full():
+    sink = RecordingSink()
+    sink.release.clear()
+    writer = _writer(sink, max_queue_size=1, batch_size=1)
+
+    writer.record(_build_event(0))
+    writer.record(_build_event(1))
+
+    producer = Thread(target=writer.record, args=(_build_event(2),))
+    producer.start()
+    producer.join(timeout=0.1)
+
+    assert producer.is_alive()
+
+    sink.release.set()
+    producer.join(timeout=5)
+    writer.close()
+
+    assert not producer.is_alive()
+    assert sink.batches == [["audit-000"], ["audit-001"], ["audit-002"]]
+
+
+def test_batching_writer_close_drains_queued_events():
+    sink = RecordingSink()
+    writer = _writer(sink, batch_size=100)
+
+    for index in range(5):
+        writer.record(_build_event(index))
+
+    writer.close()
+
+    assert sink.batches == [[f"audit-{index:03d}" for index in range(5)]]
+    assert writer.pending == 0
+
+
+def test_batching_writer_rejects_events_after_close():
+    writer = _writer(RecordingSink())
+
+    writer.close()
+    writer.close()
+
+    with pytest.raises(RuntimeError, match="closed"):
+        writer.record(_build_event(0))
+
+
+def test_batching_writer_retries_failed_batches(caplog):
+    sink = RecordingSink(failures=2)
+    writer = _writer(sink, batch_size=1)
+
+    writer.record(_build_event(0))
+
+    assert sink.written.wait(timeout=5)
+
+    writer.close()
+
+    assert sink.attempts == 3
+    assert sink.batches == [["audit-000"]]
+    assert "retrying" in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"max_queue_size": 0}, "max_queue_size must be at least 1."),
+        ({"batch_size": 0}, "batch_size must be at least 1."),
+        (
+            {"flush_interval_seconds": 0},
+            "flush_interval_seconds must be greater than 0.",
+        ),
+    ],
+)
+def test_batching_writer_rejects_invalid_bounds(kwargs: dict, message: str):
+    with pytest.raises(ValueError, match=message):
+        _writer(RecordingSink(), **kwargs)
@@ -0,0 +1,322 @@
+import gzip
+import json
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session, sessionmaker
+
+from fhir_gateway.application.models.bulk_export import (
+    BULK_EXPORT_RESOURCE_TYPES,
+    BulkExportJob,
+    BulkExportStatus,
+)
+from fhir_gateway.infrastructure.bulk_export import BulkExportRunner
+from fhir_gateway.infrastructure.bulk_export.encoding import encode_ndjson_batch
+from fhir_gateway.infrastructure.persistence.sqlalchemy import models
+from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    create_session_factory,
+)
+
+CLINICAL_TABLES = [
+    models.PatientRecord.__table__,
+    models.PatientIdentifierRecord.__table__,
+    models.ConditionCodeRecord.__table__,
+    models.ConditionRecord.__table__,
+    models.EncounterRecord.__table__,
+    models.ObservationCodeRecord.__table__,
+    models.ObservationRecord.__table__,
+]
+
+RECORDED_AT = datetime(2026, 1, 1, 9, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def session_factory(tmp_path: Path) -> Iterator[sessionmaker[Session]]:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'export.sqlite3'}")
+    Base.metadata.create_all(engine, tables=CLINICAL_TABLES)
+    session_factory = create_session_factory(engine)
+
+    with session_factory() as session:
+        _seed_clinical_data(session)
+
+    yield session_factory
+
+    engine.dispose()
+
+
+def _seed_clinical_data(session: Session) -> None:
+    session.add_all(
+        [
+            models.ConditionCodeRecord(
+                id=1,
+                system="http://snomed.info/sct",
+                code="44054006",
+                display="Diabetes mellitus type 2",
+            ),
+            models.ObservationCodeRecord(
+                id=1,
+                system="http://loinc.org",
+                code="4548-4",
+                display="Hemoglobin A1c",
+            ),
+        ]
+    )
+
+    for index in range(5):
+        patient_id = f"pat-{index:03d}"
+        session.add_all(
+            [
+                models.PatientRecord(
+                    id=patient_id,
+                    name_family="García",
+                    name_given=["Ana"],
+                    identifiers=[
+                        models.PatientIdentifierRecord(
+                            system="urn:mrn",
+                            value=f"MRN-{index:03d}",
+                        )
+                    ],
+                ),
+                models.ConditionRecord(
+                    id=f"cond-{index:03d}",
+                    patient_id=patient_id,
+                    code_id=1,
+                    recorded_at=RECORDED_AT,
+                ),
+                models.EncounterRecord(
+                    id=f"enc-{index:03d}",
+                    patient_id=patient_id,
+                    period_start_at=RECORDED_AT,
+                    period_end_at=None,
+                ),
+                *(
+                    models.ObservationRecord(
+                        id=f"obs-{index:03d}-{position}",
+                        patient_id=patient_id,
+                        status="final",
+                        code_id=1,
+                        effective_at=RECORDED_AT,
+                        value_quantity=7.0 + position,
+                        value_unit="%",
+                    )
+                    for position in range(3)
+                ),
+            ]
+        )
+
+    session.add(
+        models.ObservationRecord(
+            id="obs-deleted",
+            patient_id="pat-000",
+            status="final",
+            code_id=1,
+            effective_at=RECORDED_AT,
+            value_quantity=1.0,
+            value_unit="%",
+            deleted_at=RECORDED_AT,
+        )
+    )
+    session.commit()
+
+
+def _build_job(
+    resource_types: tuple[str, ...] = BULK_EXPORT_RESOURCE_TYPES,
+    *,
+    gzip: bool = False,
+) -> BulkExportJob:
+    return BulkExportJob(
+        id="job-001",
+        status=BulkExportStatus.IN_PROGRESS,
+        resource_types=resource_types,
+        requested_at=RECORDED_AT,
+        gzip=gzip,
+        started_at=datetime.now(timezone.utc),
+    )
+
+
+def _read_ndjson(path: str) -> list[dict]:
+    opener = gzip.open if path.endswith(".gz") else open
+
+    with opener(path, "rt", encoding="utf-8") as ndjson:
+        return [json.loads(line) for line in ndjson]
+
+
+def test_bulk_export_runner_writes_one_sorted_ndjson_file_per_resource_type(
+    session_factory: sessionmaker[Session],
+    tmp_path: Path,
+):
+    runner = BulkExportRunner(
+        session_factory,
+        output_directory=tmp_path / "exports",
+        batch_size=2,
+    )
+
+    job = runner.run(_build_job())
+
+    assert job.status is BulkExportStatus.COMPLETED
+    assert job.completed_at is not None
+    assert [
+        (output.resource_type, Path(output.path).name, output.resource_count)
+        for output in job.outputs
+    ] == [
+        ("Patient", "Patient.ndjson", 5),
+        ("Condition", "Condition.ndjson", 5),
+        ("Encounter", "Encounter.ndjson", 5),
+        ("Observation", "Observation.ndjson", 15),
+    ]
+    assert job.resource_count == 30
+    assert job.resources_per_second is not None
+
+    observations = _read_ndjson(job.outputs[3].path)
+
+    assert [observation["id"] for observation in observations] == sorted(
+        f"obs-{index:03d}-{position}" for index in range(5) for position in range(3)
+    )
+    assert observations[0]["resourceType"] == "Observation"
+    assert observations[0]["subject"] == {"reference": "Patient/pat-000"}
+    assert observations[0]["code"]["coding"][0]["code"] == "4548-4"
+
+
+def test_bulk_export_runner_exports_patient_identifiers_and_condition_codes(
+    session_factory: sessionmaker[Session],
+    tmp_path: Path,
+):
+    runner = BulkExportRunner(
+        session_factory,
+        output_directory=tmp_path,
+        batch_size=100,
+    )
+
+    job = runner.run(_build_job(("Patient", "Condition")))
+
+    patient = _read_ndjson(job.outputs[0].path)[0]
+    condition = _read_ndjson(job.outputs[1].path)[0]
+
+    assert patient["id"] == "pat-000"
+    assert patient["identifier"] == [{"system": "urn:mrn", "value": "MRN-000"}]
+    assert condition["code"]["coding"][0]["display"] == "Diabetes mellitus type 2"
+
+
+def test_bulk_export_runner_skips_resources_of_deleted_patients(
+    session_factory: sessionmaker[Session],
+    tmp_path: Path,
+):
+    with session_factory() as session:
+        session.get(models.PatientRecord, "pat-001").deleted_at = RECORDED_AT
+        session.commit()
+
+    runner = BulkExportRunner(
+        session_factory,
+        output_directory=tmp_path,
+        batch_size=2,
+    )
+
+    job = runner.run(_build_job())
+
+    assert [output.resource_count for output in job.outputs] == [4, 4, 4, 12]
+
+    for output in job.outputs:
+        for resource in _read_ndjson(output.path):
+            assert "pat-001" not in json.dumps(resource)
+
+
+def test_bulk_export_runner_writes_gzip_files(
+    session_factory: sessionmaker[Session],
+    tmp_path: Path,
+):
+    runner = BulkExportRunner(
+        session_factory,
+        output_directory=tmp_path,
+        batch_size=3,
+    )
+
+    job = runner.run(_build_job(("Encounter",), gzip=True))
+
+    assert job.outputs[0].path.endswith("job-001/Encounter.ndjson.gz")
+    assert len(_read_ndjson(job.outputs[0].path)) == 5
+
+
+def test_bulk_export_runner_encodes_batches_in_a_process_pool(
+    session_factory: sessionmaker[Session],
+    tmp_path: Path,
+):
+    runner = BulkExportRunner(
+        session_factory,
+        output_directory=tmp_path,
+        batch_size=2,
+        max_workers=2,
+    )
+
+    try:
+        job = runner.run(_build_job(("Observation",)))
+    finally:
+        runner.shutdown()
+
+    observations = _read_ndjson(job.outputs[0].path)
+
+    assert job.outputs[0].resource_count == 15
+    assert [observation["id"] for observation in observations] == sorted(
+        observation["id"] for observation in observations
+    )
+
+
+def test_bulk_export_runner_writes_empty_file_when_table_is_empty(tmp_path: Path):
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(engine, tables=CLINICAL_TABLES)
+    runner = BulkExportRunner(
+        create_session_factory(engine),
+        output_directory=tmp_path,
+        batch_size=10,
+    )
+
+    job = runner.run(_build_job(("Patient",)))
+
+    assert job.resource_count == 0
+    assert Path(job.outputs[0].path).read_bytes() == b""
+
+
+@pytest.mark.parametrize(
+    ("batch_size", "max_workers"),
+    [(0, None), (10, 0)],
+)
+def test_bulk_export_runner_rejects_invalid_limits(
+    tmp_path: Path,
+    batch_size: int,
+    max_workers: int | None,
+):
+    with pytest.raises(ValueError):
+        BulkExportRunner(
+            sessionmaker(),
+            output_directory=tmp_path,
+            batch_size=batch_size,
+            max_workers=max_workers,
+        )
+
+
+def test_encode_ndjson_batch_writes_one_resource_per_line():
+    ndjson = encode_ndjson_batch(
+        "Encounter",
+        [
+            {
+                "id": "enc-001",
+                "patient_id": "pat-001",
+                "period_start_at": RECORDED_AT,
+                "period_end_at": None,
+            },
+            {
+                "id": "enc-002",
+                "patient_id": "pat-001",
+                "period_start_at": RECORDED_AT,
+                "period_end_at": None,
+            },
+        ],
+    )
+
+    lines = ndjson.splitlines()
+
+    assert ndjson.endswith(b"\n")
+    assert [json.loads(line)["id"] for line in lines] == ["enc-001", "enc-002"]
@@ -0,0 +1,110 @@
+from dataclasses import replace
+from datetime import datetime, timezone
+from threading import Event
+
+from fhir_gateway.application.models.bulk_export import (
+    BulkExportJob,
+    BulkExportOutput,
+    BulkExportStatus,
+)
+from fhir_gateway.infrastructure.bulk_export import (
+    BackgroundBulkExportScheduler,
+    InMemoryBulkExportJobRepository,
+)
+
+
+class RecordingBulkExportRunner:
+    def __init__(self, error: Exception | None = None) -> None:
+        self.error = error
+        self.received_jobs: list[BulkExportJob] = []
+        self.started = Event()
+        self.release = Event()
+        self.release.set()
+        self.shut_down = False
+
+    def run(self, job: BulkExportJob) -> BulkExportJob:
+        self.received_jobs.append(job)
+        self.started.set()
+        self.release.wait(timeout=5)
+
+        if self.error is not None:
+            raise self.error
+
+        return replace(
+            job,
+            status=BulkExportStatus.COMPLETED,
+            completed_at=datetime.now(timezone.utc),
+            outputs=(BulkExportOutput("Patient", "exports/Patient.ndjson", 3),),
+        )
+
+    def shutdown(self) -> None:
+        self.shut_down = True
+
+
+def _build_job(job_id: str = "job-001") -> BulkExportJob:
+    return BulkExportJob(
+        id=job_id,
+        status=BulkExportStatus.ACCEPTED,
+        resource_types=("Patient",),
+        requested_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_in_memory_bulk_export_job_repository_replaces_saved_job():
+    repository = InMemoryBulkExportJobRepository()
+    job = _build_job()
+
+    repository.save(job)
+    repository.save(replace(job, status=BulkExportStatus.IN_PROGRESS))
+
+    assert repository.get("job-001").status is BulkExportStatus.IN_PROGRESS
+    assert repository.get("job-404") is None
+
+
+def test_background_bulk_export_scheduler_records_completed_job():
+    repository = InMemoryBulkExportJobRepository()
+    runner = RecordingBulkExportRunner()
+    scheduler = BackgroundBulkExportScheduler(runner, repository)
+
+    scheduler.submit(_build_job())
+    scheduler.shutdown()
+
+    job = repository.get("job-001")
+
+    assert runner.received_jobs[0].status is BulkExportStatus.IN_PROGRESS
+    assert runner.received_jobs[0].started_at is not None
+    assert job.status is BulkExportStatus.COMPLETED
+    assert job.resource_count == 3
+    assert runner.shut_down
+
+
+def test_background_bulk_export_scheduler_marks_job_in_progress_while_running():
+    repository = InMemoryBulkExportJobRepository()
+    runner = RecordingBulkExportRunner()
+    runner.release.clear()
+    scheduler = BackgroundBulkExportScheduler(runner, repository)
+
+    scheduler.submit(_build_job())
+
+    try:
+        assert runner.started.wait(timeout=5)
+        assert repository.get("job-001").status is BulkExportStatus.IN_PROGRESS
+    finally:
+        runner.release.set()
+        scheduler.shutdown()
+
+
+def test_background_bulk_export_scheduler_records_failed_job():
+    repository = InMemoryBulkExportJobRepository()
+    runner = RecordingBulkExportRunner(error=OSError("disk full"))
+    scheduler = BackgroundBulkExportScheduler(runner, repository)
+
+    scheduler.submit(_build_job())
+    scheduler.shutdown()
+
+    job = repository.get("job-001")
+
+    assert job.status is BulkExportStatus.FAILED
+    assert job.error == "disk full"
+    assert job.completed_at is not None
+    assert job.outputs == ()
@@ -0,0 +1,70 @@
+import pytest
+
+from fhir_gateway.infrastructure.cache import InMemoryLruCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_cache_returns_stored_value_and_counts_hits_and_misses():
+    cache = InMemoryLruCache(max_entries=2, ttl_seconds=60)
+    value = ("summary",)
+
+    assert cache.get("a") is None
+
+    cache.set("a", value)
+
+    assert cache.get("a") is value
+
+    stats = cache.stats()
+
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_ratio == 0.5
+    assert stats.backend == "memory"
+
+
+def test_lru_cache_evicts_least_recently_used_entry():
+    cache = InMemoryLruCache(max_entries=2, ttl_seconds=60)
+
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats().evictions == 1
+
+
+def test_lru_cache_expires_entries_after_ttl():
+    clock = FakeClock()
+    cache = InMemoryLruCache(max_entries=2, ttl_seconds=10, clock=clock)
+
+    cache.set("a", 1)
+    clock.now = 9.9
+
+    assert cache.get("a") == 1
+
+    clock.now = 10.0
+
+    assert cache.get("a") is None
+    assert cache.stats().entries == 0
+
+
+def test_lru_cache_stats_have_no_hit_ratio_before_lookups():
+    assert InMemoryLruCache(max_entries=1, ttl_seconds=1).stats().hit_ratio is None
+
+
+@pytest.mark.parametrize(
+    ("max_entries", "ttl_seconds"),
+    [(0, 10), (10, 0)],
+)
+def test_lru_cache_rejects_invalid_bounds(max_entries: int, ttl_seconds: float):
+    with pytest.raises(ValueError):
+        InMemoryLruCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
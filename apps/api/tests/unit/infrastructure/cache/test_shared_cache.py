@@ -0,0 +1,73 @@
+import pytest
+
+from fhir_gateway.application.models.patient_summary import PatientSummary
+from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.domain.value_objects.human_name import HumanName
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.cache import InMemoryKeyValueStore, SharedCache
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _build_summary() -> PatientSummary:
+    return PatientSummary(
+        patient=Patient(
+            id=ResourceId("pat-001"),
+            name=HumanName(text="Ana García"),
+        ),
+        conditions=(),
+        encounters=(),
+        observations=(),
+    )
+
+
+def test_shared_cache_round_trips_application_models_through_bytes():
+    store = InMemoryKeyValueStore()
+    cache = SharedCache(store, ttl_seconds=60)
+    summary = _build_summary()
+
+    cache.set("patient-summary:pat-001:v1", summary)
+    cached = cache.get("patient-summary:pat-001:v1")
+
+    assert cached == summary
+    assert cached is not summary
+    assert isinstance(store.get("fhir-gateway:patient-summary:pat-001:v1"), bytes)
+
+
+def test_shared_cache_counts_hits_and_misses():
+    cache = SharedCache(InMemoryKeyValueStore(), ttl_seconds=60)
+
+    cache.get("missing")
+    cache.set("present", 1)
+    cache.get("present")
+
+    stats = cache.stats()
+
+    assert (stats.hits, stats.misses) == (1, 1)
+    assert stats.entries is None
+    assert stats.backend == "shared"
+
+
+def test_in_memory_key_value_store_expires_values():
+    clock = FakeClock()
+    store = InMemoryKeyValueStore(clock=clock)
+
+    store.set("key", b"value", ttl_seconds=5)
+
+    assert store.get("key") == b"value"
+
+    clock.now = 5
+
+    assert store.get("key") is None
+
+
+def test_shared_cache_rejects_non_positive_ttl():
+    with pytest.raises(ValueError):
+        SharedCache(InMemoryKeyValueStore(), ttl_seconds=0)
+
@@ -0,0 +1,117 @@
+from collections.abc import Iterator
+import time
+from threading import Barrier, Lock
+
+import pytest
+
+from fhir_gateway.infrastructure.concurrency import ThreadPoolReadExecutor
+
+
+@pytest.fixture
+def executor() -> Iterator[ThreadPoolReadExecutor]:
+    executor = ThreadPoolReadExecutor(
+        max_workers=4,
+        max_concurrent_reads_per_call=3,
+    )
+
+    try:
+        yield executor
+    finally:
+        executor.shutdown()
+
+
+def test_run_all_returns_results_in_read_order(executor: ThreadPoolReadExecutor):
+    results = executor.run_all(
+        (
+            lambda: "conditions",
+            lambda: "encounters",
+            lambda: "observations",
+        )
+    )
+
+    assert results == ("conditions", "encounters", "observations")
+
+
+def test_run_all_runs_reads_in_parallel(executor: ThreadPoolReadExecutor):
+    # Each read waits until all three are running, so sequential execution
+    # would break the barrier instead of returning.
+    barrier = Barrier(3, timeout=5)
+
+    def read() -> int:
+        return barrier.wait()
+
+    results = executor.run_all((read, read, read))
+
+    assert sorted(results) == [0, 1, 2]
+
+
+def test_run_all_limits_concurrent_reads_per_call():
+    executor = ThreadPoolReadExecutor(
+        max_workers=8,
+        max_concurrent_reads_per_call=2,
+    )
+    lock = Lock()
+    running = 0
+    max_running = 0
+
+    def read() -> None:
+        nonlocal running, max_running
+
+        with lock:
+            running += 1
+            max_running = max(max_running, running)
+
+        try:
+            time.sleep(0.01)
+        finally:
+            with lock:
+                running -= 1
+
+    try:
+        executor.run_all([read] * 10)
+    finally:
+        executor.shutdown()
+
+    assert 1 <= max_running <= 2
+
+
+def test_run_all_waits_for_every_read_before_raising(
+    executor: ThreadPoolReadExecutor,
+):
+    finished: list[str] = []
+    barrier = Barrier(2, timeout=5)
+
+    def failing_read() -> None:
+        barrier.wait()
+        raise RuntimeError("read failed")
+
+    def slow_read() -> None:
+        barrier.wait()
+        finished.append("slow")
+
+    with pytest.raises(RuntimeError, match="read failed"):
+        executor.run_all((failing_read, slow_read))
+
+    assert finished == ["slow"]
+
+
+def test_run_all_accepts_no_reads(executor: ThreadPoolReadExecutor):
+    assert executor.run_all(()) == ()
+
+
+@pytest.mark.parametrize(
+    ("max_workers", "max_concurrent_reads_per_call"),
+    [
+        (0, 1),
+        (1, 0),
+    ],
+)
+def test_executor_rejects_non_positive_limits(
+    max_workers: int,
+    max_concurrent_reads_per_call: int,
+):
+    with pytest.raises(ValueError):
+        ThreadPoolReadExecutor(
+            max_workers=max_workers,
+            max_concurrent_reads_per_call=max_concurrent_reads_per_call,
+        )
@@ -0,0 +1,83 @@
+from collections.abc import Sequence
+
+import pytest
+
+from fhir_gateway.domain.entities.condition import Condition
+from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.infrastructure.ingestion.pipeline import BulkIngestion
+from fhir_gateway.infrastructure.serialization.errors import FhirDecodingError
+
+
+class RecordingSink:
+    def __init__(self) -> None:
+        self.batches: list[list[object]] = []
+
+    def write_batch(self, resources: Sequence[object]) -> None:
+        self.batches.append(list(resources))
+
+
+def _patient(index: int) -> dict:
+    return {"resourceType": "Patient", "id": f"pat-{index:03d}"}
+
+
+def _condition(index: int) -> dict:
+    return {
+        "resourceType": "Condition",
+        "id": f"con-{index:03d}",
+        "code": {"coding": [{"system": "http://snomed.info/sct", "code": "1"}]},
+        "subject": {"reference": "Patient/pat-000"},
+    }
+
+
+def test_ingest_writes_decoded_resources_in_batches():
+    sink = RecordingSink()
+    resources = [_patient(0), _patient(1), _condition(0), _condition(1), _patient(2)]
+
+    report = BulkIngestion(sink, batch_size=2).ingest(resources)
+
+    assert [len(batch) for batch in sink.batches] == [2, 2, 1]
+    assert [type(resource) for resource in sink.batches[1]] == [Condition, Condition]
+    assert isinstance(sink.batches[2][0], Patient)
+    assert report.resources_by_type == {"Patient": 3, "Condition": 2}
+    assert report.resources == 5
+    assert report.batches == 3
+
+
+def test_ingest_consumes_resources_lazily():
+    sink = RecordingSink()
+
+    def resources():
+        yield _patient(0)
+        assert len(sink.batches) == 0
+        yield _patient(1)
+        assert len(sink.batches) == 1
+        yield _patient(2)
+
+    BulkIngestion(sink, batch_size=2).ingest(resources())
+
+    assert len(sink.batches) == 2
+
+
+def test_ingest_reports_nothing_for_empty_input():
+    sink = RecordingSink()
+
+    report = BulkIngestion(sink).ingest([])
+
+    assert sink.batches == []
+    assert report.resources == 0
+    assert report.batches == 0
+
+
+def test_ingest_stops_at_the_first_invalid_resource_keeping_earlier_batches():
+    sink = RecordingSink()
+    resources = [_patient(0), _patient(1), {"resourceType": "Patient"}]
+
+    with pytest.raises(FhirDecodingError):
+        BulkIngestion(sink, batch_size=1).ingest(resources)
+
+    assert [batch[0].id.value for batch in sink.batches] == ["pat-000", "pat-001"]
+
+
+def test_bulk_ingestion_rejects_non_positive_batch_size():
+    with pytest.raises(ValueError, match="batch_size must be at least 1."):
+        BulkIngestion(RecordingSink(), batch_size=0)
@@ -0,0 +1,93 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from fhir_gateway.infrastructure.ingestion.sources import (
+    iter_bundle_resources,
+    iter_fhir_file,
+    iter_ndjson_resources,
+)
+from fhir_gateway.infrastructure.serialization.errors import FhirDecodingError
+
+PATIENT = {"resourceType": "Patient", "id": "pat-001"}
+CONDITION = {"resourceType": "Condition", "id": "con-001"}
+
+
+def _bundle(*resources: dict) -> dict:
+    return {
+        "resourceType": "Bundle",
+        "type": "collection",
+        "entry": [{"resource": resource} for resource in resources],
+    }
+
+
+def test_iter_ndjson_resources_yields_one_resource_per_line():
+    lines = [json.dumps(PATIENT), "", "  \n", json.dumps(CONDITION).encode()]
+
+    assert list(iter_ndjson_resources(lines)) == [PATIENT, CONDITION]
+
+
+def test_iter_ndjson_resources_expands_bundle_lines():
+    lines = [json.dumps(_bundle(PATIENT, CONDITION))]
+
+    assert list(iter_ndjson_resources(lines)) == [PATIENT, CONDITION]
+
+
+def test_iter_ndjson_resources_reports_the_invalid_line():
+    resources = iter_ndjson_resources([json.dumps(PATIENT), "{not json"])
+
+    assert next(resources) == PATIENT
+
+    with pytest.raises(FhirDecodingError, match="Line 2 is not valid JSON"):
+        next(resources)
+
+
+def test_iter_bundle_resources_expands_nested_bundles():
+    bundle = _bundle(PATIENT, _bundle(CONDITION))
+
+    assert list(iter_bundle_resources(bundle)) == [PATIENT, CONDITION]
+
+
+@pytest.mark.parametrize(
+    ("bundle", "message"),
+    [
+        (PATIENT, "Expected a FHIR Bundle."),
+        ([], "Expected a FHIR Bundle."),
+        (
+            {"resourceType": "Bundle", "entry": [{"fullUrl": "urn:uuid:1"}]},
+            "Every Bundle entry must hold a resource.",
+        ),
+    ],
+)
+def test_iter_bundle_resources_rejects_invalid_bundles(bundle, message):
+    with pytest.raises(FhirDecodingError, match=message):
+        list(iter_bundle_resources(bundle))
+
+
+def test_iter_fhir_file_streams_ndjson_files(tmp_path: Path):
+    path = tmp_path / "Patient.ndjson"
+    path.write_text(f"{json.dumps(PATIENT)}\n{json.dumps(CONDITION)}\n")
+
+    assert list(iter_fhir_file(path)) == [PATIENT, CONDITION]
+
+
+@pytest.mark.parametrize(
+    ("document", "expected"),
+    [(_bundle(PATIENT, CONDITION), [PATIENT, CONDITION]), (PATIENT, [PATIENT])],
+)
+def test_iter_fhir_file_reads_json_bundles_and_single_resources(
+    tmp_path: Path, document, expected
+):
+    path = tmp_path / "bundle.json"
+    path.write_text(json.dumps(document))
+
+    assert list(iter_fhir_file(path)) == expected
+
+
+def test_iter_fhir_file_rejects_invalid_json_documents(tmp_path: Path):
+    path = tmp_path / "bundle.json"
+    path.write_text("{not json")
+
+    with pytest.raises(FhirDecodingError, match="bundle.json is not valid JSON"):
+        list(iter_fhir_file(path))
@@ -0,0 +1,360 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from fhir_gateway.application.models.audit_events import AuditEventFilters
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    AsyncSqlAlchemyAuditEventReader,
+    AsyncSqlAlchemyConditionReader,
+    AsyncSqlAlchemyEncounterReader,
+    AsyncSqlAlchemyObservationReader,
+    AsyncSqlAlchemyPatientReader,
+    AsyncSqlAlchemyPatientSummaryReader,
+    AsyncSqlAlchemyPatientVersionReader,
+    SqlAlchemyAuditEventReader,
+    SqlAlchemyConditionReader,
+    SqlAlchemyEncounterReader,
+    SqlAlchemyObservationReader,
+    SqlAlchemyPatientReader,
+    SqlAlchemyPatientSummaryReader,
+    SqlAlchemyPatientVersionReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
+from fhir_gateway.infrastructure.persistence.sqlalchemy.code_catalog import (
+    CodeCatalog,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    create_async_database_engine,
+    create_async_session_factory,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.audit_event import (
+    AuditEventRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.condition import (
+    ConditionCodeRecord,
+    ConditionRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.encounter import (
+    EncounterRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.observation import (
+    ObservationCodeRecord,
+    ObservationRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.patient import (
+    PatientIdentifierRecord,
+    PatientRecord,
+)
+
+pytest.importorskip("aiosqlite")
+
+PATIENT_ID = ResourceId("pat-001")
+
+HBA1C = Code(system="http://loinc.org", code="4548-4")
+
+
+def _utc(year: int, month: int, day: int) -> datetime:
+    return datetime(year, month, day, 10, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def database_path(tmp_path: Path) -> Iterator[Path]:
+    # The async engine opens its own connections, so the fixture data lives
+    # in a SQLite file rather than an in-memory database.
+    path = tmp_path / "fhir_gateway.sqlite3"
+    engine = create_engine(f"sqlite+pysqlite:///{path}")
+
+    @event.listens_for(engine, "connect")
+    def _register_sqlite_btrim(dbapi_connection, connection_record):
+        dbapi_connection.create_function(
+            "btrim",
+            1,
+            lambda value: value.strip() if value is not None else None,
+        )
+
+    Base.metadata.create_all(engine)
+
+    with sessionmaker(bind=engine)() as session:
+        _seed_patient_chart(session)
+
+    yield path
+
+    engine.dispose()
+
+
+def _seed_patient_chart(session: Session) -> None:
+    condition_code = ConditionCodeRecord(
+        system="http://snomed.info/sct",
+        code="44054006",
+    )
+    observation_code = ObservationCodeRecord(
+        system=HBA1C.system,
+        code=HBA1C.code,
+    )
+
+    session.add_all(
+        [
+            PatientRecord(
+                id="pat-001",
+                name_text="Ana García",
+                identifiers=[
+                    PatientIdentifierRecord(
+                        system="https://hospital.example.org/mrn",
+                        value="MRN-001",
+                    ),
+                ],
+            ),
+            condition_code,
+            observation_code,
+            AuditEventRecord(
+                id="audit-001",
+                recorded_at=_utc(2026, 6, 1),
+                agent="system",
+                action="read",
+                entity_resource_type="Patient",
+                entity_id="pat-001",
+            ),
+        ]
+    )
+    session.flush()
+
+    session.add_all(
+        [
+            ConditionRecord(
+                id="con-001",
+                patient_id="pat-001",
+                code_id=condition_code.id,
+                recorded_at=_utc(2026, 1, 15),
+            ),
+            EncounterRecord(
+                id="enc-001",
+                patient_id="pat-001",
+                period_start_at=_utc(2026, 1, 10),
+            ),
+            ObservationRecord(
+                id="obs-001",
+                patient_id="pat-001",
+                status="final",
+                code_id=observation_code.id,
+                effective_at=_utc(2026, 1, 12),
+                value_quantity=7.2,
+                value_unit="%",
+            ),
+        ]
+    )
+    session.commit()
+
+
+def _catalog(record_type: type) -> CodeCatalog:
+    return CodeCatalog(record_type, max_entries=10, refresh_interval_seconds=60)
+
+
+def _read_sync(database_path: Path, read: Callable[[Session], object]) -> object:
+    engine = create_engine(f"sqlite+pysqlite:///{database_path}")
+
+    try:
+        with sessionmaker(bind=engine)() as session:
+            return read(session)
+    finally:
+        engine.dispose()
+
+
+def _read_async(
+    database_path: Path,
+    read: Callable[[object], Awaitable[object]],
+) -> object:
+    async def run() -> object:
+        engine = create_async_database_engine(
+            f"sqlite+aiosqlite:///{database_path}"
+        )
+
+        try:
+            async with create_async_session_factory(engine)() as session:
+                return await read(session)
+        finally:
+            await engine.dispose()
+
+    return asyncio.run(run())
+
+
+@pytest.mark.parametrize(
+    ("sync_read", "async_read"),
+    [
+        (
+            lambda session: SqlAlchemyPatientReader(session).get_by_id(PATIENT_ID),
+            lambda session: AsyncSqlAlchemyPatientReader(session).get_by_id(
+                PATIENT_ID
+            ),
+        ),
+        (
+            lambda session: SqlAlchemyPatientReader(session).search_by_text(
+                "mrn",
+                limit=10,
+            ),
+            lambda session: AsyncSqlAlchemyPatientReader(session).search_by_text(
+                "mrn",
+                limit=10,
+            ),
+        ),
+        (
+            lambda session: SqlAlchemyConditionReader(session).list_by_patient(
+                PATIENT_ID
+            ),
+            lambda session: AsyncSqlAlchemyConditionReader(
+                session
+            ).list_by_patient(PATIENT_ID),
+        ),
+        (
+            lambda session: SqlAlchemyEncounterReader(session).list_by_patient(
+                PATIENT_ID
+            ),
+            lambda session: AsyncSqlAlchemyEncounterReader(
+                session
+            ).list_by_patient(PATIENT_ID),
+        ),
+        (
+            lambda session: SqlAlchemyObservationReader(session).list_by_patient(
+                PATIENT_ID
+            ),
+            lambda session: AsyncSqlAlchemyObservationReader(
+                session
+            ).list_by_patient(PATIENT_ID),
+        ),
+        (
+            lambda session: SqlAlchemyObservationReader(
+                session
+            ).list_by_patient_and_code(PATIENT_ID, HBA1C),
+            lambda session: AsyncSqlAlchemyObservationReader(
+                session
+            ).list_by_patient_and_code(PATIENT_ID, HBA1C),
+        ),
+        (
+            lambda session: SqlAlchemyObservationReader(
+                session
+            ).list_series_by_patient_and_code(PATIENT_ID, HBA1C),
+            lambda session: AsyncSqlAlchemyObservationReader(
+                session
+            ).list_series_by_patient_and_code(PATIENT_ID, HBA1C),
+        ),
+        (
+            lambda session: SqlAlchemyConditionReader(
+                session,
+                _catalog(ConditionCodeRecord),
+            ).list_by_patient(PATIENT_ID),
+            lambda session: AsyncSqlAlchemyConditionReader(
+                session,
+                _catalog(ConditionCodeRecord),
+            ).list_by_patient(PATIENT_ID),
+        ),
+        (
+            lambda session: SqlAlchemyObservationReader(
+                session,
+                _catalog(ObservationCodeRecord),
+            ).list_by_patient(PATIENT_ID),
+            lambda session: AsyncSqlAlchemyObservationReader(
+                session,
+                _catalog(ObservationCodeRecord),
+            ).list_by_patient(PATIENT_ID),
+        ),
+        (
+            lambda session: SqlAlchemyObservationReader(
+                session,
+                _catalog(ObservationCodeRecord),
+            ).list_by_patient_and_code(PATIENT_ID, HBA1C),
+            lambda session: AsyncSqlAlchemyObservationReader(
+                session,
+                _catalog(ObservationCodeRecord),
+            ).list_by_patient_and_code(PATIENT_ID, HBA1C),
+        ),
+        (
+            lambda session: SqlAlchemyObservationReader(
+                session,
+                _catalog(ObservationCodeRecord),
+            ).list_series_by_patient_and_code(PATIENT_ID, HBA1C),
+            lambda session: AsyncSqlAlchemyObservationReader(
+                session,
+                _catalog(ObservationCodeRecord),
+            ).list_series_by_patient_and_code(PATIENT_ID, HBA1C),
+        ),
+        (
+            lambda session: SqlAlchemyAuditEventReader(session).list_recent(10),
+            lambda session: AsyncSqlAlchemyAuditEventReader(session).list_recent(
+                10
+            ),
+        ),
+        (
+            lambda session: SqlAlchemyAuditEventReader(session).list_page(
+                limit=10,
+                filters=AuditEventFilters(agent="system"),
+            ),
+            lambda session: AsyncSqlAlchemyAuditEventReader(session).list_page(
+                limit=10,
+                filters=AuditEventFilters(agent="system"),
+            ),
+        ),
+        (
+            lambda session: SqlAlchemyPatientSummaryReader(session).get_summary(
+                PATIENT_ID
+            ),
+            lambda session: AsyncSqlAlchemyPatientSummaryReader(
+                session
+            ).get_summary(PATIENT_ID),
+        ),
+        (
+            lambda session: SqlAlchemyPatientVersionReader(session).get_version(
+                PATIENT_ID
+            ),
+            lambda session: AsyncSqlAlchemyPatientVersionReader(
+                session
+            ).get_version(PATIENT_ID),
+        ),
+    ],
+    ids=[
+        "patient-by-id",
+        "patient-search",
+        "conditions",
+        "encounters",
+        "observations",
+        "observations-by-code",
+        "observation-series",
+        "conditions-code-catalog",
+        "observations-code-catalog",
+        "observations-by-code-code-catalog",
+        "observation-series-code-catalog",
+        "audit-events",
+        "audit-events-page",
+        "patient-summary",
+        "patient-version",
+    ],
+)
+def test_async_reader_returns_same_result_as_sync_reader(
+    database_path: Path,
+    sync_read: Callable[[Session], object],
+    async_read: Callable[[object], Awaitable[object]],
+):
+    expected = _read_sync(database_path, sync_read)
+
+    result = _read_async(database_path, async_read)
+
+    assert result == expected
+    assert result not in (None, ())
+
+
+def test_async_patient_reader_returns_none_when_patient_does_not_exist(
+    database_path: Path,
+):
+    patient = _read_async(
+        database_path,
+        lambda session: AsyncSqlAlchemyPatientReader(session).get_by_id(
+            ResourceId("missing-patient")
+        ),
+    )
+
+    assert patient is None
@@ -1,11 +1,16 @@
 from collections.abc import Iterator
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 import pytest
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
+from fhir_gateway.application.models.audit_events import (
+    AuditEventCursor,
+    AuditEventFilters,
+)
 from fhir_gateway.domain.entities.audit_event import AuditAction, AuditEvent
+from fhir_gateway.domain.value_objects.instant import Instant
 from fhir_gateway.domain.value_objects.resource_id import ResourceId
 from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.audit_event_reader import (
     SqlAlchemyAuditEventReader,
@@ -293,3 +298,289 @@ def test_list_recent_maps_supported_entity_resource_types(session: Session):
         "Observation",
         "Patient",
     )
+
+
+def _audit_event_records_per_day(days: int) -> list[AuditEventRecord]:
+    return [
+        AuditEventRecord(
+            id=f"audit-{day:03d}",
+            recorded_at=datetime(2026, 6, 1, 10, 0, tzinfo=timezone.utc)
+            + timedelta(days=day),
+            agent="system",
+            action="read",
+            entity_resource_type="Patient",
+            entity_id="pat-001",
+        )
+        for day in range(days)
+    ]
+
+
+@pytest.fixture
+def statements(session: Session) -> Iterator[list[str]]:
+    recorded: list[str] = []
+    engine = session.get_bind()
+
+    def record_statement(_conn, _cursor, statement, *_args) -> None:
+        recorded.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+
+    yield recorded
+
+    event.remove(engine, "before_cursor_execute", record_statement)
+
+
+def test_list_recent_reads_only_recent_window_when_it_fills_the_page(
+    session: Session,
+    statements: list[str],
+):
+    records = _audit_event_records_per_day(10)
+    session.add_all(records)
+    session.flush()
+    _restore_sqlite_datetime_timezone(*records)
+    statements.clear()
+
+    reader = SqlAlchemyAuditEventReader(
+        session,
+        recent_window=timedelta(days=3),
+        clock=lambda: datetime(2026, 6, 10, 12, 0, tzinfo=timezone.utc),
+    )
+
+    audit_events = reader.list_recent(limit=2)
+
+    assert tuple(event.id.value for event in audit_events) == (
+        "audit-009",
+        "audit-008",
+    )
+    assert len(statements) == 1
+    assert "recorded_at >=" in statements[0]
+
+
+def test_list_recent_falls_back_to_whole_table_when_window_is_short(
+    session: Session,
+    statements: list[str],
+):
+    records = _audit_event_records_per_day(10)
+    session.add_all(records)
+    session.flush()
+    _restore_sqlite_datetime_timezone(*records)
+    statements.clear()
+
+    reader = SqlAlchemyAuditEventReader(
+        session,
+        recent_window=timedelta(days=3),
+        clock=lambda: datetime(2026, 6, 10, 12, 0, tzinfo=timezone.utc),
+    )
+
+    audit_events = reader.list_recent(limit=5)
+
+    assert tuple(event.id.value for event in audit_events) == (
+        "audit-009",
+        "audit-008",
+        "audit-007",
+        "audit-006",
+        "audit-005",
+    )
+    assert len(statements) == 2
+    assert "recorded_at >=" not in statements[1]
+
+
+def _audit_event_record(
+    audit_event_id: str,
+    recorded_at: datetime,
+    *,
+    agent: str = "system",
+    action: str = "read",
+    entity_resource_type: str = "Patient",
+    entity_id: str = "pat-001",
+) -> AuditEventRecord:
+    return AuditEventRecord(
+        id=audit_event_id,
+        recorded_at=recorded_at,
+        agent=agent,
+        action=action,
+        entity_resource_type=entity_resource_type,
+        entity_id=entity_id,
+    )
+
+
+def _add_records(session: Session, *records: AuditEventRecord) -> None:
+    session.add_all(records)
+    session.flush()
+    _restore_sqlite_datetime_timezone(*records)
+
+
+def test_list_page_walks_all_events_with_cursors(session: Session):
+    tied_at = datetime(2026, 6, 2, 10, 0, tzinfo=timezone.utc)
+    _add_records(
+        session,
+        _audit_event_record(
+            "audit-001",
+            datetime(2026, 6, 1, 10, 0, tzinfo=timezone.utc),
+        ),
+        _audit_event_record("audit-002", tied_at),
+        _audit_event_record("audit-003", tied_at),
+        _audit_event_record("audit-004", tied_at),
+        _audit_event_record(
+            "audit-005",
+            datetime(2026, 6, 3, 10, 0, tzinfo=timezone.utc),
+        ),
+    )
+    reader = SqlAlchemyAuditEventReader(session)
+    pages = []
+    after = None
+
+    while True:
+        page = reader.list_page(limit=2, filters=AuditEventFilters(), after=after)
+        pages.append(tuple(event.id.value for event in page.events))
+
+        if page.next_cursor is None:
+            break
+
+        after = page.next_cursor
+
+    assert pages == [
+        ("audit-005", "audit-002"),
+        ("audit-003", "audit-004"),
+        ("audit-001",),
+    ]
+
+
+def test_list_page_returns_cursor_of_last_event_only_when_more_exist(
+    session: Session,
+):
+    _add_records(session, *_audit_event_records_per_day(3))
+    reader = SqlAlchemyAuditEventReader(session)
+
+    first_page = reader.list_page(limit=2, filters=AuditEventFilters())
+    whole_page = reader.list_page(limit=3, filters=AuditEventFilters())
+
+    assert first_page.next_cursor == AuditEventCursor(
+        recorded=Instant(datetime(2026, 6, 2, 10, 0, tzinfo=timezone.utc)),
+        event_id=ResourceId("audit-001"),
+    )
+    assert whole_page.next_cursor is None
+
+
+@pytest.mark.parametrize(
+    ("filters", "expected_ids"),
+    [
+        (AuditEventFilters(agent="doctor.alvarez"), ("audit-003", "audit-001")),
+        (AuditEventFilters(action=AuditAction.SEARCH), ("audit-002",)),
+        (
+            AuditEventFilters(entity_resource_type="Observation"),
+            ("audit-004", "audit-003"),
+        ),
+        (
+            AuditEventFilters(
+                entity_resource_type="Observation",
+                entity_id=ResourceId("obs-002"),
+            ),
+            ("audit-004",),
+        ),
+        (
+            AuditEventFilters(
+                recorded_since=Instant(
+                    datetime(2026, 6, 2, 10, 0, tzinfo=timezone.utc)
+                ),
+                recorded_before=Instant(
+                    datetime(2026, 6, 4, 10, 0, tzinfo=timezone.utc)
+                ),
+            ),
+            ("audit-003", "audit-002"),
+        ),
+    ],
+    ids=["agent", "action", "entity-type", "entity", "time-range"],
+)
+def test_list_page_applies_filters(
+    session: Session,
+    filters: AuditEventFilters,
+    expected_ids: tuple[str, ...],
+):
+    _add_records(
+        session,
+        _audit_event_record(
+            "audit-001",
+            datetime(2026, 6, 1, 10, 0, tzinfo=timezone.utc),
+            agent="doctor.alvarez",
+        ),
+        _audit_event_record(
+            "audit-002",
+            datetime(2026, 6, 2, 10, 0, tzinfo=timezone.utc),
+            action="search",
+        ),
+        _audit_event_record(
+            "audit-003",
+            datetime(2026, 6, 3, 10, 0, tzinfo=timezone.utc),
+            agent="doctor.alvarez",
+            entity_resource_type="Observation",
+            entity_id="obs-001",
+        ),
+        _audit_event_record(
+            "audit-004",
+            datetime(2026, 6, 4, 10, 0, tzinfo=timezone.utc),
+            entity_resource_type="Observation",
+            entity_id="obs-002",
+        ),
+    )
+    reader = SqlAlchemyAuditEventReader(session)
+
+    page = reader.list_page(limit=10, filters=filters)
+
+    assert tuple(event.id.value for event in page.events) == expected_ids
+
+
+def test_list_page_anchors_recent_window_at_cursor(
+    session: Session,
+    statements: list[str],
+):
+    _add_records(session, *_audit_event_records_per_day(10))
+    statements.clear()
+
+    reader = SqlAlchemyAuditEventReader(
+        session,
+        recent_window=timedelta(days=3),
+        clock=lambda: datetime(2027, 1, 1, tzinfo=timezone.utc),
+    )
+
+    page = reader.list_page(
+        limit=2,
+        filters=AuditEventFilters(),
+        after=AuditEventCursor(
+            recorded=Instant(datetime(2026, 6, 6, 10, 0, tzinfo=timezone.utc)),
+            event_id=ResourceId("audit-005"),
+        ),
+    )
+
+    assert tuple(event.id.value for event in page.events) == (
+        "audit-004",
+        "audit-003",
+    )
+    assert len(statements) == 1
+
+
+def test_list_page_skips_recent_window_when_time_range_is_narrower(
+    session: Session,
+    statements: list[str],
+):
+    _add_records(session, *_audit_event_records_per_day(10))
+    statements.clear()
+
+    reader = SqlAlchemyAuditEventReader(
+        session,
+        recent_window=timedelta(days=31),
+        clock=lambda: datetime(2026, 6, 10, 12, 0, tzinfo=timezone.utc),
+    )
+
+    page = reader.list_page(
+        limit=5,
+        filters=AuditEventFilters(
+            recorded_since=Instant(datetime(2026, 6, 9, tzinfo=timezone.utc)),
+        ),
+    )
+
+    assert tuple(event.id.value for event in page.events) == (
+        "audit-009",
+        "audit-008",
+    )
+    assert len(statements) == 1
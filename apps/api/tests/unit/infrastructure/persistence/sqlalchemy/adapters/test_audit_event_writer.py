@@ -0,0 +1,118 @@
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from fhir_gateway.domain.entities.audit_event import AuditAction, AuditEvent
+from fhir_gateway.domain.value_objects.instant import Instant
+from fhir_gateway.domain.value_objects.reference import Reference
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.audit_event_reader import (
+    SqlAlchemyAuditEventReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.audit_event_writer import (
+    SqlAlchemyAuditEventBatchWriter,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.audit_event import (
+    AuditEventRecord,
+)
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+
+    @event.listens_for(engine, "connect")
+    def _register_sqlite_btrim(dbapi_connection, connection_record):
+        dbapi_connection.create_function(
+            "btrim",
+            1,
+            lambda value: value.strip() if value is not None else None,
+        )
+
+    Base.metadata.create_all(engine, tables=[AuditEventRecord.__table__])
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine: Engine) -> sessionmaker[Session]:
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+def _audit_event(index: int) -> AuditEvent:
+    return AuditEvent(
+        id=ResourceId(f"audit-{index:03d}"),
+        recorded=Instant(
+            datetime(2026, 6, 1, tzinfo=timezone.utc) + timedelta(minutes=index)
+        ),
+        agent="user-001",
+        action=AuditAction.READ,
+        entity=Reference(resource_type="Patient", id=ResourceId("pat-001")),
+    )
+
+
+def test_write_batch_inserts_all_events_in_one_transaction(
+    engine: Engine,
+    session_factory: sessionmaker[Session],
+):
+    statements: list[str] = []
+
+    def record_statement(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    events = [_audit_event(index) for index in range(3)]
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+
+    try:
+        SqlAlchemyAuditEventBatchWriter(session_factory).write_batch(events)
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+    with session_factory() as session:
+        stored = SqlAlchemyAuditEventReader(session).list_recent(10)
+
+    assert stored == tuple(reversed(events))
+    assert len(statements) == 1
+    assert statements[0].startswith("INSERT INTO audit_events")
+
+
+def test_write_batch_ignores_empty_batches(
+    engine: Engine,
+    session_factory: sessionmaker[Session],
+):
+    statements: list[str] = []
+
+    def record_statement(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+
+    try:
+        SqlAlchemyAuditEventBatchWriter(session_factory).write_batch([])
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+    assert statements == []
+
+
+def test_write_batch_rolls_back_the_whole_batch_on_failure(
+    session_factory: sessionmaker[Session],
+):
+    writer = SqlAlchemyAuditEventBatchWriter(session_factory)
+    writer.write_batch([_audit_event(1)])
+
+    with pytest.raises(IntegrityError):
+        writer.write_batch([_audit_event(2), _audit_event(1)])
+
+    with session_factory() as session:
+        stored = SqlAlchemyAuditEventReader(session).list_recent(10)
+
+    assert [audit_event.id.value for audit_event in stored] == ["audit-001"]
@@ -12,6 +12,9 @@ from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.condition_reade
     SqlAlchemyConditionReader,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
+from fhir_gateway.infrastructure.persistence.sqlalchemy.code_catalog import (
+    CodeCatalog,
+)
 from fhir_gateway.infrastructure.persistence.sqlalchemy.models.condition import (
     ConditionCodeRecord,
     ConditionRecord,
@@ -287,3 +290,115 @@ def test_list_by_patient_maps_condition_without_recorded_at(
 
     assert len(conditions) == 1
     assert conditions[0].recorded_date is None
+
+
+def test_stream_by_patient_yields_same_conditions_as_list_by_patient(
+    session: Session,
+):
+    patient = PatientRecord(id="pat-001", name_text="John Smith")
+    code = ConditionCodeRecord(
+        system="http://snomed.info/sct",
+        code="44054006",
+        display="Diabetes mellitus type 2",
+    )
+
+    session.add_all([patient, code])
+    session.flush()
+
+    session.add_all(
+        [
+            ConditionRecord(
+                id=f"con-{index:03d}",
+                patient_id="pat-001",
+                code_id=code.id,
+                recorded_at=datetime(2026, 6, 5 - index, tzinfo=timezone.utc),
+                deleted_at=(
+                    datetime(2026, 7, 1, tzinfo=timezone.utc)
+                    if index == 1
+                    else None
+                ),
+            )
+            for index in range(4)
+        ]
+    )
+    session.flush()
+
+    reader = SqlAlchemyConditionReader(session)
+
+    streamed = tuple(reader.stream_by_patient(ResourceId("pat-001")))
+
+    assert streamed == reader.list_by_patient(ResourceId("pat-001"))
+    assert tuple(condition.id.value for condition in streamed) == (
+        "con-003",
+        "con-002",
+        "con-000",
+    )
+
+
+def test_code_catalog_reads_match_joined_reads_and_share_codes(
+    session: Session,
+):
+    patient = PatientRecord(id="pat-001", name_text="John Smith")
+    code = ConditionCodeRecord(
+        system="http://snomed.info/sct",
+        code="44054006",
+        display="Diabetes mellitus type 2",
+    )
+
+    session.add_all([patient, code])
+    session.flush()
+
+    session.add_all(
+        [
+            ConditionRecord(
+                id=f"con-{index:03d}",
+                patient_id="pat-001",
+                code_id=code.id,
+                recorded_at=datetime(2026, 6, 1 + index, tzinfo=timezone.utc),
+            )
+            for index in range(3)
+        ]
+    )
+    session.flush()
+
+    patient_id = ResourceId("pat-001")
+    catalog_reader = SqlAlchemyConditionReader(
+        session,
+        CodeCatalog(
+            ConditionCodeRecord,
+            max_entries=10,
+            refresh_interval_seconds=60,
+        ),
+    )
+
+    conditions = catalog_reader.list_by_patient(patient_id)
+
+    assert conditions == SqlAlchemyConditionReader(session).list_by_patient(
+        patient_id
+    )
+    assert tuple(catalog_reader.stream_by_patient(patient_id)) == conditions
+    assert conditions[0].code is conditions[1].code is conditions[2].code
+
+
+def test_code_catalog_reads_drop_conditions_without_code_row_like_joined_reads(
+    session: Session,
+):
+    session.add(PatientRecord(id="pat-001", name_text="John Smith"))
+    session.flush()
+    # SQLite does not enforce the foreign key, which stands in for a code
+    # row deleted between the condition read and the code lookup.
+    session.add(ConditionRecord(id="con-001", patient_id="pat-001", code_id=99))
+    session.flush()
+
+    patient_id = ResourceId("pat-001")
+    catalog_reader = SqlAlchemyConditionReader(
+        session,
+        CodeCatalog(
+            ConditionCodeRecord,
+            max_entries=10,
+            refresh_interval_seconds=60,
+        ),
+    )
+
+    assert catalog_reader.list_by_patient(patient_id) == ()
+    assert SqlAlchemyConditionReader(session).list_by_patient(patient_id) == ()
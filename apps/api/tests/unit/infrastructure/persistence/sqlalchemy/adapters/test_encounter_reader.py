@@ -262,3 +262,30 @@ def test_list_by_patient_maps_encounter_without_period_end(
 
     assert len(encounters) == 1
     assert encounters[0].period.end is None
+
+
+def test_stream_by_patient_yields_same_encounters_as_list_by_patient(
+    session: Session,
+):
+    session.add(PatientRecord(id="pat-001", name_text="John Smith"))
+    session.flush()
+
+    session.add_all(
+        [
+            EncounterRecord(
+                id=f"enc-{index:03d}",
+                patient_id="pat-001",
+                period_start_at=datetime(2026, 6, 1 + index, tzinfo=timezone.utc),
+                period_end_at=datetime(2026, 6, 1 + index, 2, tzinfo=timezone.utc),
+            )
+            for index in range(3)
+        ]
+    )
+    session.flush()
+
+    reader = SqlAlchemyEncounterReader(session)
+
+    streamed = tuple(reader.stream_by_patient(ResourceId("pat-001")))
+
+    assert streamed == reader.list_by_patient(ResourceId("pat-001"))
+    assert len(streamed) == 3
@@ -2,7 +2,7 @@ from collections.abc import Iterator
 from datetime import datetime, timezone
 
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import Session, sessionmaker
 
 from fhir_gateway.domain.entities.observation import Observation
@@ -12,6 +12,9 @@ from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.observation_rea
     SqlAlchemyObservationReader,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
+from fhir_gateway.infrastructure.persistence.sqlalchemy.code_catalog import (
+    CodeCatalog,
+)
 from fhir_gateway.infrastructure.persistence.sqlalchemy.models.observation import (
     ObservationCodeRecord,
     ObservationRecord,
@@ -351,3 +354,307 @@ def test_list_by_patient_and_code_returns_empty_tuple_when_code_does_not_match(
     )
 
     assert observations == ()
+
+
+def test_stream_by_patient_yields_same_observations_as_list_by_patient(
+    session: Session,
+):
+    patient = PatientRecord(id="pat-001", name_text="John Smith")
+    code = ObservationCodeRecord(
+        system="http://loinc.org",
+        code="4548-4",
+        display="Hemoglobin A1c/Hemoglobin.total in Blood",
+    )
+
+    session.add_all([patient, code])
+    session.flush()
+
+    session.add_all(
+        [
+            ObservationRecord(
+                id=f"obs-{index:03d}",
+                patient_id="pat-001",
+                status="final",
+                code_id=code.id,
+                effective_at=datetime(2026, 6, 1 + index, tzinfo=timezone.utc),
+                value_quantity=7.0 + index / 10,
+                value_unit="%",
+                deleted_at=(
+                    datetime(2026, 7, 1, tzinfo=timezone.utc)
+                    if index == 2
+                    else None
+                ),
+            )
+            for index in range(5)
+        ]
+    )
+    session.flush()
+
+    reader = SqlAlchemyObservationReader(session)
+
+    streamed = tuple(reader.stream_by_patient(ResourceId("pat-001")))
+
+    assert streamed == reader.list_by_patient(ResourceId("pat-001"))
+    assert tuple(observation.id.value for observation in streamed) == (
+        "obs-000",
+        "obs-001",
+        "obs-003",
+        "obs-004",
+    )
+
+
+def test_stream_by_patient_does_not_query_until_iterated(session: Session):
+    statements: list[str] = []
+    engine = session.get_bind()
+
+    def record_statement(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+
+    try:
+        reader = SqlAlchemyObservationReader(session)
+
+        stream = reader.stream_by_patient(ResourceId("pat-001"))
+
+        assert statements == []
+        assert tuple(stream) == ()
+        assert len(statements) == 1
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+
+def test_code_catalog_reads_match_joined_reads_without_joining_codes(
+    session: Session,
+):
+    patient = PatientRecord(id="pat-001", name_text="John Smith")
+    hba1c = ObservationCodeRecord(system="http://loinc.org", code="4548-4")
+    glucose = ObservationCodeRecord(system="http://loinc.org", code="2339-0")
+
+    session.add_all([patient, hba1c, glucose])
+    session.flush()
+
+    session.add_all(
+        [
+            ObservationRecord(
+                id=f"obs-{index:03d}",
+                patient_id="pat-001",
+                status="final",
+                code_id=hba1c.id if index % 2 == 0 else glucose.id,
+                effective_at=datetime(2026, 6, 1 + index, tzinfo=timezone.utc),
+                value_quantity=7.0 + index / 10,
+                value_unit="%",
+            )
+            for index in range(4)
+        ]
+    )
+    session.flush()
+
+    patient_id = ResourceId("pat-001")
+    hba1c_code = Code(system="http://loinc.org", code="4548-4")
+    joined_reader = SqlAlchemyObservationReader(session)
+    catalog_reader = SqlAlchemyObservationReader(
+        session,
+        CodeCatalog(
+            ObservationCodeRecord,
+            max_entries=10,
+            refresh_interval_seconds=60,
+        ),
+    )
+    statements: list[str] = []
+
+    def record_statement(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    event.listen(session.get_bind(), "before_cursor_execute", record_statement)
+
+    try:
+        observations = catalog_reader.list_by_patient(patient_id)
+        by_code = catalog_reader.list_by_patient_and_code(patient_id, hba1c_code)
+        streamed = tuple(catalog_reader.stream_by_patient(patient_id))
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", record_statement)
+
+    assert observations == joined_reader.list_by_patient(patient_id)
+    assert by_code == joined_reader.list_by_patient_and_code(
+        patient_id,
+        hba1c_code,
+    )
+    assert streamed == observations
+    assert observations[0].code is observations[2].code
+    assert by_code[0].code is observations[0].code
+    assert not any("JOIN observation_codes" in sql for sql in statements)
+
+
+def test_list_series_returns_columns_per_unit_for_plotted_observations(
+    session: Session,
+):
+    patient = PatientRecord(id="pat-001", name_text="John Smith")
+    hba1c_code = ObservationCodeRecord(system="http://loinc.org", code="4548-4")
+    glucose_code = ObservationCodeRecord(system="http://loinc.org", code="2345-7")
+
+    session.add_all([patient, hba1c_code, glucose_code])
+    session.flush()
+
+    def observation(
+        observation_id: str,
+        day: int,
+        value: float | None,
+        unit: str | None = "%",
+        *,
+        status: str = "final",
+        code_id: int = hba1c_code.id,
+        deleted_at: datetime | None = None,
+    ) -> ObservationRecord:
+        return ObservationRecord(
+            id=observation_id,
+            patient_id="pat-001",
+            status=status,
+            code_id=code_id,
+            effective_at=datetime(2026, 6, day, 10, 0, tzinfo=timezone.utc),
+            value_quantity=value,
+            value_unit=unit,
+            deleted_at=deleted_at,
+        )
+
+    session.add_all(
+        [
+            observation("obs-003", 3, 6.9),
+            observation("obs-001", 1, 7.2),
+            observation("obs-002", 2, 53.0, "mmol/mol"),
+            observation("obs-004", 4, None, None),
+            observation("obs-005", 5, 9.9, status="entered-in-error"),
+            observation(
+                "obs-006",
+                6,
+                8.1,
+                deleted_at=datetime(2026, 6, 7, tzinfo=timezone.utc),
+            ),
+            observation("obs-007", 7, 110.0, "mg/dL", code_id=glucose_code.id),
+        ]
+    )
+    session.flush()
+    statements: list[str] = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *_args: statements.append(statement),
+    )
+
+    reader = SqlAlchemyObservationReader(session)
+
+    series = reader.list_series_by_patient_and_code(
+        ResourceId("pat-001"),
+        Code(system="http://loinc.org", code="4548-4"),
+    )
+
+    assert [unit_series.unit for unit_series in series] == ["%", "mmol/mol"]
+    assert series[0].timestamps == (
+        datetime(2026, 6, 1, 10, 0, tzinfo=timezone.utc),
+        datetime(2026, 6, 3, 10, 0, tzinfo=timezone.utc),
+    )
+    assert series[0].values == (7.2, 6.9)
+    assert series[1].values == (53.0,)
+    assert len(statements) == 1
+    assert statements[0].startswith(
+        "SELECT observations.effective_at, observations.value_quantity, "
+        "observations.value_unit \nFROM observations"
+    )
+
+
+def test_list_series_returns_empty_tuple_for_unknown_code(session: Session):
+    reader = SqlAlchemyObservationReader(session)
+
+    series = reader.list_series_by_patient_and_code(
+        ResourceId("pat-001"),
+        Code(system="http://loinc.org", code="4548-4"),
+    )
+
+    assert series == ()
+
+
+def test_code_catalog_by_code_reads_select_only_covering_index_columns(
+    session: Session,
+):
+    patient = PatientRecord(id="pat-001", name_text="John Smith")
+    hba1c = ObservationCodeRecord(system="http://loinc.org", code="4548-4")
+
+    session.add_all([patient, hba1c])
+    session.flush()
+    session.add_all(
+        [
+            ObservationRecord(
+                id=f"obs-{index:03d}",
+                patient_id="pat-001",
+                status="final",
+                code_id=hba1c.id,
+                effective_at=datetime(2026, 6, 3 - index, tzinfo=timezone.utc),
+                value_quantity=7.0 + index / 10,
+                value_unit="%",
+            )
+            for index in range(3)
+        ]
+    )
+    session.flush()
+
+    patient_id = ResourceId("pat-001")
+    hba1c_code = Code(system="http://loinc.org", code="4548-4")
+    joined_reader = SqlAlchemyObservationReader(session)
+    catalog_reader = SqlAlchemyObservationReader(
+        session,
+        CodeCatalog(
+            ObservationCodeRecord,
+            max_entries=10,
+            refresh_interval_seconds=60,
+        ),
+    )
+    catalog_reader.list_by_patient_and_code(patient_id, hba1c_code)
+    statements: list[str] = []
+
+    def record_statement(_conn, _cursor, statement, *_args) -> None:
+        statements.append(statement)
+
+    event.listen(session.get_bind(), "before_cursor_execute", record_statement)
+
+    try:
+        by_code = catalog_reader.list_by_patient_and_code(patient_id, hba1c_code)
+        series = catalog_reader.list_series_by_patient_and_code(
+            patient_id,
+            hba1c_code,
+        )
+    finally:
+        event.remove(session.get_bind(), "before_cursor_execute", record_statement)
+
+    assert by_code == joined_reader.list_by_patient_and_code(patient_id, hba1c_code)
+    assert series == joined_reader.list_series_by_patient_and_code(
+        patient_id,
+        hba1c_code,
+    )
+    assert len(statements) == 2
+    assert statements[0].startswith(
+        "SELECT observations.id, observations.patient_id, observations.status, "
+        "observations.effective_at, observations.value_quantity, "
+        "observations.value_unit \nFROM observations \n"
+        "WHERE observations.patient_id = ? AND observations.code_id = ?"
+    )
+    assert not any("observation_codes" in sql for sql in statements)
+
+
+def test_code_catalog_by_code_reads_return_empty_tuple_for_unknown_code(
+    session: Session,
+):
+    reader = SqlAlchemyObservationReader(
+        session,
+        CodeCatalog(
+            ObservationCodeRecord,
+            max_entries=10,
+            refresh_interval_seconds=60,
+        ),
+    )
+    unknown = Code(system="http://loinc.org", code="0000-0")
+
+    assert reader.list_by_patient_and_code(ResourceId("pat-001"), unknown) == ()
+    assert (
+        reader.list_series_by_patient_and_code(ResourceId("pat-001"), unknown)
+        == ()
+    )
@@ -5,11 +5,13 @@ import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import Session, sessionmaker
 
+from fhir_gateway.application.models.patient_search import PatientSearchCursor
 from fhir_gateway.domain.entities.patient import Patient
 from fhir_gateway.domain.value_objects.identifier import Identifier
 from fhir_gateway.domain.value_objects.resource_id import ResourceId
 from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.patient_reader import (
     SqlAlchemyPatientReader,
+    _select_patients_by_text,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
 from fhir_gateway.infrastructure.persistence.sqlalchemy.models.patient import (
@@ -113,7 +115,7 @@ def test_search_by_text_matches_patient_name(session: Session):
 
     reader = SqlAlchemyPatientReader(session)
 
-    patients = reader.search_by_text("smith")
+    patients = reader.search_by_text("smith", limit=10).patients
 
     assert tuple(patient.id for patient in patients) == (
         ResourceId("pat-001"),
@@ -137,7 +139,7 @@ def test_search_by_text_matches_patient_identifier(session: Session):
 
     reader = SqlAlchemyPatientReader(session)
 
-    patients = reader.search_by_text("MRN-001")
+    patients = reader.search_by_text("MRN-001", limit=10).patients
 
     assert tuple(patient.id for patient in patients) == (
         ResourceId("pat-001"),
@@ -157,7 +159,7 @@ def test_search_by_text_returns_empty_tuple_when_no_patient_matches(
 
     reader = SqlAlchemyPatientReader(session)
 
-    patients = reader.search_by_text("Garcia")
+    patients = reader.search_by_text("Garcia", limit=10).patients
 
     assert patients == ()
 
@@ -180,7 +182,7 @@ def test_search_by_text_ignores_logically_deleted_patients(session: Session):
 
     reader = SqlAlchemyPatientReader(session)
 
-    patients = reader.search_by_text("John")
+    patients = reader.search_by_text("John", limit=10).patients
 
     assert tuple(patient.id for patient in patients) == (
         ResourceId("pat-001"),
@@ -210,8 +212,356 @@ def test_search_by_text_does_not_return_duplicate_patients_when_multiple_identif
 
     reader = SqlAlchemyPatientReader(session)
 
-    patients = reader.search_by_text("MRN")
+    patients = reader.search_by_text("MRN", limit=10).patients
 
     assert tuple(patient.id for patient in patients) == (
         ResourceId("pat-001"),
     )
+
+
+def test_search_by_text_resolves_identifier_token_exactly(session: Session):
+    session.add_all(
+        [
+            PatientRecord(
+                id="pat-001",
+                identifiers=[
+                    PatientIdentifierRecord(
+                        system="https://hospital.example.org/mrn",
+                        value="MRN-001",
+                    )
+                ],
+            ),
+            PatientRecord(
+                id="pat-002",
+                identifiers=[
+                    PatientIdentifierRecord(
+                        system="https://hospital.example.org/mrn",
+                        value="MRN-0010",
+                    )
+                ],
+            ),
+        ]
+    )
+    session.commit()
+
+    reader = SqlAlchemyPatientReader(session)
+
+    patients = reader.search_by_text(
+        "https://hospital.example.org/mrn|MRN-001",
+        limit=10,
+    ).patients
+
+    assert tuple(patient.id for patient in patients) == (
+        ResourceId("pat-001"),
+    )
+
+
+def test_search_by_text_identifier_token_ignores_logically_deleted_patients(
+    session: Session,
+):
+    session.add(
+        PatientRecord(
+            id="pat-001",
+            deleted_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            identifiers=[
+                PatientIdentifierRecord(
+                    system="https://hospital.example.org/mrn",
+                    value="MRN-001",
+                )
+            ],
+        )
+    )
+    session.commit()
+
+    reader = SqlAlchemyPatientReader(session)
+
+    patients = reader.search_by_text(
+        "https://hospital.example.org/mrn|MRN-001",
+        limit=10,
+    ).patients
+
+    assert patients == ()
+
+
+def test_search_by_text_ranks_exact_then_prefix_then_substring_matches(
+    session: Session,
+):
+    session.add_all(
+        [
+            PatientRecord(
+                id="pat-001",
+                name_family="Goldsmith",
+                name_given=["Ada"],
+            ),
+            PatientRecord(
+                id="pat-002",
+                name_family="Smithson",
+                name_given=["Ben"],
+            ),
+            PatientRecord(
+                id="pat-003",
+                name_family="Smith",
+                name_given=["Cara"],
+            ),
+            PatientRecord(id="pat-004", name_text="Anna Smith"),
+        ]
+    )
+    session.commit()
+
+    reader = SqlAlchemyPatientReader(session)
+
+    patients = reader.search_by_text("smith", limit=10).patients
+
+    assert tuple(patient.id for patient in patients) == (
+        ResourceId("pat-003"),
+        ResourceId("pat-002"),
+        ResourceId("pat-001"),
+        ResourceId("pat-004"),
+    )
+
+
+def test_search_by_text_ranks_patient_by_its_best_matching_column(
+    session: Session,
+):
+    session.add_all(
+        [
+            PatientRecord(
+                id="pat-001",
+                name_text="Old MRN-7 holder",
+                identifiers=[
+                    PatientIdentifierRecord(
+                        system="https://hospital.example.org/mrn",
+                        value="MRN-7",
+                    )
+                ],
+            ),
+            PatientRecord(id="pat-000", name_text="MRN-7 transferred"),
+        ]
+    )
+    session.commit()
+
+    reader = SqlAlchemyPatientReader(session)
+
+    patients = reader.search_by_text("MRN-7", limit=10).patients
+
+    assert tuple(patient.id for patient in patients) == (
+        ResourceId("pat-001"),
+        ResourceId("pat-000"),
+    )
+
+
+def test_search_by_text_treats_like_wildcards_literally(session: Session):
+    session.add_all(
+        [
+            PatientRecord(id="pat-001", name_text="100% Smith"),
+            PatientRecord(id="pat-002", name_text="1000 Smith"),
+            PatientRecord(id="pat-003", name_text="A_B"),
+            PatientRecord(id="pat-004", name_text="AXB"),
+        ]
+    )
+    session.commit()
+
+    reader = SqlAlchemyPatientReader(session)
+
+    percent_page = reader.search_by_text("100%", limit=10)
+    underscore_page = reader.search_by_text("A_B", limit=10)
+
+    assert tuple(patient.id for patient in percent_page.patients) == (
+        ResourceId("pat-001"),
+    )
+    assert tuple(patient.id for patient in underscore_page.patients) == (
+        ResourceId("pat-003"),
+    )
+
+
+def test_search_by_text_falls_back_to_text_search_for_incomplete_token(
+    session: Session,
+):
+    session.add(PatientRecord(id="pat-001", name_text="Smith|"))
+    session.commit()
+
+    reader = SqlAlchemyPatientReader(session)
+
+    patients = reader.search_by_text("Smith|", limit=10).patients
+
+    assert tuple(patient.id for patient in patients) == (
+        ResourceId("pat-001"),
+    )
+
+
+def _seed_smith_patients(session: Session) -> None:
+    # Ranks: pat-003 and pat-005 exact, pat-002 prefix, pat-001 and
+    # pat-004 substring.
+    session.add_all(
+        [
+            PatientRecord(id="pat-001", name_text="Goldsmith"),
+            PatientRecord(id="pat-002", name_text="Smithson"),
+            PatientRecord(id="pat-003", name_text="Smith"),
+            PatientRecord(id="pat-004", name_text="Anna Smith"),
+            PatientRecord(id="pat-005", name_text="SMITH"),
+        ]
+    )
+    session.commit()
+
+
+def test_search_by_text_returns_at_most_limit_patients_with_next_cursor(
+    session: Session,
+):
+    _seed_smith_patients(session)
+
+    reader = SqlAlchemyPatientReader(session)
+
+    page = reader.search_by_text("smith", limit=2)
+
+    # The page holds the first two matching ids, best match first.
+    assert tuple(patient.id for patient in page.patients) == (
+        ResourceId("pat-002"),
+        ResourceId("pat-001"),
+    )
+    assert page.next_cursor == PatientSearchCursor(patient_id=ResourceId("pat-002"))
+
+
+def test_search_by_text_pages_through_matches_by_id_without_gaps(
+    session: Session,
+):
+    _seed_smith_patients(session)
+
+    reader = SqlAlchemyPatientReader(session)
+
+    patient_ids = []
+    after = None
+
+    while True:
+        page = reader.search_by_text("smith", limit=2, after=after)
+        patient_ids.extend(patient.id.value for patient in page.patients)
+
+        if page.next_cursor is None:
+            break
+
+        after = page.next_cursor
+
+    assert patient_ids == ["pat-002", "pat-001", "pat-003", "pat-004", "pat-005"]
+
+
+def test_search_by_text_pages_patient_once_by_its_best_matching_column(
+    session: Session,
+):
+    session.add_all(
+        [
+            PatientRecord(id="pat-001", name_text="Smith", name_family="Goldsmith"),
+            PatientRecord(id="pat-002", name_text="Smithson"),
+        ]
+    )
+    session.commit()
+
+    reader = SqlAlchemyPatientReader(session)
+
+    first_page = reader.search_by_text("smith", limit=1)
+    second_page = reader.search_by_text(
+        "smith",
+        limit=1,
+        after=first_page.next_cursor,
+    )
+
+    assert [patient.id.value for patient in first_page.patients] == ["pat-001"]
+    assert [patient.id.value for patient in second_page.patients] == ["pat-002"]
+
+
+def test_search_by_text_branch_limits_skip_logically_deleted_patients(
+    session: Session,
+):
+    session.add_all(
+        [
+            PatientRecord(
+                id=patient_id,
+                deleted_at=(
+                    None
+                    if patient_id == "pat-004"
+                    else datetime(2026, 1, 1, tzinfo=timezone.utc)
+                ),
+                identifiers=[
+                    PatientIdentifierRecord(
+                        system="https://hospital.example.org/mrn",
+                        value=f"MRN-{patient_id}",
+                    )
+                ],
+            )
+            for patient_id in ("pat-001", "pat-002", "pat-003", "pat-004")
+        ]
+    )
+    session.commit()
+
+    reader = SqlAlchemyPatientReader(session)
+
+    page = reader.search_by_text("mrn-", limit=1)
+
+    assert [patient.id.value for patient in page.patients] == ["pat-004"]
+    assert page.next_cursor is None
+
+
+def test_search_by_text_limits_each_branch_to_the_page_after_the_cursor():
+    stmt = _select_patients_by_text(
+        "smith",
+        limit=2,
+        after=PatientSearchCursor(patient_id=ResourceId("pat-002")),
+    )
+
+    sql = str(stmt.compile(compile_kwargs={"literal_binds": True}))
+
+    # Five searched columns, each bounded to `limit + 1` patients after the
+    # cursor before they are grouped, plus the page's own LIMIT.
+    assert sql.count("LIMIT 3") == 6
+    assert sql.count("patient_id > 'pat-002'") == 2
+    assert sql.count("patients.id > 'pat-002'") == 3
+
+
+def test_search_by_text_omits_next_cursor_when_page_is_exactly_full(
+    session: Session,
+):
+    _seed_smith_patients(session)
+
+    reader = SqlAlchemyPatientReader(session)
+
+    page = reader.search_by_text("smith", limit=5)
+
+    assert len(page.patients) == 5
+    assert page.next_cursor is None
+
+
+def test_search_by_text_pages_identifier_token_matches(session: Session):
+    session.add_all(
+        [
+            PatientRecord(
+                id=patient_id,
+                identifiers=[
+                    PatientIdentifierRecord(
+                        system="https://hospital.example.org/shared",
+                        value="FAMILY-1",
+                    )
+                ],
+            )
+            for patient_id in ("pat-001", "pat-002", "pat-003")
+        ]
+    )
+    session.commit()
+
+    reader = SqlAlchemyPatientReader(session)
+
+    first_page = reader.search_by_text(
+        "https://hospital.example.org/shared|FAMILY-1",
+        limit=2,
+    )
+    second_page = reader.search_by_text(
+        "https://hospital.example.org/shared|FAMILY-1",
+        limit=2,
+        after=first_page.next_cursor,
+    )
+
+    assert tuple(patient.id.value for patient in first_page.patients) == (
+        "pat-001",
+        "pat-002",
+    )
+    assert tuple(patient.id.value for patient in second_page.patients) == (
+        "pat-003",
+    )
+    assert second_page.next_cursor is None
@@ -0,0 +1,258 @@
+from collections.abc import Iterator
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from fhir_gateway.application.models.patient_summary import PatientSummary
+from fhir_gateway.domain.entities.observation import ObservationStatus
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.human_name import HumanName
+from fhir_gateway.domain.value_objects.identifier import Identifier
+from fhir_gateway.domain.value_objects.instant import Instant
+from fhir_gateway.domain.value_objects.quantity import Quantity
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.patient_summary_reader import (
+    SqlAlchemyPatientSummaryReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.condition import (
+    ConditionCodeRecord,
+    ConditionRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.encounter import (
+    EncounterRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.observation import (
+    ObservationCodeRecord,
+    ObservationRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.patient import (
+    PatientIdentifierRecord,
+    PatientRecord,
+)
+
+TABLES = [
+    PatientRecord.__table__,
+    PatientIdentifierRecord.__table__,
+    ConditionCodeRecord.__table__,
+    ConditionRecord.__table__,
+    EncounterRecord.__table__,
+    ObservationCodeRecord.__table__,
+    ObservationRecord.__table__,
+]
+
+
+@pytest.fixture
+def session_factory() -> Iterator[sessionmaker[Session]]:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+
+    Base.metadata.create_all(engine, tables=TABLES)
+
+    yield sessionmaker(
+        bind=engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+    Base.metadata.drop_all(engine, tables=list(reversed(TABLES)))
+
+
+def _utc(year: int, month: int, day: int) -> datetime:
+    return datetime(year, month, day, 10, 0, tzinfo=timezone.utc)
+
+
+def _seed_patient_chart(session: Session) -> None:
+    condition_code = ConditionCodeRecord(
+        system="http://snomed.info/sct",
+        code="44054006",
+        display="Diabetes mellitus type 2",
+    )
+    observation_code = ObservationCodeRecord(
+        system="http://loinc.org",
+        code="4548-4",
+        display="Hemoglobin A1c/Hemoglobin.total in Blood",
+    )
+
+    session.add_all(
+        [
+            PatientRecord(
+                id="pat-001",
+                name_family="García",
+                name_given=["Ana"],
+                identifiers=[
+                    PatientIdentifierRecord(
+                        system="https://hospital.example.org/mrn",
+                        value="MRN-001",
+                    ),
+                    PatientIdentifierRecord(
+                        system="https://hospital.example.org/legacy-mrn",
+                        value="OLD-001",
+                    ),
+                ],
+            ),
+            condition_code,
+            observation_code,
+        ]
+    )
+    session.flush()
+
+    session.add_all(
+        [
+            ConditionRecord(
+                id="con-002",
+                patient_id="pat-001",
+                code_id=condition_code.id,
+                recorded_at=_utc(2026, 3, 1),
+            ),
+            ConditionRecord(
+                id="con-001",
+                patient_id="pat-001",
+                code_id=condition_code.id,
+                recorded_at=_utc(2026, 1, 15),
+            ),
+            EncounterRecord(
+                id="enc-001",
+                patient_id="pat-001",
+                period_start_at=_utc(2026, 1, 10),
+                period_end_at=_utc(2026, 1, 11),
+            ),
+            ObservationRecord(
+                id="obs-002",
+                patient_id="pat-001",
+                status="final",
+                code_id=observation_code.id,
+                effective_at=_utc(2026, 2, 12),
+                value_quantity=6.9,
+                value_unit="%",
+            ),
+            ObservationRecord(
+                id="obs-001",
+                patient_id="pat-001",
+                status="amended",
+                code_id=observation_code.id,
+                effective_at=_utc(2026, 1, 12),
+                value_quantity=7.2,
+                value_unit="%",
+            ),
+            ObservationRecord(
+                id="obs-deleted",
+                patient_id="pat-001",
+                status="final",
+                code_id=observation_code.id,
+                effective_at=_utc(2026, 1, 1),
+                deleted_at=_utc(2026, 1, 2),
+            ),
+        ]
+    )
+    session.commit()
+
+
+def test_get_summary_returns_patient_and_ordered_clinical_resources(
+    session_factory: sessionmaker[Session],
+):
+    with session_factory() as session:
+        _seed_patient_chart(session)
+
+    with session_factory() as session:
+        summary = SqlAlchemyPatientSummaryReader(session).get_summary(
+            ResourceId("pat-001")
+        )
+
+    assert isinstance(summary, PatientSummary)
+    assert summary.patient.id == ResourceId("pat-001")
+    assert summary.patient.name == HumanName(given=("Ana",), family="García")
+    assert summary.patient.identifiers == (
+        Identifier(system="https://hospital.example.org/mrn", value="MRN-001"),
+        Identifier(
+            system="https://hospital.example.org/legacy-mrn",
+            value="OLD-001",
+        ),
+    )
+    assert tuple(c.id.value for c in summary.conditions) == ("con-001", "con-002")
+    assert summary.conditions[0].code == Code(
+        system="http://snomed.info/sct",
+        code="44054006",
+        display="Diabetes mellitus type 2",
+    )
+    assert summary.conditions[0].recorded_date == Instant(_utc(2026, 1, 15))
+    assert tuple(e.id.value for e in summary.encounters) == ("enc-001",)
+    assert summary.encounters[0].period.end == Instant(_utc(2026, 1, 11))
+    assert tuple(o.id.value for o in summary.observations) == (
+        "obs-001",
+        "obs-002",
+    )
+    assert summary.observations[0].status == ObservationStatus.AMENDED
+    assert summary.observations[0].value == Quantity(value=7.2, unit="%")
+
+
+def test_get_summary_uses_a_single_database_round_trip(
+    session_factory: sessionmaker[Session],
+):
+    with session_factory() as session:
+        _seed_patient_chart(session)
+
+    statements: list[str] = []
+
+    with session_factory() as session:
+        event.listen(
+            session.get_bind(),
+            "before_cursor_execute",
+            lambda *args: statements.append(args[2]),
+        )
+
+        SqlAlchemyPatientSummaryReader(session).get_summary(ResourceId("pat-001"))
+
+    assert len(statements) == 1
+
+
+def test_get_summary_returns_empty_collections_for_patient_without_resources(
+    session_factory: sessionmaker[Session],
+):
+    with session_factory() as session:
+        session.add(PatientRecord(id="pat-001", name_text="John Smith"))
+        session.commit()
+
+    with session_factory() as session:
+        summary = SqlAlchemyPatientSummaryReader(session).get_summary(
+            ResourceId("pat-001")
+        )
+
+    assert summary is not None
+    assert summary.patient.identifiers == ()
+    assert summary.conditions == ()
+    assert summary.encounters == ()
+    assert summary.observations == ()
+
+
+def test_get_summary_returns_none_when_patient_does_not_exist(
+    session_factory: sessionmaker[Session],
+):
+    with session_factory() as session:
+        summary = SqlAlchemyPatientSummaryReader(session).get_summary(
+            ResourceId("missing-patient")
+        )
+
+    assert summary is None
+
+
+def test_get_summary_returns_none_for_logically_deleted_patient(
+    session_factory: sessionmaker[Session],
+):
+    with session_factory() as session:
+        session.add(
+            PatientRecord(
+                id="pat-001",
+                name_text="John Smith",
+                deleted_at=_utc(2026, 6, 14),
+            )
+        )
+        session.commit()
+
+    with session_factory() as session:
+        summary = SqlAlchemyPatientSummaryReader(session).get_summary(
+            ResourceId("pat-001")
+        )
+
+    assert summary is None
@@ -0,0 +1,188 @@
+from collections.abc import Iterator
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters.patient_version_reader import (
+    SqlAlchemyPatientVersionReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.condition import (
+    ConditionCodeRecord,
+    ConditionRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.encounter import (
+    EncounterRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.observation import (
+    ObservationCodeRecord,
+    ObservationRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.patient import (
+    PatientIdentifierRecord,
+    PatientRecord,
+)
+
+TABLES = [
+    PatientRecord.__table__,
+    PatientIdentifierRecord.__table__,
+    ConditionCodeRecord.__table__,
+    ConditionRecord.__table__,
+    EncounterRecord.__table__,
+    ObservationCodeRecord.__table__,
+    ObservationRecord.__table__,
+]
+
+PATIENT_ID = ResourceId("pat-001")
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(engine, tables=TABLES)
+
+    with sessionmaker(bind=engine, expire_on_commit=False)() as session:
+        _seed_patients(session)
+        yield session
+
+    engine.dispose()
+
+
+def _utc(year: int, month: int, day: int) -> datetime:
+    return datetime(year, month, day, 10, 0, tzinfo=timezone.utc)
+
+
+def _seed_patients(session: Session) -> None:
+    session.add_all(
+        [
+            ObservationCodeRecord(id=1, system="http://loinc.org", code="4548-4"),
+            PatientRecord(
+                id="pat-001",
+                name_text="Ana García",
+                identifiers=[
+                    PatientIdentifierRecord(system="urn:mrn", value="MRN-001"),
+                ],
+            ),
+            PatientRecord(id="pat-002", name_text="Luis Pérez"),
+        ]
+    )
+    session.flush()
+    session.add(_observation("obs-001", "pat-001"))
+    session.commit()
+
+
+def _observation(observation_id: str, patient_id: str) -> ObservationRecord:
+    return ObservationRecord(
+        id=observation_id,
+        patient_id=patient_id,
+        status="final",
+        code_id=1,
+        effective_at=_utc(2026, 1, 12),
+        value_quantity=7.2,
+        value_unit="%",
+        updated_at=_utc(2026, 1, 12),
+    )
+
+
+def test_patient_version_reader_returns_none_for_unknown_patient(session: Session):
+    reader = SqlAlchemyPatientVersionReader(session)
+
+    assert reader.get_version(ResourceId("pat-404")) is None
+
+
+def test_patient_version_reader_returns_none_for_deleted_patient(session: Session):
+    reader = SqlAlchemyPatientVersionReader(session)
+
+    session.get(PatientRecord, "pat-001").deleted_at = _utc(2026, 2, 1)
+    session.commit()
+
+    assert reader.get_version(PATIENT_ID) is None
+
+    session.get(PatientRecord, "pat-001").deleted_at = None
+    session.commit()
+
+    assert reader.get_version(PATIENT_ID) is not None
+
+
+def test_patient_version_reader_is_stable_while_chart_is_unchanged(
+    session: Session,
+):
+    reader = SqlAlchemyPatientVersionReader(session)
+
+    assert reader.get_version(PATIENT_ID) == reader.get_version(PATIENT_ID)
+
+
+def test_patient_version_reader_uses_one_statement(session: Session):
+    statements: list[str] = []
+    event.listen(
+        session.get_bind(),
+        "before_cursor_execute",
+        lambda _conn, _cursor, statement, *_args: statements.append(statement),
+    )
+
+    SqlAlchemyPatientVersionReader(session).get_version(PATIENT_ID)
+
+    assert len(statements) == 1
+
+
+def test_patient_version_changes_when_a_resource_is_added(session: Session):
+    reader = SqlAlchemyPatientVersionReader(session)
+    before = reader.get_version(PATIENT_ID)
+
+    session.add(_observation("obs-002", "pat-001"))
+    session.commit()
+
+    assert reader.get_version(PATIENT_ID) != before
+
+
+def test_patient_version_changes_when_a_resource_is_updated(session: Session):
+    reader = SqlAlchemyPatientVersionReader(session)
+    before = reader.get_version(PATIENT_ID)
+
+    observation = session.get(ObservationRecord, "obs-001")
+    observation.value_quantity = 6.8
+    observation.updated_at = _utc(2026, 2, 1)
+    session.commit()
+
+    assert reader.get_version(PATIENT_ID) != before
+
+
+def test_patient_version_changes_when_a_resource_is_logically_deleted(
+    session: Session,
+):
+    reader = SqlAlchemyPatientVersionReader(session)
+    before = reader.get_version(PATIENT_ID)
+
+    session.get(ObservationRecord, "obs-001").deleted_at = _utc(2026, 2, 1)
+    session.commit()
+
+    assert reader.get_version(PATIENT_ID) != before
+
+
+def test_patient_version_changes_when_an_identifier_is_added(session: Session):
+    reader = SqlAlchemyPatientVersionReader(session)
+    before = reader.get_version(PATIENT_ID)
+
+    session.add(
+        PatientIdentifierRecord(
+            patient_id="pat-001",
+            system="urn:mrn",
+            value="MRN-999",
+        )
+    )
+    session.commit()
+
+    assert reader.get_version(PATIENT_ID) != before
+
+
+def test_patient_version_ignores_other_patients_resources(session: Session):
+    reader = SqlAlchemyPatientVersionReader(session)
+    before = reader.get_version(PATIENT_ID)
+
+    session.add(_observation("obs-101", "pat-002"))
+    session.commit()
+
+    assert reader.get_version(PATIENT_ID) == before
@@ -0,0 +1,216 @@
+from collections.abc import Iterator
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import Engine, create_engine, event, func, insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, sessionmaker
+
+from fhir_gateway.domain.entities.condition import Condition
+from fhir_gateway.domain.entities.encounter import Encounter
+from fhir_gateway.domain.entities.observation import Observation, ObservationStatus
+from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.human_name import HumanName
+from fhir_gateway.domain.value_objects.identifier import Identifier
+from fhir_gateway.domain.value_objects.instant import Instant
+from fhir_gateway.domain.value_objects.period import Period
+from fhir_gateway.domain.value_objects.quantity import Quantity
+from fhir_gateway.domain.value_objects.reference import Reference
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    SqlAlchemyConditionReader,
+    SqlAlchemyEncounterReader,
+    SqlAlchemyObservationReader,
+    SqlAlchemyPatientReader,
+    SqlAlchemyResourceBulkWriter,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models import (
+    ConditionCodeRecord,
+    ConditionRecord,
+    EncounterRecord,
+    ObservationCodeRecord,
+    ObservationRecord,
+    PatientIdentifierRecord,
+    PatientRecord,
+)
+
+TABLES = [
+    PatientRecord.__table__,
+    PatientIdentifierRecord.__table__,
+    ConditionCodeRecord.__table__,
+    ConditionRecord.__table__,
+    EncounterRecord.__table__,
+    ObservationCodeRecord.__table__,
+    ObservationRecord.__table__,
+]
+
+PATIENT_ID = ResourceId("pat-001")
+SUBJECT = Reference(resource_type="Patient", id=PATIENT_ID)
+HBA1C = Code(system="http://loinc.org", code="4548-4", display="HbA1c")
+GLUCOSE = Code(system="http://loinc.org", code="2339-0")
+DIABETES = Code(system="http://snomed.info/sct", code="44054006")
+
+
+@pytest.fixture
+def engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+
+    @event.listens_for(engine, "connect")
+    def _enable_foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA foreign_keys = ON")
+
+    Base.metadata.create_all(engine, tables=TABLES)
+
+    yield engine
+
+    engine.dispose()
+
+
+@pytest.fixture
+def session_factory(engine: Engine) -> sessionmaker[Session]:
+    return sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+
+
+def _instant(day: int) -> Instant:
+    return Instant(datetime(2026, 1, day, 10, 0, tzinfo=timezone.utc))
+
+
+def _patient(patient_id: ResourceId = PATIENT_ID) -> Patient:
+    return Patient(
+        id=patient_id,
+        identifiers=(
+            Identifier(system="urn:mrn", value=f"MRN-{patient_id.value}"),
+            Identifier(system="urn:insurer", value=f"M-{patient_id.value}"),
+        ),
+        name=HumanName(given=("Ana",), family="García"),
+    )
+
+
+def _observation(index: int, code: Code = HBA1C) -> Observation:
+    return Observation(
+        id=ResourceId(f"obs-{index:03d}"),
+        status=ObservationStatus.FINAL,
+        code=code,
+        subject=SUBJECT,
+        effective=_instant(index),
+        value=Quantity(value=6.0 + index / 10, unit="%"),
+    )
+
+
+def _count(session_factory: sessionmaker[Session], record_type) -> int:
+    with session_factory() as session:
+        return session.scalar(select(func.count()).select_from(record_type))
+
+
+def test_write_batch_inserts_resources_readable_by_the_read_adapters(
+    session_factory: sessionmaker[Session],
+):
+    condition = Condition(
+        id=ResourceId("con-001"),
+        code=DIABETES,
+        subject=SUBJECT,
+        recorded_date=_instant(2),
+    )
+    encounter = Encounter(
+        id=ResourceId("enc-001"),
+        subject=SUBJECT,
+        period=Period(start=_instant(3), end=_instant(4)),
+    )
+    observations = [_observation(5), _observation(6, GLUCOSE)]
+
+    # Clinical resources come first to show rows are written in FK order.
+    SqlAlchemyResourceBulkWriter(session_factory).write_batch(
+        [condition, encounter, *observations, _patient()]
+    )
+
+    with session_factory() as session:
+        patient = SqlAlchemyPatientReader(session).get_by_id(PATIENT_ID)
+
+        # Identifier rows come back unordered.
+        assert patient.name == _patient().name
+        assert set(patient.identifiers) == set(_patient().identifiers)
+        assert SqlAlchemyConditionReader(session).list_by_patient(PATIENT_ID) == (
+            condition,
+        )
+        assert SqlAlchemyEncounterReader(session).list_by_patient(PATIENT_ID) == (
+            encounter,
+        )
+        assert SqlAlchemyObservationReader(session).list_by_patient(
+            PATIENT_ID
+        ) == tuple(observations)
+
+
+def test_write_batch_inserts_each_new_code_once_across_batches(
+    session_factory: sessionmaker[Session],
+):
+    writer = SqlAlchemyResourceBulkWriter(session_factory)
+
+    writer.write_batch([_patient(), _observation(1), _observation(2)])
+    writer.write_batch([_observation(3), _observation(4, GLUCOSE)])
+
+    with session_factory() as session:
+        codes = session.execute(
+            select(ObservationCodeRecord.code, ObservationCodeRecord.display)
+        ).all()
+        code_ids = session.scalars(select(ObservationRecord.code_id)).all()
+
+    assert sorted(codes) == [("2339-0", None), ("4548-4", "HbA1c")]
+    assert len(set(code_ids)) == 2
+
+
+def test_write_batch_reuses_codes_already_stored(
+    session_factory: sessionmaker[Session],
+):
+    with session_factory() as session, session.begin():
+        session.execute(
+            insert(ObservationCodeRecord),
+            [{"id": 42, "system": HBA1C.system, "code": HBA1C.code}],
+        )
+
+    SqlAlchemyResourceBulkWriter(session_factory).write_batch(
+        [_patient(), _observation(1)]
+    )
+
+    with session_factory() as session:
+        assert session.scalars(select(ObservationRecord.code_id)).all() == [42]
+
+    assert _count(session_factory, ObservationCodeRecord) == 1
+
+
+def test_write_batch_rolls_back_the_whole_batch_and_forgets_its_new_codes(
+    session_factory: sessionmaker[Session],
+):
+    writer = SqlAlchemyResourceBulkWriter(session_factory)
+    orphan = Condition(
+        id=ResourceId("con-001"),
+        code=DIABETES,
+        subject=Reference(resource_type="Patient", id=ResourceId("pat-404")),
+    )
+
+    with pytest.raises(IntegrityError):
+        writer.write_batch([_patient(), orphan])
+
+    assert _count(session_factory, PatientRecord) == 0
+    assert _count(session_factory, ConditionCodeRecord) == 0
+
+    writer.write_batch(
+        [_patient(), Condition(id=orphan.id, code=DIABETES, subject=SUBJECT)]
+    )
+
+    assert _count(session_factory, ConditionRecord) == 1
+    assert _count(session_factory, ConditionCodeRecord) == 1
+
+
+def test_write_batch_ignores_empty_batches(session_factory: sessionmaker[Session]):
+    SqlAlchemyResourceBulkWriter(session_factory).write_batch([])
+
+    assert _count(session_factory, PatientRecord) == 0
+
+
+def test_write_batch_rejects_unsupported_resources(
+    session_factory: sessionmaker[Session],
+):
+    with pytest.raises(TypeError, match="Unsupported resource: str"):
+        SqlAlchemyResourceBulkWriter(session_factory).write_batch(["pat-001"])
@@ -0,0 +1,91 @@
+import time
+from collections.abc import Iterator
+from functools import partial
+from pathlib import Path
+from threading import Lock
+
+import pytest
+from sqlalchemy import Engine, create_engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from fhir_gateway.infrastructure.concurrency import ThreadPoolReadExecutor
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    SessionPerCallReader,
+)
+
+
+class CountingReader:
+    def __init__(self, session: Session, engine: Engine, record) -> None:
+        self._session = session
+        self._engine = engine
+        self._record = record
+
+    def list_by_patient(self, patient_id: str) -> tuple[str, int]:
+        self._session.execute(text("SELECT 1"))
+        self._record(self._engine.pool.checkedout())
+        time.sleep(0.02)
+
+        return patient_id, self._session.execute(text("SELECT 2")).scalar_one()
+
+
+@pytest.fixture
+def engine(tmp_path: Path) -> Iterator[Engine]:
+    # A file database gets a QueuePool, which counts checked-out connections.
+    engine = create_engine(
+        f"sqlite+pysqlite:///{tmp_path / 'reads.sqlite3'}",
+        pool_size=10,
+    )
+
+    yield engine
+
+    engine.dispose()
+
+
+def test_session_per_call_reader_returns_result_and_releases_connection(
+    engine: Engine,
+):
+    sessions: list[Session] = []
+
+    def build_reader(session: Session) -> CountingReader:
+        sessions.append(session)
+        return CountingReader(session, engine, lambda _: None)
+
+    reader = SessionPerCallReader(sessionmaker(bind=engine), build_reader)
+
+    assert reader.list_by_patient("pat-001") == ("pat-001", 2)
+    assert reader.list_by_patient("pat-002") == ("pat-002", 2)
+    assert len(sessions) == 2
+    assert sessions[0] is not sessions[1]
+    assert engine.pool.checkedout() == 0
+
+
+def test_session_per_call_reader_keeps_checkouts_within_read_limit(
+    engine: Engine,
+):
+    lock = Lock()
+    checkouts: list[int] = []
+
+    def record(checked_out: int) -> None:
+        with lock:
+            checkouts.append(checked_out)
+
+    reader = SessionPerCallReader(
+        sessionmaker(bind=engine),
+        lambda session: CountingReader(session, engine, record),
+    )
+    executor = ThreadPoolReadExecutor(
+        max_workers=8,
+        max_concurrent_reads_per_call=2,
+    )
+
+    try:
+        results = executor.run_all(
+            [partial(reader.list_by_patient, f"pat-{index:03d}") for index in range(6)]
+        )
+    finally:
+        executor.shutdown()
+
+    assert len(results) == 6
+    assert len(checkouts) == 6
+    assert max(checkouts) <= 2
+    assert engine.pool.checkedout() == 0
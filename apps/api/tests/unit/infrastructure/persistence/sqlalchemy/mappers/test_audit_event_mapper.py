@@ -6,6 +6,7 @@ from fhir_gateway.domain.value_objects.reference import Reference
 from fhir_gateway.domain.value_objects.resource_id import ResourceId
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.audit_event import (
     audit_event_record_to_domain,
+    audit_event_to_record_values,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.models.audit_event import (
     AuditEventRecord,
@@ -145,3 +146,25 @@ def test_audit_event_record_to_domain_ignores_technical_metadata():
     assert not hasattr(audit_event, "created_at")
     assert not hasattr(audit_event, "updated_at")
     assert not hasattr(audit_event, "deleted_at")
+
+
+def test_audit_event_to_record_values_round_trips_through_record():
+    audit_event = AuditEvent(
+        id=ResourceId("audit-001"),
+        recorded=Instant(datetime(2026, 6, 4, 10, 0, tzinfo=timezone.utc)),
+        agent="system:fhir-gateway",
+        action=AuditAction.SEARCH,
+        entity=Reference(resource_type="Patient", id=ResourceId("pat-001")),
+    )
+
+    values = audit_event_to_record_values(audit_event)
+
+    assert values == {
+        "id": "audit-001",
+        "recorded_at": datetime(2026, 6, 4, 10, 0, tzinfo=timezone.utc),
+        "agent": "system:fhir-gateway",
+        "action": "search",
+        "entity_resource_type": "Patient",
+        "entity_id": "pat-001",
+    }
+    assert audit_event_record_to_domain(AuditEventRecord(**values)) == audit_event
@@ -1,3 +1,4 @@
+from dataclasses import replace
 from datetime import datetime, timezone
 
 import pytest
@@ -9,6 +10,8 @@ from fhir_gateway.domain.value_objects.reference import Reference
 from fhir_gateway.domain.value_objects.resource_id import ResourceId
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.condition import (
     condition_record_to_domain,
+    condition_record_with_code_to_domain,
+    condition_to_record_values,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.models.condition import (
     ConditionCodeRecord,
@@ -140,3 +143,33 @@ def test_condition_record_to_domain_ignores_technical_metadata():
     assert not hasattr(condition, "created_at")
     assert not hasattr(condition, "updated_at")
     assert not hasattr(condition, "deleted_at")
+
+
+def test_condition_record_with_code_to_domain_reuses_given_code():
+    record = _condition_record()
+    code = Code(system="http://example.org/codes", code="shared")
+
+    condition = condition_record_with_code_to_domain(record, code)
+
+    assert condition.code is code
+    assert condition == replace(
+        condition_record_to_domain(record, _condition_code_record()),
+        code=code,
+    )
+
+
+def test_condition_to_record_values_uses_the_resolved_code_id():
+    recorded_at = datetime(2026, 6, 4, 10, 0, tzinfo=timezone.utc)
+    condition = Condition(
+        id=ResourceId("con-001"),
+        code=Code(system="http://snomed.info/sct", code="44054006"),
+        subject=Reference(resource_type="Patient", id=ResourceId("pat-001")),
+        recorded_date=Instant(recorded_at),
+    )
+
+    assert condition_to_record_values(condition, 7) == {
+        "id": "con-001",
+        "patient_id": "pat-001",
+        "code_id": 7,
+        "recorded_at": recorded_at,
+    }
@@ -0,0 +1,17 @@
+from datetime import datetime, timedelta, timezone
+
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.datetimes import (
+    ensure_utc,
+)
+
+
+def test_ensure_utc_reads_naive_datetime_as_utc():
+    value = ensure_utc(datetime(2026, 6, 1, 10, 0))
+
+    assert value == datetime(2026, 6, 1, 10, 0, tzinfo=timezone.utc)
+
+
+def test_ensure_utc_keeps_timezone_aware_datetime_unchanged():
+    original = datetime(2026, 6, 1, 10, 0, tzinfo=timezone(timedelta(hours=2)))
+
+    assert ensure_utc(original) is original
@@ -7,6 +7,7 @@ from fhir_gateway.domain.value_objects.reference import Reference
 from fhir_gateway.domain.value_objects.resource_id import ResourceId
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.encounter import (
     encounter_record_to_domain,
+    encounter_to_record_values,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.models.encounter import (
     EncounterRecord,
@@ -110,3 +111,19 @@ def test_encounter_record_to_domain_ignores_technical_metadata():
     assert not hasattr(encounter, "created_at")
     assert not hasattr(encounter, "updated_at")
     assert not hasattr(encounter, "deleted_at")
+
+
+def test_encounter_to_record_values_maps_period_bounds():
+    start = datetime(2026, 6, 4, 10, 0, tzinfo=timezone.utc)
+    encounter = Encounter(
+        id=ResourceId("enc-001"),
+        subject=Reference(resource_type="Patient", id=ResourceId("pat-001")),
+        period=Period(start=Instant(start)),
+    )
+
+    assert encounter_to_record_values(encounter) == {
+        "id": "enc-001",
+        "patient_id": "pat-001",
+        "period_start_at": start,
+        "period_end_at": None,
+    }
@@ -1,3 +1,5 @@
+from collections.abc import Iterator
+from dataclasses import replace
 from datetime import datetime, timezone
 
 import pytest
@@ -12,8 +14,11 @@ from fhir_gateway.domain.value_objects.instant import Instant
 from fhir_gateway.domain.value_objects.quantity import Quantity
 from fhir_gateway.domain.value_objects.reference import Reference
 from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers import trusted
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.observation import (
     observation_record_to_domain,
+    observation_record_with_code_to_domain,
+    observation_to_record_values,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.models.observation import (
     ObservationCodeRecord,
@@ -21,6 +26,16 @@ from fhir_gateway.infrastructure.persistence.sqlalchemy.models.observation impor
 )
 
 
+@pytest.fixture
+def full_validation() -> Iterator[None]:
+    trusted.set_full_validation(True)
+
+    try:
+        yield
+    finally:
+        trusted.set_full_validation(False)
+
+
 def _observation_record(
     *,
     code_id: int = 1,
@@ -146,7 +161,22 @@ def test_observation_record_to_domain_maps_missing_quantity_to_empty_quantity():
     assert observation.value == Quantity()
 
 
-def test_observation_record_to_domain_rejects_quantity_value_without_unit():
+def test_observation_record_to_domain_trusts_quantity_value_without_unit():
+    # The database CHECK constraint rules these rows out, so the trusted
+    # mapping path does not re-validate them.
+    record = _observation_record(
+        value_quantity=5.4,
+        value_unit=None,
+    )
+
+    observation = observation_record_to_domain(record, _observation_code_record())
+
+    assert (observation.value.value, observation.value.unit) == (5.4, None)
+
+
+def test_observation_record_to_domain_rejects_quantity_value_without_unit_with_full_validation(
+    full_validation: None,
+):
     record = _observation_record(
         value_quantity=5.4,
         value_unit=None,
@@ -202,3 +232,38 @@ def test_observation_record_to_domain_ignores_technical_metadata():
     assert not hasattr(observation, "created_at")
     assert not hasattr(observation, "updated_at")
     assert not hasattr(observation, "deleted_at")
+
+
+def test_observation_record_with_code_to_domain_reuses_given_code():
+    record = _observation_record()
+    code = Code(system="http://example.org/codes", code="shared")
+
+    observation = observation_record_with_code_to_domain(record, code)
+
+    assert observation.code is code
+    assert observation == replace(
+        observation_record_to_domain(record, _observation_code_record()),
+        code=code,
+    )
+
+
+def test_observation_to_record_values_uses_the_resolved_code_id():
+    effective_at = datetime(2026, 6, 4, 10, 0, tzinfo=timezone.utc)
+    observation = Observation(
+        id=ResourceId("obs-001"),
+        status=ObservationStatus.AMENDED,
+        code=Code(system="http://loinc.org", code="4548-4"),
+        subject=Reference(resource_type="Patient", id=ResourceId("pat-001")),
+        effective=Instant(effective_at),
+        value=Quantity(value=7.2, unit="%"),
+    )
+
+    assert observation_to_record_values(observation, 3) == {
+        "id": "obs-001",
+        "patient_id": "pat-001",
+        "status": "amended",
+        "code_id": 3,
+        "effective_at": effective_at,
+        "value_quantity": 7.2,
+        "value_unit": "%",
+    }
@@ -6,7 +6,9 @@ from fhir_gateway.domain.value_objects.human_name import HumanName
 from fhir_gateway.domain.value_objects.identifier import Identifier
 from fhir_gateway.domain.value_objects.resource_id import ResourceId
 from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.patient import (
+    patient_identifiers_to_record_values,
     patient_record_to_domain,
+    patient_to_record_values,
 )
 from fhir_gateway.infrastructure.persistence.sqlalchemy.models.patient import (
     PatientIdentifierRecord,
@@ -201,3 +203,43 @@ def test_patient_record_to_domain_accepts_text_name_even_without_structured_fiel
     patient = patient_record_to_domain(record)
 
     assert patient.name == HumanName(text="John Smith")
+
+
+def test_patient_to_record_values_maps_structured_name():
+    patient = Patient(
+        id=ResourceId("pat-001"),
+        name=HumanName(given=("Ana", "María"), family="García"),
+    )
+
+    assert patient_to_record_values(patient) == {
+        "id": "pat-001",
+        "name_text": None,
+        "name_family": "García",
+        "name_given": ["Ana", "María"],
+    }
+
+
+def test_patient_to_record_values_maps_missing_name_to_null_columns():
+    patient = Patient(id=ResourceId("pat-001"))
+
+    assert patient_to_record_values(patient) == {
+        "id": "pat-001",
+        "name_text": None,
+        "name_family": None,
+        "name_given": None,
+    }
+
+
+def test_patient_identifiers_to_record_values_returns_one_row_per_identifier():
+    patient = Patient(
+        id=ResourceId("pat-001"),
+        identifiers=(
+            Identifier(system="urn:mrn", value="MRN-1"),
+            Identifier(system="urn:insurer", value="M-1"),
+        ),
+    )
+
+    assert patient_identifiers_to_record_values(patient) == [
+        {"patient_id": "pat-001", "system": "urn:mrn", "value": "MRN-1"},
+        {"patient_id": "pat-001", "system": "urn:insurer", "value": "M-1"},
+    ]
@@ -0,0 +1,80 @@
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from fhir_gateway.domain.entities.observation import Observation, ObservationStatus
+from fhir_gateway.domain.errors import DomainValidationError
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.instant import Instant
+from fhir_gateway.domain.value_objects.quantity import Quantity
+from fhir_gateway.domain.value_objects.reference import Reference
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers import trusted
+
+
+@pytest.fixture(params=[False, True], ids=["trusted", "full-validation"])
+def full_validation(request: pytest.FixtureRequest) -> Iterator[bool]:
+    trusted.set_full_validation(request.param)
+
+    try:
+        yield request.param
+    finally:
+        trusted.set_full_validation(False)
+
+
+def test_full_validation_is_disabled_by_default():
+    assert trusted.full_validation_enabled() is False
+
+
+def test_builders_match_validating_constructors(full_validation: bool):
+    effective_at = datetime(2026, 6, 1, 10, 0, tzinfo=timezone.utc)
+
+    observation = trusted.observation(
+        id=trusted.resource_id("obs-001"),
+        status=ObservationStatus.FINAL,
+        code=trusted.code("http://loinc.org", "4548-4", "HbA1c"),
+        subject=trusted.patient_reference("pat-001"),
+        effective=trusted.instant(effective_at),
+        value=trusted.quantity(7.2, "%"),
+    )
+
+    assert trusted.full_validation_enabled() is full_validation
+    assert observation == Observation(
+        id=ResourceId("obs-001"),
+        status=ObservationStatus.FINAL,
+        code=Code(system="http://loinc.org", code="4548-4", display="HbA1c"),
+        subject=Reference(resource_type="Patient", id=ResourceId("pat-001")),
+        effective=Instant(effective_at),
+        value=Quantity(value=7.2, unit="%"),
+    )
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2026, 6, 1, 10, 0),
+        datetime(2026, 6, 1, 12, 0, tzinfo=timezone(timedelta(hours=2))),
+    ],
+    ids=["naive", "offset"],
+)
+def test_instant_normalizes_database_datetimes_to_utc(
+    full_validation: bool,
+    value: datetime,
+):
+    instant = trusted.instant(value)
+
+    assert instant.value == datetime(2026, 6, 1, 10, 0, tzinfo=timezone.utc)
+    assert instant.value.tzinfo is timezone.utc
+
+
+def test_full_validation_rejects_invalid_values():
+    trusted.set_full_validation(True)
+
+    try:
+        with pytest.raises(DomainValidationError):
+            trusted.resource_id("   ")
+    finally:
+        trusted.set_full_validation(False)
+
+    assert trusted.resource_id("   ").value == "   "
@@ -1,3 +1,4 @@
+import pytest
 from sqlalchemy import CheckConstraint, DateTime
 
 from fhir_gateway.domain.entities.audit_event import AuditAction
@@ -79,6 +80,7 @@ def test_audit_events_table_has_expected_primary_key_and_required_columns():
     table = AuditEventRecord.__table__
 
     assert table.c.id.primary_key
+    assert table.c.recorded_at.primary_key
     assert not table.c.recorded_at.nullable
     assert not table.c.agent.nullable
     assert not table.c.action.nullable
@@ -155,20 +157,58 @@ def test_audit_events_agent_not_empty_check_constraint_trims_blank_values():
     assert "''" in agent_check_sql
 
 
-def test_audit_events_table_has_recorded_at_index():
+def test_audit_events_table_has_recent_first_index():
     table = AuditEventRecord.__table__
 
-    indexes = _index_columns_by_name(table)
+    index = next(
+        index
+        for index in table.indexes
+        if index.name == "ix_audit_events_recorded_at_id"
+    )
 
-    assert indexes["ix_audit_events_recorded_at"] == ("recorded_at",)
+    assert [str(expression) for expression in index.expressions] == [
+        "recorded_at DESC",
+        "audit_events.id",
+    ]
+    assert "ix_audit_events_recorded_at" not in _index_columns_by_name(table)
 
 
-def test_audit_events_table_does_not_have_entity_lookup_index():
+def test_audit_events_table_is_range_partitioned_on_recorded_at():
     table = AuditEventRecord.__table__
 
-    indexes = _index_columns_by_name(table)
+    assert table.dialect_options["postgresql"]["partition_by"] == (
+        "RANGE (recorded_at)"
+    )
+    assert [column.name for column in table.primary_key.columns] == [
+        "id",
+        "recorded_at",
+    ]
 
-    assert "ix_audit_events_entity" not in indexes
+
+@pytest.mark.parametrize(
+    ("index_name", "leading_columns"),
+    [
+        ("ix_audit_events_agent_recorded_at_id", ["audit_events.agent"]),
+        ("ix_audit_events_action_recorded_at_id", ["audit_events.action"]),
+        (
+            "ix_audit_events_entity_recorded_at_id",
+            ["audit_events.entity_resource_type", "audit_events.entity_id"],
+        ),
+    ],
+)
+def test_audit_events_filter_indexes_end_with_page_order(
+    index_name: str,
+    leading_columns: list[str],
+):
+    table = AuditEventRecord.__table__
+
+    index = next(index for index in table.indexes if index.name == index_name)
+
+    assert [str(expression) for expression in index.expressions] == [
+        *leading_columns,
+        "recorded_at DESC",
+        "audit_events.id",
+    ]
 
 
 def test_audit_events_table_has_no_foreign_keys():
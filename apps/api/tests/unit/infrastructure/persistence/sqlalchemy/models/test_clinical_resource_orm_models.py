@@ -1,4 +1,6 @@
 from sqlalchemy import CheckConstraint, DateTime
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateIndex
 
 from fhir_gateway.domain.entities.observation import ObservationStatus
 from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
@@ -235,13 +237,36 @@ def test_observations_table_has_expected_indexes():
     indexes = _index_columns_by_name(table)
 
     assert set(indexes.keys()) == {
-        "ix_observations_patient_code",
+        "ix_observations_patient_code_effective_at",
         "ix_observations_patient_effective_at",
     }
-    assert indexes["ix_observations_patient_code"] == ("patient_id", "code_id")
+    assert indexes["ix_observations_patient_code_effective_at"] == (
+        "patient_id",
+        "code_id",
+        "effective_at",
+        "id",
+    )
     assert indexes["ix_observations_patient_effective_at"] == (
         "patient_id",
         "effective_at",
+        "id",
+    )
+
+
+def test_observations_by_code_index_covers_reads_of_undeleted_rows():
+    index = next(
+        index
+        for index in ObservationRecord.__table__.indexes
+        if index.name == "ix_observations_patient_code_effective_at"
+    )
+
+    ddl = str(CreateIndex(index).compile(dialect=postgresql.dialect()))
+
+    assert ddl == (
+        "CREATE INDEX ix_observations_patient_code_effective_at "
+        "ON observations (patient_id, code_id, effective_at, id) "
+        "INCLUDE (status, value_quantity, value_unit) "
+        "WHERE deleted_at IS NULL"
     )
 
 
@@ -251,9 +276,13 @@ def test_conditions_table_has_expected_indexes():
     indexes = _index_columns_by_name(table)
 
     assert set(indexes.keys()) == {
-        "ix_conditions_patient_code",
+        "ix_conditions_patient_recorded_at",
     }
-    assert indexes["ix_conditions_patient_code"] == ("patient_id", "code_id")
+    assert indexes["ix_conditions_patient_recorded_at"] == (
+        "patient_id",
+        "recorded_at",
+        "id",
+    )
 
 
 def test_encounters_table_has_expected_indexes():
@@ -267,6 +296,7 @@ def test_encounters_table_has_expected_indexes():
     assert indexes["ix_encounters_patient_period_start_at"] == (
         "patient_id",
         "period_start_at",
+        "id",
     )
 
 
@@ -282,6 +312,22 @@ def test_clinical_resource_tables_do_not_have_deleted_at_indexes():
             }
 
 
+def test_clinical_resource_indexes_exclude_logically_deleted_rows():
+    for table in (
+        ObservationRecord.__table__,
+        ConditionRecord.__table__,
+        EncounterRecord.__table__,
+    ):
+        for index in table.indexes:
+            for dialect in ("postgresql", "sqlite"):
+                predicate = index.dialect_options[dialect]["where"]
+
+                assert str(predicate) == "deleted_at IS NULL", (
+                    index.name,
+                    dialect,
+                )
+
+
 def test_clinical_resource_timestamp_columns_keep_expected_defaults():
     for table in (
         ObservationRecord.__table__,
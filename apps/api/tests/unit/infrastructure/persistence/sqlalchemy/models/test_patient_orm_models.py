@@ -157,3 +157,54 @@ def test_patient_identifier_record_has_patient_relationship():
 
     assert relationship_property.mapper.class_ is PatientRecord
     assert relationship_property.back_populates == "identifiers"
+
+
+def _trigram_indexes(table) -> dict[str, tuple[str, ...]]:
+    return {
+        index.name: tuple(column.name for column in index.columns)
+        for index in table.indexes
+        if index.dialect_options["postgresql"]["using"] == "gin"
+    }
+
+
+def test_patients_table_has_trigram_search_indexes():
+    indexes = _trigram_indexes(PatientRecord.__table__)
+
+    assert indexes == {
+        "ix_patients_id_trgm": ("id",),
+        "ix_patients_name_text_trgm": ("name_text",),
+        "ix_patients_name_family_trgm": ("name_family",),
+    }
+
+
+def test_patient_identifiers_table_has_trigram_search_indexes():
+    indexes = _trigram_indexes(PatientIdentifierRecord.__table__)
+
+    assert indexes == {
+        "ix_patient_identifiers_system_trgm": ("system",),
+        "ix_patient_identifiers_value_trgm": ("value",),
+    }
+
+
+def test_trigram_indexes_use_gin_trgm_ops():
+    tables = (PatientRecord.__table__, PatientIdentifierRecord.__table__)
+
+    for table in tables:
+        for index in table.indexes:
+            if index.dialect_options["postgresql"]["using"] != "gin":
+                continue
+
+            (column,) = index.columns
+            assert index.dialect_options["postgresql"]["ops"] == {
+                column.name: "gin_trgm_ops"
+            }
+
+
+def test_patients_trigram_indexes_exclude_logically_deleted_rows():
+    for index in PatientRecord.__table__.indexes:
+        predicate = index.dialect_options["postgresql"]["where"]
+
+        assert str(predicate) == "deleted_at IS NULL", index.name
+
+    for index in PatientIdentifierRecord.__table__.indexes:
+        assert index.dialect_options["postgresql"]["where"] is None, index.name
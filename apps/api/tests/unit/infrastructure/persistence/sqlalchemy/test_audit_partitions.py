@@ -0,0 +1,264 @@
+import os
+from collections.abc import Iterator
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import Engine, create_engine, insert, select, text
+
+from fhir_gateway.infrastructure.persistence.sqlalchemy.audit_partitions import (
+    AuditEventPartition,
+    create_audit_event_partitions,
+    detach_audit_event_partitions,
+    list_audit_event_partitions,
+    monthly_partitions,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.audit_event import (
+    AuditEventRecord,
+)
+
+TEST_DATABASE_URL_VARIABLE = "FHIR_GATEWAY_TEST_DATABASE_URL"
+
+requires_postgresql = pytest.mark.skipif(
+    not os.environ.get(TEST_DATABASE_URL_VARIABLE),
+    reason=f"{TEST_DATABASE_URL_VARIABLE} is not set",
+)
+
+
+class FakeScalarResult:
+    def __init__(self, values: tuple) -> None:
+        self._values = values
+
+    def scalars(self) -> tuple:
+        return self._values
+
+    def scalar_one(self):
+        (value,) = self._values
+
+        return value
+
+
+class RecordingConnection:
+    """Answer the partition queries and record every DDL statement.
+
+    `default_rows` maps a month's first day to the number of its rows in
+    the default partition.
+    """
+
+    def __init__(
+        self,
+        partition_names: tuple[str, ...] = (),
+        default_rows: dict[datetime, int] | None = None,
+    ) -> None:
+        self.partition_names = partition_names
+        self.default_rows = default_rows or {}
+        self.statements: list[str] = []
+
+    def execute(self, statement, parameters=None) -> FakeScalarResult:
+        if parameters is None:
+            self.statements.append(str(statement))
+
+            return FakeScalarResult(())
+
+        if "pg_inherits" in str(statement):
+            return FakeScalarResult(self.partition_names)
+
+        return FakeScalarResult((self.default_rows.get(parameters["starts_at"], 0),))
+
+
+NOW = datetime(2026, 11, 15, 8, 30, tzinfo=timezone.utc)
+
+
+def test_partition_covers_one_utc_calendar_month():
+    partition = AuditEventPartition.for_month(2026, 12)
+
+    assert partition.name == "audit_events_y2026m12"
+    assert partition.starts_at == datetime(2026, 12, 1, tzinfo=timezone.utc)
+    assert partition.ends_at == datetime(2027, 1, 1, tzinfo=timezone.utc)
+
+
+def test_partition_containing_uses_utc_month():
+    instant = datetime(
+        2026,
+        12,
+        1,
+        0,
+        30,
+        tzinfo=timezone(timedelta(hours=2)),
+    )
+
+    assert AuditEventPartition.containing(instant).name == "audit_events_y2026m11"
+
+
+def test_partition_from_name_ignores_other_tables():
+    assert AuditEventPartition.from_name("audit_events_y2025m02") == (
+        AuditEventPartition.for_month(2025, 2)
+    )
+    assert AuditEventPartition.from_name("audit_events_default") is None
+    assert AuditEventPartition.from_name("audit_events_y2025m02_old") is None
+
+
+def test_partition_create_sql_declares_month_range():
+    partition = AuditEventPartition.for_month(2026, 6)
+
+    assert partition.create_sql() == (
+        "CREATE TABLE IF NOT EXISTS audit_events_y2026m06 "
+        "PARTITION OF audit_events "
+        "FOR VALUES FROM ('2026-06-01T00:00:00+00:00') "
+        "TO ('2026-07-01T00:00:00+00:00')"
+    )
+
+
+def test_monthly_partitions_span_year_boundary():
+    partitions = monthly_partitions(
+        datetime(2026, 11, 20, tzinfo=timezone.utc),
+        datetime(2027, 2, 3, tzinfo=timezone.utc),
+    )
+
+    assert [partition.name for partition in partitions] == [
+        "audit_events_y2026m11",
+        "audit_events_y2026m12",
+        "audit_events_y2027m01",
+        "audit_events_y2027m02",
+    ]
+
+
+def test_create_partitions_skips_existing_partitions():
+    connection = RecordingConnection(
+        ("audit_events_default", "audit_events_y2026m11")
+    )
+
+    created = create_audit_event_partitions(connection, now=NOW, months_ahead=2)
+
+    assert created == ("audit_events_y2026m12", "audit_events_y2027m01")
+    assert connection.statements == [
+        AuditEventPartition.for_month(2026, 12).create_sql(),
+        AuditEventPartition.for_month(2027, 1).create_sql(),
+    ]
+
+
+def test_create_partitions_moves_rows_out_of_default_partition():
+    march = AuditEventPartition.for_month(2027, 3)
+    connection = RecordingConnection(
+        ("audit_events_default", "audit_events_y2026m11"),
+        default_rows={march.starts_at: 2},
+    )
+
+    created = create_audit_event_partitions(connection, now=NOW, months_ahead=4)
+
+    assert created == (
+        "audit_events_y2026m12",
+        "audit_events_y2027m01",
+        "audit_events_y2027m02",
+        "audit_events_y2027m03",
+    )
+    assert connection.statements[3:] == [
+        "ALTER TABLE audit_events DETACH PARTITION audit_events_default",
+        march.create_sql(),
+        march.move_rows_sql("audit_events_default"),
+        "ALTER TABLE audit_events ATTACH PARTITION audit_events_default DEFAULT",
+    ]
+
+
+def test_detach_partitions_keeps_retention_window_and_default_partition():
+    connection = RecordingConnection(
+        (
+            "audit_events_default",
+            "audit_events_y2026m07",
+            "audit_events_y2026m08",
+            "audit_events_y2026m09",
+            "audit_events_y2026m10",
+            "audit_events_y2026m11",
+        )
+    )
+
+    detached = detach_audit_event_partitions(
+        connection,
+        now=NOW,
+        retention_months=3,
+    )
+
+    assert detached == ("audit_events_y2026m07",)
+    assert connection.statements == [
+        "ALTER TABLE audit_events DETACH PARTITION audit_events_y2026m07"
+    ]
+
+
+def test_partition_maintenance_rejects_invalid_bounds():
+    connection = RecordingConnection()
+
+    with pytest.raises(ValueError, match="months_ahead must not be negative."):
+        create_audit_event_partitions(connection, now=NOW, months_ahead=-1)
+
+    with pytest.raises(ValueError, match="retention_months must be at least 1."):
+        detach_audit_event_partitions(connection, now=NOW, retention_months=0)
+
+
+@pytest.fixture
+def postgresql_engine() -> Iterator[Engine]:
+    engine = create_engine(os.environ[TEST_DATABASE_URL_VARIABLE])
+    tables = [AuditEventRecord.__table__]
+    Base.metadata.drop_all(engine, tables=tables)
+    # On PostgreSQL `create_all` also creates the default partition.
+    Base.metadata.create_all(engine, tables=tables)
+
+    yield engine
+
+    Base.metadata.drop_all(engine, tables=tables)
+    engine.dispose()
+
+
+def _audit_event_row(event_id: str, recorded_at: datetime) -> dict:
+    return {
+        "id": event_id,
+        "recorded_at": recorded_at,
+        "agent": "clinician-demo-001",
+        "action": "read",
+        "entity_resource_type": "Patient",
+        "entity_id": "pat-001",
+    }
+
+
+@requires_postgresql
+def test_postgresql_create_partitions_adopts_rows_from_default_partition(
+    postgresql_engine: Engine,
+):
+    early = datetime(2027, 1, 20, tzinfo=timezone.utc)
+
+    with postgresql_engine.begin() as connection:
+        connection.execute(
+            insert(AuditEventRecord),
+            [
+                _audit_event_row("ae-current", NOW),
+                _audit_event_row("ae-early", early),
+            ],
+        )
+
+    with postgresql_engine.begin() as connection:
+        created = create_audit_event_partitions(
+            connection,
+            now=NOW,
+            months_ahead=2,
+        )
+
+    with postgresql_engine.connect() as connection:
+        partitions = list_audit_event_partitions(connection)
+        placement = dict(
+            connection.execute(
+                select(
+                    AuditEventRecord.id,
+                    text("tableoid::regclass::text"),
+                )
+            ).all()
+        )
+
+    assert created == (
+        "audit_events_y2026m11",
+        "audit_events_y2026m12",
+        "audit_events_y2027m01",
+    )
+    assert "audit_events_default" in partitions
+    assert placement == {
+        "ae-current": "audit_events_y2026m11",
+        "ae-early": "audit_events_y2027m01",
+    }
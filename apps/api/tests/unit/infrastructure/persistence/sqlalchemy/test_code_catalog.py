@@ -0,0 +1,253 @@
+from collections.abc import Iterator
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import Session, sessionmaker
+
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
+from fhir_gateway.infrastructure.persistence.sqlalchemy.code_catalog import (
+    CodeCatalog,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.observation import (
+    ObservationCodeRecord,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def session() -> Iterator[Session]:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+
+    Base.metadata.create_all(engine, tables=[ObservationCodeRecord.__table__])
+
+    with sessionmaker(bind=engine, expire_on_commit=False)() as session:
+        session.add_all(
+            [
+                ObservationCodeRecord(
+                    id=1,
+                    system="http://loinc.org",
+                    code="4548-4",
+                    display="Hemoglobin A1c",
+                ),
+                ObservationCodeRecord(
+                    id=2,
+                    system="http://loinc.org",
+                    code="2339-0",
+                ),
+                ObservationCodeRecord(
+                    id=3,
+                    system="http://loinc.org",
+                    code="8867-4",
+                ),
+            ]
+        )
+        session.commit()
+
+        yield session
+
+    engine.dispose()
+
+
+@pytest.fixture
+def statements(session: Session) -> Iterator[list[str]]:
+    recorded: list[str] = []
+    engine = session.get_bind()
+
+    def record_statement(_conn, _cursor, statement, *_args) -> None:
+        recorded.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record_statement)
+
+    yield recorded
+
+    event.remove(engine, "before_cursor_execute", record_statement)
+
+
+def _catalog(
+    *,
+    max_entries: int = 10,
+    clock: FakeClock | None = None,
+) -> CodeCatalog:
+    return CodeCatalog(
+        ObservationCodeRecord,
+        max_entries=max_entries,
+        refresh_interval_seconds=30,
+        clock=clock or FakeClock(),
+    )
+
+
+def test_code_catalog_resolves_codes_by_id(session: Session):
+    catalog = _catalog()
+
+    codes = catalog.resolve(session, [1, 2, 1])
+
+    assert codes == {
+        1: Code(
+            system="http://loinc.org",
+            code="4548-4",
+            display="Hemoglobin A1c",
+        ),
+        2: Code(system="http://loinc.org", code="2339-0"),
+    }
+
+
+def test_code_catalog_returns_interned_codes_without_querying_again(
+    session: Session,
+    statements: list[str],
+):
+    catalog = _catalog()
+
+    first = catalog.resolve(session, [1, 2])
+    queries_after_first_resolve = len(statements)
+    second = catalog.resolve(session, [2, 1])
+
+    assert second[1] is first[1]
+    assert second[2] is first[2]
+    assert len(statements) == queries_after_first_resolve
+
+    stats = catalog.stats()
+
+    assert (stats.hits, stats.misses, stats.entries) == (2, 2, 2)
+    assert stats.backend == "code-catalog:observation_codes"
+
+
+def test_code_catalog_loads_only_unknown_ids(
+    session: Session,
+    statements: list[str],
+):
+    catalog = _catalog()
+    catalog.resolve(session, [1])
+    statements.clear()
+
+    codes = catalog.resolve(session, [1, 3])
+
+    assert set(codes) == {1, 3}
+    assert len(statements) == 1
+
+
+def test_code_catalog_resolves_code_ids_once_and_interns_their_codes(
+    session: Session,
+    statements: list[str],
+):
+    catalog = _catalog()
+    hba1c = Code(system="http://loinc.org", code="4548-4")
+
+    assert catalog.resolve_id(session, hba1c) == 1
+
+    statements.clear()
+
+    assert catalog.resolve_id(session, hba1c) == 1
+    assert catalog.resolve(session, [1])[1] == Code(
+        system="http://loinc.org",
+        code="4548-4",
+        display="Hemoglobin A1c",
+    )
+    assert statements == []
+
+
+def test_code_catalog_does_not_cache_unknown_code_ids(
+    session: Session,
+    statements: list[str],
+):
+    catalog = _catalog()
+    missing = Code(system="http://loinc.org", code="0000-0")
+
+    assert catalog.resolve_id(session, missing) is None
+
+    session.add(ObservationCodeRecord(id=4, system="http://loinc.org", code="0000-0"))
+    session.commit()
+    statements.clear()
+
+    assert catalog.resolve_id(session, missing) == 4
+    assert len(statements) == 1
+
+
+def test_code_catalog_picks_up_edited_codes_after_refresh_interval(
+    session: Session,
+):
+    clock = FakeClock()
+    catalog = _catalog(clock=clock)
+    original = catalog.resolve(session, [1])[1]
+
+    record = session.get(ObservationCodeRecord, 1)
+    record.display = "HbA1c"
+    record.updated_at = datetime(2099, 1, 1, tzinfo=timezone.utc)
+    session.commit()
+
+    clock.now = 29.9
+
+    assert catalog.resolve(session, [1])[1] is original
+
+    clock.now = 30.0
+
+    assert catalog.resolve(session, [1])[1].display == "HbA1c"
+
+
+def test_code_catalog_keeps_codes_when_version_is_unchanged(session: Session):
+    clock = FakeClock()
+    catalog = _catalog(clock=clock)
+    original = catalog.resolve(session, [1])[1]
+
+    clock.now = 60.0
+
+    assert catalog.resolve(session, [1])[1] is original
+
+
+def test_code_catalog_evicts_least_recently_used_codes(session: Session):
+    catalog = _catalog(max_entries=2)
+
+    catalog.resolve(session, [1])
+    catalog.resolve(session, [2])
+    catalog.resolve(session, [1])
+    codes = catalog.resolve(session, [3])
+
+    assert set(codes) == {3}
+
+    stats = catalog.stats()
+
+    assert (stats.entries, stats.evictions) == (2, 1)
+
+    catalog.resolve(session, [1])
+
+    assert catalog.stats().hits == 2
+
+
+def test_code_catalog_leaves_out_unknown_code_ids_with_warning(
+    session: Session,
+    caplog: pytest.LogCaptureFixture,
+):
+    catalog = _catalog()
+
+    codes = catalog.resolve(session, [1, 99])
+
+    assert set(codes) == {1}
+    assert "observation_codes has no rows with id 99" in caplog.text
+
+
+@pytest.mark.parametrize(
+    ("max_entries", "refresh_interval_seconds", "message"),
+    [
+        (0, 30, "max_entries must be at least 1."),
+        (10, 0, "refresh_interval_seconds must be greater than 0."),
+    ],
+)
+def test_code_catalog_rejects_invalid_bounds(
+    max_entries: int,
+    refresh_interval_seconds: float,
+    message: str,
+):
+    with pytest.raises(ValueError, match=message):
+        CodeCatalog(
+            ObservationCodeRecord,
+            max_entries=max_entries,
+            refresh_interval_seconds=refresh_interval_seconds,
+        )
@@ -0,0 +1,137 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    DatabaseEngineOptions,
+    create_database_engine,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.pool_metrics import (
+    WAIT_BUCKET_BOUNDS_MS,
+    PoolMetrics,
+)
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+        self.step = 0.0
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+@pytest.fixture
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture
+def metrics(clock: FakeClock) -> PoolMetrics:
+    return PoolMetrics(clock=clock)
+
+
+@pytest.fixture
+def engine(tmp_path: Path, metrics: PoolMetrics) -> Iterator[Engine]:
+    engine = create_database_engine(
+        f"sqlite:///{tmp_path / 'pool.sqlite3'}",
+        DatabaseEngineOptions(pool_size=1, max_overflow=1, pool_timeout_seconds=0.01),
+        pool_metrics=metrics,
+    )
+
+    yield engine
+
+    engine.dispose()
+
+
+def _buckets(metrics: PoolMetrics) -> dict[float | None, int]:
+    return dict(metrics.stats().wait_buckets)
+
+
+def test_stats_report_an_idle_pool_before_any_checkout(metrics: PoolMetrics):
+    stats = metrics.stats()
+
+    assert stats.pool_size == 0
+    assert stats.checked_out == 0
+    assert stats.checkouts == 0
+    assert stats.wait_seconds_total == 0.0
+    assert [bound for bound, _count in stats.wait_buckets] == [
+        *WAIT_BUCKET_BOUNDS_MS,
+        None,
+    ]
+    assert all(count == 0 for _bound, count in stats.wait_buckets)
+
+
+def test_stats_track_checked_out_and_overflow_connections(
+    engine: Engine,
+    metrics: PoolMetrics,
+):
+    with engine.connect() as first, engine.connect() as second:
+        first.execute(text("SELECT 1"))
+        second.execute(text("SELECT 1"))
+        stats = metrics.stats()
+
+        assert stats.pool_size == 1
+        assert stats.checked_out == 2
+        assert stats.overflow == 1
+
+    stats = metrics.stats()
+
+    assert stats.checked_out == 0
+    assert stats.checked_in == 1
+    assert stats.checkouts == 2
+
+
+def test_stats_bucket_checkout_waits_cumulatively(
+    engine: Engine,
+    metrics: PoolMetrics,
+    clock: FakeClock,
+):
+    clock.step = 0.003
+
+    with engine.connect():
+        pass
+
+    clock.step = 0.2
+
+    with engine.connect():
+        pass
+
+    buckets = _buckets(metrics)
+
+    assert buckets[1.0] == 0
+    assert buckets[5.0] == 1
+    assert buckets[100.0] == 1
+    assert buckets[250.0] == 2
+    assert buckets[None] == 2
+    assert metrics.stats().wait_seconds_total == pytest.approx(0.203)
+
+
+def test_stats_count_checkouts_that_time_out(engine: Engine, metrics: PoolMetrics):
+    with engine.connect(), engine.connect():
+        with pytest.raises(PoolTimeoutError):
+            engine.connect()
+
+    stats = metrics.stats()
+
+    assert stats.timeouts == 1
+    assert stats.checkouts == 3
+
+
+def test_metrics_follow_the_pool_recreated_by_dispose(
+    engine: Engine,
+    metrics: PoolMetrics,
+):
+    with engine.connect():
+        pass
+
+    engine.dispose()
+
+    with engine.connect():
+        assert metrics.stats().checked_out == 1
+
+    assert metrics.stats().checkouts == 2
@@ -0,0 +1,489 @@
+"""Check that hot read queries use the indexes designed for them.
+
+Every case runs one adapter read, captures the statements it executes and
+checks that the tables it reads are searched through the indexes built for
+that read. The SQLite tests always run and read `EXPLAIN QUERY PLAN`. The
+PostgreSQL tests read `EXPLAIN (FORMAT JSON)` and only run when
+`FHIR_GATEWAY_TEST_DATABASE_URL` points to an empty, disposable database.
+"""
+
+import os
+import re
+from collections.abc import Callable, Iterator
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from sqlalchemy import Connection, Engine, create_engine, event, insert
+from sqlalchemy.orm import Session
+
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.persistence.sqlalchemy import models
+from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    SqlAlchemyConditionReader,
+    SqlAlchemyEncounterReader,
+    SqlAlchemyObservationReader,
+    SqlAlchemyPatientReader,
+    SqlAlchemyPatientSummaryReader,
+    SqlAlchemyPatientVersionReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
+from fhir_gateway.infrastructure.persistence.sqlalchemy.code_catalog import (
+    CodeCatalog,
+)
+
+TEST_DATABASE_URL_VARIABLE = "FHIR_GATEWAY_TEST_DATABASE_URL"
+
+CLINICAL_TABLES = [
+    models.PatientRecord.__table__,
+    models.PatientIdentifierRecord.__table__,
+    models.ConditionCodeRecord.__table__,
+    models.ConditionRecord.__table__,
+    models.EncounterRecord.__table__,
+    models.ObservationCodeRecord.__table__,
+    models.ObservationRecord.__table__,
+]
+
+PATIENT_ID = ResourceId("pat-0001")
+HBA1C = Code(system="http://loinc.org", code="4548-4")
+MRN_SYSTEM = "https://hospital.example.org/mrn"
+BASE_INSTANT = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+requires_postgresql = pytest.mark.skipif(
+    not os.environ.get(TEST_DATABASE_URL_VARIABLE),
+    reason=f"{TEST_DATABASE_URL_VARIABLE} is not set",
+)
+
+
+def _seed_patient_charts(
+    engine: Engine,
+    *,
+    patients: int,
+    resources_per_patient: int,
+) -> None:
+    patient_ids = [f"pat-{patient:04d}" for patient in range(patients)]
+
+    def resource_rows(prefix: str, build_columns: Callable[[int], dict]) -> list:
+        # Every tenth resource is logically deleted, so the partial indexes
+        # really leave rows out.
+        return [
+            {
+                "id": f"{prefix}-{patient_id}-{index:04d}",
+                "patient_id": patient_id,
+                "deleted_at": BASE_INSTANT if index % 10 == 0 else None,
+                **build_columns(index),
+            }
+            for patient_id in patient_ids
+            for index in range(resources_per_patient)
+        ]
+
+    with engine.begin() as connection:
+        connection.execute(
+            insert(models.ConditionCodeRecord),
+            [{"id": 1, "system": "http://snomed.info/sct", "code": "44054006"}],
+        )
+        connection.execute(
+            insert(models.ObservationCodeRecord),
+            [
+                {"id": 1, "system": HBA1C.system, "code": HBA1C.code},
+                {"id": 2, "system": "http://loinc.org", "code": "2339-0"},
+            ],
+        )
+        connection.execute(
+            insert(models.PatientRecord),
+            [
+                {"id": patient_id, "name_text": "Synthetic Patient"}
+                for patient_id in patient_ids
+            ],
+        )
+        connection.execute(
+            insert(models.PatientIdentifierRecord),
+            [
+                {
+                    "patient_id": patient_id,
+                    "system": MRN_SYSTEM,
+                    "value": f"MRN-{patient_id}",
+                }
+                for patient_id in patient_ids
+            ],
+        )
+        connection.execute(
+            insert(models.ConditionRecord),
+            resource_rows(
+                "con",
+                lambda index: {
+                    "code_id": 1,
+                    "recorded_at": BASE_INSTANT + timedelta(days=index),
+                },
+            ),
+        )
+        connection.execute(
+            insert(models.EncounterRecord),
+            resource_rows(
+                "enc",
+                lambda index: {
+                    "period_start_at": BASE_INSTANT + timedelta(days=index),
+                },
+            ),
+        )
+        connection.execute(
+            insert(models.ObservationRecord),
+            resource_rows(
+                "obs",
+                lambda index: {
+                    "status": "final",
+                    "code_id": 1 + index % 2,
+                    "effective_at": BASE_INSTANT + timedelta(days=index),
+                    "value_quantity": 5.0 + index % 30 / 10,
+                    "value_unit": "%",
+                },
+            ),
+        )
+
+
+def _capture_statements(
+    engine: Engine,
+    read: Callable[[Session], object],
+) -> list[tuple[str, object]]:
+    """Run `read` on a session and return the statements it executed."""
+    statements: list[tuple[str, object]] = []
+
+    def record_statement(_conn, _cursor, statement, parameters, *_args) -> None:
+        statements.append((statement, parameters))
+
+    with Session(engine) as session:
+        # Warm the code catalogs first, so only the resource queries are left.
+        read(session)
+        event.listen(engine, "before_cursor_execute", record_statement)
+
+        try:
+            read(session)
+        finally:
+            event.remove(engine, "before_cursor_execute", record_statement)
+
+    return statements
+
+
+_OBSERVATION_CATALOG = CodeCatalog(
+    models.ObservationCodeRecord,
+    max_entries=100,
+    refresh_interval_seconds=3600,
+)
+_CONDITION_CATALOG = CodeCatalog(
+    models.ConditionCodeRecord,
+    max_entries=100,
+    refresh_interval_seconds=3600,
+)
+
+
+def _catalog_reader(session: Session) -> SqlAlchemyObservationReader:
+    return SqlAlchemyObservationReader(session, _OBSERVATION_CATALOG)
+
+
+def _catalog_condition_reader(session: Session) -> SqlAlchemyConditionReader:
+    return SqlAlchemyConditionReader(session, _CONDITION_CATALOG)
+
+
+# Reads that join the code table may also reach observations through the
+# by-code index; either way only live rows are read.
+LIVE_ROW_INDEXES = {
+    "conditions": ("ix_conditions_patient_recorded_at",),
+    "encounters": ("ix_encounters_patient_period_start_at",),
+    "observations": (
+        "ix_observations_patient_effective_at",
+        "ix_observations_patient_code_effective_at",
+    ),
+}
+
+# Each read names, for every table it must search rather than scan, the
+# indexes built for it, and whether that index provides the read's ORDER BY.
+ADAPTER_READS = pytest.mark.parametrize(
+    ("read", "expected_indexes", "ordered_by_index"),
+    [
+        pytest.param(
+            lambda session: SqlAlchemyConditionReader(session).list_by_patient(
+                PATIENT_ID
+            ),
+            {"conditions": ("ix_conditions_patient_recorded_at",)},
+            True,
+            id="conditions",
+        ),
+        pytest.param(
+            lambda session: _catalog_condition_reader(session).list_by_patient(
+                PATIENT_ID
+            ),
+            {"conditions": ("ix_conditions_patient_recorded_at",)},
+            True,
+            id="conditions-code-catalog",
+        ),
+        pytest.param(
+            lambda session: SqlAlchemyEncounterReader(session).list_by_patient(
+                PATIENT_ID
+            ),
+            {"encounters": ("ix_encounters_patient_period_start_at",)},
+            True,
+            id="encounters",
+        ),
+        pytest.param(
+            lambda session: SqlAlchemyObservationReader(session).list_by_patient(
+                PATIENT_ID
+            ),
+            {"observations": ("ix_observations_patient_effective_at",)},
+            True,
+            id="observations",
+        ),
+        pytest.param(
+            lambda session: _catalog_reader(session).list_by_patient(PATIENT_ID),
+            {"observations": ("ix_observations_patient_effective_at",)},
+            True,
+            id="observations-code-catalog",
+        ),
+        pytest.param(
+            lambda session: SqlAlchemyObservationReader(
+                session
+            ).list_by_patient_and_code(PATIENT_ID, HBA1C),
+            {"observations": ("ix_observations_patient_code_effective_at",)},
+            True,
+            id="observations-by-code",
+        ),
+        pytest.param(
+            lambda session: _catalog_reader(session).list_by_patient_and_code(
+                PATIENT_ID,
+                HBA1C,
+            ),
+            {"observations": ("ix_observations_patient_code_effective_at",)},
+            True,
+            id="observations-by-code-code-catalog",
+        ),
+        pytest.param(
+            lambda session: SqlAlchemyObservationReader(
+                session
+            ).list_series_by_patient_and_code(PATIENT_ID, HBA1C),
+            {"observations": ("ix_observations_patient_code_effective_at",)},
+            True,
+            id="observation-series",
+        ),
+        pytest.param(
+            lambda session: _catalog_reader(
+                session
+            ).list_series_by_patient_and_code(PATIENT_ID, HBA1C),
+            {"observations": ("ix_observations_patient_code_effective_at",)},
+            True,
+            id="observation-series-code-catalog",
+        ),
+        pytest.param(
+            lambda session: SqlAlchemyPatientSummaryReader(session).get_summary(
+                PATIENT_ID
+            ),
+            LIVE_ROW_INDEXES,
+            False,
+            id="patient-summary",
+        ),
+        pytest.param(
+            lambda session: SqlAlchemyPatientVersionReader(session).get_version(
+                PATIENT_ID
+            ),
+            LIVE_ROW_INDEXES,
+            False,
+            id="patient-version",
+        ),
+        pytest.param(
+            lambda session: SqlAlchemyPatientReader(session).search_by_text(
+                f"{MRN_SYSTEM}|MRN-{PATIENT_ID.value}",
+                limit=10,
+            ),
+            {"patient_identifiers": ("ix_patient_identifiers_system_value",)},
+            False,
+            id="patient-search-by-identifier",
+        ),
+    ],
+)
+
+# The default configuration has no code catalog and resolves the code in
+# scalar subqueries of the same statement.
+BY_CODE_READS = pytest.mark.parametrize(
+    "read",
+    [
+        pytest.param(
+            lambda session: SqlAlchemyObservationReader(
+                session
+            ).list_by_patient_and_code(PATIENT_ID, HBA1C),
+            id="observations-by-code",
+        ),
+        pytest.param(
+            lambda session: _catalog_reader(session).list_by_patient_and_code(
+                PATIENT_ID,
+                HBA1C,
+            ),
+            id="observations-by-code-code-catalog",
+        ),
+        pytest.param(
+            lambda session: SqlAlchemyObservationReader(
+                session
+            ).list_series_by_patient_and_code(PATIENT_ID, HBA1C),
+            id="observation-series",
+        ),
+        pytest.param(
+            lambda session: _catalog_reader(
+                session
+            ).list_series_by_patient_and_code(PATIENT_ID, HBA1C),
+            id="observation-series-code-catalog",
+        ),
+    ],
+)
+
+
+@pytest.fixture
+def sqlite_engine() -> Iterator[Engine]:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(engine, tables=CLINICAL_TABLES)
+    _seed_patient_charts(engine, patients=20, resources_per_patient=100)
+
+    with engine.begin() as connection:
+        connection.exec_driver_sql("ANALYZE")
+
+    yield engine
+
+    engine.dispose()
+
+
+def _sqlite_plan(connection: Connection, statement: str, parameters) -> str:
+    rows = connection.exec_driver_sql(
+        f"EXPLAIN QUERY PLAN {statement}",
+        parameters,
+    ).all()
+
+    return "\n".join(row[-1] for row in rows)
+
+
+@ADAPTER_READS
+def test_sqlite_adapter_reads_search_their_indexes(
+    sqlite_engine: Engine,
+    read: Callable[[Session], object],
+    expected_indexes: dict[str, tuple[str, ...]],
+    ordered_by_index: bool,
+):
+    statements = _capture_statements(sqlite_engine, read)
+
+    with sqlite_engine.connect() as connection:
+        plan = "\n".join(
+            _sqlite_plan(connection, statement, parameters)
+            for statement, parameters in statements
+        )
+
+    for table, indexes in expected_indexes.items():
+        searches = re.findall(
+            rf"SEARCH {table} USING (?:COVERING )?INDEX (\w+)",
+            plan,
+        )
+
+        assert set(searches) & set(indexes), plan
+        assert not re.search(rf"\bSCAN {table}\b", plan), plan
+
+    if ordered_by_index:
+        assert "TEMP B-TREE" not in plan, plan
+
+
+@BY_CODE_READS
+def test_sqlite_by_code_reads_search_the_by_code_index_without_sorting(
+    sqlite_engine: Engine,
+    read: Callable[[Session], object],
+):
+    (statement, parameters), = _capture_statements(sqlite_engine, read)
+
+    with sqlite_engine.connect() as connection:
+        plan = _sqlite_plan(connection, statement, parameters)
+
+    assert (
+        "SEARCH observations USING INDEX "
+        "ix_observations_patient_code_effective_at (patient_id=? AND code_id=?)"
+    ) in plan
+    assert "TEMP B-TREE" not in plan
+
+
+@pytest.fixture
+def postgresql_engine() -> Iterator[Engine]:
+    engine = create_engine(os.environ[TEST_DATABASE_URL_VARIABLE])
+    Base.metadata.drop_all(engine, tables=CLINICAL_TABLES)
+    Base.metadata.create_all(engine, tables=CLINICAL_TABLES)
+    _seed_patient_charts(engine, patients=200, resources_per_patient=200)
+
+    # VACUUM sets the visibility map bits an index-only scan relies on.
+    with engine.connect().execution_options(
+        isolation_level="AUTOCOMMIT"
+    ) as connection:
+        connection.exec_driver_sql("VACUUM ANALYZE")
+
+    yield engine
+
+    Base.metadata.drop_all(engine, tables=CLINICAL_TABLES)
+    engine.dispose()
+
+
+def _postgresql_plan(connection: Connection, statement: str, parameters) -> dict:
+    # Sequential scans are disabled so the planner's choice between index
+    # paths, not the tables' small size, decides the plan.
+    connection.exec_driver_sql("SET enable_seqscan = off")
+    (plan,) = connection.exec_driver_sql(
+        f"EXPLAIN (FORMAT JSON) {statement}",
+        parameters,
+    ).scalar_one()
+
+    return plan["Plan"]
+
+
+def _plan_nodes(plan: dict) -> Iterator[dict]:
+    yield plan
+
+    for child in plan.get("Plans", ()):
+        yield from _plan_nodes(child)
+
+
+@requires_postgresql
+@BY_CODE_READS
+def test_postgresql_by_code_reads_are_index_only_scans(
+    postgresql_engine: Engine,
+    read: Callable[[Session], object],
+):
+    (statement, parameters), = _capture_statements(postgresql_engine, read)
+
+    with postgresql_engine.connect() as connection:
+        plan = _postgresql_plan(connection, statement, parameters)
+
+    node_types = [node["Node Type"] for node in _plan_nodes(plan)]
+
+    assert plan["Node Type"] == "Index Only Scan"
+    assert plan["Index Name"] == "ix_observations_patient_code_effective_at"
+    assert "Sort" not in node_types
+
+
+@requires_postgresql
+@ADAPTER_READS
+def test_postgresql_adapter_reads_scan_their_indexes(
+    postgresql_engine: Engine,
+    read: Callable[[Session], object],
+    expected_indexes: dict[str, tuple[str, ...]],
+    ordered_by_index: bool,
+):
+    statements = _capture_statements(postgresql_engine, read)
+
+    with postgresql_engine.connect() as connection:
+        plans = [
+            _postgresql_plan(connection, statement, parameters)
+            for statement, parameters in statements
+        ]
+
+    nodes = [node for plan in plans for node in _plan_nodes(plan)]
+    node_types = [node["Node Type"] for node in nodes]
+    # Bitmap index scans carry the index name but not the table name.
+    index_names = {node["Index Name"] for node in nodes if "Index Name" in node}
+    seq_scanned = {
+        node["Relation Name"] for node in nodes if node["Node Type"] == "Seq Scan"
+    }
+
+    for table, indexes in expected_indexes.items():
+        assert index_names & set(indexes), nodes
+        assert table not in seq_scanned, nodes
+
+    if ordered_by_index:
+        assert "Sort" not in node_types
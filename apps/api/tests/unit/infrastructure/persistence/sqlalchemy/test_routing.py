@@ -0,0 +1,174 @@
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from sqlalchemy import Engine, text
+from sqlalchemy.orm import Session, sessionmaker
+
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    DatabaseEngineOptions,
+    create_database_engine,
+    create_session_factory,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.routing import ReplicaRouter
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 100.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def engines(tmp_path: Path) -> Iterator[dict[str, Engine]]:
+    # One SQLite file per role stands in for a primary and its replicas.
+    engines = {
+        name: create_database_engine(
+            f"sqlite:///{tmp_path / f'{name}.sqlite3'}",
+            DatabaseEngineOptions(pool_size=2, max_overflow=0),
+        )
+        for name in ("primary", "replica-a", "replica-b")
+    }
+
+    for name, engine in engines.items():
+        with engine.begin() as connection:
+            connection.execute(text("CREATE TABLE node (name TEXT)"))
+            connection.execute(text("INSERT INTO node VALUES (:name)"), {"name": name})
+
+    yield engines
+
+    for engine in engines.values():
+        engine.dispose()
+
+
+@pytest.fixture
+def factories(engines: dict[str, Engine]) -> dict[str, sessionmaker[Session]]:
+    return {name: create_session_factory(engine) for name, engine in engines.items()}
+
+
+def _node(session_factory: sessionmaker[Session]) -> str:
+    with session_factory() as session:
+        return session.execute(
+            text("SELECT name FROM node ORDER BY rowid LIMIT 1")
+        ).scalar_one()
+
+
+def _router(
+    factories: dict[str, sessionmaker[Session]],
+    **kwargs,
+) -> ReplicaRouter[sessionmaker[Session]]:
+    return ReplicaRouter(
+        factories["primary"],
+        [factories["replica-a"], factories["replica-b"]],
+        **kwargs,
+    )
+
+
+def test_reads_use_primary_without_replicas(
+    factories: dict[str, sessionmaker[Session]],
+):
+    router = ReplicaRouter(factories["primary"], read_your_writes_seconds=5.0)
+
+    assert _node(router.for_read()) == "primary"
+    assert router.read_your_writes_enabled is False
+
+
+def test_round_robin_alternates_between_replicas(
+    factories: dict[str, sessionmaker[Session]],
+):
+    router = _router(factories)
+
+    assert [_node(router.for_read()) for _ in range(4)] == [
+        "replica-a",
+        "replica-b",
+        "replica-a",
+        "replica-b",
+    ]
+    assert _node(router.primary) == "primary"
+
+
+def test_least_connections_skips_busy_replica(
+    engines: dict[str, Engine],
+    factories: dict[str, sessionmaker[Session]],
+):
+    router = _router(factories, selection="least-connections")
+
+    with engines["replica-a"].connect():
+        assert [_node(router.for_read()) for _ in range(3)] == ["replica-b"] * 3
+
+    assert [_node(router.for_read()) for _ in range(2)] == [
+        "replica-b",
+        "replica-a",
+    ]
+
+
+def test_committed_write_pins_key_to_primary_for_window(
+    factories: dict[str, sessionmaker[Session]],
+):
+    clock = FakeClock()
+    router = _router(factories, read_your_writes_seconds=2.0, clock=clock)
+
+    with router.primary() as session:
+        router.track_writes(session, "user-123")
+        session.execute(text("INSERT INTO node VALUES ('written')"))
+        session.commit()
+
+    assert _node(router.for_read("user-123")) == "primary"
+    assert _node(router.for_read("user-456")).startswith("replica")
+
+    clock.now += 2.0
+
+    assert _node(router.for_read("user-123")).startswith("replica")
+
+
+def test_rolled_back_session_does_not_pin_key(
+    factories: dict[str, sessionmaker[Session]],
+):
+    router = _router(factories, read_your_writes_seconds=2.0)
+
+    with router.primary() as session:
+        router.track_writes(session, "user-123")
+        session.rollback()
+
+    assert router.for_read("user-123") is not router.primary
+
+
+def test_record_write_drops_expired_keys(
+    factories: dict[str, sessionmaker[Session]],
+):
+    clock = FakeClock()
+    router = _router(factories, read_your_writes_seconds=1.0, clock=clock)
+
+    router.record_write("user-123")
+    clock.now += 5.0
+    router.record_write("user-456")
+
+    assert list(router._sticky_until) == ["user-456"]
+
+
+def test_record_write_is_ignored_when_window_is_disabled(
+    factories: dict[str, sessionmaker[Session]],
+):
+    router = _router(factories)
+
+    router.record_write("user-123")
+
+    assert router.for_read("user-123") is not router.primary
+
+
+@pytest.mark.parametrize(
+    ("kwargs", "message"),
+    [
+        ({"selection": "random"}, "Unsupported replica selection"),
+        ({"read_your_writes_seconds": -1.0}, "must not be negative"),
+    ],
+)
+def test_router_rejects_invalid_configuration(
+    factories: dict[str, sessionmaker[Session]],
+    kwargs: dict[str, object],
+    message: str,
+):
+    with pytest.raises(ValueError, match=message):
+        _router(factories, **kwargs)
@@ -0,0 +1,86 @@
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models.patient import (
+    PatientRecord,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.streaming import (
+    STREAM_BATCH_SIZE,
+    stream_rows,
+)
+
+
+class FakeResult:
+    def __init__(self, rows: list[tuple]) -> None:
+        self.rows = rows
+        self.closed = False
+
+    def __iter__(self):
+        return iter(self.rows)
+
+    def close(self) -> None:
+        self.closed = True
+
+
+class FakeSession:
+    def __init__(self, result: FakeResult) -> None:
+        self.result = result
+        self.execution_options: dict | None = None
+
+    def execute(self, _stmt, *, execution_options: dict) -> FakeResult:
+        self.execution_options = execution_options
+        return self.result
+
+
+def test_stream_rows_yields_all_rows_in_small_batches():
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+    Base.metadata.create_all(engine, tables=[PatientRecord.__table__])
+
+    with Session(engine) as session:
+        session.add_all(
+            [
+                PatientRecord(id=f"pat-{index:03d}", name_text=f"Patient {index}")
+                for index in range(5)
+            ]
+        )
+        session.commit()
+
+        stmt = select(PatientRecord.id).order_by(PatientRecord.id)
+
+        rows = list(stream_rows(session, stmt, batch_size=2))
+
+    assert [patient_id for (patient_id,) in rows] == [
+        "pat-000",
+        "pat-001",
+        "pat-002",
+        "pat-003",
+        "pat-004",
+    ]
+
+
+def test_stream_rows_uses_yield_per_execution_option():
+    session = FakeSession(FakeResult([]))
+
+    list(stream_rows(session, select(PatientRecord.id)))
+
+    assert session.execution_options == {"yield_per": STREAM_BATCH_SIZE}
+
+
+def test_stream_rows_closes_result_when_stream_is_closed_early():
+    result = FakeResult([("pat-001",), ("pat-002",)])
+    stream = stream_rows(FakeSession(result), select(PatientRecord.id))
+
+    assert next(stream) == ("pat-001",)
+
+    stream.close()
+
+    assert result.closed is True
+
+
+def test_stream_rows_closes_result_when_exhausted():
+    result = FakeResult([("pat-001",)])
+
+    list(stream_rows(FakeSession(result), select(PatientRecord.id)))
+
+    assert result.closed is True
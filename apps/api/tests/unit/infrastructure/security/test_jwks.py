@@ -0,0 +1,243 @@
+import json
+import logging
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from threading import Thread
+from typing import Any
+
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from jwt.algorithms import ECAlgorithm, OKPAlgorithm, RSAAlgorithm
+
+from fhir_gateway.infrastructure.security import JwksKeyProvider, jwks_fetcher
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeJwksSource:
+    def __init__(self, *keys: dict[str, Any]) -> None:
+        self.keys = list(keys)
+        self.fetches = 0
+        self.error: Exception | None = None
+
+    def __call__(self) -> bytes:
+        self.fetches += 1
+
+        if self.error is not None:
+            raise self.error
+
+        return json.dumps({"keys": self.keys}).encode("utf-8")
+
+
+def _rsa_jwk(kid: str) -> dict[str, Any]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    jwk = RSAAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+
+    return {**jwk, "kid": kid, "use": "sig", "alg": "RS256"}
+
+
+def _ec_jwk(kid: str) -> dict[str, Any]:
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    jwk = ECAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+
+    return {**jwk, "kid": kid}
+
+
+def _ed25519_jwk(kid: str) -> dict[str, Any]:
+    private_key = ed25519.Ed25519PrivateKey.generate()
+    jwk = OKPAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+
+    return {**jwk, "kid": kid}
+
+
+def test_refresh_indexes_parsed_keys_by_kid():
+    provider = JwksKeyProvider(
+        FakeJwksSource(_rsa_jwk("rsa-1"), _ec_jwk("ec-1"), _ed25519_jwk("ed-1")),
+    )
+
+    provider.refresh()
+
+    assert provider.key_ids == ("rsa-1", "ec-1", "ed-1")
+    assert provider.get_signing_key("rsa-1").algorithm_name == "RS256"
+    assert provider.get_signing_key("ec-1").algorithm_name == "ES256"
+    assert provider.get_signing_key("ed-1").algorithm_name == "EdDSA"
+    assert provider.get_signing_key("rsa-1") is provider.get_signing_key("rsa-1")
+
+
+def test_refresh_skips_encryption_and_unusable_keys(caplog: pytest.LogCaptureFixture):
+    provider = JwksKeyProvider(
+        FakeJwksSource(
+            _rsa_jwk("rsa-1"),
+            {**_rsa_jwk("rsa-enc"), "use": "enc"},
+            {"kty": "RSA", "kid": "broken"},
+            {"kty": "RSA"},
+        ),
+    )
+
+    with caplog.at_level(logging.WARNING):
+        provider.refresh()
+
+    assert provider.key_ids == ("rsa-1",)
+    assert "broken" in caplog.text
+
+
+@pytest.mark.parametrize("document", [b"not json", b"{}", b'{"keys": {}}'])
+def test_refresh_rejects_malformed_documents(document: bytes):
+    provider = JwksKeyProvider(lambda: document)
+
+    with pytest.raises(ValueError):
+        provider.refresh()
+
+
+def test_rotated_out_key_is_served_during_overlap():
+    clock = FakeClock()
+    source = FakeJwksSource(_rsa_jwk("old"))
+    provider = JwksKeyProvider(source, rotation_overlap_seconds=60, clock=clock)
+    provider.refresh()
+
+    source.keys = [_rsa_jwk("new")]
+    provider.refresh()
+
+    assert set(provider.key_ids) == {"old", "new"}
+    assert provider.get_signing_key("old") is not None
+
+    clock.now += 60
+
+    assert provider.get_signing_key("old") is None
+
+    provider.refresh()
+
+    assert provider.key_ids == ("new",)
+
+
+def test_failed_refresh_keeps_current_keys():
+    source = FakeJwksSource(_rsa_jwk("rsa-1"))
+    provider = JwksKeyProvider(source)
+    provider.refresh()
+
+    source.error = OSError("identity provider is down")
+
+    with pytest.raises(OSError):
+        provider.refresh()
+
+    assert provider.get_signing_key("rsa-1") is not None
+
+
+def test_unknown_kid_wakes_background_refresh_once_per_interval():
+    clock = FakeClock()
+    provider = JwksKeyProvider(
+        FakeJwksSource(),
+        min_refresh_interval_seconds=30,
+        clock=clock,
+    )
+    provider.refresh()
+
+    assert provider.get_signing_key("missing") is None
+    assert provider._wake.is_set() is False
+
+    clock.now += 30
+
+    assert provider.get_signing_key("missing") is None
+    assert provider._wake.is_set() is True
+
+
+def test_background_refresh_picks_up_new_keys():
+    source = FakeJwksSource(_rsa_jwk("rsa-1"))
+    provider = JwksKeyProvider(source, min_refresh_interval_seconds=0)
+    provider.start()
+
+    try:
+        source.keys.append(_rsa_jwk("rsa-2"))
+
+        assert provider.get_signing_key("rsa-2") is None
+
+        for _ in range(200):
+            if provider.get_signing_key("rsa-2") is not None:
+                break
+
+            provider._worker.join(0.01)
+
+        assert provider.get_signing_key("rsa-2") is not None
+    finally:
+        provider.close()
+
+    assert provider._worker.is_alive() is False
+
+
+def test_start_logs_and_survives_an_unreachable_key_set(
+    caplog: pytest.LogCaptureFixture,
+):
+    source = FakeJwksSource()
+    source.error = OSError("identity provider is down")
+    provider = JwksKeyProvider(source)
+
+    with caplog.at_level(logging.ERROR):
+        provider.start()
+
+    provider.close()
+
+    assert provider.key_ids == ()
+    assert "Refreshing the JWKS key set failed." in caplog.text
+
+
+def test_jwks_fetcher_reads_file(tmp_path: Path):
+    path = tmp_path / "jwks.json"
+    path.write_text(json.dumps({"keys": [_ec_jwk("ec-1")]}), encoding="utf-8")
+    provider = JwksKeyProvider(jwks_fetcher(str(path)))
+
+    provider.refresh()
+
+    assert provider.key_ids == ("ec-1",)
+
+
+@pytest.fixture
+def jwks_server() -> Iterator[str]:
+    document = json.dumps({"keys": [_ed25519_jwk("ed-1")]}).encode("utf-8")
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(document)))
+            self.end_headers()
+            self.wfile.write(document)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield f"http://127.0.0.1:{server.server_port}/.well-known/jwks.json"
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_jwks_fetcher_reads_local_http_stand_in(jwks_server: str):
+    provider = JwksKeyProvider(jwks_fetcher(jwks_server, timeout_seconds=2))
+
+    provider.refresh()
+
+    assert provider.key_ids == ("ed-1",)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"refresh_interval_seconds": 0},
+        {"rotation_overlap_seconds": -1},
+        {"min_refresh_interval_seconds": -1},
+    ],
+)
+def test_provider_rejects_invalid_intervals(kwargs: dict[str, float]):
+    with pytest.raises(ValueError):
+        JwksKeyProvider(FakeJwksSource(), **kwargs)
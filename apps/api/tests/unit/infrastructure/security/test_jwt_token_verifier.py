@@ -1,10 +1,15 @@
+import json
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import jwt
 import pytest
+from cryptography.hazmat.primitives.asymmetric import ec, ed25519, rsa
+from jwt.algorithms import ECAlgorithm, OKPAlgorithm, RSAAlgorithm
 
 from fhir_gateway.infrastructure.security import (
+    JwksKeyProvider,
     JwtTokenVerifier,
     TokenVerificationError,
     TokenVerifierConfigurationError,
@@ -24,12 +29,14 @@ def _build_verifier(
     issuer: str = ISSUER,
     audience: str = AUDIENCE,
     algorithm: str = ALGORITHM,
+    **kwargs: Any,
 ) -> JwtTokenVerifier:
     return JwtTokenVerifier(
         secret=secret,
         issuer=issuer,
         audience=audience,
         algorithm=algorithm,
+        **kwargs,
     )
 
 
@@ -248,3 +255,237 @@ def test_verify_allows_missing_optional_claims():
 
     assert claims.name is None
     assert claims.email is None
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = time.time()
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_verify_returns_cached_claims_without_decoding_again(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    verifier = _build_verifier()
+    token = _encode_token()
+    first_claims = verifier.verify(token)
+
+    def fail_decode(*args: Any, **kwargs: Any) -> None:
+        raise AssertionError("cached token was decoded again")
+
+    monkeypatch.setattr(jwt, "decode", fail_decode)
+
+    assert verifier.verify(token) is first_claims
+
+
+def test_verify_does_not_cache_rejected_tokens():
+    verifier = _build_verifier()
+    token = _encode_token(secret=WRONG_SECRET)
+
+    for _ in range(2):
+        with pytest.raises(TokenVerificationError):
+            verifier.verify(token)
+
+    assert len(verifier._cache) == 0
+
+
+def test_verify_drops_cached_claims_once_token_expires():
+    clock = FakeClock()
+    verifier = _build_verifier(clock_skew_seconds=30, clock=clock)
+    expires_at = int(clock.now) + 60
+    token = _encode_token(overrides={"exp": expires_at})
+    verifier.verify(token)
+
+    # Within the skew allowance the cached claims are still served.
+    clock.now = expires_at + 29
+
+    assert verifier.verify(token).expires_at == expires_at
+
+    # Past it the entry is dropped and the token decoded again, which
+    # `jwt.decode` accepts only while the real clock allows it.
+    clock.now = expires_at + 30
+
+    assert verifier.verify(token).expires_at == expires_at
+    assert len(verifier._cache) == 1
+
+
+def test_verify_evicts_least_recently_used_claims():
+    verifier = _build_verifier(cache_max_entries=2)
+    tokens = [
+        _encode_token(overrides={"sub": f"clinician-{index}"}) for index in range(3)
+    ]
+
+    verifier.verify(tokens[0])
+    verifier.verify(tokens[1])
+    verifier.verify(tokens[0])
+    verifier.verify(tokens[2])
+
+    cached_subjects = [claims.subject for claims in verifier._cache.values()]
+
+    assert cached_subjects == ["clinician-0", "clinician-2"]
+
+
+def test_verify_without_cache_decodes_every_call():
+    verifier = _build_verifier(cache_max_entries=0)
+    token = _encode_token()
+
+    first_claims = verifier.verify(token)
+
+    assert verifier.verify(token) == first_claims
+    assert verifier.verify(token) is not first_claims
+    assert len(verifier._cache) == 0
+
+
+def test_verify_is_safe_under_concurrent_calls():
+    verifier = _build_verifier(cache_max_entries=4)
+    tokens = [
+        _encode_token(overrides={"sub": f"clinician-{index}"}) for index in range(8)
+    ]
+
+    def verify_all(offset: int) -> list[str]:
+        return [
+            verifier.verify(tokens[(offset + index) % len(tokens)]).subject
+            for index in range(200)
+        ]
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(verify_all, range(8)))
+
+    for offset, subjects in enumerate(results):
+        assert subjects == [
+            f"clinician-{(offset + index) % len(tokens)}" for index in range(200)
+        ]
+
+    assert len(verifier._cache) == 4
+
+
+def test_verify_keeps_raising_configuration_errors():
+    verifier = _build_verifier(secret=None)
+    token = _encode_token()
+
+    for _ in range(2):
+        with pytest.raises(TokenVerifierConfigurationError):
+            verifier.verify(token)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"cache_max_entries": -1}, {"clock_skew_seconds": -1}],
+)
+def test_verifier_rejects_negative_cache_settings(kwargs: dict[str, int]):
+    with pytest.raises(ValueError):
+        _build_verifier(**kwargs)
+
+
+
+ASYMMETRIC_KEYS = {
+    "RS256": (
+        lambda: rsa.generate_private_key(public_exponent=65537, key_size=2048),
+        RSAAlgorithm,
+    ),
+    "ES256": (lambda: ec.generate_private_key(ec.SECP256R1()), ECAlgorithm),
+    "EdDSA": (ed25519.Ed25519PrivateKey.generate, OKPAlgorithm),
+}
+
+
+def _asymmetric_setup(algorithm: str) -> tuple[Any, JwksKeyProvider]:
+    generate_key, jwk_algorithm = ASYMMETRIC_KEYS[algorithm]
+    private_key = generate_key()
+    jwk = jwk_algorithm.to_jwk(private_key.public_key(), as_dict=True)
+    document = json.dumps({"keys": [{**jwk, "kid": "key-1"}]}).encode("utf-8")
+    provider = JwksKeyProvider(lambda: document)
+    provider.refresh()
+
+    return private_key, provider
+
+
+def _encode_asymmetric_token(
+    private_key: Any,
+    algorithm: str,
+    *,
+    kid: str | None = "key-1",
+) -> str:
+    now = int(time.time())
+    payload = {
+        "iss": ISSUER,
+        "aud": AUDIENCE,
+        "sub": "clinician-demo-001",
+        "exp": now + 3600,
+        "iat": now,
+        "roles": ["clinician"],
+    }
+    headers = {"kid": kid} if kid is not None else None
+
+    return jwt.encode(payload, private_key, algorithm=algorithm, headers=headers)
+
+
+@pytest.mark.parametrize("algorithm", ["RS256", "ES256", "EdDSA"])
+def test_verify_accepts_asymmetric_token_signed_by_published_key(algorithm: str):
+    private_key, provider = _asymmetric_setup(algorithm)
+    verifier = _build_verifier(
+        secret=None,
+        algorithm=algorithm,
+        key_provider=provider,
+    )
+
+    claims = verifier.verify(_encode_asymmetric_token(private_key, algorithm))
+
+    assert claims.subject == "clinician-demo-001"
+    assert claims.roles == ("clinician",)
+
+
+@pytest.mark.parametrize("kid", ["unknown-key", None])
+def test_verify_rejects_asymmetric_token_with_unknown_kid(kid: str | None):
+    private_key, provider = _asymmetric_setup("ES256")
+    verifier = _build_verifier(algorithm="ES256", key_provider=provider)
+    token = _encode_asymmetric_token(private_key, "ES256", kid=kid)
+
+    with pytest.raises(TokenVerificationError) as exc_info:
+        verifier.verify(token)
+
+    assert exc_info.value.message == "Token signing key is unknown."
+
+
+def test_verify_rejects_token_signed_by_another_key():
+    _private_key, provider = _asymmetric_setup("RS256")
+    other_private_key, _other_provider = _asymmetric_setup("RS256")
+    verifier = _build_verifier(algorithm="RS256", key_provider=provider)
+
+    with pytest.raises(TokenVerificationError) as exc_info:
+        verifier.verify(_encode_asymmetric_token(other_private_key, "RS256"))
+
+    assert exc_info.value.message == "Token verification failed."
+
+
+def test_verify_rejects_hmac_token_when_asymmetric_algorithm_is_configured():
+    _private_key, provider = _asymmetric_setup("RS256")
+    verifier = _build_verifier(algorithm="RS256", key_provider=provider)
+    token = jwt.encode(
+        {"sub": "clinician-demo-001"},
+        SECRET,
+        algorithm=ALGORITHM,
+        headers={"kid": "key-1"},
+    )
+
+    with pytest.raises(TokenVerificationError):
+        verifier.verify(token)
+
+
+def test_verify_rejects_asymmetric_algorithm_without_key_set():
+    verifier = _build_verifier(algorithm="RS256")
+
+    with pytest.raises(TokenVerifierConfigurationError) as exc_info:
+        verifier.verify(_encode_token())
+
+    assert exc_info.value.message == "JWKS key set is not configured."
+
+
+def test_verify_rejects_unsupported_algorithm():
+    verifier = _build_verifier(algorithm="none")
+
+    with pytest.raises(TokenVerifierConfigurationError) as exc_info:
+        verifier.verify(_encode_token())
+
+    assert exc_info.value.message == "Unsupported JWT algorithm: none."
@@ -0,0 +1,180 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from fhir_gateway.application.models.patient_bundle import PatientBundle
+from fhir_gateway.application.models.patient_summary import PatientSummary
+from fhir_gateway.domain.entities.audit_event import AuditAction, AuditEvent
+from fhir_gateway.domain.entities.condition import Condition
+from fhir_gateway.domain.entities.encounter import Encounter
+from fhir_gateway.domain.entities.observation import Observation, ObservationStatus
+from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.human_name import HumanName
+from fhir_gateway.domain.value_objects.identifier import Identifier
+from fhir_gateway.domain.value_objects.instant import Instant
+from fhir_gateway.domain.value_objects.period import Period
+from fhir_gateway.domain.value_objects.quantity import Quantity
+from fhir_gateway.domain.value_objects.reference import Reference
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.serialization.fhir_bytes import (
+    encode_fhir,
+    encode_resource,
+)
+from fhir_gateway.infrastructure.serialization.fhir_json import resource_to_fhir
+
+SUBJECT = Reference(resource_type="Patient", id=ResourceId("pat-001"))
+
+
+def _instant(day: int, offset_hours: int = 0) -> Instant:
+    return Instant(
+        datetime(2026, 1, day, 10, 0, tzinfo=timezone(timedelta(hours=offset_hours)))
+    )
+
+
+def _observation(observation_id: str, value: Quantity) -> Observation:
+    return Observation(
+        id=ResourceId(observation_id),
+        status=ObservationStatus.FINAL,
+        code=Code(system="http://loinc.org", code="4548-4", display="HbA1c"),
+        subject=SUBJECT,
+        effective=_instant(12),
+        value=value,
+    )
+
+
+def _dumps(value: dict) -> bytes:
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+RESOURCES = [
+    Patient(
+        id=ResourceId("pat-001"),
+        identifiers=(
+            Identifier(system="urn:mrn", value="MRN-1"),
+            Identifier(system="urn:ssn", value="000-00-0000"),
+        ),
+        name=HumanName(text="Ana", given=("Ana", "María"), family="García"),
+    ),
+    Patient(id=ResourceId("pat-002"), name=HumanName(family="Zoë", given=("Zoë",))),
+    Patient(id=ResourceId("pat-003"), name=HumanName(text='O"Brien\\\n\t\x01 ☤')),
+    Patient(id=ResourceId("pat-004")),
+    Condition(
+        id=ResourceId("con-001"),
+        code=Code(system="http://snomed.info/sct", code="44054006", display="Diabète"),
+        subject=SUBJECT,
+        recorded_date=_instant(15, offset_hours=2),
+    ),
+    Condition(
+        id=ResourceId("con-002"),
+        code=Code(system="http://snomed.info/sct", code="38341003"),
+        subject=SUBJECT,
+    ),
+    Encounter(
+        id=ResourceId("enc-001"),
+        subject=SUBJECT,
+        period=Period(start=_instant(10), end=_instant(11)),
+    ),
+    Encounter(
+        id=ResourceId("enc-002"), subject=SUBJECT, period=Period(start=_instant(10))
+    ),
+    _observation("obs-001", Quantity(value=7.2, unit="%")),
+    _observation("obs-002", Quantity(value=120, unit="mm[Hg]")),
+    _observation("obs-003", Quantity(value=1e-7, unit="mol/L")),
+    _observation("obs-004", Quantity(value=1e22, unit="1")),
+    _observation("obs-005", Quantity(unit="%")),
+    _observation("obs-006", Quantity()),
+    AuditEvent(
+        id=ResourceId("aud-001"),
+        recorded=_instant(20),
+        agent="clinician-01 «ICU»",
+        action=AuditAction.READ,
+        entity=SUBJECT,
+    ),
+    AuditEvent(
+        id=ResourceId("aud-002"),
+        recorded=_instant(20),
+        agent="clinician-02",
+        action=AuditAction.EXPORT,
+        entity=SUBJECT,
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    "resource",
+    RESOURCES,
+    ids=lambda resource: resource.id.value,
+)
+def test_encode_resource_matches_json_dumps_of_resource_to_fhir(resource):
+    expected = _dumps(resource_to_fhir(resource))
+
+    assert encode_resource(resource) == expected
+    assert encode_fhir(resource) == expected
+
+
+def test_encode_resource_spells_non_finite_values_like_json():
+    observation = _observation("obs-001", Quantity._from_trusted(float("nan"), "%"))
+
+    assert encode_resource(observation) == _dumps(resource_to_fhir(observation))
+
+
+def test_encode_resource_rejects_unsupported_resources():
+    with pytest.raises(TypeError, match="Unsupported FHIR resource: str"):
+        encode_resource("pat-001")  # type: ignore[arg-type]
+
+
+def test_encode_resource_rejects_collections():
+    summary = PatientSummary(
+        patient=Patient(id=ResourceId("pat-001")),
+        conditions=(),
+        encounters=(),
+        observations=(),
+    )
+
+    with pytest.raises(TypeError):
+        encode_resource(summary)  # type: ignore[arg-type]
+
+
+@pytest.mark.parametrize("collection_type", [PatientSummary, PatientBundle])
+def test_encode_fhir_encodes_collections_as_bundles(collection_type):
+    patient, conditions, encounters = RESOURCES[0], RESOURCES[4:6], RESOURCES[6:8]
+    observations = RESOURCES[8:14]
+    collection = collection_type(
+        patient=patient,
+        conditions=conditions,
+        encounters=encounters,
+        observations=observations,
+    )
+
+    assert encode_fhir(collection) == _dumps(
+        {
+            "resourceType": "Bundle",
+            "type": "collection",
+            "entry": [
+                {"resource": resource_to_fhir(resource)}
+                for resource in (patient, *conditions, *encounters, *observations)
+            ],
+        }
+    )
+
+
+def test_encode_fhir_encodes_patient_only_collection():
+    bundle = PatientBundle(
+        patient=Patient(id=ResourceId("pat-001")),
+        conditions=(),
+        encounters=(),
+        observations=(),
+    )
+
+    assert json.loads(encode_fhir(bundle)) == {
+        "resourceType": "Bundle",
+        "type": "collection",
+        "entry": [{"resource": {"resourceType": "Patient", "id": "pat-001"}}],
+    }
+
+
+def test_encode_fhir_rejects_unsupported_values():
+    with pytest.raises(TypeError, match="Unsupported FHIR value: dict"):
+        encode_fhir({"resourceType": "Patient"})
@@ -0,0 +1,259 @@
+from datetime import datetime, timezone
+
+import pytest
+
+from fhir_gateway.domain.entities.condition import Condition
+from fhir_gateway.domain.entities.encounter import Encounter
+from fhir_gateway.domain.entities.observation import Observation, ObservationStatus
+from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.domain.value_objects.code import Code
+from fhir_gateway.domain.value_objects.human_name import HumanName
+from fhir_gateway.domain.value_objects.identifier import Identifier
+from fhir_gateway.domain.value_objects.instant import Instant
+from fhir_gateway.domain.value_objects.period import Period
+from fhir_gateway.domain.value_objects.quantity import Quantity
+from fhir_gateway.domain.value_objects.reference import Reference
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.serialization.errors import FhirDecodingError
+from fhir_gateway.infrastructure.serialization.fhir_json import (
+    condition_to_fhir,
+    encode_fhir_resource,
+    encounter_to_fhir,
+    observation_to_fhir,
+    patient_to_fhir,
+    resource_from_fhir,
+    resource_to_fhir,
+)
+
+SUBJECT = Reference(resource_type="Patient", id=ResourceId("pat-001"))
+
+
+def _instant(day: int) -> Instant:
+    return Instant(datetime(2026, 1, day, 10, 0, tzinfo=timezone.utc))
+
+
+def test_patient_to_fhir_includes_identifiers_and_name():
+    patient = Patient(
+        id=ResourceId("pat-001"),
+        identifiers=(Identifier(system="urn:mrn", value="MRN-1"),),
+        name=HumanName(given=("Ana", "María"), family="García"),
+    )
+
+    assert patient_to_fhir(patient) == {
+        "resourceType": "Patient",
+        "id": "pat-001",
+        "identifier": [{"system": "urn:mrn", "value": "MRN-1"}],
+        "name": [{"family": "García", "given": ["Ana", "María"]}],
+    }
+
+
+def test_patient_to_fhir_omits_missing_optional_elements():
+    patient = Patient(id=ResourceId("pat-001"))
+
+    assert patient_to_fhir(patient) == {
+        "resourceType": "Patient",
+        "id": "pat-001",
+    }
+
+
+def test_condition_to_fhir_maps_code_subject_and_recorded_date():
+    condition = Condition(
+        id=ResourceId("con-001"),
+        code=Code(system="http://snomed.info/sct", code="44054006"),
+        subject=SUBJECT,
+        recorded_date=_instant(15),
+    )
+
+    assert condition_to_fhir(condition) == {
+        "resourceType": "Condition",
+        "id": "con-001",
+        "code": {
+            "coding": [{"system": "http://snomed.info/sct", "code": "44054006"}]
+        },
+        "subject": {"reference": "Patient/pat-001"},
+        "recordedDate": "2026-01-15T10:00:00+00:00",
+    }
+
+
+def test_encounter_to_fhir_omits_missing_period_end():
+    encounter = Encounter(
+        id=ResourceId("enc-001"),
+        subject=SUBJECT,
+        period=Period(start=_instant(10)),
+    )
+
+    assert encounter_to_fhir(encounter) == {
+        "resourceType": "Encounter",
+        "id": "enc-001",
+        "subject": {"reference": "Patient/pat-001"},
+        "period": {"start": "2026-01-10T10:00:00+00:00"},
+    }
+
+
+def test_observation_to_fhir_maps_status_effective_and_value():
+    observation = Observation(
+        id=ResourceId("obs-001"),
+        status=ObservationStatus.FINAL,
+        code=Code(system="http://loinc.org", code="4548-4", display="HbA1c"),
+        subject=SUBJECT,
+        effective=_instant(12),
+        value=Quantity(value=7.2, unit="%"),
+    )
+
+    assert observation_to_fhir(observation) == {
+        "resourceType": "Observation",
+        "id": "obs-001",
+        "status": "final",
+        "code": {
+            "coding": [
+                {"system": "http://loinc.org", "code": "4548-4", "display": "HbA1c"}
+            ]
+        },
+        "subject": {"reference": "Patient/pat-001"},
+        "effectiveDateTime": "2026-01-12T10:00:00+00:00",
+        "valueQuantity": {"value": 7.2, "unit": "%"},
+    }
+
+
+def test_resource_to_fhir_dispatches_on_resource_type():
+    patient = Patient(id=ResourceId("pat-001"))
+
+    assert resource_to_fhir(patient) == patient_to_fhir(patient)
+
+
+def test_resource_to_fhir_rejects_unsupported_resources():
+    with pytest.raises(TypeError):
+        resource_to_fhir("pat-001")  # type: ignore[arg-type]
+
+
+def test_encode_fhir_resource_returns_compact_utf8_json_line():
+    patient = Patient(
+        id=ResourceId("pat-001"),
+        name=HumanName(text="Ana García"),
+    )
+
+    encoded = encode_fhir_resource(patient)
+
+    assert encoded == (
+        '{"resourceType":"Patient","id":"pat-001","name":[{"text":"Ana García"}]}'
+    ).encode("utf-8")
+    assert b"\n" not in encoded
+
+
+@pytest.mark.parametrize(
+    "resource",
+    [
+        Patient(
+            id=ResourceId("pat-001"),
+            identifiers=(Identifier(system="urn:mrn", value="MRN-1"),),
+            name=HumanName(given=("Ana", "María"), family="García"),
+        ),
+        Patient(id=ResourceId("pat-002"), name=HumanName(text="Ana García")),
+        Patient(id=ResourceId("pat-003")),
+        Condition(
+            id=ResourceId("con-001"),
+            code=Code(system="http://snomed.info/sct", code="44054006"),
+            subject=SUBJECT,
+            recorded_date=_instant(15),
+        ),
+        Condition(
+            id=ResourceId("con-002"),
+            code=Code(system="http://snomed.info/sct", code="38341003"),
+            subject=SUBJECT,
+        ),
+        Encounter(
+            id=ResourceId("enc-001"),
+            subject=SUBJECT,
+            period=Period(start=_instant(10), end=_instant(11)),
+        ),
+        Observation(
+            id=ResourceId("obs-001"),
+            status=ObservationStatus.FINAL,
+            code=Code(system="http://loinc.org", code="4548-4", display="HbA1c"),
+            subject=SUBJECT,
+            effective=_instant(12),
+            value=Quantity(value=7.2, unit="%"),
+        ),
+        Observation(
+            id=ResourceId("obs-002"),
+            status=ObservationStatus.CANCELLED,
+            code=Code(system="http://loinc.org", code="4548-4"),
+            subject=SUBJECT,
+            effective=_instant(13),
+            value=Quantity(),
+        ),
+    ],
+    ids=lambda resource: resource.id.value,
+)
+def test_resource_from_fhir_inverts_resource_to_fhir(resource):
+    assert resource_from_fhir(resource_to_fhir(resource)) == resource
+
+
+def test_resource_from_fhir_accepts_utc_designator_and_normalizes_offsets():
+    condition = resource_from_fhir(
+        {
+            "resourceType": "Condition",
+            "id": "con-001",
+            "code": {"coding": [{"system": "http://snomed.info/sct", "code": "1"}]},
+            "subject": {"reference": "Patient/pat-001"},
+            "recordedDate": "2026-01-15T12:00:00+02:00",
+        }
+    )
+
+    assert condition.recorded_date == _instant(15)
+    assert resource_from_fhir(
+        {**condition_to_fhir(condition), "recordedDate": "2026-01-15T10:00:00Z"}
+    ) == condition
+
+
+@pytest.mark.parametrize(
+    ("resource", "message"),
+    [
+        ("pat-001", "must be a JSON object"),
+        ({"resourceType": "Medication", "id": "med-001"}, "Unsupported"),
+        ({"resourceType": "Patient"}, "Patient/None: malformed element"),
+        (
+            {
+                "resourceType": "Encounter",
+                "id": "enc-001",
+                "subject": {"reference": "Patient/pat-001"},
+                "period": {"start": "2026-01-10T10:00:00"},
+            },
+            "Encounter/enc-001: Instant.value",
+        ),
+        (
+            {
+                "resourceType": "Condition",
+                "id": "con-001",
+                "code": {"coding": []},
+                "subject": {"reference": "Patient/pat-001"},
+            },
+            "Condition/con-001: malformed element",
+        ),
+        (
+            {
+                "resourceType": "Observation",
+                "id": "obs-001",
+                "status": "final",
+                "code": {"coding": [{"system": "http://loinc.org", "code": "1"}]},
+                "subject": {"reference": "pat-001"},
+                "effectiveDateTime": "2026-01-10T10:00:00+00:00",
+            },
+            "has no id",
+        ),
+        (
+            {
+                "resourceType": "Observation",
+                "id": "obs-001",
+                "status": "done",
+                "code": {"coding": [{"system": "http://loinc.org", "code": "1"}]},
+                "subject": {"reference": "Patient/pat-001"},
+                "effectiveDateTime": "2026-01-10T10:00:00+00:00",
+            },
+            "Observation/obs-001: malformed element",
+        ),
+    ],
+)
+def test_resource_from_fhir_rejects_invalid_resources(resource, message):
+    with pytest.raises(FhirDecodingError, match=message):
+        resource_from_fhir(resource)
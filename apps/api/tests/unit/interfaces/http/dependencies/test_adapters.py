@@ -1,22 +1,49 @@
-from collections.abc import Callable
+import asyncio
+from collections.abc import Awaitable, Callable
 
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, sessionmaker
 
 from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    AsyncSqlAlchemyAuditEventReader,
+    AsyncSqlAlchemyConditionReader,
+    AsyncSqlAlchemyEncounterReader,
+    AsyncSqlAlchemyObservationReader,
+    AsyncSqlAlchemyPatientReader,
+    AsyncSqlAlchemyPatientSummaryReader,
+    SessionPerCallReader,
     SqlAlchemyAuditEventReader,
     SqlAlchemyConditionReader,
     SqlAlchemyEncounterReader,
     SqlAlchemyObservationReader,
     SqlAlchemyPatientReader,
+    SqlAlchemyPatientSummaryReader,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.code_catalog import (
+    CodeCatalog,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.models import (
+    ConditionCodeRecord,
+    ObservationCodeRecord,
 )
 from fhir_gateway.interfaces.http.dependencies.adapters import (
+    get_async_audit_event_reader,
+    get_async_condition_reader,
+    get_async_encounter_reader,
+    get_async_observation_reader,
+    get_async_patient_reader,
+    get_async_patient_summary_reader,
     get_audit_event_reader,
     get_condition_reader,
     get_encounter_reader,
+    get_fanout_condition_reader,
+    get_fanout_encounter_reader,
+    get_fanout_observation_reader,
     get_observation_reader,
     get_patient_reader,
+    get_patient_summary_reader,
 )
 
 
@@ -41,8 +68,7 @@ def session() -> Session:
     ("dependency", "expected_type"),
     [
         (get_patient_reader, SqlAlchemyPatientReader),
-        (get_observation_reader, SqlAlchemyObservationReader),
-        (get_condition_reader, SqlAlchemyConditionReader),
+        (get_patient_summary_reader, SqlAlchemyPatientSummaryReader),
         (get_encounter_reader, SqlAlchemyEncounterReader),
         (get_audit_event_reader, SqlAlchemyAuditEventReader),
     ],
@@ -56,3 +82,166 @@ def test_adapter_dependency_returns_expected_reader(
 
     assert isinstance(reader, expected_type)
     assert reader._session is session
+
+
+@pytest.mark.parametrize(
+    ("dependency", "expected_type", "record_type"),
+    [
+        (get_observation_reader, SqlAlchemyObservationReader, ObservationCodeRecord),
+        (get_condition_reader, SqlAlchemyConditionReader, ConditionCodeRecord),
+    ],
+)
+@pytest.mark.parametrize("with_catalog", [True, False])
+def test_coded_reader_dependency_passes_code_catalog(
+    session: Session,
+    dependency: Callable[..., object],
+    expected_type: type[object],
+    record_type: type,
+    with_catalog: bool,
+):
+    code_catalog = (
+        CodeCatalog(record_type, max_entries=10, refresh_interval_seconds=60)
+        if with_catalog
+        else None
+    )
+
+    reader = dependency(session=session, code_catalog=code_catalog)
+
+    assert isinstance(reader, expected_type)
+    assert reader._session is session
+    assert reader._code_catalog is code_catalog
+
+
+FANOUT_READER_DEPENDENCIES = [
+    (get_fanout_observation_reader, SqlAlchemyObservationReader, ObservationCodeRecord),
+    (get_fanout_condition_reader, SqlAlchemyConditionReader, ConditionCodeRecord),
+    (get_fanout_encounter_reader, SqlAlchemyEncounterReader, None),
+]
+
+
+def _call_fanout_dependency(
+    dependency: Callable[..., object],
+    record_type: type | None,
+    **arguments: object,
+) -> tuple[object, CodeCatalog | None]:
+    if record_type is None:
+        return dependency(**arguments), None
+
+    code_catalog = CodeCatalog(
+        record_type,
+        max_entries=10,
+        refresh_interval_seconds=60,
+    )
+
+    return dependency(**arguments, code_catalog=code_catalog), code_catalog
+
+
+@pytest.mark.parametrize(
+    ("dependency", "expected_type", "record_type"),
+    FANOUT_READER_DEPENDENCIES,
+)
+def test_fanout_reader_dependency_shares_request_session_when_sequential(
+    session: Session,
+    dependency: Callable[..., object],
+    expected_type: type[object],
+    record_type: type | None,
+):
+    reader, code_catalog = _call_fanout_dependency(
+        dependency,
+        record_type,
+        session=session,
+        session_factory=sessionmaker(),
+        read_executor=None,
+    )
+
+    assert isinstance(reader, expected_type)
+    assert reader._session is session
+
+    if code_catalog is not None:
+        assert reader._code_catalog is code_catalog
+
+
+@pytest.mark.parametrize(
+    ("dependency", "expected_type", "record_type"),
+    FANOUT_READER_DEPENDENCIES,
+)
+def test_fanout_reader_dependency_opens_session_per_read_when_concurrent(
+    session: Session,
+    dependency: Callable[..., object],
+    expected_type: type[object],
+    record_type: type | None,
+):
+    session_factory = sessionmaker()
+
+    reader, code_catalog = _call_fanout_dependency(
+        dependency,
+        record_type,
+        session=session,
+        session_factory=session_factory,
+        read_executor=object(),
+    )
+
+    assert isinstance(reader, SessionPerCallReader)
+    assert reader._session_factory is session_factory
+
+    built_reader = reader._build_reader(session)
+
+    assert isinstance(built_reader, expected_type)
+
+    if code_catalog is not None:
+        assert built_reader._code_catalog is code_catalog
+
+
+@pytest.mark.parametrize(
+    ("dependency", "expected_type"),
+    [
+        (get_async_patient_reader, AsyncSqlAlchemyPatientReader),
+        (get_async_patient_summary_reader, AsyncSqlAlchemyPatientSummaryReader),
+        (get_async_encounter_reader, AsyncSqlAlchemyEncounterReader),
+        (get_async_audit_event_reader, AsyncSqlAlchemyAuditEventReader),
+    ],
+)
+def test_async_adapter_dependency_returns_expected_reader(
+    dependency: Callable[[AsyncSession], Awaitable[object]],
+    expected_type: type[object],
+):
+    session = AsyncSession()
+
+    reader = asyncio.run(dependency(session))
+
+    assert isinstance(reader, expected_type)
+    assert reader._session is session
+
+
+@pytest.mark.parametrize(
+    ("dependency", "expected_type", "record_type"),
+    [
+        (
+            get_async_observation_reader,
+            AsyncSqlAlchemyObservationReader,
+            ObservationCodeRecord,
+        ),
+        (
+            get_async_condition_reader,
+            AsyncSqlAlchemyConditionReader,
+            ConditionCodeRecord,
+        ),
+    ],
+)
+def test_async_coded_reader_dependency_passes_code_catalog(
+    dependency: Callable[..., Awaitable[object]],
+    expected_type: type[object],
+    record_type: type,
+):
+    session = AsyncSession()
+    code_catalog = CodeCatalog(
+        record_type,
+        max_entries=10,
+        refresh_interval_seconds=60,
+    )
+
+    reader = asyncio.run(dependency(session=session, code_catalog=code_catalog))
+
+    assert isinstance(reader, expected_type)
+    assert reader._session is session
+    assert reader._code_catalog is code_catalog
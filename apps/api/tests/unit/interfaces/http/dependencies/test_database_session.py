@@ -0,0 +1,206 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
+
+from fhir_gateway.infrastructure.persistence.sqlalchemy.routing import ReplicaRouter
+from fhir_gateway.infrastructure.security import TokenVerificationError
+from fhir_gateway.interfaces.http.dependencies.database import (
+    get_async_database_session,
+    get_async_read_database_session,
+    get_async_session_factory,
+    get_database_session,
+    get_read_session_factory,
+    get_read_your_writes_key,
+)
+
+
+class FakeTokenVerifier:
+    def verify(self, token: str) -> SimpleNamespace:
+        if token != "valid-token":
+            raise TokenVerificationError()
+
+        return SimpleNamespace(subject="user-123")
+
+
+@pytest.fixture
+def session_factory() -> sessionmaker[Session]:
+    engine = create_engine("sqlite+pysqlite:///:memory:")
+
+    return sessionmaker(
+        bind=engine,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+def _build_request(
+    session_factory: sessionmaker[Session],
+    *,
+    read_executor: object | None,
+    async_session_factory: async_sessionmaker[AsyncSession] | None = None,
+    session_router: ReplicaRouter | None = None,
+    async_session_router: ReplicaRouter | None = None,
+    authorization: str | None = None,
+) -> SimpleNamespace:
+    if async_session_router is None and async_session_factory is not None:
+        async_session_router = ReplicaRouter(async_session_factory)
+
+    return SimpleNamespace(
+        headers={"Authorization": authorization} if authorization else {},
+        app=SimpleNamespace(
+            state=SimpleNamespace(
+                session_factory=session_factory,
+                session_router=session_router or ReplicaRouter(session_factory),
+                async_session_factory=async_session_factory,
+                async_session_router=async_session_router,
+                jwt_token_verifier=FakeTokenVerifier(),
+                read_executor=read_executor,
+            )
+        ),
+    )
+
+
+def test_get_database_session_yields_session_from_factory(
+    session_factory: sessionmaker[Session],
+):
+    request = _build_request(session_factory, read_executor=None)
+
+    sessions = get_database_session(request)
+    session = next(sessions)
+
+    assert isinstance(session, Session)
+
+    sessions.close()
+
+
+def test_get_async_database_session_yields_session_from_async_factory(
+    session_factory: sessionmaker[Session],
+):
+    request = _build_request(
+        session_factory,
+        read_executor=None,
+        async_session_factory=async_sessionmaker(),
+    )
+
+    async def run() -> AsyncSession:
+        sessions = get_async_database_session(request)
+        session = await anext(sessions)
+        await sessions.aclose()
+
+        return session
+
+    assert isinstance(asyncio.run(run()), AsyncSession)
+
+
+def test_get_read_session_factory_routes_reads_to_replicas(
+    session_factory: sessionmaker[Session],
+):
+    replica_factory = sessionmaker()
+    request = _build_request(
+        session_factory,
+        read_executor=None,
+        session_router=ReplicaRouter(session_factory, [replica_factory]),
+    )
+
+    assert get_read_session_factory(request) is replica_factory
+
+
+def test_get_read_session_factory_keeps_recent_writers_on_primary(
+    session_factory: sessionmaker[Session],
+):
+    router = ReplicaRouter(
+        session_factory,
+        [sessionmaker()],
+        read_your_writes_seconds=5.0,
+    )
+    request = _build_request(
+        session_factory,
+        read_executor=None,
+        session_router=router,
+    )
+
+    sessions = get_database_session(request, "user-123")
+    session = next(sessions)
+    session.commit()
+    sessions.close()
+
+    assert get_read_session_factory(request, "user-123") is session_factory
+    assert get_read_session_factory(request, "user-456") is not session_factory
+
+
+def test_get_read_your_writes_key_is_none_when_stickiness_is_disabled(
+    session_factory: sessionmaker[Session],
+):
+    request = _build_request(
+        session_factory,
+        read_executor=None,
+        authorization="Bearer valid-token",
+    )
+
+    assert get_read_your_writes_key(request) is None
+
+
+@pytest.mark.parametrize(
+    ("authorization", "expected_key"),
+    [
+        ("Bearer valid-token", "user-123"),
+        ("Bearer invalid-token", None),
+        ("Basic valid-token", None),
+        (None, None),
+    ],
+)
+def test_get_read_your_writes_key_uses_verified_token_subject(
+    session_factory: sessionmaker[Session],
+    authorization: str | None,
+    expected_key: str | None,
+):
+    request = _build_request(
+        session_factory,
+        read_executor=None,
+        session_router=ReplicaRouter(
+            session_factory,
+            [sessionmaker()],
+            read_your_writes_seconds=5.0,
+        ),
+        authorization=authorization,
+    )
+
+    assert get_read_your_writes_key(request) == expected_key
+
+
+def test_get_async_read_database_session_opens_session_from_replica(
+    session_factory: sessionmaker[Session],
+):
+    primary_factory = async_sessionmaker()
+    replica_factory = async_sessionmaker(info={"role": "replica"})
+    request = _build_request(
+        session_factory,
+        read_executor=None,
+        async_session_factory=primary_factory,
+        async_session_router=ReplicaRouter(primary_factory, [replica_factory]),
+    )
+
+    async def run() -> AsyncSession:
+        sessions = get_async_read_database_session(request)
+        session = await anext(sessions)
+        await sessions.aclose()
+
+        return session
+
+    session = asyncio.run(run())
+
+    assert isinstance(session, AsyncSession)
+    assert session.info == {"role": "replica"}
+
+
+def test_get_async_session_factory_rejects_sync_database_stack(
+    session_factory: sessionmaker[Session],
+):
+    request = _build_request(session_factory, read_executor=None)
+
+    with pytest.raises(RuntimeError, match="FHIR_GATEWAY_DATABASE_STACK"):
+        get_async_session_factory(request)
@@ -2,6 +2,7 @@ import time
 from typing import Annotated
 
 import jwt
+import pytest
 from fastapi import Depends, FastAPI, Request
 from fastapi.testclient import TestClient
 
@@ -10,6 +11,7 @@ from fhir_gateway.infrastructure.security import JwtTokenVerifier
 from fhir_gateway.interfaces.http.dependencies.security import (
     get_current_principal,
     get_jwt_token_verifier,
+    require_roles,
 )
 from fhir_gateway.interfaces.http.error_handlers import register_exception_handlers
 
@@ -35,6 +37,7 @@ def _build_verifier(
 def _encode_token(
     *,
     secret: str = SECRET,
+    roles: list[str] | None = None,
 ) -> str:
     now = int(time.time())
 
@@ -45,7 +48,7 @@ def _encode_token(
             "sub": "clinician-demo-001",
             "iat": now,
             "exp": now + 3600,
-            "roles": ["clinician"],
+            "roles": roles or ["clinician"],
             "name": "Demo Clinician",
         },
         secret,
@@ -74,6 +77,15 @@ def _create_test_app(
             "display_name": principal.display_name,
         }
 
+    @app.get("/admin-test")
+    def admin_test(
+        principal: Annotated[
+            CurrentPrincipal,
+            Depends(require_roles("admin", "auditor")),
+        ],
+    ) -> dict[str, object]:
+        return {"subject": principal.subject}
+
     return app
 
 
@@ -211,3 +223,50 @@ def test_verifier_configuration_error_remains_internal_server_error():
         }
     }
     assert "JWT secret is not configured" not in response.text
+
+
+def test_require_roles_admits_principal_with_any_listed_role():
+    client = TestClient(
+        _create_test_app(_build_verifier()),
+    )
+
+    response = client.get(
+        "/admin-test",
+        headers={
+            "Authorization": f"Bearer {_encode_token(roles=['clinician', 'auditor'])}",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {"subject": "clinician-demo-001"}
+
+
+def test_require_roles_forbids_principal_without_listed_role():
+    client = TestClient(
+        _create_test_app(_build_verifier()),
+    )
+
+    response = client.get(
+        "/admin-test",
+        headers={
+            "Authorization": f"Bearer {_encode_token()}",
+        },
+    )
+
+    assert response.status_code == 403
+    assert response.json()["error"]["code"] == "forbidden"
+
+
+def test_require_roles_still_rejects_missing_credentials():
+    client = TestClient(
+        _create_test_app(_build_verifier()),
+    )
+
+    response = client.get("/admin-test")
+
+    assert response.status_code == 401
+
+
+def test_require_roles_needs_at_least_one_role():
+    with pytest.raises(ValueError):
+        require_roles()
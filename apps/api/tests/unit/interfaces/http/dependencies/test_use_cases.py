@@ -1,36 +1,68 @@
+import asyncio
+
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, sessionmaker
 
 import pytest
 
 from fhir_gateway.application.use_cases.export_patient_bundle import (
+    AsyncExportPatientBundleUseCase,
     ExportPatientBundleUseCase,
+    StreamPatientBundleUseCase,
 )
 from fhir_gateway.application.use_cases.get_patient_summary import (
+    AsyncGetPatientSummaryUseCase,
     GetPatientSummaryUseCase,
 )
+from fhir_gateway.application.use_cases.get_patient_version import (
+    AsyncGetPatientVersionUseCase,
+    GetPatientVersionUseCase,
+)
 from fhir_gateway.application.use_cases.list_audit_events import (
+    AsyncListAuditEventsUseCase,
     ListAuditEventsUseCase,
 )
 from fhir_gateway.application.use_cases.list_observations_by_code import (
+    AsyncListObservationsByCodeUseCase,
     ListObservationsByCodeUseCase,
 )
 from fhir_gateway.application.use_cases.search_patients import (
+    AsyncSearchPatientsUseCase,
     SearchPatientsUseCase,
 )
+from fhir_gateway.infrastructure.cache import InMemoryLruCache
+from fhir_gateway.infrastructure.concurrency import ThreadPoolReadExecutor
 from fhir_gateway.infrastructure.persistence.sqlalchemy.adapters import (
+    AsyncSqlAlchemyAuditEventReader,
+    AsyncSqlAlchemyConditionReader,
+    AsyncSqlAlchemyEncounterReader,
+    AsyncSqlAlchemyObservationReader,
+    AsyncSqlAlchemyPatientReader,
+    AsyncSqlAlchemyPatientSummaryReader,
+    AsyncSqlAlchemyPatientVersionReader,
     SqlAlchemyAuditEventReader,
     SqlAlchemyConditionReader,
     SqlAlchemyEncounterReader,
     SqlAlchemyObservationReader,
     SqlAlchemyPatientReader,
+    SqlAlchemyPatientSummaryReader,
+    SqlAlchemyPatientVersionReader,
 )
 from fhir_gateway.interfaces.http.dependencies.use_cases import (
+    get_async_export_patient_bundle_use_case,
+    get_async_list_audit_events_use_case,
+    get_async_list_observations_by_code_use_case,
+    get_async_patient_summary_use_case,
+    get_async_patient_version_use_case,
+    get_async_search_patients_use_case,
     get_export_patient_bundle_use_case,
     get_list_audit_events_use_case,
     get_list_observations_by_code_use_case,
     get_patient_summary_use_case,
+    get_patient_version_use_case,
     get_search_patients_use_case,
+    get_stream_patient_bundle_use_case,
 )
 
 
@@ -71,6 +103,29 @@ def encounter_reader(session: Session) -> SqlAlchemyEncounterReader:
     return SqlAlchemyEncounterReader(session)
 
 
+@pytest.fixture
+def patient_summary_reader(session: Session) -> SqlAlchemyPatientSummaryReader:
+    return SqlAlchemyPatientSummaryReader(session)
+
+
+@pytest.fixture
+def version_reader(session: Session) -> SqlAlchemyPatientVersionReader:
+    return SqlAlchemyPatientVersionReader(session)
+
+
+@pytest.fixture
+def read_executor() -> ThreadPoolReadExecutor:
+    executor = ThreadPoolReadExecutor(
+        max_workers=2,
+        max_concurrent_reads_per_call=2,
+    )
+
+    try:
+        yield executor
+    finally:
+        executor.shutdown()
+
+
 @pytest.fixture
 def audit_event_reader(session: Session) -> SqlAlchemyAuditEventReader:
     return SqlAlchemyAuditEventReader(session)
@@ -85,17 +140,32 @@ def test_get_search_patients_use_case_returns_use_case(
     assert use_case._patient_search_reader is patient_reader
 
 
+def test_get_patient_version_use_case_returns_use_case(
+    version_reader: SqlAlchemyPatientVersionReader,
+):
+    use_case = get_patient_version_use_case(version_reader)
+
+    assert isinstance(use_case, GetPatientVersionUseCase)
+    assert use_case._version_reader is version_reader
+
+
 def test_get_patient_summary_use_case_returns_use_case(
     patient_reader: SqlAlchemyPatientReader,
     condition_reader: SqlAlchemyConditionReader,
     encounter_reader: SqlAlchemyEncounterReader,
     observation_reader: SqlAlchemyObservationReader,
+    patient_summary_reader: SqlAlchemyPatientSummaryReader,
+    version_reader: SqlAlchemyPatientVersionReader,
 ):
     use_case = get_patient_summary_use_case(
         patient_reader=patient_reader,
         condition_reader=condition_reader,
         encounter_reader=encounter_reader,
         observation_reader=observation_reader,
+        patient_summary_reader=patient_summary_reader,
+        read_executor=None,
+        version_reader=version_reader,
+        patient_cache=None,
     )
 
     assert isinstance(use_case, GetPatientSummaryUseCase)
@@ -103,6 +173,66 @@ def test_get_patient_summary_use_case_returns_use_case(
     assert use_case._condition_reader is condition_reader
     assert use_case._encounter_reader is encounter_reader
     assert use_case._observation_reader is observation_reader
+    assert use_case._patient_summary_reader is patient_summary_reader
+    assert use_case._read_executor is None
+
+
+def test_get_patient_summary_use_case_fans_out_with_read_executor(
+    patient_reader: SqlAlchemyPatientReader,
+    condition_reader: SqlAlchemyConditionReader,
+    encounter_reader: SqlAlchemyEncounterReader,
+    observation_reader: SqlAlchemyObservationReader,
+    patient_summary_reader: SqlAlchemyPatientSummaryReader,
+    read_executor: ThreadPoolReadExecutor,
+):
+    use_case = get_patient_summary_use_case(
+        patient_reader=patient_reader,
+        condition_reader=condition_reader,
+        encounter_reader=encounter_reader,
+        observation_reader=observation_reader,
+        patient_summary_reader=patient_summary_reader,
+        read_executor=read_executor,
+        version_reader=version_reader,
+        patient_cache=None,
+    )
+
+    assert use_case._patient_summary_reader is None
+    assert use_case._read_executor is read_executor
+
+
+def test_patient_use_cases_read_through_configured_cache(
+    patient_reader: SqlAlchemyPatientReader,
+    condition_reader: SqlAlchemyConditionReader,
+    encounter_reader: SqlAlchemyEncounterReader,
+    observation_reader: SqlAlchemyObservationReader,
+    patient_summary_reader: SqlAlchemyPatientSummaryReader,
+    version_reader: SqlAlchemyPatientVersionReader,
+):
+    cache = InMemoryLruCache(max_entries=10, ttl_seconds=60)
+
+    summary_use_case = get_patient_summary_use_case(
+        patient_reader=patient_reader,
+        condition_reader=condition_reader,
+        encounter_reader=encounter_reader,
+        observation_reader=observation_reader,
+        patient_summary_reader=patient_summary_reader,
+        read_executor=None,
+        version_reader=version_reader,
+        patient_cache=cache,
+    )
+    bundle_use_case = get_export_patient_bundle_use_case(
+        patient_reader=patient_reader,
+        condition_reader=condition_reader,
+        encounter_reader=encounter_reader,
+        observation_reader=observation_reader,
+        read_executor=None,
+        version_reader=version_reader,
+        patient_cache=cache,
+    )
+
+    for use_case in (summary_use_case, bundle_use_case):
+        assert use_case._cache is cache
+        assert use_case._version_reader is version_reader
 
 
 def test_get_list_observations_by_code_use_case_returns_use_case(
@@ -124,12 +254,17 @@ def test_get_export_patient_bundle_use_case_returns_use_case(
     condition_reader: SqlAlchemyConditionReader,
     encounter_reader: SqlAlchemyEncounterReader,
     observation_reader: SqlAlchemyObservationReader,
+    read_executor: ThreadPoolReadExecutor,
+    version_reader: SqlAlchemyPatientVersionReader,
 ):
     use_case = get_export_patient_bundle_use_case(
         patient_reader=patient_reader,
         condition_reader=condition_reader,
         encounter_reader=encounter_reader,
         observation_reader=observation_reader,
+        read_executor=read_executor,
+        version_reader=version_reader,
+        patient_cache=None,
     )
 
     assert isinstance(use_case, ExportPatientBundleUseCase)
@@ -137,6 +272,47 @@ def test_get_export_patient_bundle_use_case_returns_use_case(
     assert use_case._condition_reader is condition_reader
     assert use_case._encounter_reader is encounter_reader
     assert use_case._observation_reader is observation_reader
+    assert use_case._read_executor is read_executor
+
+
+def test_get_export_patient_bundle_use_case_is_skipped_without_cache_or_fanout(
+    patient_reader: SqlAlchemyPatientReader,
+    condition_reader: SqlAlchemyConditionReader,
+    encounter_reader: SqlAlchemyEncounterReader,
+    observation_reader: SqlAlchemyObservationReader,
+    version_reader: SqlAlchemyPatientVersionReader,
+):
+    use_case = get_export_patient_bundle_use_case(
+        patient_reader=patient_reader,
+        condition_reader=condition_reader,
+        encounter_reader=encounter_reader,
+        observation_reader=observation_reader,
+        read_executor=None,
+        version_reader=version_reader,
+        patient_cache=None,
+    )
+
+    assert use_case is None
+
+
+def test_get_stream_patient_bundle_use_case_returns_use_case(
+    patient_reader: SqlAlchemyPatientReader,
+    condition_reader: SqlAlchemyConditionReader,
+    encounter_reader: SqlAlchemyEncounterReader,
+    observation_reader: SqlAlchemyObservationReader,
+):
+    use_case = get_stream_patient_bundle_use_case(
+        patient_reader=patient_reader,
+        condition_reader=condition_reader,
+        encounter_reader=encounter_reader,
+        observation_reader=observation_reader,
+    )
+
+    assert isinstance(use_case, StreamPatientBundleUseCase)
+    assert use_case._patient_reader is patient_reader
+    assert use_case._condition_reader is condition_reader
+    assert use_case._encounter_reader is encounter_reader
+    assert use_case._observation_reader is observation_reader
 
 
 def test_get_list_audit_events_use_case_returns_use_case(
@@ -146,3 +322,64 @@ def test_get_list_audit_events_use_case_returns_use_case(
 
     assert isinstance(use_case, ListAuditEventsUseCase)
     assert use_case._audit_event_reader is audit_event_reader
+
+
+def test_async_use_case_dependencies_return_async_use_cases():
+    session = AsyncSession()
+    patient_reader = AsyncSqlAlchemyPatientReader(session)
+    condition_reader = AsyncSqlAlchemyConditionReader(session)
+    encounter_reader = AsyncSqlAlchemyEncounterReader(session)
+    observation_reader = AsyncSqlAlchemyObservationReader(session)
+    patient_summary_reader = AsyncSqlAlchemyPatientSummaryReader(session)
+    audit_event_reader = AsyncSqlAlchemyAuditEventReader(session)
+    version_reader = AsyncSqlAlchemyPatientVersionReader(session)
+
+    async def build() -> tuple[object, ...]:
+        return (
+            await get_async_search_patients_use_case(patient_reader),
+            await get_async_patient_summary_use_case(
+                patient_reader=patient_reader,
+                condition_reader=condition_reader,
+                encounter_reader=encounter_reader,
+                observation_reader=observation_reader,
+                patient_summary_reader=patient_summary_reader,
+                version_reader=version_reader,
+                patient_cache=None,
+            ),
+            await get_async_list_observations_by_code_use_case(
+                patient_reader=patient_reader,
+                observation_reader=observation_reader,
+            ),
+            await get_async_export_patient_bundle_use_case(
+                patient_reader=patient_reader,
+                condition_reader=condition_reader,
+                encounter_reader=encounter_reader,
+                observation_reader=observation_reader,
+                version_reader=version_reader,
+                patient_cache=None,
+            ),
+            await get_async_list_audit_events_use_case(audit_event_reader),
+            await get_async_patient_version_use_case(version_reader),
+        )
+
+    (
+        search_patients,
+        patient_summary,
+        observations_by_code,
+        export_patient_bundle,
+        list_audit_events,
+        patient_version,
+    ) = asyncio.run(build())
+
+    assert isinstance(search_patients, AsyncSearchPatientsUseCase)
+    assert search_patients._patient_search_reader is patient_reader
+    assert isinstance(patient_summary, AsyncGetPatientSummaryUseCase)
+    assert patient_summary._patient_summary_reader is patient_summary_reader
+    assert isinstance(observations_by_code, AsyncListObservationsByCodeUseCase)
+    assert observations_by_code._observation_by_code_reader is observation_reader
+    assert isinstance(export_patient_bundle, AsyncExportPatientBundleUseCase)
+    assert export_patient_bundle._observation_reader is observation_reader
+    assert isinstance(list_audit_events, AsyncListAuditEventsUseCase)
+    assert list_audit_events._audit_event_reader is audit_event_reader
+    assert isinstance(patient_version, AsyncGetPatientVersionUseCase)
+    assert patient_version._version_reader is version_reader
@@ -0,0 +1,94 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from fhir_gateway.application.models.patient_bundle import PatientBundleStream
+from fhir_gateway.domain.entities.encounter import Encounter
+from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.domain.value_objects.instant import Instant
+from fhir_gateway.domain.value_objects.period import Period
+from fhir_gateway.domain.value_objects.reference import Reference
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.interfaces.http.presenters import patient_bundle
+from fhir_gateway.interfaces.http.presenters.patient_bundle import (
+    iter_patient_bundle_json,
+    iter_patient_bundle_ndjson,
+)
+
+
+def _build_stream(encounter_count: int) -> PatientBundleStream:
+    subject = Reference(resource_type="Patient", id=ResourceId("pat-001"))
+    encounters = (
+        Encounter(
+            id=ResourceId(f"enc-{index:03d}"),
+            subject=subject,
+            period=Period(
+                start=Instant(datetime(2026, 1, 1, tzinfo=timezone.utc)),
+            ),
+        )
+        for index in range(encounter_count)
+    )
+
+    return PatientBundleStream(
+        patient=Patient(id=ResourceId("pat-001")),
+        conditions=iter(()),
+        encounters=encounters,
+        observations=iter(()),
+    )
+
+
+def test_iter_patient_bundle_ndjson_emits_one_resource_per_line():
+    body = b"".join(iter_patient_bundle_ndjson(_build_stream(2)))
+
+    lines = body.decode("utf-8").splitlines()
+
+    assert [json.loads(line)["id"] for line in lines] == [
+        "pat-001",
+        "enc-000",
+        "enc-001",
+    ]
+    assert body.endswith(b"\n")
+
+
+def test_iter_patient_bundle_json_emits_collection_bundle():
+    body = b"".join(iter_patient_bundle_json(_build_stream(2)))
+
+    bundle = json.loads(body)
+
+    assert bundle["resourceType"] == "Bundle"
+    assert bundle["type"] == "collection"
+    assert [entry["resource"]["id"] for entry in bundle["entry"]] == [
+        "pat-001",
+        "enc-000",
+        "enc-001",
+    ]
+
+
+def test_iter_patient_bundle_json_is_valid_with_patient_only():
+    body = b"".join(iter_patient_bundle_json(_build_stream(0)))
+
+    assert [entry["resource"]["id"] for entry in json.loads(body)["entry"]] == [
+        "pat-001"
+    ]
+
+
+def test_patient_bundle_encoders_buffer_resources_into_chunks(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setattr(patient_bundle, "STREAM_CHUNK_SIZE", 256)
+
+    chunks = list(iter_patient_bundle_ndjson(_build_stream(20)))
+
+    assert len(chunks) > 1
+    assert all(len(chunk) >= 256 for chunk in chunks[:-1])
+    assert len(b"".join(chunks).splitlines()) == 21
+
+
+def test_patient_bundle_encoders_read_resources_lazily():
+    stream = _build_stream(3)
+
+    chunks = iter_patient_bundle_ndjson(stream)
+
+    assert next(stream.encounters).id == ResourceId("enc-000")
+    assert len(b"".join(chunks).splitlines()) == 3
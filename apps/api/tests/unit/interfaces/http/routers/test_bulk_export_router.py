@@ -0,0 +1,214 @@
+import gzip
+import json
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from fhir_gateway.application.models.bulk_export import (
+    BulkExportJob,
+    BulkExportStatus,
+)
+from fhir_gateway.application.security.current_principal import CurrentPrincipal
+from fhir_gateway.infrastructure.bulk_export import (
+    BackgroundBulkExportScheduler,
+    BulkExportRunner,
+)
+from fhir_gateway.infrastructure.config.settings import get_settings
+from fhir_gateway.infrastructure.persistence.sqlalchemy import models
+from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    create_session_factory,
+)
+from fhir_gateway.interfaces.http.app import create_app
+from fhir_gateway.interfaces.http.dependencies.security import (
+    get_current_principal,
+)
+
+CLINICAL_TABLES = [
+    models.PatientRecord.__table__,
+    models.PatientIdentifierRecord.__table__,
+    models.ConditionCodeRecord.__table__,
+    models.ConditionRecord.__table__,
+    models.EncounterRecord.__table__,
+    models.ObservationCodeRecord.__table__,
+    models.ObservationRecord.__table__,
+]
+
+
+@pytest.fixture
+def client(tmp_path: Path) -> Iterator[TestClient]:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'export.sqlite3'}")
+    Base.metadata.create_all(engine, tables=CLINICAL_TABLES)
+    session_factory = create_session_factory(engine)
+
+    with session_factory() as session:
+        session.add_all(
+            [
+                models.PatientRecord(id="pat-001", name_text="Ana García"),
+                models.PatientRecord(id="pat-002", name_text="Luis Pérez"),
+            ]
+        )
+        session.commit()
+
+    get_settings.cache_clear()
+    app = create_app()
+    app.state.bulk_export_scheduler.shutdown()
+    app.state.bulk_export_scheduler = BackgroundBulkExportScheduler(
+        BulkExportRunner(
+            session_factory,
+            output_directory=tmp_path / "exports",
+            batch_size=1,
+        ),
+        app.state.bulk_export_job_repository,
+    )
+    app.dependency_overrides[get_current_principal] = lambda: CurrentPrincipal(
+        subject="admin-demo-001",
+        roles=("admin",),
+    )
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    get_settings.cache_clear()
+    engine.dispose()
+
+
+def _save_job(client: TestClient, status: BulkExportStatus) -> None:
+    client.app.state.bulk_export_job_repository.save(
+        BulkExportJob(
+            id="job-001",
+            status=status,
+            resource_types=("Patient",),
+            requested_at=datetime(2026, 1, 1, tzinfo=timezone.utc),
+        )
+    )
+
+
+def test_start_bulk_export_returns_accepted_job_location(client: TestClient):
+    response = client.get("/$export", params={"_type": "Patient, Observation"})
+
+    assert response.status_code == 202
+
+    job = response.json()
+
+    assert job["status"] == "accepted"
+    assert job["resource_types"] == ["Patient", "Observation"]
+    assert response.headers["content-location"] == f"/bulk-export/jobs/{job['id']}"
+
+
+def test_bulk_export_job_reports_completed_manifest(client: TestClient):
+    location = client.get("/$export", params={"_type": "Patient"}).headers[
+        "content-location"
+    ]
+    client.app.state.bulk_export_scheduler.shutdown()
+
+    response = client.get(location)
+
+    assert response.status_code == 200
+
+    job = response.json()
+
+    assert job["status"] == "completed"
+    assert job["resource_count"] == 2
+    assert job["resources_per_second"] is not None
+    assert job["outputs"] == [
+        {
+            "type": "Patient",
+            "url": f"http://testserver/bulk-export/jobs/{job['id']}/outputs/Patient",
+            "count": 2,
+        }
+    ]
+
+    download = client.get(job["outputs"][0]["url"])
+
+    assert download.status_code == 200
+    assert download.headers["content-type"] == "application/fhir+ndjson"
+    assert [json.loads(line)["id"] for line in download.text.splitlines()] == [
+        "pat-001",
+        "pat-002",
+    ]
+
+
+def test_bulk_export_output_downloads_gzip_files(client: TestClient):
+    location = client.get(
+        "/$export",
+        params={"_type": "Patient", "gzip": "true"},
+    ).headers["content-location"]
+    client.app.state.bulk_export_scheduler.shutdown()
+
+    url = client.get(location).json()["outputs"][0]["url"]
+    response = client.get(url, headers={"Accept-Encoding": "identity"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/gzip"
+    assert "Patient.ndjson.gz" in response.headers["content-disposition"]
+    assert len(gzip.decompress(response.content).splitlines()) == 2
+
+
+def test_bulk_export_output_returns_404_until_written(client: TestClient):
+    _save_job(client, BulkExportStatus.IN_PROGRESS)
+
+    response = client.get("/bulk-export/jobs/job-001/outputs/Patient")
+
+    assert response.status_code == 404
+    assert response.json()["error"]["resource"] == "BulkExportOutput"
+
+
+@pytest.mark.parametrize(
+    "status",
+    [BulkExportStatus.ACCEPTED, BulkExportStatus.IN_PROGRESS],
+)
+def test_bulk_export_job_returns_202_while_running(
+    client: TestClient,
+    status: BulkExportStatus,
+):
+    _save_job(client, status)
+
+    response = client.get("/bulk-export/jobs/job-001")
+
+    assert response.status_code == 202
+    assert response.headers["x-progress"] == status.value
+
+
+def test_bulk_export_job_returns_404_for_unknown_job(client: TestClient):
+    response = client.get("/bulk-export/jobs/job-404")
+
+    assert response.status_code == 404
+    assert response.json()["error"]["identifier"] == "job-404"
+
+
+def test_start_bulk_export_rejects_unknown_resource_type(client: TestClient):
+    response = client.get("/$export", params={"_type": "Medication"})
+
+    assert response.status_code == 400
+    assert response.json()["error"]["field"] == "StartBulkExport.resource_types"
+
+
+def test_bulk_export_requires_authentication(client: TestClient):
+    client.app.dependency_overrides.clear()
+
+    assert client.get("/$export").status_code == 401
+    assert client.get("/bulk-export/jobs/job-001").status_code == 401
+    assert client.get("/bulk-export/jobs/job-001/outputs/Patient").status_code == 401
+
+
+def test_bulk_export_requires_admin_role(client: TestClient):
+    _save_job(client, BulkExportStatus.COMPLETED)
+    client.app.dependency_overrides[get_current_principal] = lambda: CurrentPrincipal(
+        subject="clinician-demo-001",
+        roles=("clinician",),
+    )
+
+    for path in (
+        "/$export",
+        "/bulk-export/jobs/job-001",
+        "/bulk-export/jobs/job-001/outputs/Patient",
+    ):
+        response = client.get(path)
+
+        assert response.status_code == 403
+        assert response.json()["error"]["code"] == "forbidden"
@@ -0,0 +1,481 @@
+import json
+from collections.abc import Iterator
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+
+from fhir_gateway.application.security.current_principal import CurrentPrincipal
+from fhir_gateway.infrastructure.config.settings import get_settings
+from fhir_gateway.infrastructure.persistence.sqlalchemy import models
+from fhir_gateway.infrastructure.persistence.sqlalchemy.base import Base
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    create_async_database_engine,
+    create_async_session_factory,
+    create_session_factory,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.routing import ReplicaRouter
+from fhir_gateway.interfaces.http.app import create_app
+from fhir_gateway.interfaces.http.dependencies.security import (
+    get_current_principal,
+)
+from fhir_gateway.interfaces.http.dependencies.use_cases import (
+    get_async_patient_summary_use_case,
+    get_patient_summary_use_case,
+    get_stream_patient_bundle_use_case,
+)
+
+CLINICAL_TABLES = [
+    models.PatientRecord.__table__,
+    models.PatientIdentifierRecord.__table__,
+    models.ConditionCodeRecord.__table__,
+    models.ConditionRecord.__table__,
+    models.EncounterRecord.__table__,
+    models.ObservationCodeRecord.__table__,
+    models.ObservationRecord.__table__,
+]
+
+
+@pytest.fixture
+def client(tmp_path: Path) -> Iterator[TestClient]:
+    engine = create_engine(f"sqlite+pysqlite:///{tmp_path / 'patients.sqlite3'}")
+    Base.metadata.create_all(engine, tables=CLINICAL_TABLES)
+    _seed_patient(engine)
+
+    get_settings.cache_clear()
+    app = create_app()
+    app.state.session_factory = create_session_factory(engine)
+    app.state.session_router = ReplicaRouter(app.state.session_factory)
+    app.dependency_overrides[get_current_principal] = lambda: CurrentPrincipal(
+        subject="clinician-demo-001",
+        roles=("clinician",),
+    )
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    get_settings.cache_clear()
+    engine.dispose()
+
+
+@pytest.fixture
+def async_client(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> Iterator[TestClient]:
+    database_path = tmp_path / "patients.sqlite3"
+    engine = create_engine(f"sqlite+pysqlite:///{database_path}")
+    Base.metadata.create_all(engine, tables=CLINICAL_TABLES)
+    _seed_patient(engine)
+
+    monkeypatch.setenv("FHIR_GATEWAY_DATABASE_STACK", "async")
+    get_settings.cache_clear()
+    app = create_app()
+    app.state.async_engine = create_async_database_engine(
+        f"sqlite+aiosqlite:///{database_path}"
+    )
+    app.state.async_session_factory = create_async_session_factory(
+        app.state.async_engine
+    )
+    app.state.async_session_router = ReplicaRouter(app.state.async_session_factory)
+    app.dependency_overrides[get_current_principal] = lambda: CurrentPrincipal(
+        subject="clinician-demo-001",
+        roles=("clinician",),
+    )
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    get_settings.cache_clear()
+    engine.dispose()
+
+
+@pytest.fixture
+def compression_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FHIR_GATEWAY_COMPRESSION_ENABLED", "true")
+
+
+@pytest.fixture
+def patient_cache_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FHIR_GATEWAY_PATIENT_CACHE_BACKEND", "memory")
+
+
+@pytest.fixture
+def concurrent_fanout_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("FHIR_GATEWAY_READ_FANOUT_MODE", "concurrent")
+
+
+def _seed_patient(engine) -> None:
+    with create_session_factory(engine)() as session:
+        code = models.ObservationCodeRecord(
+            id=1,
+            system="http://loinc.org",
+            code="4548-4",
+        )
+        session.add_all(
+            [
+                models.PatientRecord(id="pat-001", name_text="Ana García"),
+                code,
+                *(
+                    models.ObservationRecord(
+                        id=f"obs-{index:03d}",
+                        patient_id="pat-001",
+                        status="final",
+                        code_id=1,
+                        effective_at=datetime(
+                            2026, 1, 1 + index, tzinfo=timezone.utc
+                        ),
+                        value_quantity=7.0,
+                        value_unit="%",
+                    )
+                    for index in range(3)
+                ),
+            ]
+        )
+        session.commit()
+
+
+def test_export_patient_bundle_streams_fhir_bundle_by_default(client: TestClient):
+    response = client.get("/patients/pat-001/bundle")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/fhir+json"
+
+    bundle = response.json()
+
+    assert bundle["resourceType"] == "Bundle"
+    assert [entry["resource"]["id"] for entry in bundle["entry"]] == [
+        "pat-001",
+        "obs-000",
+        "obs-001",
+        "obs-002",
+    ]
+
+
+def test_export_patient_bundle_streams_ndjson(client: TestClient):
+    response = client.get("/patients/pat-001/bundle", params={"_format": "ndjson"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/fhir+ndjson"
+    assert [
+        json.loads(line)["resourceType"] for line in response.text.splitlines()
+    ] == ["Patient", "Observation", "Observation", "Observation"]
+
+
+def test_export_patient_bundle_returns_404_before_streaming(client: TestClient):
+    response = client.get("/patients/pat-404/bundle")
+
+    assert response.status_code == 404
+    assert response.json()["error"]["identifier"] == "pat-404"
+
+
+def test_export_patient_bundle_rejects_unknown_format(client: TestClient):
+    response = client.get("/patients/pat-001/bundle", params={"_format": "xml"})
+
+    assert response.status_code == 422
+
+
+def test_export_patient_bundle_requires_authentication(client: TestClient):
+    client.app.dependency_overrides.clear()
+
+    response = client.get("/patients/pat-001/bundle")
+
+    assert response.status_code == 401
+
+
+def test_get_observation_series_returns_columnar_series(client: TestClient):
+    response = client.get(
+        "/patients/pat-001/observations/series",
+        params={"system": "http://loinc.org", "code": "4548-4"},
+    )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "patient_id": "pat-001",
+        "system": "http://loinc.org",
+        "code": "4548-4",
+        "downsampling": None,
+        "series": [
+            {
+                "unit": "%",
+                "timestamps": [
+                    "2026-01-01T00:00:00Z",
+                    "2026-01-02T00:00:00Z",
+                    "2026-01-03T00:00:00Z",
+                ],
+                "values": [7.0, 7.0, 7.0],
+            }
+        ],
+    }
+
+
+def test_get_observation_series_downsamples_to_max_points(client: TestClient):
+    response = client.get(
+        "/patients/pat-001/observations/series",
+        params={
+            "system": "http://loinc.org",
+            "code": "4548-4",
+            "max_points": 3,
+            "method": "average",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.json()["downsampling"] == "average"
+    assert len(response.json()["series"][0]["values"]) <= 3
+
+
+def test_get_observation_series_rejects_invalid_max_points(client: TestClient):
+    response = client.get(
+        "/patients/pat-001/observations/series",
+        params={"system": "http://loinc.org", "code": "4548-4", "max_points": 1},
+    )
+
+    assert response.status_code == 400
+    assert response.json()["error"]["field"] == "GetObservationSeries.max_points"
+
+
+def test_get_observation_series_returns_404_for_unknown_patient(
+    client: TestClient,
+):
+    response = client.get(
+        "/patients/pat-404/observations/series",
+        params={"system": "http://loinc.org", "code": "4548-4"},
+    )
+
+    assert response.status_code == 404
+
+
+class UnusedUseCase:
+    def execute(self, *args, **kwargs):
+        raise AssertionError("the chart must not be loaded")
+
+
+def _add_observation(client: TestClient, observation_id: str) -> None:
+    with client.app.state.session_factory() as session:
+        session.add(
+            models.ObservationRecord(
+                id=observation_id,
+                patient_id="pat-001",
+                status="final",
+                code_id=1,
+                effective_at=datetime(2026, 2, 1, tzinfo=timezone.utc),
+                value_quantity=6.5,
+                value_unit="%",
+            )
+        )
+        session.commit()
+
+
+def test_get_patient_summary_returns_fhir_bundle_with_etag(client: TestClient):
+    response = client.get("/patients/pat-001/summary")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/fhir+json"
+    assert response.headers["etag"].startswith('"')
+    assert response.headers["cache-control"] == "private, no-cache"
+    assert [entry["resource"]["id"] for entry in response.json()["entry"]] == [
+        "pat-001",
+        "obs-000",
+        "obs-001",
+        "obs-002",
+    ]
+
+
+def test_get_patient_summary_returns_304_without_loading_chart(client: TestClient):
+    etag = client.get("/patients/pat-001/summary").headers["etag"]
+    client.app.dependency_overrides[get_patient_summary_use_case] = UnusedUseCase
+
+    response = client.get(
+        "/patients/pat-001/summary",
+        headers={"If-None-Match": f'"other", W/{etag}'},
+    )
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+    assert response.headers["cache-control"] == "private, no-cache"
+
+
+def test_get_patient_summary_returns_new_etag_after_chart_changes(
+    client: TestClient,
+):
+    etag = client.get("/patients/pat-001/summary").headers["etag"]
+    _add_observation(client, "obs-100")
+
+    response = client.get("/patients/pat-001/summary", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert len(response.json()["entry"]) == 5
+
+
+def test_get_patient_summary_returns_404_for_unknown_patient(client: TestClient):
+    response = client.get("/patients/pat-404/summary", headers={"If-None-Match": "*"})
+
+    assert response.status_code == 404
+    assert response.json()["error"]["identifier"] == "pat-404"
+
+
+@pytest.mark.parametrize("path", ["summary", "bundle"])
+def test_conditional_request_returns_404_for_deleted_patient(
+    client: TestClient,
+    path: str,
+):
+    etag = client.get(f"/patients/pat-001/{path}").headers["etag"]
+
+    with client.app.state.session_factory() as session:
+        session.get(models.PatientRecord, "pat-001").deleted_at = datetime(
+            2026, 3, 1, tzinfo=timezone.utc
+        )
+        session.commit()
+
+    for if_none_match in ("*", etag):
+        response = client.get(
+            f"/patients/pat-001/{path}",
+            headers={"If-None-Match": if_none_match},
+        )
+
+        assert response.status_code == 404
+        assert response.json()["error"]["identifier"] == "pat-001"
+
+
+def test_export_patient_bundle_etag_depends_on_format(client: TestClient):
+    bundle = client.get("/patients/pat-001/bundle")
+    ndjson = client.get("/patients/pat-001/bundle", params={"_format": "ndjson"})
+
+    assert bundle.headers["etag"] != ndjson.headers["etag"]
+    assert bundle.headers["cache-control"] == "private, no-cache"
+
+    response = client.get(
+        "/patients/pat-001/bundle",
+        params={"_format": "ndjson"},
+        headers={"If-None-Match": bundle.headers["etag"]},
+    )
+
+    assert response.status_code == 200
+
+
+def test_export_patient_bundle_returns_304_without_streaming(client: TestClient):
+    etag = client.get("/patients/pat-001/bundle").headers["etag"]
+    client.app.dependency_overrides[get_stream_patient_bundle_use_case] = UnusedUseCase
+
+    response = client.get("/patients/pat-001/bundle", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+
+
+def test_export_patient_bundle_reads_through_patient_cache(
+    patient_cache_enabled: None,
+    client: TestClient,
+):
+    client.app.dependency_overrides[get_stream_patient_bundle_use_case] = UnusedUseCase
+
+    bundle = client.get("/patients/pat-001/bundle")
+    ndjson = client.get("/patients/pat-001/bundle", params={"_format": "ndjson"})
+
+    assert len(bundle.json()["entry"]) == 4
+    assert len(ndjson.text.splitlines()) == 4
+    assert client.app.state.patient_cache.stats().hits == 1
+
+    _add_observation(client, "obs-003")
+    response = client.get("/patients/pat-001/bundle")
+
+    assert response.headers["etag"] != bundle.headers["etag"]
+    assert len(response.json()["entry"]) == 5
+    assert client.app.state.patient_cache.stats().misses == 2
+
+
+def test_export_patient_bundle_fans_out_reads_when_concurrent(
+    concurrent_fanout_enabled: None,
+    client: TestClient,
+):
+    client.app.dependency_overrides[get_stream_patient_bundle_use_case] = UnusedUseCase
+
+    bundle = client.get("/patients/pat-001/bundle")
+    ndjson = client.get("/patients/pat-001/bundle", params={"_format": "ndjson"})
+
+    assert [entry["resource"]["id"] for entry in bundle.json()["entry"]] == [
+        "pat-001",
+        "obs-000",
+        "obs-001",
+        "obs-002",
+    ]
+    assert [json.loads(line)["id"] for line in ndjson.text.splitlines()] == [
+        "pat-001",
+        "obs-000",
+        "obs-001",
+        "obs-002",
+    ]
+
+
+def test_export_patient_bundle_is_compressed_for_accepting_clients(
+    compression_enabled: None,
+    client: TestClient,
+):
+    response = client.get(
+        "/patients/pat-001/bundle",
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["etag"].startswith('W/"')
+    assert len(response.json()["entry"]) == 4
+
+
+def test_async_stack_serves_patient_summary(async_client: TestClient):
+    response = async_client.get("/patients/pat-001/summary")
+
+    assert response.status_code == 200
+    assert [entry["resource"]["id"] for entry in response.json()["entry"]] == [
+        "pat-001",
+        "obs-000",
+        "obs-001",
+        "obs-002",
+    ]
+
+    async_client.app.dependency_overrides[get_async_patient_summary_use_case] = (
+        UnusedUseCase
+    )
+    not_modified = async_client.get(
+        "/patients/pat-001/summary",
+        headers={"If-None-Match": response.headers["etag"]},
+    )
+
+    assert not_modified.status_code == 304
+
+
+def test_async_stack_serves_patient_bundle_in_both_formats(
+    async_client: TestClient,
+):
+    bundle = async_client.get("/patients/pat-001/bundle")
+    ndjson = async_client.get(
+        "/patients/pat-001/bundle",
+        params={"_format": "ndjson"},
+    )
+
+    assert bundle.headers["content-type"] == "application/fhir+json"
+    assert len(bundle.json()["entry"]) == 4
+    assert ndjson.headers["content-type"] == "application/fhir+ndjson"
+    assert len(ndjson.text.splitlines()) == 4
+    assert bundle.headers["etag"] != ndjson.headers["etag"]
+
+
+def test_async_stack_serves_observation_series(async_client: TestClient):
+    response = async_client.get(
+        "/patients/pat-001/observations/series",
+        params={"system": "http://loinc.org", "code": "4548-4"},
+    )
+
+    assert response.status_code == 200
+    assert response.json()["series"][0]["values"] == [7.0, 7.0, 7.0]
+
+
+def test_async_stack_returns_404_for_unknown_patient(async_client: TestClient):
+    response = async_client.get("/patients/pat-404/bundle")
+
+    assert response.status_code == 404
+    assert response.json()["error"]["identifier"] == "pat-404"
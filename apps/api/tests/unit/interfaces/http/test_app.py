@@ -1,8 +1,36 @@
+import inspect
+import json
+
 import pytest
 from fhir_gateway.infrastructure.config.settings import get_settings
 from fhir_gateway.interfaces.http.app import create_app
+from sqlalchemy.ext.asyncio import async_sessionmaker
 from sqlalchemy.orm import Session, sessionmaker
-from fhir_gateway.infrastructure.security import JwtTokenVerifier
+from cryptography.hazmat.primitives.asymmetric import ec
+from jwt.algorithms import ECAlgorithm
+from fhir_gateway.infrastructure.security import JwksKeyProvider, JwtTokenVerifier
+from fhir_gateway.infrastructure.concurrency import ThreadPoolReadExecutor
+from fhir_gateway.infrastructure.cache import InMemoryLruCache, SharedCache
+from fhir_gateway.infrastructure.audit import BatchingAuditEventWriter
+from fhir_gateway.infrastructure.bulk_export import (
+    BackgroundBulkExportScheduler,
+    InMemoryBulkExportJobRepository,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.database import (
+    DatabaseEngineOptions,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.pool_metrics import (
+    InstrumentedQueuePool,
+    PoolMetrics,
+)
+from fhir_gateway.infrastructure.persistence.sqlalchemy.routing import ReplicaRouter
+from fhir_gateway.interfaces.http.app import create_database_engine_options
+from fhir_gateway.interfaces.http.compression import CompressionMiddleware
+from fhir_gateway.infrastructure.persistence.sqlalchemy.mappers.trusted import (
+    full_validation_enabled,
+    set_full_validation,
+)
+from fastapi.testclient import TestClient
 
 
 ENVIRONMENT_VARIABLES = (
@@ -10,6 +38,34 @@ ENVIRONMENT_VARIABLES = (
     "FHIR_GATEWAY_APP_VERSION",
     "FHIR_GATEWAY_ENVIRONMENT",
     "FHIR_GATEWAY_LOG_LEVEL",
+    "FHIR_GATEWAY_READ_FANOUT_MODE",
+    "FHIR_GATEWAY_DATABASE_STACK",
+    "FHIR_GATEWAY_BULK_EXPORT_MAX_WORKERS",
+    "FHIR_GATEWAY_PATIENT_CACHE_BACKEND",
+    "FHIR_GATEWAY_CODE_CATALOG_ENABLED",
+    "FHIR_GATEWAY_PERSISTENCE_FULL_VALIDATION",
+    "FHIR_GATEWAY_DB_POOL_SIZE",
+    "FHIR_GATEWAY_DB_MAX_OVERFLOW",
+    "FHIR_GATEWAY_DB_POOL_TIMEOUT_SECONDS",
+    "FHIR_GATEWAY_DB_POOL_RECYCLE_SECONDS",
+    "FHIR_GATEWAY_DB_POOL_PRE_PING",
+    "FHIR_GATEWAY_DB_POOL_USE_LIFO",
+    "FHIR_GATEWAY_DB_STATEMENT_TIMEOUT_MS",
+    "FHIR_GATEWAY_DB_PREPARED_STATEMENTS_ENABLED",
+    "FHIR_GATEWAY_DB_PREPARE_THRESHOLD",
+    "FHIR_GATEWAY_DB_REPLICA_URLS",
+    "FHIR_GATEWAY_DB_REPLICA_SELECTION",
+    "FHIR_GATEWAY_DB_READ_YOUR_WRITES_SECONDS",
+    "FHIR_GATEWAY_AUTH_JWT_CACHE_MAX_ENTRIES",
+    "FHIR_GATEWAY_AUTH_JWT_CLOCK_SKEW_SECONDS",
+    "FHIR_GATEWAY_AUTH_JWKS_LOCATION",
+    "FHIR_GATEWAY_AUTH_JWKS_REFRESH_SECONDS",
+    "FHIR_GATEWAY_AUTH_JWKS_ROTATION_OVERLAP_SECONDS",
+    "FHIR_GATEWAY_AUTH_JWKS_FETCH_TIMEOUT_SECONDS",
+    "FHIR_GATEWAY_COMPRESSION_ENABLED",
+    "FHIR_GATEWAY_COMPRESSION_MINIMUM_SIZE",
+    "FHIR_GATEWAY_COMPRESSION_LEVEL",
+    "FHIR_GATEWAY_COMPRESSION_EXPORT_LEVEL",
 )
 
 
@@ -58,6 +114,75 @@ def test_create_app_configures_session_factory():
     finally:
         session.close()
 
+def test_create_app_configures_database_pool(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("FHIR_GATEWAY_DB_POOL_SIZE", "12")
+    monkeypatch.setenv("FHIR_GATEWAY_DB_POOL_PRE_PING", "true")
+
+    app = create_app()
+    pool = app.state.session_factory.kw["bind"].pool
+
+    assert isinstance(app.state.database_pool_metrics, PoolMetrics)
+    assert isinstance(pool, InstrumentedQueuePool)
+    assert pool.size() == 12
+    assert pool._pre_ping is True
+
+
+def test_create_app_reads_from_primary_without_replicas():
+    app = create_app()
+    router = app.state.session_router
+
+    assert isinstance(router, ReplicaRouter)
+    assert router.replicas == ()
+    assert router.for_read() is app.state.session_factory
+
+
+def test_create_app_configures_replica_session_router(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+):
+    replica_urls = [
+        f"sqlite:///{tmp_path / 'replica-a.sqlite3'}",
+        f"sqlite:///{tmp_path / 'replica-b.sqlite3'}",
+    ]
+    monkeypatch.setenv("FHIR_GATEWAY_DB_REPLICA_URLS", json.dumps(replica_urls))
+    monkeypatch.setenv("FHIR_GATEWAY_DB_REPLICA_SELECTION", "least-connections")
+    monkeypatch.setenv("FHIR_GATEWAY_DB_READ_YOUR_WRITES_SECONDS", "2")
+    monkeypatch.setenv("FHIR_GATEWAY_DB_POOL_SIZE", "3")
+
+    app = create_app()
+    router = app.state.session_router
+
+    assert router.primary is app.state.session_factory
+    assert [
+        factory.kw["bind"].url.render_as_string() for factory in router.replicas
+    ] == replica_urls
+    assert router.replicas[0].kw["bind"].pool.size() == 3
+    assert router.read_your_writes_enabled is True
+    assert app.state.audit_event_writer._sink._session_factory is (
+        app.state.session_factory
+    )
+
+
+def test_create_database_engine_options_maps_settings(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("FHIR_GATEWAY_DB_MAX_OVERFLOW", "0")
+    monkeypatch.setenv("FHIR_GATEWAY_DB_POOL_RECYCLE_SECONDS", "1800")
+    monkeypatch.setenv("FHIR_GATEWAY_DB_POOL_USE_LIFO", "true")
+    monkeypatch.setenv("FHIR_GATEWAY_DB_STATEMENT_TIMEOUT_MS", "5000")
+    monkeypatch.setenv("FHIR_GATEWAY_DB_PREPARED_STATEMENTS_ENABLED", "false")
+
+    options = create_database_engine_options(get_settings())
+
+    assert options == DatabaseEngineOptions(
+        max_overflow=0,
+        pool_recycle_seconds=1800,
+        pool_use_lifo=True,
+        statement_timeout_ms=5000,
+        prepare_threshold=None,
+    )
+
+
 def test_create_app_configures_jwt_token_verifier():
     app = create_app()
 
@@ -66,3 +191,217 @@ def test_create_app_configures_jwt_token_verifier():
         app.state.jwt_token_verifier,
         JwtTokenVerifier,
     )
+
+
+def test_create_app_uses_no_jwks_key_provider_for_hs256():
+    app = create_app()
+
+    assert app.state.jwks_key_provider is None
+
+
+def test_create_app_loads_jwks_key_set_for_asymmetric_algorithm(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path,
+):
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    jwk = ECAlgorithm.to_jwk(private_key.public_key(), as_dict=True)
+    jwks_path = tmp_path / "jwks.json"
+    jwks_path.write_text(json.dumps({"keys": [{**jwk, "kid": "ec-1"}]}))
+    monkeypatch.setenv("FHIR_GATEWAY_AUTH_JWT_ALGORITHM", "ES256")
+    monkeypatch.setenv("FHIR_GATEWAY_AUTH_JWKS_LOCATION", str(jwks_path))
+
+    app = create_app()
+    provider = app.state.jwks_key_provider
+
+    with TestClient(app):
+        assert isinstance(provider, JwksKeyProvider)
+        assert provider.key_ids == ("ec-1",)
+
+    assert provider._worker.is_alive() is False
+
+
+def test_create_app_configures_jwt_claims_cache(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("FHIR_GATEWAY_AUTH_JWT_CACHE_MAX_ENTRIES", "16")
+    monkeypatch.setenv("FHIR_GATEWAY_AUTH_JWT_CLOCK_SKEW_SECONDS", "30")
+
+    verifier = create_app().state.jwt_token_verifier
+
+    assert verifier._cache_max_entries == 16
+    assert verifier._clock_skew_seconds == 30
+
+
+def test_create_app_uses_sequential_reads_by_default():
+    app = create_app()
+
+    assert app.state.read_executor is None
+
+
+def test_create_app_configures_read_executor_for_concurrent_reads(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("FHIR_GATEWAY_READ_FANOUT_MODE", "concurrent")
+
+    app = create_app()
+
+    assert isinstance(app.state.read_executor, ThreadPoolReadExecutor)
+
+    with TestClient(app):
+        pass
+
+    assert app.state.read_executor._executor._shutdown
+
+
+def test_create_app_configures_bulk_export_scheduler():
+    app = create_app()
+
+    assert isinstance(
+        app.state.bulk_export_job_repository,
+        InMemoryBulkExportJobRepository,
+    )
+    assert isinstance(app.state.bulk_export_scheduler, BackgroundBulkExportScheduler)
+
+    with TestClient(app):
+        pass
+
+    assert app.state.bulk_export_scheduler._executor._shutdown
+
+
+def test_create_app_configures_audit_event_writer():
+    app = create_app()
+
+    assert isinstance(app.state.audit_event_writer, BatchingAuditEventWriter)
+
+    with TestClient(app):
+        pass
+
+    with pytest.raises(RuntimeError, match="closed"):
+        app.state.audit_event_writer.record(None)
+
+
+@pytest.mark.parametrize(
+    ("max_workers", "expected_max_workers"),
+    [("1", None), ("3", 3)],
+)
+def test_create_app_encodes_bulk_export_inline_with_a_single_worker(
+    monkeypatch: pytest.MonkeyPatch,
+    max_workers: str,
+    expected_max_workers: int | None,
+):
+    monkeypatch.setenv("FHIR_GATEWAY_BULK_EXPORT_MAX_WORKERS", max_workers)
+
+    app = create_app()
+
+    assert (
+        app.state.bulk_export_scheduler._runner._max_workers == expected_max_workers
+    )
+
+
+def test_create_app_disables_patient_cache_by_default():
+    app = create_app()
+
+    assert app.state.patient_cache is None
+
+
+@pytest.mark.parametrize(
+    ("backend", "cache_type"),
+    [("memory", InMemoryLruCache), ("shared", SharedCache)],
+)
+def test_create_app_configures_patient_cache_backend(
+    monkeypatch: pytest.MonkeyPatch,
+    backend: str,
+    cache_type: type,
+):
+    monkeypatch.setenv("FHIR_GATEWAY_PATIENT_CACHE_BACKEND", backend)
+
+    app = create_app()
+
+    assert isinstance(app.state.patient_cache, cache_type)
+
+
+def test_create_app_disables_code_catalogs_by_default():
+    app = create_app()
+
+    assert app.state.observation_code_catalog is None
+    assert app.state.condition_code_catalog is None
+
+
+def test_create_app_enables_code_catalogs(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("FHIR_GATEWAY_CODE_CATALOG_ENABLED", "true")
+
+    app = create_app()
+
+    assert app.state.observation_code_catalog.table_name == "observation_codes"
+    assert app.state.condition_code_catalog.table_name == "condition_codes"
+
+
+def test_create_app_configures_compression(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("FHIR_GATEWAY_COMPRESSION_ENABLED", "true")
+    monkeypatch.setenv("FHIR_GATEWAY_COMPRESSION_MINIMUM_SIZE", "512")
+    monkeypatch.setenv("FHIR_GATEWAY_COMPRESSION_LEVEL", "5")
+    monkeypatch.setenv("FHIR_GATEWAY_COMPRESSION_EXPORT_LEVEL", "2")
+
+    app = create_app()
+
+    [middleware] = app.user_middleware
+
+    assert middleware.cls is CompressionMiddleware
+    assert middleware.kwargs == {
+        "minimum_size": 512,
+        "level": 5,
+        "route_levels": {"export_patient_bundle": 2},
+    }
+
+
+def test_create_app_disables_compression_by_default():
+    app = create_app()
+
+    assert app.user_middleware == []
+
+
+def test_create_app_configures_persistence_full_validation(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("FHIR_GATEWAY_PERSISTENCE_FULL_VALIDATION", "true")
+
+    try:
+        create_app()
+
+        assert full_validation_enabled() is True
+    finally:
+        set_full_validation(False)
+
+
+def test_create_app_trusts_database_rows_by_default():
+    set_full_validation(True)
+
+    create_app()
+
+    assert full_validation_enabled() is False
+
+
+def _route_endpoint(app, name: str):
+    return next(route.endpoint for route in app.routes if route.name == name)
+
+
+def test_create_app_uses_sync_database_stack_by_default():
+    app = create_app()
+
+    assert app.state.async_engine is None
+    assert app.state.async_session_factory is None
+    assert app.state.async_session_router is None
+    assert not inspect.iscoroutinefunction(_route_endpoint(app, "get_patient_summary"))
+
+
+def test_create_app_configures_async_session_factory_for_async_stack(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv("FHIR_GATEWAY_DATABASE_STACK", "async")
+
+    app = create_app()
+
+    assert isinstance(app.state.async_session_factory, async_sessionmaker)
+    assert isinstance(app.state.session_factory, sessionmaker)
+    assert inspect.iscoroutinefunction(_route_endpoint(app, "get_patient_summary"))
+
+    with TestClient(app):
+        pass
@@ -0,0 +1,264 @@
+import asyncio
+import gzip
+import zlib
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import Response, StreamingResponse
+from fastapi.testclient import TestClient
+
+from fhir_gateway.interfaces.http.compression import (
+    CompressionMiddleware,
+    GzipCompressor,
+    is_compressible,
+    negotiate_encoding,
+)
+
+ENCODINGS = {"zstd": object, "br": object, "gzip": GzipCompressor}
+
+BODY = b'{"resourceType":"Observation","valueQuantity":{"unit":"mg/dL"}}' * 100
+
+
+class RecordingCompressor(GzipCompressor):
+    levels: list[int] = []
+
+    def __init__(self, level: int) -> None:
+        super().__init__(level)
+        self.levels.append(level)
+
+
+def _build_app(**options) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/body")
+    def get_body() -> Response:
+        return Response(
+            BODY,
+            media_type="application/fhir+json",
+            headers={"ETag": '"v1"'},
+        )
+
+    @app.get("/image")
+    def get_image() -> Response:
+        return Response(BODY, media_type="image/png")
+
+    @app.get("/encoded")
+    def get_encoded() -> Response:
+        return Response(
+            BODY,
+            media_type="application/json",
+            headers={"Content-Encoding": "identity"},
+        )
+
+    @app.get("/not-modified")
+    def get_not_modified() -> Response:
+        return Response(status_code=304, headers={"ETag": '"v1"'})
+
+    @app.get("/export")
+    def export() -> StreamingResponse:
+        return StreamingResponse(
+            iter([BODY, BODY, BODY]),
+            media_type="application/fhir+ndjson",
+        )
+
+    app.add_middleware(CompressionMiddleware, **options)
+
+    return app
+
+
+def _client(**options) -> TestClient:
+    options.setdefault("encodings", {"gzip": GzipCompressor})
+
+    return TestClient(_build_app(**options))
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        (None, None),
+        ("", None),
+        ("gzip", "gzip"),
+        ("x-gzip", "gzip"),
+        ("gzip, br", "br"),
+        ("gzip, br, zstd", "zstd"),
+        ("br;q=0.5, gzip", "gzip"),
+        ("GZIP;Q=0.2, deflate", "gzip"),
+        ("*", "zstd"),
+        ("*;q=0.5, zstd;q=0, br;q=0", "gzip"),
+        ("gzip;q=0", None),
+        ("gzip;q=oops", None),
+        ("identity, deflate", None),
+    ],
+)
+def test_negotiate_encoding_prefers_highest_quality_then_server_order(
+    accept_encoding,
+    expected,
+):
+    assert negotiate_encoding(accept_encoding, ENCODINGS) == expected
+
+
+@pytest.mark.parametrize(
+    ("content_type", "expected"),
+    [
+        ("application/fhir+json", True),
+        ("application/fhir+ndjson", True),
+        ("application/json; charset=utf-8", True),
+        ("text/plain", True),
+        ("application/xml", True),
+        ("image/png", False),
+        ("application/octet-stream", False),
+        (None, False),
+    ],
+)
+def test_is_compressible_accepts_text_like_media_types(content_type, expected):
+    assert is_compressible(content_type) is expected
+
+
+def test_compression_middleware_compresses_large_bodies():
+    response = _client().get(
+        "/body",
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert int(response.headers["content-length"]) < len(BODY) // 10
+    assert response.headers["etag"] == 'W/"v1"'
+    assert response.content == BODY
+
+
+def test_compression_middleware_keeps_small_bodies_but_varies():
+    response = _client(minimum_size=len(BODY) + 1).get(
+        "/body",
+        headers={"Accept-Encoding": "gzip"},
+    )
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == '"v1"'
+    assert response.content == BODY
+
+
+def test_compression_middleware_sends_identity_without_accepted_coding():
+    response = _client().get("/body", headers={"Accept-Encoding": "identity"})
+
+    assert "content-encoding" not in response.headers
+    assert response.headers["content-length"] == str(len(BODY))
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+@pytest.mark.parametrize("path", ["/image", "/encoded"])
+def test_compression_middleware_skips_binary_and_encoded_bodies(path):
+    response = _client().get(path, headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers.get("content-encoding") in (None, "identity")
+    assert "vary" not in response.headers
+    assert response.content == BODY
+
+
+def test_compression_middleware_leaves_not_modified_responses_unchanged():
+    client = _client()
+
+    accepting = client.get("/not-modified", headers={"Accept-Encoding": "gzip"})
+    identity = client.get("/not-modified", headers={"Accept-Encoding": "identity"})
+
+    assert accepting.status_code == 304
+    assert accepting.headers["etag"] == '"v1"'
+    assert "vary" not in accepting.headers
+    assert identity.headers["etag"] == '"v1"'
+
+
+def test_compression_middleware_streams_flushed_chunks():
+    app = _build_app(encodings={"gzip": GzipCompressor})
+    messages = []
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0", "spec_version": "2.4"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": "/export",
+        "raw_path": b"/export",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"accept-encoding", b"gzip")],
+        "server": ("testserver", 80),
+        "client": ("testclient", 50000),
+    }
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(app(scope, receive, send))
+
+    start, *bodies = messages
+    headers = dict(start["headers"])
+    decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    assert headers[b"content-encoding"] == b"gzip"
+    assert b"content-length" not in headers
+    # Every flushed chunk decodes to the data sent so far.
+    assert decompressor.decompress(bodies[0]["body"]) == BODY
+    assert decompressor.decompress(bodies[1]["body"]) == BODY
+    assert [body.get("more_body", False) for body in bodies] == [
+        True,
+        True,
+        True,
+        False,
+    ]
+    assert gzip.decompress(b"".join(body["body"] for body in bodies)) == BODY * 3
+
+
+def test_compression_middleware_uses_route_levels():
+    RecordingCompressor.levels = []
+    client = _client(
+        level=6,
+        route_levels={"export": 1},
+        encodings={"gzip": RecordingCompressor},
+    )
+
+    client.get("/body", headers={"Accept-Encoding": "gzip"})
+    client.get("/export", headers={"Accept-Encoding": "gzip"})
+
+    assert RecordingCompressor.levels == [6, 1]
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"minimum_size": -1},
+        {"level": 0},
+        {"level": 10},
+        {"route_levels": {"export": 12}},
+    ],
+)
+def test_compression_middleware_rejects_invalid_options(options):
+    with pytest.raises(ValueError):
+        CompressionMiddleware(FastAPI(), **options)
+
+
+def test_compression_middleware_offers_brotli_when_installed():
+    brotli = pytest.importorskip("brotli")
+
+    response = TestClient(_build_app()).get(
+        "/body",
+        headers={"Accept-Encoding": "gzip, br"},
+    )
+
+    assert response.headers["content-encoding"] == "br"
+    assert brotli.decompress(response.content) == BODY
+
+
+def test_compression_middleware_offers_zstd_when_installed():
+    zstandard = pytest.importorskip("zstandard")
+
+    response = TestClient(_build_app()).get(
+        "/body",
+        headers={"Accept-Encoding": "zstd"},
+    )
+
+    assert response.headers["content-encoding"] == "zstd"
+    assert zstandard.ZstdDecompressor().decompress(response.content) == BODY
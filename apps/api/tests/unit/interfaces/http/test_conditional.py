@@ -0,0 +1,52 @@
+import pytest
+
+from fhir_gateway.interfaces.http.conditional import (
+    entity_tag,
+    is_not_modified,
+    not_modified_response,
+)
+
+
+def test_entity_tag_is_strong_and_names_representation():
+    assert entity_tag("abc123") == '"abc123"'
+    assert entity_tag("abc123", "ndjson") == '"abc123-ndjson"'
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        '"abc123"',
+        'W/"abc123"',
+        '"other", "abc123"',
+        '"other",W/"abc123"',
+        "*",
+        " * ",
+    ],
+)
+def test_is_not_modified_matches_current_tag(if_none_match):
+    assert is_not_modified(if_none_match, '"abc123"')
+
+
+@pytest.mark.parametrize(
+    "if_none_match",
+    [
+        None,
+        "",
+        '"abc1234"',
+        "abc123",
+        '"abc123-ndjson"',
+        '"other, abc123"',
+    ],
+)
+def test_is_not_modified_rejects_other_tags(if_none_match):
+    assert not is_not_modified(if_none_match, '"abc123"')
+
+
+def test_not_modified_response_has_no_body_and_keeps_validators():
+    response = not_modified_response('"abc123"')
+
+    assert response.status_code == 304
+    assert response.body == b""
+    assert "content-length" not in response.headers
+    assert response.headers["etag"] == '"abc123"'
+    assert response.headers["cache-control"] == "private, no-cache"
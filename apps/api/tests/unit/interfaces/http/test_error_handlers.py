@@ -10,7 +10,10 @@ from fhir_gateway.infrastructure.security import (
     TokenVerifierConfigurationError,
 )
 from fhir_gateway.interfaces.http.error_handlers import register_exception_handlers
-from fhir_gateway.interfaces.http.errors import AuthenticationError
+from fhir_gateway.interfaces.http.errors import (
+    AuthenticationError,
+    AuthorizationError,
+)
 
 
 def _create_test_app() -> FastAPI:
@@ -42,6 +45,10 @@ def _create_test_app() -> FastAPI:
     def raise_authentication_error() -> None:
         raise AuthenticationError()
 
+    @app.get("/authorization-error")
+    def raise_authorization_error() -> None:
+        raise AuthorizationError()
+
     @app.get("/token-verifier-configuration-error")
     def raise_token_verifier_configuration_error() -> None:
         raise TokenVerifierConfigurationError(
@@ -131,6 +138,24 @@ def test_authentication_error_includes_bearer_challenge():
     assert response.headers["WWW-Authenticate"] == "Bearer"
 
 
+def test_authorization_error_returns_forbidden_envelope():
+    client = TestClient(_create_test_app())
+
+    response = client.get("/authorization-error")
+
+    assert response.status_code == 403
+    assert response.json() == {
+        "error": {
+            "code": "forbidden",
+            "message": "The authenticated principal does not have permission to perform this operation.",
+            "field": None,
+            "resource": None,
+            "identifier": None,
+        }
+    }
+    assert "WWW-Authenticate" not in response.headers
+
+
 def test_token_verifier_configuration_error_returns_internal_error():
     client = TestClient(_create_test_app())
 
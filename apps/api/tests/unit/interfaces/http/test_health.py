@@ -1,6 +1,24 @@
+import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from fhir_gateway.application.security.current_principal import CurrentPrincipal
+from fhir_gateway.infrastructure.cache import InMemoryLruCache
 from fhir_gateway.interfaces.http.app import create_app
+from fhir_gateway.interfaces.http.dependencies.security import (
+    get_current_principal,
+)
+
+HEALTH_METRICS_PATHS = ("/health/cache", "/health/database-pool")
+
+
+def _as_principal(app: FastAPI, *roles: str) -> FastAPI:
+    app.dependency_overrides[get_current_principal] = lambda: CurrentPrincipal(
+        subject="admin-demo-001",
+        roles=roles,
+    )
+
+    return app
 
 
 def test_health_returns_http_200():
@@ -17,3 +35,70 @@ def test_health_returns_status_ok():
     response = client.get("/health")
 
     assert response.json() == {"status": "ok"}
+
+
+def test_cache_health_reports_disabled_cache():
+    app = _as_principal(create_app(), "admin")
+    app.state.patient_cache = None
+    client = TestClient(app)
+
+    response = client.get("/health/cache")
+
+    assert response.status_code == 200
+    assert response.json()["backend"] == "disabled"
+
+
+def test_cache_health_reports_hit_and_miss_counts():
+    app = _as_principal(create_app(), "admin")
+    app.state.patient_cache = InMemoryLruCache(max_entries=10, ttl_seconds=60)
+    app.state.patient_cache.set("key", "value")
+    app.state.patient_cache.get("key")
+    app.state.patient_cache.get("missing")
+    client = TestClient(app)
+
+    response = client.get("/health/cache")
+
+    assert response.json() == {
+        "backend": "memory",
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "entries": 1,
+        "hit_ratio": 0.5,
+    }
+
+
+def test_database_pool_health_reports_pool_statistics():
+    client = TestClient(_as_principal(create_app(), "admin"))
+
+    response = client.get("/health/database-pool")
+
+    assert response.status_code == 200
+
+    body = response.json()
+
+    assert body["pool_size"] == 5
+    assert body["checked_out"] == 0
+    assert body["checkouts"] == 0
+    assert body["timeouts"] == 0
+    assert body["wait_buckets"][0] == {"le_ms": 1.0, "count": 0}
+    assert body["wait_buckets"][-1] == {"le_ms": None, "count": 0}
+
+
+@pytest.mark.parametrize("path", HEALTH_METRICS_PATHS)
+def test_health_metrics_require_authentication(path: str):
+    client = TestClient(create_app())
+
+    response = client.get(path)
+
+    assert response.status_code == 401
+
+
+@pytest.mark.parametrize("path", HEALTH_METRICS_PATHS)
+def test_health_metrics_require_admin_role(path: str):
+    client = TestClient(_as_principal(create_app(), "clinician"))
+
+    response = client.get(path)
+
+    assert response.status_code == 403
+    assert response.json()["error"]["code"] == "forbidden"
@@ -0,0 +1,50 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fhir_gateway.application.models.patient_summary import PatientSummary
+from fhir_gateway.domain.entities.patient import Patient
+from fhir_gateway.domain.value_objects.human_name import HumanName
+from fhir_gateway.domain.value_objects.resource_id import ResourceId
+from fhir_gateway.infrastructure.serialization import encode_fhir
+from fhir_gateway.interfaces.http.responses import FhirJsonResponse
+
+PATIENT = Patient(id=ResourceId("pat-001"), name=HumanName(text="Ana García"))
+
+
+def test_fhir_json_response_encodes_domain_values():
+    summary = PatientSummary(
+        patient=PATIENT,
+        conditions=(),
+        encounters=(),
+        observations=(),
+    )
+
+    response = FhirJsonResponse(summary)
+
+    assert response.body == encode_fhir(summary)
+    assert response.media_type == "application/fhir+json"
+    assert response.headers["content-length"] == str(len(response.body))
+
+
+def test_fhir_json_response_sends_bytes_unchanged():
+    response = FhirJsonResponse(b'{"resourceType":"Patient","id":"pat-001"}')
+
+    assert response.body == b'{"resourceType":"Patient","id":"pat-001"}'
+
+
+def test_fhir_json_response_is_served_by_routes():
+    app = FastAPI()
+
+    @app.get("/patient")
+    def get_patient() -> FhirJsonResponse:
+        return FhirJsonResponse(PATIENT, status_code=200)
+
+    response = TestClient(app).get("/patient")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/fhir+json"
+    assert response.json() == {
+        "resourceType": "Patient",
+        "id": "pat-001",
+        "name": [{"text": "Ana García"}],
+    }